@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for the binary VDF decoder.
+
+Builds synthetic shortcuts.vdf- and packageinfo.vdf-shaped files with
+~100k keys and times the buffer-based decoder against the previous
+byte-at-a-time stream reader (kept here as the reference).
+
+Usage: python scripts/bench_vdf.py [--keys N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import struct
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from steam_library_manager.core.vdf_parser import binary_decode, binary_dumps, binary_loads  # noqa: E402
+
+__all__: list[str] = []
+
+
+# ---------------------------------------------------------------------------
+# Reference: the previous stream reader (one read(1) per byte)
+# ---------------------------------------------------------------------------
+
+
+def _legacy_str(s: BytesIO) -> str:
+    b = bytearray()
+    while True:
+        c = s.read(1)
+        if not c or c == b"\x00":
+            break
+        b.extend(c)
+    return b.decode("utf-8", errors="replace")
+
+
+def _legacy_obj(s: BytesIO) -> dict:
+    o: dict = {}
+    while True:
+        tag = s.read(1)
+        if not tag or tag == b"\x08":
+            break
+        k = _legacy_str(s)
+        if tag == b"\x00":
+            o[k] = _legacy_obj(s)
+        elif tag == b"\x01":
+            o[k] = _legacy_str(s)
+        elif tag == b"\x02":
+            o[k] = struct.unpack("<i", s.read(4))[0]
+        elif tag == b"\x07":
+            o[k] = struct.unpack("<Q", s.read(8))[0]
+        elif tag == b"\x0a":
+            o[k] = struct.unpack("<q", s.read(8))[0]
+        elif tag == b"\x03":
+            o[k] = struct.unpack("<f", s.read(4))[0]
+        else:
+            raise ValueError("bad tag: 0x%s" % tag.hex())
+    return o
+
+
+def _legacy_loads(data: bytes) -> dict:
+    s = BytesIO(data)
+    o: dict = {}
+    while True:
+        tag = s.read(1)
+        if not tag or tag in (b"\x08", b"\x0b"):
+            break
+        if tag == b"\x00":
+            k = _legacy_str(s)
+            o[k] = _legacy_obj(s)
+    return o
+
+
+# ---------------------------------------------------------------------------
+# Synthetic inputs
+# ---------------------------------------------------------------------------
+
+
+def make_shortcuts(keys: int) -> bytes:
+    """shortcuts.vdf with ~keys leaf values (10 per entry)."""
+    entries = {}
+    for i in range(max(1, keys // 10)):
+        entries[str(i)] = {
+            "appid": -(i + 1),
+            "AppName": "Synthetic Game %d" % i,
+            "Exe": '"/opt/games/game_%d/bin/launcher"' % i,
+            "StartDir": '"/opt/games/game_%d/"' % i,
+            "icon": "",
+            "LaunchOptions": "--fullscreen --lang=en",
+            "IsHidden": 0,
+            "LastPlayTime": 1700000000 + i,
+            "FlatpakAppID": "",
+            "tags": {"0": "favorite"},
+        }
+    return binary_dumps({"shortcuts": entries})
+
+
+def make_packageinfo(keys: int) -> bytes:
+    """packageinfo.vdf records with ~keys leaf values (10 per package)."""
+    out = bytearray(struct.pack("<II", 0x06565528, 1))
+    for pkg in range(max(1, keys // 10)):
+        out += struct.pack("<I", pkg) + bytes(32)
+        body = {
+            str(pkg): {
+                "packageid": pkg,
+                "billingtype": 1,
+                "licensetype": 1,
+                "status": 0,
+                "appids": {str(j): pkg * 10 + j for j in range(4)},
+                "depotids": {"0": pkg * 10 + 1},
+            }
+        }
+        out += binary_dumps(body)
+    out += struct.pack("<I", 0xFFFFFFFF)
+    return bytes(out)
+
+
+def _legacy_pkg_obj(f: BytesIO) -> dict:
+    # the old PackageInfoParser._read_binary_vdf (list-of-bytes joins)
+    result: dict = {}
+    while True:
+        type_byte = f.read(1)
+        if not type_byte or type_byte == b"\x08":
+            break
+        key_parts: list[bytes] = []
+        while True:
+            c = f.read(1)
+            if not c or c == b"\x00":
+                break
+            key_parts.append(c)
+        key = b"".join(key_parts).decode("utf-8", errors="replace")
+        if type_byte[0] == 0x00:
+            result[key] = _legacy_pkg_obj(f)
+        elif type_byte[0] == 0x01:
+            val_parts: list[bytes] = []
+            while True:
+                c = f.read(1)
+                if not c or c == b"\x00":
+                    break
+                val_parts.append(c)
+            result[key] = b"".join(val_parts).decode("utf-8", errors="replace")
+        elif type_byte[0] == 0x02:
+            result[key] = struct.unpack("<I", f.read(4))[0]
+        elif type_byte[0] == 0x07:
+            result[key] = struct.unpack("<Q", f.read(8))[0]
+        else:
+            break
+    return result
+
+
+def _packageinfo_new(buf: bytes) -> int:
+    pos, n, count = 8, len(buf), 0
+    while pos + 4 <= n:
+        if struct.unpack_from("<I", buf, pos)[0] == 0xFFFFFFFF:
+            break
+        _data, pos = binary_decode(buf, pos + 36)
+        count += 1
+    return count
+
+
+def _packageinfo_legacy(buf: bytes) -> int:
+    s = BytesIO(buf)
+    s.read(8)
+    count = 0
+    while True:
+        raw = s.read(4)
+        if len(raw) < 4 or struct.unpack("<I", raw)[0] == 0xFFFFFFFF:
+            break
+        s.read(32)
+        _legacy_pkg_obj(s)
+        count += 1
+    return count
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def _best(fn, arg, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--keys", type=int, default=100_000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    shortcuts = make_shortcuts(args.keys)
+    packages = make_packageinfo(args.keys)
+    assert binary_loads(shortcuts) == _legacy_loads(shortcuts)
+    assert _packageinfo_new(packages) == _packageinfo_legacy(packages)
+
+    for name, data, new, old in (
+        ("shortcuts.vdf", shortcuts, binary_loads, _legacy_loads),
+        ("packageinfo.vdf", packages, _packageinfo_new, _packageinfo_legacy),
+    ):
+        t_new = _best(new, data, args.repeat)
+        t_old = _best(old, data, args.repeat)
+        print(
+            "%-16s %6.1f MB  buffer %7.1f ms  stream %7.1f ms  speedup %.1fx"
+            % (name, len(data) / 1e6, t_new * 1000, t_old * 1000, t_old / t_new)
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
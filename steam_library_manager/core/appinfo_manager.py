@@ -68,7 +68,8 @@ class AppInfoManager:
         # load binary appinfo.vdf
         if self.appinfo_path and self.appinfo_path.exists():
             try:
-                self.appinfo = AppInfo(path=str(self.appinfo_path))
+                # lazy: only the app index is built, entries decode on access
+                self.appinfo = AppInfo(path=str(self.appinfo_path), lazy=True)
                 self.steam_apps = self.appinfo.apps
 
                 count = len(self.appinfo.apps)
@@ -137,9 +138,10 @@ class AppInfoManager:
         # get metadata with user modifications applied
         result = {}
 
-        # get from binary appinfo
-        if self.appinfo and int(app_id) in self.appinfo.apps:
-            app_data = self.appinfo.apps[int(app_id)]
+        # get from binary appinfo; one lookup, lazy mode drops entries
+        # that fail to decode
+        app_data = self.appinfo.apps.get(int(app_id)) if self.appinfo else None
+        if app_data is not None:
             vdf_data = app_data.get("data", {})
 
             common = self._find_common_section(vdf_data)
@@ -67,6 +67,14 @@ class CloudStorageParser:
         self._file_mtime = 0.0
         self._deleted_keys = set()
 
+        # inverted index, rebuilt lazily (see _ensure_index)
+        self._app_index = None  # app_id -> {id(col): col}
+        self._col_apps = {}  # id(col) -> set of app_ids
+        self._col_pos = {}  # id(col) -> position in self.collections
+        self._by_name = {}  # name -> first collection with that name
+        self._indexed_list = None
+        self._indexed_len = 0
+
     def load(self):
         # load collections from cloud storage
         try:
@@ -95,6 +103,7 @@ class CloudStorageParser:
                             except json.JSONDecodeError:
                                 logger.warning(t("logs.parser.parse_failed", key=key))
 
+            self.invalidate_index()
             return True
 
         except FileNotFoundError:
@@ -160,11 +169,15 @@ class CloudStorageParser:
                 )
 
             # sanitize: 'added' must be list, not int
+            sanitized = False
             for col in self.collections:
                 raw = col.get("added", col.get("apps"))
                 if not isinstance(raw, list):
                     col["added"] = []
                     col.setdefault("apps", [])
+                    sanitized = True
+            if sanitized:
+                self.invalidate_index()
 
             # add our collections
             ts = int(time.time())
@@ -268,18 +281,101 @@ class CloudStorageParser:
         except (ValueError, TypeError):
             return None
 
+    def invalidate_index(self):
+        # drop the inverted index; call after mutating collections in place
+        self._app_index = None
+
+    def _ensure_index(self):
+        # (re)build app_id -> collections if collections was replaced or resized;
+        # in-place edits to a collection's app list must call invalidate_index()
+        cols = self.collections
+        if self._app_index is not None and cols is self._indexed_list and len(cols) == self._indexed_len:
+            return
+
+        idx = {}
+        col_apps = {}
+        pos = {}
+        by_name = {}
+        for i, col in enumerate(cols):
+            key = id(col)
+            pos[key] = i
+            by_name.setdefault(col.get("name"), col)
+            members = set(self._get_collection_apps(col))
+            col_apps[key] = members
+            for aid in members:
+                idx.setdefault(aid, {})[key] = col
+
+        self._app_index = idx
+        self._col_apps = col_apps
+        self._col_pos = pos
+        self._by_name = by_name
+        self._indexed_list = cols
+        self._indexed_len = len(cols)
+
+    def _index_collection(self, col):
+        # register a collection just appended to self.collections
+        key = id(col)
+        self._col_pos[key] = len(self.collections) - 1
+        self._col_apps[key] = set()
+        self._by_name.setdefault(col.get("name"), col)
+        self._indexed_len = len(self.collections)
+
+    def _index_add(self, aid, col):
+        self._col_apps[id(col)].add(aid)
+        self._app_index.setdefault(aid, {})[id(col)] = col
+
+    def _index_discard(self, aid, col):
+        self._col_apps[id(col)].discard(aid)
+        cols = self._app_index.get(aid)
+        if cols is not None:
+            cols.pop(id(col), None)
+            if not cols:
+                del self._app_index[aid]
+
+    def _app_collections(self, aid):
+        # collections containing aid, in list order
+        self._ensure_index()
+        cols = self._app_index.get(aid)
+        if not cols:
+            return []
+        if len(cols) == 1:
+            return list(cols.values())
+        pos = self._col_pos
+        return sorted(cols.values(), key=lambda c: pos[id(c)])
+
     def get_app_categories(self, app_id):
         # get categories for specific app
         aid = self._to_app_id_int(app_id)
         if aid is None:
             return []
 
-        cats = []
-        for col in self.collections:
-            apps = self._get_collection_apps(col)
-            if aid in apps:
-                cats.append(col.get("name", ""))
-        return cats
+        return [col.get("name", "") for col in self._app_collections(aid)]
+
+    def _find_or_create(self, cat_name):
+        # first collection named cat_name, appended if missing
+        self._ensure_index()
+        col = self._by_name.get(cat_name)
+        if col is None:
+            cid = "from-tag-%s" % cat_name
+            col = {"id": cid, "name": cat_name, "added": [], "removed": []}
+            self.collections.append(col)
+            self._index_collection(col)
+        return col
+
+    def _add_to(self, aid, col):
+        # append aid to col's list (keeps serialized order)
+        apps = self._get_collection_apps(col)
+        if col.get("added") is not apps:
+            col["added"] = apps
+        if aid not in self._col_apps[id(col)]:
+            apps.append(aid)
+            self._index_add(aid, col)
+
+    def _remove_from(self, aid, col):
+        apps = self._get_collection_apps(col)
+        if aid in apps:
+            apps.remove(aid)
+        self._index_discard(aid, col)
 
     def set_app_categories(self, app_id, categories):
         # set categories for app
@@ -288,46 +384,100 @@ class CloudStorageParser:
             return  # silently skip invalid IDs
 
         # remove from all collections first
-        for col in self.collections:
-            apps = self._get_collection_apps(col)
-            if aid in apps:
-                apps.remove(aid)
+        for col in self._app_collections(aid):
+            self._remove_from(aid, col)
 
         # add to specified categories
         for cat_name in categories:
-            col = None
-            for c in self.collections:
-                if c.get("name") == cat_name:
-                    col = c
-                    break
-
-            if not col:
-                cid = "from-tag-%s" % cat_name
-                col = {"id": cid, "name": cat_name, "added": [], "removed": []}
-                self.collections.append(col)
-
-            apps = self._get_collection_apps(col)
-            if aid not in apps:
-                apps.append(aid)
-
-            if "added" not in col:
-                col["added"] = apps
+            self._add_to(aid, self._find_or_create(cat_name))
 
         self.modified = True
 
     def add_app_category(self, app_id, category):
         # add single category to app
-        cats = self.get_app_categories(app_id)
-        if category not in cats:
-            cats.append(category)
-            self.set_app_categories(app_id, cats)
+        aid = self._to_app_id_int(app_id)
+        if aid is None:
+            return
+
+        if category not in self.get_app_categories(aid):
+            self._add_to(aid, self._find_or_create(category))
+            self.modified = True
 
     def remove_app_category(self, app_id, category):
         # remove category from app
-        cats = self.get_app_categories(app_id)
-        if category in cats:
-            cats.remove(category)
-            self.set_app_categories(app_id, cats)
+        aid = self._to_app_id_int(app_id)
+        if aid is None:
+            return
+
+        hits = [col for col in self._app_collections(aid) if col.get("name") == category]
+        if hits:
+            for col in hits:
+                self._remove_from(aid, col)
+            self.modified = True
+
+    def _ids(self, app_ids):
+        # valid int app IDs in first-seen order
+        out = {}
+        for a in app_ids:
+            aid = self._to_app_id_int(a)
+            if aid is not None:
+                out[aid] = None
+        return out
+
+    def apply_category_changes(self, add=None, remove=None):
+        """Adds and removes many apps in one pass.
+
+        Args:
+            add: {category: app IDs} to add; missing categories are created.
+            remove: {category: app IDs} to remove.
+
+        Removals run first. Membership is diffed with set operations
+        against the index, so apps already in (or not in) a category are
+        skipped, and each collection's app list is rewritten at most once.
+
+        Returns:
+            (added, removed): {category: set of int app IDs} that actually
+            changed, categories without changes left out.
+        """
+        self._ensure_index()
+        added = {}
+        removed = {}
+
+        for cat, app_ids in (remove or {}).items():
+            ids = set(self._ids(app_ids))
+            gone = set()
+            for col in [c for c in self.collections if c.get("name") == cat]:
+                hit = ids & self._col_apps[id(col)]
+                if not hit:
+                    continue
+                apps = self._get_collection_apps(col)
+                apps[:] = [a for a in apps if a not in hit]
+                for aid in hit:
+                    self._index_discard(aid, col)
+                gone |= hit
+            if gone:
+                removed[cat] = gone
+
+        for cat, app_ids in (add or {}).items():
+            ids = self._ids(app_ids)
+            # an app counts as a member if any same-named collection has it
+            for c in self.collections:
+                if c.get("name") == cat:
+                    ids = {a: None for a in ids if a not in self._col_apps[id(c)]}
+            if not ids:
+                continue
+            col = self._find_or_create(cat)
+            apps = self._get_collection_apps(col)
+            if col.get("added") is not apps:
+                col["added"] = apps
+            apps.extend(ids)
+            for aid in ids:
+                self._index_add(aid, col)
+            added[cat] = set(ids)
+
+        if added or removed:
+            self.modified = True
+        return added, removed
 
     def delete_category(self, category):
         # delete category completely
@@ -336,13 +486,17 @@ class CloudStorageParser:
                 cid = col.get("id", "")
                 if cid:
                     self._deleted_keys.add("user-collections.%s" % cid)
+        # new list object - the index is rebuilt on next lookup
         self.collections = [c for c in self.collections if c.get("name") != category]
         self.modified = True
 
     def create_empty_collection(self, name):
         # create empty collection (safe way)
+        self._ensure_index()
         cid = "from-tag-%s" % name
-        self.collections.append({"id": cid, "name": name, "added": [], "removed": []})
+        col = {"id": cid, "name": name, "added": [], "removed": []}
+        self.collections.append(col)
+        self._index_collection(col)
         self.modified = True
 
     def rename_category(self, old_name, new_name):
@@ -353,6 +507,15 @@ class CloudStorageParser:
                 col["id"] = "from-tag-%s" % new_name
                 self.modified = True
                 break
+        else:
+            return
+
+        # only the name lookup changes, app membership stays
+        if self._app_index is not None:
+            by_name = {}
+            for c in self.collections:
+                by_name.setdefault(c.get("name"), c)
+            self._by_name = by_name
 
     def get_all_app_ids(self):
         # get all app IDs from all collections
@@ -378,11 +541,9 @@ class CloudStorageParser:
             return False
 
         removed = False
-        for col in self.collections:
-            apps = self._get_collection_apps(col)
-            if aid in apps:
-                apps.remove(aid)
-                removed = True
+        for col in self._app_collections(aid):
+            self._remove_from(aid, col)
+            removed = True
 
         if removed:
             self.modified = True
@@ -430,6 +591,7 @@ class CloudStorageParser:
             self.collections.remove(dup)
 
         if dups:
+            self.invalidate_index()
             self.modified = True
 
         return len(dups)
@@ -17,6 +17,21 @@ logger = logging.getLogger("steamlibmgr.database_importer")
 
 __all__ = ["DatabaseImporter", "create_initial_database"]
 
+# tables the appinfo import writes to
+_GAME_TABLES = ("games", "game_genres", "game_tags", "game_franchises", "game_languages", "game_custom_meta")
+
+# sync_state key for the appinfo.vdf mtime/size seen at the last sync
+APPINFO_SIGNATURE_KEY = "appinfo_signature"
+
+
+def _file_signature(path):
+    # "mtime_ns:size" or None if the file is missing
+    try:
+        st = path.stat()
+        return "%d:%d" % (st.st_mtime_ns, st.st_size)
+    except (OSError, AttributeError, TypeError):
+        return None
+
 
 class DatabaseImporter:
     """Reads game metadata from appinfo.vdf, converts it to DatabaseEntry
@@ -47,33 +62,46 @@ class DatabaseImporter:
 
         logger.info(t("logs.db.found_apps", count=total))
 
-        items = list(all_apps.items())
+        # ids only - entries are decoded batch by batch
+        app_ids = list(all_apps)
 
         imported = 0
         updated = 0
         failed = 0
-        batch_sz = 100
-
-        for i in range(0, total, batch_sz):
-            batch = items[i : i + batch_sz]
-            bnum = i // batch_sz + 1
-            btotal = (total + batch_sz - 1) // batch_sz
-
-            logger.debug(t("logs.db.importing_batch", current=bnum, total=btotal))
-            if progress_callback:
-                progress_callback(i, total, t("logs.db.importing_batch", current=bnum, total=btotal))
-
-            entries = []
-            for app_id, app_data in batch:
-                try:
-                    entry = self._convert_to_database_entry(app_id, app_data)
-                    entries.append(entry)
-                except (ValueError, KeyError, TypeError) as e:
-                    logger.warning(t("logs.db.import_failed_app", app_id=app_id, error=str(e)))
-                    failed += 1
-
-            count = self.db.batch_insert_games(entries)
-            imported += count
+        batch_sz = 2000
+        t_conv = 0.0
+        t_ins = 0.0
+
+        # one transaction for the whole run, indexes rebuilt once at the end
+        with self.db.bulk_import_mode(defer_indexes=_GAME_TABLES):
+            for i in range(0, total, batch_sz):
+                batch = app_ids[i : i + batch_sz]
+                bnum = i // batch_sz + 1
+                btotal = (total + batch_sz - 1) // batch_sz
+
+                logger.debug(t("logs.db.importing_batch", current=bnum, total=btotal))
+                if progress_callback:
+                    progress_callback(i, total, t("logs.db.importing_batch", current=bnum, total=btotal))
+
+                tc = time.perf_counter()
+                entries = []
+                for app_id in batch:
+                    try:
+                        app_data = all_apps.get(app_id)
+                        if app_data is None:
+                            # undecodable entry, dropped by the lazy parser
+                            failed += 1
+                            continue
+                        entry = self._convert_to_database_entry(app_id, app_data)
+                        entries.append(entry)
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.warning(t("logs.db.import_failed_app", app_id=app_id, error=str(e)))
+                        failed += 1
+
+                ti = time.perf_counter()
+                imported += self.db.batch_insert_games(entries, commit=False)
+                t_conv += ti - tc
+                t_ins += time.perf_counter() - ti
 
         dur = time.time() - t0
 
@@ -83,6 +111,8 @@ class DatabaseImporter:
             games_failed=failed,
             duration_seconds=dur,
             source="appinfo.vdf",
+            convert_seconds=t_conv,
+            insert_seconds=t_ins,
         )
 
         self.db.record_import(stats)
@@ -126,12 +156,10 @@ class DatabaseImporter:
 
                 entry = self._convert_to_database_entry(app_id, app_data)
 
-                existing = self.db.get_game(app_id)
-                if existing:
-                    self.db.update_game(entry)
+                # appinfo fields only - enrichment columns and tags stay
+                if self.db.update_appinfo_fields(entry):
                     updated += 1
                 else:
-                    self.db.insert_game(entry)
                     imported += 1
 
             except (ValueError, KeyError, TypeError) as e:
@@ -159,6 +187,46 @@ class DatabaseImporter:
 
         return stats
 
+    def sync_changed_apps(self, progress_callback=None):
+        # diff appinfo.vdf change numbers against the stored index and
+        # refresh only apps whose entry moved; returns ImportStats or None
+        path = self.appinfo_manager.appinfo_path
+        sig = _file_signature(path)
+        if sig is None:
+            return None
+
+        if self.db.get_sync_state(APPINFO_SIGNATURE_KEY) == sig:
+            logger.info(t("logs.db.appinfo_unchanged"))
+            return None
+
+        if not self.appinfo_manager.appinfo:
+            self.appinfo_manager.load_appinfo()
+        appinfo = self.appinfo_manager.appinfo
+        if not appinfo:
+            return None
+
+        current = appinfo.get_change_index()
+        stored = self.db.get_appinfo_index()
+
+        changed = [aid for aid, state in current.items() if stored.get(aid) != state]
+        removed = [aid for aid in stored if aid not in current]
+
+        stats = None
+        if not stored:
+            # first sync - the table was just imported (or predates the index)
+            logger.info(t("logs.db.appinfo_index_seeded", count=len(current)))
+        elif changed:
+            stats = self.incremental_update(changed, progress_callback)
+
+        if stored:
+            logger.info(t("logs.db.appinfo_delta", changed=len(changed), total=len(current), removed=len(removed)))
+
+        self.db.update_appinfo_index({aid: current[aid] for aid in changed}, removed)
+        self.db.set_sync_state(APPINFO_SIGNATURE_KEY, sig)
+        self.db.commit()
+
+        return stats
+
     def _convert_to_database_entry(self, app_id, app_data):
         # convert appinfo data to DatabaseEntry
         vdf = app_data.get("data", app_data)
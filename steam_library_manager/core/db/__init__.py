@@ -13,6 +13,7 @@ from steam_library_manager.core.db.connection import ConnectionBase
 from steam_library_manager.core.db.schema import SchemaMixin
 
 # query mixins
+from steam_library_manager.core.db.appinfo_index_queries import AppInfoIndexMixin
 from steam_library_manager.core.db.curator_mixin import CuratorMixin
 from steam_library_manager.core.db.enrichment_queries import EnrichmentQueryMixin
 from steam_library_manager.core.db.game_batch_queries import GameBatchQueryMixin
@@ -47,6 +48,7 @@ class Database(
     TagQueryMixin,
     ModificationMixin,
     CuratorMixin,
+    AppInfoIndexMixin,
     ConnectionBase,
 ):
     """Composes all query mixins on top of ConnectionBase."""
@@ -0,0 +1,50 @@
+#
+# steam_library_manager/core/db/appinfo_index_queries.py
+# Stored appinfo.vdf change numbers and source file sync state
+#
+# Copyright © 2025-2026 SwitchBros
+# Licensed under the MIT License. See LICENSE for details.
+#
+
+from __future__ import annotations
+
+import logging
+import time
+
+logger = logging.getLogger("steamlibmgr.database")
+
+__all__ = ["AppInfoIndexMixin"]
+
+
+class AppInfoIndexMixin:
+    """Change-number index for incremental appinfo refresh, plus a tiny
+    key/value table for remembering source file signatures.
+
+    Needs conn from ConnectionBase.
+    """
+
+    def get_appinfo_index(self):
+        # app_id -> (change_number, sha1)
+        cur = self.conn.execute("SELECT app_id, change_number, sha1 FROM appinfo_index")
+        return {r[0]: (r[1], bytes(r[2] or b"")) for r in cur.fetchall()}
+
+    def update_appinfo_index(self, upserts, removed=()):
+        # upserts: app_id -> (change_number, sha1)
+        with self.conn:
+            if upserts:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO appinfo_index (app_id, change_number, sha1) VALUES (?, ?, ?)",
+                    [(aid, cn, sha) for aid, (cn, sha) in upserts.items()],
+                )
+            if removed:
+                self.conn.executemany("DELETE FROM appinfo_index WHERE app_id = ?", [(aid,) for aid in removed])
+
+    def get_sync_state(self, key):
+        r = self.conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return r[0] if r else None
+
+    def set_sync_state(self, key, value):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO sync_state (key, value, updated_at) VALUES (?, ?, ?)",
+            (key, value, int(time.time())),
+        )
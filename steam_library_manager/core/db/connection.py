@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
 
 from steam_library_manager.utils.timeouts import DB_BUSY_TIMEOUT_MS, DB_CONNECT_TIMEOUT
@@ -26,13 +27,24 @@ class ConnectionBase:
     with this it creates or migrates the schema on first connect.
     """
 
-    SCHEMA_VERSION = 9
+    SCHEMA_VERSION = 10
 
     conn: sqlite3.Connection
     db_path: Path
 
-    def __init__(self, db_path):
+    def __init__(self, db_path, read_only=False):
         self.db_path = db_path
+
+        if read_only:
+            # lookups next to a DatabaseWriter: never takes the write lock,
+            # expects an existing, migrated file
+            uri = "%s?mode=ro" % Path(db_path).resolve().as_uri()
+            self.conn = sqlite3.connect(uri, uri=True, timeout=DB_CONNECT_TIMEOUT)
+            self.conn.row_factory = sqlite3.Row
+            self.conn.execute("PRAGMA query_only = ON")
+            self.conn.execute("PRAGMA busy_timeout = %d" % DB_BUSY_TIMEOUT_MS)
+            return
+
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
         self.conn = sqlite3.connect(str(db_path), timeout=DB_CONNECT_TIMEOUT)
@@ -46,6 +58,49 @@ class ConnectionBase:
     def commit(self):
         self.conn.commit()
 
+    @contextmanager
+    def bulk_import_mode(self, defer_indexes=()):
+        # for loading lots of rows at once: no fsync and no FK checks until the
+        # block ends, secondary indexes of defer_indexes tables are dropped and
+        # rebuilt in one go afterwards. A crash mid-import can lose the import,
+        # WAL keeps the file itself intact. Previous pragma values are restored.
+        self.conn.commit()
+        prev_sync = self.conn.execute("PRAGMA synchronous").fetchone()[0]
+        prev_fk = self.conn.execute("PRAGMA foreign_keys").fetchone()[0]
+        self.conn.execute("PRAGMA synchronous = OFF")
+        self.conn.execute("PRAGMA foreign_keys = OFF")
+        dropped = self._drop_indexes(defer_indexes)
+        try:
+            yield self
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        finally:
+            self._rebuild_indexes(dropped)
+            self.conn.commit()
+            self.conn.execute("PRAGMA foreign_keys = %d" % prev_fk)
+            self.conn.execute("PRAGMA synchronous = %d" % prev_sync)
+
+    def _drop_indexes(self, tables):
+        if not tables:
+            return []
+        ph = ",".join("?" * len(tables))
+        idx = self.conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL AND tbl_name IN (%s)" % ph,
+            tuple(tables),
+        ).fetchall()
+        for name, _sql in idx:
+            self.conn.execute('DROP INDEX IF EXISTS "%s"' % name)
+        self.conn.commit()
+        return idx
+
+    def _rebuild_indexes(self, idx):
+        have = {r[0] for r in self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        for name, sql in idx:
+            if name not in have:
+                self.conn.execute(sql)
+
     def close(self):
         self.conn.close()
 
@@ -108,6 +108,19 @@ class EnrichmentQueryMixin:
     def get_apps_without_hltb(self):
         return self._apps_without("hltb_data")
 
+    def upsert_hltb_batch(self, rows):
+        # rows: (app_id, main_story, main_extras, completionist); None times
+        # mark the app as checked. Caller commits.
+        if not rows:
+            return 0
+        now = int(time.time())
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO hltb_data"
+            " (app_id, main_story, main_extras, completionist, last_updated) VALUES (?, ?, ?, ?, ?)",
+            [(aid, ms, mx, cp, now) for aid, ms, mx, cp in rows],
+        )
+        return len(rows)
+
     # hltb cache
 
     _HLTB_TTL = 30  # days
@@ -117,7 +130,7 @@ class EnrichmentQueryMixin:
         cur = self.conn.execute("SELECT steam_app_id, hltb_game_id FROM hltb_id_cache WHERE cached_at > ?", (cut,))
         return {r[0]: r[1] for r in cur.fetchall()}
 
-    def save_hltb_id_cache(self, maps):
+    def save_hltb_id_cache(self, maps, commit=True):
         if not maps:
             return 0
         now = int(time.time())
@@ -125,7 +138,8 @@ class EnrichmentQueryMixin:
         self.conn.executemany(
             "INSERT OR REPLACE INTO hltb_id_cache (steam_app_id, hltb_game_id, cached_at) VALUES (?, ?, ?)", rows
         )
-        self.conn.commit()
+        if commit:
+            self.conn.commit()
         return len(rows)
 
     def clear_expired_hltb_cache(self):
@@ -157,6 +171,12 @@ class EnrichmentQueryMixin:
             "last_updated": int(r[5]),
         }
 
+    def get_fresh_protondb_ids(self):
+        # app ids whose rating is still within the TTL
+        cut = int(time.time()) - (self._PDB_TTL * 86400)
+        cur = self.conn.execute("SELECT app_id FROM protondb_ratings WHERE last_updated > ?", (cut,))
+        return {r[0] for r in cur.fetchall()}
+
     def upsert_protondb(self, app_id, tier, confidence="", trending_tier="", score=0.0, best_reported=""):
         self.conn.execute(
             "INSERT OR REPLACE INTO protondb_ratings"
@@ -168,6 +188,32 @@ class EnrichmentQueryMixin:
     def get_apps_without_protondb(self):
         return self._apps_without("protondb_ratings")
 
+    # age ratings / store taxonomy (Steam API track)
+
+    def set_pegi_rating(self, app_id, rating):
+        self.conn.execute("UPDATE games SET pegi_rating = ? WHERE app_id = ?", (rating, app_id))
+
+    def upsert_age_ratings(self, app_id, ratings, source="api"):
+        # ratings: (system, value) pairs
+        now = int(time.time())
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO age_ratings (app_id, rating_system, rating_value, source, fetched_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [(app_id, system, str(value), source, now) for system, value in ratings],
+        )
+
+    def replace_genres(self, app_id, genres):
+        self.conn.execute("DELETE FROM game_genres WHERE app_id = ?", (app_id,))
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO game_genres (app_id, genre) VALUES (?, ?)", [(app_id, g) for g in genres]
+        )
+
+    def replace_tags(self, app_id, tags):
+        self.conn.execute("DELETE FROM game_tags WHERE app_id = ?", (app_id,))
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO game_tags (app_id, tag) VALUES (?, ?)", [(app_id, tg) for tg in tags]
+        )
+
     def get_apps_without_pegi(self):
         cur = self.conn.execute(
             "SELECT app_id, name FROM games"
@@ -243,11 +289,26 @@ class EnrichmentQueryMixin:
                 stats.games_imported,
                 stats.games_updated,
                 stats.games_failed,
-                t("logs.db.import_duration", duration="%.2f" % stats.duration_seconds),
+                self._import_notes(stats),
             ),
         )
         self.conn.commit()
 
+    @staticmethod
+    def _import_notes(stats):
+        dur = "%.2f" % stats.duration_seconds
+        if not stats.insert_seconds:
+            return t("logs.db.import_duration", duration=dur)
+
+        rate = stats.games_imported / stats.insert_seconds
+        return t(
+            "logs.db.import_timing",
+            duration=dur,
+            convert="%.2f" % stats.convert_seconds,
+            insert="%.2f" % stats.insert_seconds,
+            rate="%d" % rate,
+        )
+
     # data quality
 
     def repair_placeholder_names(self):
@@ -11,7 +11,9 @@ from __future__ import annotations
 import json
 import logging
 import sqlite3
+import time
 
+from steam_library_manager.core.db.game_queries import INSERT_GAME_SQL, INSERT_RELATED_SQL, game_row, related_rows
 from steam_library_manager.core.db.models import DatabaseEntry
 from steam_library_manager.utils.i18n import t
 
@@ -23,15 +25,44 @@ __all__ = ["GameBatchQueryMixin"]
 class GameBatchQueryMixin:
     """Batch queries for games."""
 
-    def batch_insert_games(self, ents):
-        ins = 0
+    def batch_insert_games(self, ents, commit=True):
+        # columnar bulk load: one executemany per table, per-row fallback on error
+        ents = list(ents)
+        if not ents:
+            return 0
+
+        now = int(time.time())
+        games = [game_row(e, now) for e in ents]
+        related = {tb: [] for tb in INSERT_RELATED_SQL}
         for e in ents:
-            try:
-                self.insert_game(e)
-                ins += 1
-            except sqlite3.Error as err:
-                logger.warning(t("logs.db.import_failed_app", app_id=e.app_id, error=str(err)))
-        self.conn.commit()
+            for tb, rows in related_rows(e).items():
+                related[tb].extend(rows)
+
+        # explicit BEGIN so releasing the savepoint doesn't commit
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN")
+        self.conn.execute("SAVEPOINT bulk_games")
+        try:
+            self.conn.executemany(INSERT_GAME_SQL, games)
+            for tb, rows in related.items():
+                if rows:
+                    self.conn.executemany(INSERT_RELATED_SQL[tb], rows)
+            self.conn.execute("RELEASE SAVEPOINT bulk_games")
+            ins = len(ents)
+        except sqlite3.Error:
+            # one bad row spoils the batch - redo it row by row to isolate it
+            self.conn.execute("ROLLBACK TO SAVEPOINT bulk_games")
+            self.conn.execute("RELEASE SAVEPOINT bulk_games")
+            ins = 0
+            for e in ents:
+                try:
+                    self.insert_game(e)
+                    ins += 1
+                except sqlite3.Error as err:
+                    logger.warning(t("logs.db.import_failed_app", app_id=e.app_id, error=str(err)))
+
+        if commit:
+            self.conn.commit()
         return ins
 
     def get_all_games(self, gtypes=None):
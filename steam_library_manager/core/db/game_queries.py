@@ -17,7 +17,88 @@ from steam_library_manager.core.db.models import DatabaseEntry, is_placeholder_n
 
 logger = logging.getLogger("steamlibmgr.database")
 
-__all__ = ["GameQueryMixin"]
+__all__ = ["GameQueryMixin", "INSERT_GAME_SQL", "INSERT_RELATED_SQL", "game_row", "related_rows"]
+
+INSERT_GAME_SQL = """
+    INSERT OR REPLACE INTO games (
+        app_id, name, sort_as, app_type,
+        developer, publisher,
+        original_release_date, steam_release_date, release_date,
+        review_score, review_percentage, review_count,
+        is_free, is_early_access,
+        vr_support, controller_support,
+        cloud_saves, workshop, trading_cards, achievements_total,
+        platforms,
+        pegi_rating, esrb_rating, metacritic_score,
+        steam_deck_status, short_description, content_descriptors,
+        is_modified, last_synced, last_updated,
+        created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def game_row(entry, now):
+    # DatabaseEntry -> parameter tuple for INSERT_GAME_SQL
+    return (
+        entry.app_id,
+        entry.name,
+        entry.sort_as,
+        entry.app_type,
+        entry.developer,
+        entry.publisher,
+        entry.original_release_date,
+        entry.steam_release_date,
+        entry.release_date,
+        entry.review_score,
+        entry.review_percentage,
+        entry.review_count,
+        entry.is_free,
+        entry.is_early_access,
+        entry.vr_support,
+        entry.controller_support,
+        entry.cloud_saves,
+        entry.workshop,
+        entry.trading_cards,
+        entry.achievements_total,
+        json.dumps(entry.platforms),
+        entry.pegi_rating,
+        entry.esrb_rating,
+        entry.metacritic_score,
+        entry.steam_deck_status,
+        entry.short_description,
+        entry.content_descriptors,
+        entry.is_modified,
+        entry.last_synced,
+        entry.last_updated,
+        now,
+        now,
+    )
+
+
+INSERT_RELATED_SQL = {
+    "game_genres": "INSERT OR REPLACE INTO game_genres (app_id, genre) VALUES (?, ?)",
+    "game_tags": "INSERT OR REPLACE INTO game_tags (app_id, tag) VALUES (?, ?)",
+    "game_franchises": "INSERT OR REPLACE INTO game_franchises (app_id, franchise) VALUES (?, ?)",
+    "game_languages": "INSERT OR REPLACE INTO game_languages"
+    " (app_id, language, interface, audio, subtitles) VALUES (?, ?, ?, ?, ?)",
+    "game_custom_meta": "INSERT OR REPLACE INTO game_custom_meta (app_id, key, value) VALUES (?, ?, ?)",
+}
+
+
+def related_rows(entry):
+    # table -> parameter rows for the multi-value tables
+    aid = entry.app_id
+    langs = entry.languages or {}
+    return {
+        "game_genres": [(aid, g) for g in entry.genres or ()],
+        "game_tags": [(aid, tag) for tag in entry.tags or ()],
+        "game_franchises": [(aid, f) for f in entry.franchises or ()],
+        "game_languages": [
+            (aid, lang, sup.get("interface", False), sup.get("audio", False), sup.get("subtitles", False))
+            for lang, sup in langs.items()
+        ],
+        "game_custom_meta": [(aid, k, v) for k, v in (entry.custom_meta or {}).items()],
+    }
 
 
 class GameQueryMixin:
@@ -27,58 +108,7 @@ class GameQueryMixin:
         # insert or replace game row
         now = int(time.time())
 
-        self.conn.execute(
-            """
-            INSERT OR REPLACE INTO games (
-                app_id, name, sort_as, app_type,
-                developer, publisher,
-                original_release_date, steam_release_date, release_date,
-                review_score, review_percentage, review_count,
-                is_free, is_early_access,
-                vr_support, controller_support,
-                cloud_saves, workshop, trading_cards, achievements_total,
-                platforms,
-                pegi_rating, esrb_rating, metacritic_score,
-                steam_deck_status, short_description, content_descriptors,
-                is_modified, last_synced, last_updated,
-                created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                entry.app_id,
-                entry.name,
-                entry.sort_as,
-                entry.app_type,
-                entry.developer,
-                entry.publisher,
-                entry.original_release_date,
-                entry.steam_release_date,
-                entry.release_date,
-                entry.review_score,
-                entry.review_percentage,
-                entry.review_count,
-                entry.is_free,
-                entry.is_early_access,
-                entry.vr_support,
-                entry.controller_support,
-                entry.cloud_saves,
-                entry.workshop,
-                entry.trading_cards,
-                entry.achievements_total,
-                json.dumps(entry.platforms),
-                entry.pegi_rating,
-                entry.esrb_rating,
-                entry.metacritic_score,
-                entry.steam_deck_status,
-                entry.short_description,
-                entry.content_descriptors,
-                entry.is_modified,
-                entry.last_synced,
-                entry.last_updated,
-                now,
-                now,
-            ),
-        )
+        self.conn.execute(INSERT_GAME_SQL, game_row(entry, now))
 
         self._insert_related_data(entry)
 
@@ -155,47 +185,53 @@ class GameQueryMixin:
         else:
             self.insert_game(entry)
 
-    def _insert_related_data(self, entry: DatabaseEntry) -> None:
+    def update_appinfo_fields(self, entry: DatabaseEntry) -> bool:
+        # refresh only what the appinfo importer derives, keep enrichment data
+        # returns False if the game was new and got inserted instead
+        cur = self.conn.execute("SELECT name FROM games WHERE app_id = ?", (entry.app_id,)).fetchone()
+        if not cur:
+            self.insert_game(entry)
+            return False
+
+        cur_name = cur["name"] or ""
+        ename = cur_name if is_placeholder_name(entry.name) and not is_placeholder_name(cur_name) else entry.name
+
+        self.conn.execute(
+            """
+            UPDATE games SET
+                name = ?, app_type = ?,
+                developer = COALESCE(?, developer), publisher = COALESCE(?, publisher),
+                release_date = COALESCE(?, release_date),
+                controller_support = ?, platforms = ?,
+                last_updated = ?, updated_at = ?
+            WHERE app_id = ?
+            """,
+            (
+                ename,
+                entry.app_type,
+                entry.developer,
+                entry.publisher,
+                entry.release_date,
+                entry.controller_support,
+                json.dumps(entry.platforms),
+                entry.last_updated,
+                int(time.time()),
+                entry.app_id,
+            ),
+        )
+
         if entry.genres:
+            self.conn.execute("DELETE FROM game_genres WHERE app_id = ?", (entry.app_id,))
             self.conn.executemany(
                 "INSERT OR REPLACE INTO game_genres (app_id, genre) VALUES (?, ?)",
                 [(entry.app_id, genre) for genre in entry.genres],
             )
-        if entry.tags:
-            self.conn.executemany(
-                "INSERT OR REPLACE INTO game_tags (app_id, tag) VALUES (?, ?)",
-                [(entry.app_id, tag) for tag in entry.tags],
-            )
-        if entry.franchises:
-            self.conn.executemany(
-                "INSERT OR REPLACE INTO game_franchises (app_id, franchise) VALUES (?, ?)",
-                [(entry.app_id, franchise) for franchise in entry.franchises],
-            )
-        if entry.languages:
-            rows = []
-            for lang, support in entry.languages.items():
-                rows.append(
-                    (
-                        entry.app_id,
-                        lang,
-                        support.get("interface", False),
-                        support.get("audio", False),
-                        support.get("subtitles", False),
-                    )
-                )
-            self.conn.executemany(
-                """
-                INSERT OR REPLACE INTO game_languages
-                (app_id, language, interface, audio, subtitles)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                rows,
-            )
-        if entry.custom_meta:
-            self.conn.executemany(
-                "INSERT OR REPLACE INTO game_custom_meta (app_id, key, value) VALUES (?, ?, ?)",
-                [(entry.app_id, key, value) for key, value in entry.custom_meta.items()],
-            )
+        return True
+
+    def _insert_related_data(self, entry: DatabaseEntry) -> None:
+        for table, rows in related_rows(entry).items():
+            if rows:
+                self.conn.executemany(INSERT_RELATED_SQL[table], rows)
 
     def get_game(self, app_id: int) -> DatabaseEntry | None:
         # load game with all related data
@@ -40,6 +40,9 @@ class ImportStats:
     games_failed: int
     duration_seconds: float
     source: str
+    # phase breakdown, 0.0 when not measured
+    convert_seconds: float = 0.0
+    insert_seconds: float = 0.0
 
 
 @dataclass
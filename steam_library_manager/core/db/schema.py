@@ -1,6 +1,6 @@
 #
 # steam_library_manager/core/db/schema.py
-# Schema creation and migration (v3 through v9)
+# Schema creation and migration (v3 through v10)
 #
 # Copyright © 2025-2026 SwitchBros
 # Licensed under the MIT License. See LICENSE for details.
@@ -24,7 +24,7 @@ class SchemaMixin:
     """Schema creation and migration logic.
 
     Creates schema from schema.sql on first run, then applies
-    migrations v3-v9 for existing databases. Each migration is
+    migrations v3-v10 for existing databases. Each migration is
     idempotent (IF NOT EXISTS, try/except for ALTER TABLE).
     """
 
@@ -93,6 +93,9 @@ class SchemaMixin:
         if frm < 9:
             self._m9()
             self._set_schema_version(9)
+        if frm < 10:
+            self._m10()
+            self._set_schema_version(10)
 
     # migrations
 
@@ -298,3 +301,21 @@ class SchemaMixin:
         """)
         self.conn.commit()
         logger.info("Migrated to v9")
+
+    def _m10(self):
+        # appinfo change index + sync state
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS appinfo_index (
+                app_id INTEGER PRIMARY KEY,
+                change_number INTEGER NOT NULL,
+                sha1 BLOB
+            );
+
+            CREATE TABLE IF NOT EXISTS sync_state (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                updated_at INTEGER NOT NULL
+            );
+        """)
+        self.conn.commit()
+        logger.info("Migrated to v10")
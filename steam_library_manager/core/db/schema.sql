@@ -581,6 +581,20 @@ CREATE TABLE IF NOT EXISTS import_history (
     notes TEXT
 );
 
+-- v10: per-app appinfo.vdf change numbers for incremental refresh
+CREATE TABLE IF NOT EXISTS appinfo_index (
+    app_id INTEGER PRIMARY KEY,
+    change_number INTEGER NOT NULL,
+    sha1 BLOB
+);
+
+-- v10: small key/value store for source file signatures etc.
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at INTEGER NOT NULL
+);
+
 -- ============================================================================
 -- INDEXES FOR PERFORMANCE
 -- ============================================================================
@@ -101,6 +101,20 @@ class SmartCollectionMixin:
         )
         return len(app_ids)
 
+    def update_smart_collection_games(self, collection_id, added, removed):
+        # Apply a membership diff without rewriting the whole collection
+        if removed:
+            self.conn.executemany(
+                "DELETE FROM collection_games WHERE collection_id = ? AND app_id = ?",
+                [(collection_id, aid) for aid in removed],
+            )
+        if added:
+            now = int(time.time())
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO collection_games (collection_id, app_id, added_at) VALUES (?, ?, ?)",
+                [(collection_id, aid, now) for aid in added],
+            )
+
     def get_smart_collection_games(self, collection_id):
         # All app_ids belonging to a smart collection
         cursor = self.conn.execute(
@@ -0,0 +1,278 @@
+#
+# steam_library_manager/core/db/write_service.py
+# Single writer thread that owns the write connection during parallel enrichment
+#
+# Copyright © 2025-2026 SwitchBros
+# Licensed under the MIT License. See LICENSE for details.
+#
+
+from __future__ import annotations
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger("steamlibmgr.database")
+
+__all__ = ["DatabaseWriter", "WRITE_METHODS", "WriteBatch", "WriterMetrics"]
+
+# Database methods a WriteBatch may call. None of them commit - the writer does.
+WRITE_METHODS = frozenset(
+    {
+        "replace_genres",
+        "replace_tags",
+        "save_hltb_id_cache",
+        "set_pegi_rating",
+        "upsert_achievement_stats",
+        "upsert_achievements",
+        "upsert_age_ratings",
+        "upsert_game_metadata",
+        "upsert_hltb_batch",
+        "upsert_languages",
+        "upsert_protondb",
+    }
+)
+
+
+@dataclass(frozen=True)
+class WriteBatch:
+    """One or more calls of a single Database write method.
+
+    calls holds (args, kwargs) pairs, applied in order inside one savepoint.
+    """
+
+    method: str
+    calls: tuple
+
+    def __post_init__(self):
+        if self.method not in WRITE_METHODS:
+            raise ValueError("not a DatabaseWriter method: %s" % self.method)
+
+
+@dataclass(frozen=True)
+class WriterMetrics:
+    """Snapshot of the writer's back-pressure and commit cost."""
+
+    queue_depth: int = 0
+    peak_queue_depth: int = 0
+    batches: int = 0
+    calls: int = 0
+    commits: int = 0
+    errors: int = 0
+    last_commit_ms: float = 0.0
+    avg_commit_ms: float = 0.0
+    max_commit_ms: float = 0.0
+
+
+class _Flush:
+    # queue marker: commit and wake the caller
+    __slots__ = ("done",)
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class DatabaseWriter:
+    """Serializes all writes of concurrent producers onto one connection.
+
+    Producers submit WriteBatch objects from any thread; the writer thread
+    applies them in arrival order and commits every max_calls calls or
+    max_delay seconds, whichever comes first. Readers keep their own
+    read-only connections (Database(path, read_only=True)).
+    """
+
+    def __init__(self, db_path, max_calls=500, max_delay=0.25):
+        self._db_path = db_path
+        self._max_calls = max_calls
+        self._max_delay = max_delay
+        self._q = queue.Queue()
+        self._thread = None
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+
+        # metrics, guarded by _lock
+        self._peak = 0
+        self._batches = 0
+        self._calls = 0
+        self._commits = 0
+        self._errors = 0
+        self._last_ms = 0.0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    # producer side
+
+    def start(self):
+        # opens the connection on the writer thread; returns once it is usable
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._loop, name="db-writer", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def submit(self, method, *args, **kwargs):
+        self.put(WriteBatch(method, ((args, kwargs),)))
+
+    def submit_many(self, method, rows):
+        # rows: argument tuples, one call each
+        if rows:
+            self.put(WriteBatch(method, tuple((tuple(r), {}) for r in rows)))
+
+    def put(self, batch):
+        if self._thread is None:
+            raise RuntimeError("DatabaseWriter is not running")
+        self._q.put(batch)
+        depth = self._q.qsize()
+        with self._lock:
+            if depth > self._peak:
+                self._peak = depth
+
+    def flush(self, timeout=None):
+        # wait until everything submitted so far is committed
+        if self._thread is None:
+            return True
+        marker = _Flush()
+        self._q.put(marker)
+        return marker.done.wait(timeout)
+
+    def stop(self, timeout=None):
+        # commit what is queued and end the thread
+        if self._thread is None:
+            return
+        self._q.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def metrics(self):
+        with self._lock:
+            return WriterMetrics(
+                queue_depth=self._q.qsize(),
+                peak_queue_depth=self._peak,
+                batches=self._batches,
+                calls=self._calls,
+                commits=self._commits,
+                errors=self._errors,
+                last_commit_ms=self._last_ms,
+                avg_commit_ms=self._total_ms / self._commits if self._commits else 0.0,
+                max_commit_ms=self._max_ms,
+            )
+
+    # writer thread
+
+    def _loop(self):
+        from steam_library_manager.core.database import Database
+
+        try:
+            db = Database(self._db_path)
+        except Exception as exc:
+            logger.error("Database writer could not open %s: %s", self._db_path, exc)
+            self._thread = None
+            self._ready.set()
+            return
+        self._ready.set()
+
+        pending = 0
+        since = 0.0
+        try:
+            while True:
+                wait = None
+                if pending:
+                    wait = max(0.0, self._max_delay - (time.monotonic() - since))
+                try:
+                    item = self._q.get(timeout=wait)
+                except queue.Empty:
+                    self._commit(db)
+                    pending = 0
+                    continue
+
+                if item is _STOP:
+                    break
+                if isinstance(item, _Flush):
+                    if pending:
+                        self._commit(db)
+                        pending = 0
+                    item.done.set()
+                    continue
+
+                if not pending:
+                    since = time.monotonic()
+                pending += self._apply(db, item)
+                if pending >= self._max_calls:
+                    self._commit(db)
+                    pending = 0
+        finally:
+            if pending:
+                self._commit(db)
+            db.close()
+            # wake anyone still waiting on a flush
+            while not self._q.empty():
+                item = self._q.get_nowait()
+                if isinstance(item, _Flush):
+                    item.done.set()
+
+    def _apply(self, db, batch):
+        # whole batch in one savepoint; on error redo call by call to isolate it
+        fn = getattr(db, batch.method)
+        if not db.conn.in_transaction:
+            db.conn.execute("BEGIN")
+        db.conn.execute("SAVEPOINT write_batch")
+        try:
+            for args, kwargs in batch.calls:
+                fn(*args, **kwargs)
+            db.conn.execute("RELEASE SAVEPOINT write_batch")
+            failed = 0
+        except sqlite3.Error as exc:
+            db.conn.execute("ROLLBACK TO SAVEPOINT write_batch")
+            db.conn.execute("RELEASE SAVEPOINT write_batch")
+            if len(batch.calls) == 1:
+                logger.warning("Database writer: %s failed: %s", batch.method, exc)
+                failed = 1
+            else:
+                failed = self._apply_each(db, fn, batch)
+
+        with self._lock:
+            self._batches += 1
+            self._calls += len(batch.calls)
+            self._errors += failed
+        return len(batch.calls)
+
+    @staticmethod
+    def _apply_each(db, fn, batch):
+        failed = 0
+        for args, kwargs in batch.calls:
+            db.conn.execute("SAVEPOINT write_call")
+            try:
+                fn(*args, **kwargs)
+                db.conn.execute("RELEASE SAVEPOINT write_call")
+            except sqlite3.Error as exc:
+                db.conn.execute("ROLLBACK TO SAVEPOINT write_call")
+                db.conn.execute("RELEASE SAVEPOINT write_call")
+                logger.warning("Database writer: %s%r failed: %s", batch.method, args, exc)
+                failed += 1
+        return failed
+
+    def _commit(self, db):
+        t0 = time.perf_counter()
+        try:
+            db.commit()
+        except sqlite3.Error as exc:
+            logger.warning("Database writer commit failed: %s", exc)
+            with self._lock:
+                self._errors += 1
+            return
+        ms = (time.perf_counter() - t0) * 1000.0
+        with self._lock:
+            self._commits += 1
+            self._last_ms = ms
+            self._total_ms += ms
+            self._max_ms = max(self._max_ms, ms)
@@ -10,15 +10,19 @@ from __future__ import annotations
 
 import logging
 import platform
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 
 from steam_library_manager.core.database import is_placeholder_name
 from steam_library_manager.core.game import Game, NON_GAME_APP_IDS, NON_GAME_NAME_PATTERNS
+from steam_library_manager.services.game_change_log import GameChangeLog
 from steam_library_manager.services.game_detail_service import GameDetailService
 from steam_library_manager.services.game_query_service import GameQueryService
 from steam_library_manager.services.enrichment.metadata_enrichment_service import MetadataEnrichmentService
+from steam_library_manager.utils.http_client import http
 from steam_library_manager.utils.i18n import t
+from steam_library_manager.utils.profiler import span
 from steam_library_manager.utils.timeouts import HTTP_TIMEOUT
 
 logger = logging.getLogger("steamlibmgr.game_manager")
@@ -54,12 +58,14 @@ class GameManager:
         self.detail_svc = GameDetailService(self.games, cache_dir)
         self.enrich_svc = MetadataEnrichmentService(self.games, cache_dir)
         self.query_svc = GameQueryService(self.games, self.filter_non_games)
+        self.changes = GameChangeLog()  # field edits since the last smart collection refresh
 
     def load_games(self, steam_user_id, progress_callback=None):
         """Load games from API and/or local files.
 
-        Tries API first if credentials exist, fallback to local.
-        Shows progress via callback if provided.
+        The GetOwnedGames request runs on a helper thread while the local
+        manifests are read; API games are added first either way, so the
+        result is the same as loading one after the other.
 
         Args:
             steam_user_id: Steam ID to load for
@@ -69,23 +75,32 @@ class GameManager:
             bool: True if loaded, False if complete fail
         """
         self.steam_user_id = steam_user_id
-        api_ok = False
 
         from steam_library_manager.config import config as _cfg
 
+        api_fut = None
         has_creds = self.api_key or getattr(_cfg, "STEAM_ACCESS_TOKEN", None)
         if has_creds:
             if progress_callback:
                 progress_callback(t("logs.manager.api_trying"), 0, 3)
 
             logger.info(t("logs.manager.api_trying"))
-            api_ok = self._load_api(steam_user_id)
+            pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="owned-games")
+            api_fut = pool.submit(self._fetch_api, steam_user_id)
+            pool.shutdown(wait=False)
 
         if progress_callback:
             progress_callback(t("logs.manager.local_loading"), 1, 3)
 
         logger.info(t("logs.manager.local_loading"))
-        local_ok = self._load_local(progress_callback)
+        local = self._read_local()
+
+        api_ok = False
+        if api_fut is not None:
+            api_games = api_fut.result()
+            api_ok = api_games is not None and self._add_api_games(api_games)
+
+        local_ok = local is not None and self._add_local_games(*local, progress_cb=progress_callback)
 
         if progress_callback:
             progress_callback(t("common.loading"), 2, 3)
@@ -101,6 +116,8 @@ class GameManager:
             self.load_source = "failed"
             return False
 
+        self.query_svc.invalidate()
+
         if progress_callback:
             progress_callback(t("ui.main_window.status_ready"), 3, 3)
 
@@ -108,6 +125,11 @@ class GameManager:
 
     def _load_local(self, progress_cb=None):
         # grab installed games from local steam manifests
+        local = self._read_local()
+        return local is not None and self._add_local_games(*local, progress_cb=progress_cb)
+
+    def _read_local(self):
+        # manifests + localconfig playtimes, None if nothing usable
         from steam_library_manager.core.local_games_loader import LocalGamesLoader
 
         try:
@@ -116,7 +138,7 @@ class GameManager:
 
             if not games_data:
                 logger.warning(t("logs.manager.error_local", error="No local games found"))
-                return False
+                return None
 
             # get playtime from localconfig
             from steam_library_manager.config import config
@@ -128,6 +150,14 @@ class GameManager:
             else:
                 playtimes = {}
 
+            return games_data, playtimes
+
+        except (OSError, ValueError, KeyError, RecursionError) as e:
+            logger.error(t("logs.manager.error_local", error=e))
+            return None
+
+    def _add_local_games(self, games_data, playtimes, progress_cb=None):
+        try:
             total = len(games_data)
             for i, gd in enumerate(games_data):
                 if progress_cb and i % 50 == 0:
@@ -144,19 +174,35 @@ class GameManager:
             logger.info(t("logs.manager.loaded_local", count=len(games_data)))
             return True
 
-        except (OSError, ValueError, KeyError, RecursionError) as e:
+        except (ValueError, KeyError) as e:
             logger.error(t("logs.manager.error_local", error=e))
             return False
 
     def _load_api(self, steam_uid):
-        # fetch from steam web api (oauth first, api key fallback)
+        games_list = self._fetch_api(steam_uid)
+        return games_list is not None and self._add_api_games(games_list)
+
+    def _add_api_games(self, games_list):
+        try:
+            for gd in games_list:
+                aid = str(gd["appid"])
+                name = gd.get("name") or t("ui.game_details.game_fallback", id=aid)
+                game = Game(app_id=aid, name=name, playtime_minutes=gd.get("playtime_forever", 0))
+                self.games[aid] = game
+            return True
+        except (KeyError, TypeError, AttributeError) as e:
+            logger.error(t("logs.manager.error_api", error=type(e).__name__))
+            return False
+
+    def _fetch_api(self, steam_uid):
+        # fetch from steam web api (oauth first, api key fallback), None on failure
         from steam_library_manager.config import config
 
         token = getattr(config, "STEAM_ACCESS_TOKEN", None)
 
         if not self.api_key and not token:
             logger.info(t("logs.manager.no_api_key"))
-            return False
+            return None
 
         url = "https://api.steampowered.com/IPlayerService/GetOwnedGames/v1/"
         base_params = {
@@ -183,7 +229,7 @@ class GameManager:
                     logger.info(t("logs.manager.using_api_key"))
 
                 params = {**base_params, **auth_params}
-                resp = requests.get(url, params=params, timeout=HTTP_TIMEOUT)
+                resp = http.get(url, params=params, timeout=HTTP_TIMEOUT)
                 resp.raise_for_status()
                 data = resp.json()
 
@@ -192,18 +238,11 @@ class GameManager:
                         logger.info("OAuth returned empty, trying API key")
                         continue
                     logger.warning(t("logs.manager.error_api", error="No games in response"))
-                    return False
+                    return None
 
                 games_list = data["response"]["games"]
                 logger.info(t("logs.manager.loaded_api", count=len(games_list)))
-
-                for gd in games_list:
-                    aid = str(gd["appid"])
-                    name = gd.get("name") or t("ui.game_details.game_fallback", id=aid)
-                    game = Game(app_id=aid, name=name, playtime_minutes=gd.get("playtime_forever", 0))
-                    self.games[aid] = game
-
-                return True
+                return games_list
 
             except (requests.RequestException, ValueError, KeyError) as e:
                 if isinstance(e, requests.HTTPError) and e.response is not None:
@@ -217,31 +256,38 @@ class GameManager:
                     logger.info("OAuth failed, trying API key fallback")
                     continue
 
-                return False
+                return None
 
-        return False
+        return None
 
-    # wrapper for enrich service
+    # wrapper for enrich service - all of these rewrite games in bulk,
+    # so the category index is rebuilt on the next query
     def merge_with_localconfig(self, parser):
         self.enrich_svc.merge_with_localconfig(parser)
+        self.query_svc.invalidate()
 
     def apply_appinfo_data(self, appinfo_data):
         self.enrich_svc.apply_appinfo_data(appinfo_data)
+        self.query_svc.invalidate()
 
     def apply_metadata_overrides(self, appinfo_mgr):
         self.appinfo_manager = appinfo_mgr
         self.enrich_svc.apply_metadata_overrides(appinfo_mgr)
+        self.query_svc.invalidate()
 
     def discover_missing_games(self, localconfig_helper, appinfo_manager, packageinfo_ids=None, *, db_type_lookup=None):
-        return self.enrich_svc.discover_missing_games(
+        found = self.enrich_svc.discover_missing_games(
             localconfig_helper,
             appinfo_manager,
             packageinfo_ids,
             db_type_lookup=db_type_lookup,
         )
+        self.query_svc.invalidate()
+        return found
 
     def apply_custom_overrides(self, mods):
         self.enrich_svc.apply_custom_overrides(mods)
+        self.query_svc.invalidate()
 
     def enrich_from_database(self, db):
         """Fill in cached metadata from DB.
@@ -255,6 +301,12 @@ class GameManager:
         Returns:
             int: Number of games enriched
         """
+        with span("enrich_from_database") as sp:
+            n = self._enrich_from_database(db)
+            sp.count = n
+        return n
+
+    def _enrich_from_database(self, db):
         entries = db.get_all_games()
         if not entries:
             return 0
@@ -345,6 +397,7 @@ class GameManager:
             if g and not g.proton_db_rating:
                 g.proton_db_rating = tier
 
+        self.query_svc.invalidate()
         logger.info(t("logs.db.loaded_from_cache", count=enriched, duration="<1"))
         return enriched
 
@@ -0,0 +1,131 @@
+#
+# steam_library_manager/core/library_snapshot.py
+# On-disk snapshot of the fully prepared game library for warm starts
+#
+# Copyright © 2025-2026 SwitchBros
+# Licensed under the MIT License. See LICENSE for details.
+#
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, fields
+from datetime import datetime
+from pathlib import Path
+
+from steam_library_manager.core.game import Game
+
+logger = logging.getLogger("steamlibmgr.library_snapshot")
+
+__all__ = ["LibrarySnapshot", "source_stamps"]
+
+_GAME_FIELDS = frozenset(f.name for f in fields(Game))
+
+
+def source_stamps(paths: dict[str, Path | str | None]) -> dict[str, list[int] | None]:
+    """Returns [mtime_ns, size] per source file, None for missing ones.
+
+    Args:
+        paths: Mapping of a stable source name to its file path.
+
+    Returns:
+        Mapping of the same names to their stamps.
+    """
+    out: dict[str, list[int] | None] = {}
+    for name, path in paths.items():
+        try:
+            st = Path(path).stat() if path else None
+        except (OSError, TypeError):
+            st = None
+        out[name] = [st.st_mtime_ns, st.st_size] if st else None
+    return out
+
+
+class LibrarySnapshot:
+    """The prepared GameManager.games state, keyed by its source files.
+
+    Written after every full load. While none of the source files
+    (localconfig.vdf, cloud storage, packageinfo.vdf, licensecache,
+    custom_metadata.json) changed, the next launch can show the library
+    from the snapshot and run the slow pipeline in the background.
+    """
+
+    _VERSION = 1
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initializes the snapshot.
+
+        Args:
+            cache_dir: Directory holding library_snapshot.json.
+        """
+        self.path = Path(cache_dir) / "library_snapshot.json"
+
+    def load(self, user_id: str, stamps: dict) -> tuple[dict[str, Game], str] | None:
+        """Returns the stored games if the snapshot matches user and stamps.
+
+        Args:
+            user_id: The Steam user the library was loaded for.
+            stamps: Current source_stamps() of the source files.
+
+        Returns:
+            Tuple of (games by app ID, load source), or None if stale/unusable.
+        """
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self._VERSION or data.get("user") != str(user_id):
+                return None
+            if data.get("stamps") != stamps:
+                return None
+            games = {}
+            for row in data["games"]:
+                g = self._game_from_json(row)
+                games[g.app_id] = g
+            return games, data.get("source", "snapshot")
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.debug("library snapshot unusable: %s", exc)
+            return None
+
+    def save(self, user_id: str, stamps: dict, games: dict[str, Game], source: str) -> None:
+        """Writes the games to disk atomically.
+
+        Args:
+            user_id: The Steam user the library was loaded for.
+            stamps: source_stamps() taken before the load started.
+            games: GameManager.games after the full pipeline.
+            source: GameManager.load_source.
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            payload = {
+                "version": self._VERSION,
+                "user": str(user_id),
+                "stamps": stamps,
+                "source": source,
+                "games": [self._game_to_json(g) for g in games.values()],
+            }
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            tmp.replace(self.path)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.debug("library snapshot not written: %s", exc)
+
+    @staticmethod
+    def _game_to_json(game: Game) -> dict:
+        row = asdict(game)
+        # transient, recomputed on selection
+        row.pop("curator_overlap", None)
+        if game.last_played is not None:
+            row["last_played"] = game.last_played.isoformat()
+        return row
+
+    @staticmethod
+    def _game_from_json(row: dict) -> Game:
+        kw = {k: v for k, v in row.items() if k in _GAME_FIELDS}
+        if kw.get("last_played"):
+            kw["last_played"] = datetime.fromisoformat(kw["last_played"])
+        return Game(**kw)
@@ -8,69 +8,123 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import struct
+from collections.abc import Iterator
 from pathlib import Path
 
+from steam_library_manager.core.vdf_parser import binary_decode
 from steam_library_manager.utils.i18n import t
 
 logger = logging.getLogger("steamlibmgr.packageinfo")
 
-__all__ = ["PackageInfoParser"]
+__all__ = ["PackageIndex", "PackageInfoParser"]
 
+_U32 = struct.Struct("<I")
 
-class PackageInfoParser:
-    """Extracts owned app IDs from Steam's binary packageinfo.vdf."""
 
-    def __init__(self, steam_path: Path) -> None:
-        """Initializes the parser.
+class PackageIndex:
+    """packageinfo.vdf reduced to package -> app ids, with the reverse map.
+
+    Built in one pass over the file; ownership queries are set lookups.
+    """
+
+    def __init__(self, packages: dict[int, tuple[int, ...]]) -> None:
+        """Initializes the index.
 
         Args:
-            steam_path: Path to the Steam installation directory.
+            packages: Mapping of package ID to the app IDs it grants.
         """
-        self._path = steam_path / "appcache" / "packageinfo.vdf"
+        self._packages = packages
+        self._by_app: dict[int, list[int]] | None = None
 
-    def get_all_app_ids(self) -> set[str]:
-        """Parses packageinfo.vdf and returns all app IDs from all packages.
+    def __len__(self) -> int:
+        return len(self._packages)
+
+    def app_ids(self) -> set[str]:
+        """Returns every app ID granted by any package.
 
         Returns:
-            Set of app ID strings found across all packages.
+            Set of app ID strings.
         """
-        if not self._path.exists():
-            logger.warning(t("logs.manager.packageinfo_not_found"))
-            return set()
+        return {str(aid) for aids in self._packages.values() for aid in aids}
 
-        app_ids: set[str] = set()
+    def app_ids_for_packages(self, package_ids: set[int]) -> set[str]:
+        """Returns the app IDs granted by the given packages.
 
+        Args:
+            package_ids: Package IDs, e.g. the owned ones from licensecache.
+
+        Returns:
+            Set of app ID strings.
+        """
+        pk = self._packages
+        return {str(aid) for pid in package_ids for aid in pk.get(pid, ())}
+
+    def packages_for_app(self, app_id: int | str) -> list[int]:
+        """Returns the packages (licenses) that grant an app.
+
+        Args:
+            app_id: The app ID.
+
+        Returns:
+            Sorted list of package IDs, empty if none grants it.
+        """
+        if self._by_app is None:
+            rev: dict[int, list[int]] = {}
+            for pid, aids in self._packages.items():
+                for aid in aids:
+                    rev.setdefault(aid, []).append(pid)
+            self._by_app = rev
         try:
-            with open(self._path, "rb") as f:
-                # Header: version (4 bytes) + universe (4 bytes)
-                f.read(8)
+            return sorted(self._by_app.get(int(app_id), ()))
+        except ValueError:
+            return []
 
-                while True:
-                    pkg_id_bytes = f.read(4)
-                    if len(pkg_id_bytes) < 4:
-                        break
-                    pkg_id = struct.unpack("<I", pkg_id_bytes)[0]
+    def to_json(self) -> dict:
+        """Serializes the forward map for the on-disk cache."""
+        return {str(pid): list(aids) for pid, aids in self._packages.items()}
 
-                    # End-of-file marker
-                    if pkg_id == 0xFFFFFFFF:
-                        break
+    @classmethod
+    def from_json(cls, data: dict) -> PackageIndex:
+        """Rebuilds an index written by to_json()."""
+        return cls({int(pid): tuple(aids) for pid, aids in data.items()})
 
-                    # SHA1 hash (20) + change number (4) + token (8)
-                    f.read(32)
 
-                    data = self._read_binary_vdf(f)
+class PackageInfoParser:
+    """Extracts owned app IDs from Steam's binary packageinfo.vdf.
 
-                    # Package data is wrapped in one outer key
-                    inner = next(iter(data.values()), data) if data else {}
-                    for val in inner.get("appids", {}).values():
-                        app_ids.add(str(val))
+    The file is parsed once into a PackageIndex. With a cache_dir the index
+    is also stored on disk, keyed by the file's mtime and size, so later
+    launches skip parsing until Steam rewrites the file.
+    """
 
-        except (OSError, struct.error) as exc:
-            logger.error("packageinfo.vdf parse error: %s", exc)
+    _CACHE_VERSION = 1
+
+    def __init__(self, steam_path: Path, cache_dir: Path | None = None) -> None:
+        """Initializes the parser.
+
+        Args:
+            steam_path: Path to the Steam installation directory.
+            cache_dir: Directory for the index cache, None to disable it.
+        """
+        self._path = steam_path / "appcache" / "packageinfo.vdf"
+        self._cache = cache_dir / "packageinfo_index.json" if cache_dir else None
+        self._index: PackageIndex | None = None
+        self._stamp: list[int] | None = None
 
-        return app_ids
+    def get_all_app_ids(self) -> set[str]:
+        """Returns all app IDs from all packages.
+
+        Returns:
+            Set of app ID strings found across all packages.
+        """
+        if not self._path.exists():
+            logger.warning(t("logs.manager.packageinfo_not_found"))
+            return set()
+
+        return self.index().app_ids()
 
     def get_app_ids_for_packages(self, owned_packages: set[int]) -> set[str]:
         """Returns AppIDs only from packages the user actually owns.
@@ -92,89 +146,112 @@ class PackageInfoParser:
         if not owned_packages:
             return set()
 
-        app_ids: set[str] = set()
+        return self.index().app_ids_for_packages(owned_packages)
 
-        try:
-            with open(self._path, "rb") as f:
-                # Header: version (4 bytes) + universe (4 bytes)
-                f.read(8)
+    def get_packages_for_app(self, app_id: int | str) -> list[int]:
+        """Returns the packages that grant an app ("which license gave me this").
 
-                while True:
-                    pkg_id_bytes = f.read(4)
-                    if len(pkg_id_bytes) < 4:
-                        break
-                    pkg_id = struct.unpack("<I", pkg_id_bytes)[0]
-
-                    if pkg_id == 0xFFFFFFFF:
-                        break
-
-                    # SHA1 hash (20) + change number (4) + token (8)
-                    f.read(32)
+        Args:
+            app_id: The app ID.
 
-                    data = self._read_binary_vdf(f)
+        Returns:
+            Sorted list of package IDs.
+        """
+        if not self._path.exists():
+            return []
+        return self.index().packages_for_app(app_id)
 
-                    # Only process packages the user owns
-                    if pkg_id in owned_packages:
-                        inner = next(iter(data.values()), data) if data else {}
-                        for val in inner.get("appids", {}).values():
-                            app_ids.add(str(val))
+    def index(self) -> PackageIndex:
+        """Returns the package index, from memory, the disk cache or a fresh parse.
 
-        except (OSError, struct.error) as exc:
+        Returns:
+            The PackageIndex for the current packageinfo.vdf.
+        """
+        try:
+            st = self._path.stat()
+            stamp = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            return PackageIndex({})
+
+        # a stat per call, so a file rewritten by Steam is picked up
+        if self._index is not None and stamp == self._stamp:
+            return self._index
+
+        index = self._load_cache(stamp)
+        if index is None:
+            index, complete = self._build()
+            if complete:
+                self._save_cache(stamp, index)
+        self._index, self._stamp = index, stamp
+        return index
+
+    def _build(self) -> tuple[PackageIndex, bool]:
+        # one pass over the file; a parse error keeps what was read so far
+        packages: dict[int, tuple[int, ...]] = {}
+        try:
+            for pkg_id, data in self._iter_packages():
+                # Package data is wrapped in one outer key
+                inner = next(iter(data.values()), data) if data else {}
+                appids = inner.get("appids", {}) if isinstance(inner, dict) else {}
+                packages[pkg_id] = tuple(v for v in appids.values() if isinstance(v, int))
+        except (OSError, ValueError, struct.error) as exc:
             logger.error("packageinfo.vdf parse error: %s", exc)
+            return PackageIndex(packages), False
+        return PackageIndex(packages), True
 
-        return app_ids
+    def _load_cache(self, stamp: list[int]) -> PackageIndex | None:
+        if not self._cache or not self._cache.exists():
+            return None
+        try:
+            with open(self._cache, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self._CACHE_VERSION or data.get("stamp") != stamp:
+                return None
+            return PackageIndex.from_json(data["packages"])
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.debug("packageinfo index cache unusable: %s", exc)
+            return None
+
+    def _save_cache(self, stamp: list[int], index: PackageIndex) -> None:
+        if not self._cache:
+            return
+        try:
+            self._cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._cache.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": self._CACHE_VERSION, "stamp": stamp, "packages": index.to_json()}, f)
+            tmp.replace(self._cache)
+        except OSError as exc:
+            logger.debug("packageinfo index cache not written: %s", exc)
 
     # ------------------------------------------------------------------
-    # Binary VDF reader (minimal, read-only)
+    # Package records
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _read_binary_vdf(f, depth: int = 0, max_depth: int = 5) -> dict:
-        """Reads a single binary VDF object from the file stream.
+    def _iter_packages(self) -> Iterator[tuple[int, dict]]:
+        """Yields (package_id, data) for every record in packageinfo.vdf.
 
-        Args:
-            f: Open binary file handle positioned at the start of an object.
-            depth: Current nesting depth (for recursion guard).
-            max_depth: Maximum allowed nesting depth.
+        The file is read once into memory and decoded with the shared
+        buffer-based binary VDF decoder.
 
-        Returns:
-            Parsed dictionary of key-value pairs.
+        Yields:
+            Tuples of package ID and its parsed key-value data.
         """
-        result: dict = {}
-        while True:
-            type_byte = f.read(1)
-            if not type_byte or type_byte == b"\x08":
-                break
+        buf = self._path.read_bytes()
+        n = len(buf)
+
+        # Header: version (4 bytes) + universe (4 bytes)
+        pos = 8
+        while pos + 4 <= n:
+            pkg_id = _U32.unpack_from(buf, pos)[0]
+            pos += 4
 
-            vdf_type = type_byte[0]
-
-            # Read null-terminated key name
-            key_parts: list[bytes] = []
-            while True:
-                c = f.read(1)
-                if not c or c == b"\x00":
-                    break
-                key_parts.append(c)
-            key_str = b"".join(key_parts).decode("utf-8", errors="replace")
-
-            if vdf_type == 0x00:  # sub-object
-                if depth < max_depth:
-                    result[key_str] = PackageInfoParser._read_binary_vdf(f, depth + 1, max_depth)
-                else:
-                    result[key_str] = {}
-            elif vdf_type == 0x01:  # string
-                val_parts: list[bytes] = []
-                while True:
-                    c = f.read(1)
-                    if not c or c == b"\x00":
-                        break
-                    val_parts.append(c)
-                result[key_str] = b"".join(val_parts).decode("utf-8", errors="replace")
-            elif vdf_type == 0x02:  # uint32
-                result[key_str] = struct.unpack("<I", f.read(4))[0]
-            elif vdf_type == 0x07:  # uint64
-                result[key_str] = struct.unpack("<Q", f.read(8))[0]
-            else:
+            # End-of-file marker
+            if pkg_id == 0xFFFFFFFF:
                 break
 
-        return result
+            # SHA1 hash (20) + change number (4) + token (8)
+            pos += 32
+
+            data, pos = binary_decode(buf, pos)
+            yield pkg_id, data
@@ -0,0 +1,335 @@
+#
+# steam_library_manager/core/response_cache.py
+# SQLite cache for store/API responses, replacing per-app JSON files
+#
+# Copyright © 2025-2026 SwitchBros
+# Licensed under the MIT License. See LICENSE for details.
+#
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("steamlibmgr.response_cache")
+
+__all__ = ["KIND_TTL", "ResponseCache", "response_cache"]
+
+DAY = 86400.0
+
+# default time-to-live per kind of cached response, in seconds
+KIND_TTL: dict[str, float] = {
+    "store": 7 * DAY,  # appdetails data
+    "reviews": 1 * DAY,
+    "news": 1 * DAY,
+    "deck": 7 * DAY,
+    "hltb": 7 * DAY,
+    "achievements": 7 * DAY,
+    "tags": 30 * DAY,  # key: "<app_id>_<language>"
+    "age_rating": 30 * DAY,
+}
+
+# legacy files: <dir>/<app_id>[_<suffix>].json -> kind
+_LEGACY_SUFFIX = {
+    "": "store",
+    "reviews": "reviews",
+    "news": "news",
+    "deck": "deck",
+    "hltb": "hltb",
+    "achievements": "achievements",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS response_cache (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    ttl REAL NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (kind, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_response_cache_expiry ON response_cache (fetched_at + ttl);
+"""
+
+# PRAGMA user_version: 1 = schema created, 2 = legacy JSON files imported
+_VERSION = 2
+
+# stay below SQLite's default host-parameter limit
+_CHUNK = 500
+
+# evictions that make a VACUUM worth it
+_VACUUM_AFTER = 1000
+
+
+def _pack(obj: Any) -> bytes:
+    return zlib.compress(json.dumps(obj, separators=(",", ":")).encode("utf-8"))
+
+
+def _unpack(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+class ResponseCache:
+    """One SQLite file holding every cached store/API response.
+
+    Rows are keyed by (kind, key) and carry fetched_at plus their own TTL,
+    so lookups are one indexed query instead of a stat() + open() +
+    json.load() per file. Each thread gets its own connection; WAL mode
+    lets enrichment workers write while the UI reads.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initializes the cache.
+
+        Args:
+            path: SQLite file, created on first use.
+        """
+        self.path = Path(path)
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._ready = False
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        if not self._ready:
+            with self._init_lock:
+                if not self._ready:
+                    self._migrate(conn)
+                    self._ready = True
+        return conn
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            conn.executescript(_SCHEMA)
+            conn.execute("PRAGMA user_version = 1")
+        if version < 2:
+            n = self._import_legacy(conn, self.path.parent)
+            conn.execute("PRAGMA user_version = %d" % _VERSION)
+            if n:
+                logger.info("imported %d cached responses from JSON files" % n)
+
+    # lookups
+
+    def get(self, kind: str, key: str | int) -> Any | None:
+        """Returns the cached payload, or None if missing or expired.
+
+        Args:
+            kind: Response kind, see KIND_TTL.
+            key: Usually the app ID.
+
+        Returns:
+            The decoded JSON payload or None.
+        """
+        try:
+            row = (
+                self._conn()
+                .execute(
+                    "SELECT payload FROM response_cache WHERE kind = ? AND key = ? AND fetched_at + ttl > ?",
+                    (kind, str(key), time.time()),
+                )
+                .fetchone()
+            )
+            return _unpack(row[0]) if row else None
+        except (sqlite3.Error, OSError, zlib.error, ValueError) as exc:
+            logger.debug("response cache read failed: %s", exc)
+            return None
+
+    def get_many(self, kind: str, keys) -> dict[str, Any]:
+        """Returns the fresh payloads for many keys in a few queries.
+
+        Args:
+            kind: Response kind.
+            keys: Iterable of keys.
+
+        Returns:
+            Dict of key (as str) -> payload, for the keys that were cached.
+        """
+        keys = [str(k) for k in keys]
+        out: dict[str, Any] = {}
+        now = time.time()
+        try:
+            conn = self._conn()
+            for i in range(0, len(keys), _CHUNK):
+                chunk = keys[i : i + _CHUNK]
+                rows = conn.execute(
+                    "SELECT key, payload FROM response_cache WHERE kind = ? AND fetched_at + ttl > ?"
+                    " AND key IN (%s)" % ",".join("?" * len(chunk)),
+                    (kind, now, *chunk),
+                )
+                for key, blob in rows:
+                    try:
+                        out[key] = _unpack(blob)
+                    except (zlib.error, ValueError):
+                        continue
+        except (sqlite3.Error, OSError) as exc:
+            logger.debug("response cache batch read failed: %s", exc)
+        return out
+
+    def fresh_keys(self, kind: str, keys) -> set[str]:
+        """Returns which of the keys have a fresh entry, without decoding them."""
+        keys = [str(k) for k in keys]
+        found: set[str] = set()
+        now = time.time()
+        try:
+            conn = self._conn()
+            for i in range(0, len(keys), _CHUNK):
+                chunk = keys[i : i + _CHUNK]
+                rows = conn.execute(
+                    "SELECT key FROM response_cache WHERE kind = ? AND fetched_at + ttl > ?"
+                    " AND key IN (%s)" % ",".join("?" * len(chunk)),
+                    (kind, now, *chunk),
+                )
+                found.update(r[0] for r in rows)
+        except (sqlite3.Error, OSError) as exc:
+            logger.debug("response cache batch read failed: %s", exc)
+        return found
+
+    # writes
+
+    def put(self, kind: str, key: str | int, payload: Any, ttl: float | None = None) -> None:
+        """Stores a payload, replacing an older entry.
+
+        Args:
+            kind: Response kind.
+            key: Usually the app ID.
+            payload: JSON-serializable data.
+            ttl: Seconds until stale, defaults to KIND_TTL[kind].
+        """
+        if ttl is None:
+            ttl = KIND_TTL.get(kind, DAY)
+        try:
+            self._conn().execute(
+                "INSERT OR REPLACE INTO response_cache (kind, key, fetched_at, ttl, payload) VALUES (?, ?, ?, ?, ?)",
+                (kind, str(key), time.time(), float(ttl), _pack(payload)),
+            )
+        except (sqlite3.Error, OSError, TypeError, ValueError) as exc:
+            logger.debug("response cache write failed: %s", exc)
+
+    def delete(self, kind: str, key: str | int) -> None:
+        """Drops one entry so the next lookup refetches it."""
+        try:
+            self._conn().execute("DELETE FROM response_cache WHERE kind = ? AND key = ?", (kind, str(key)))
+        except (sqlite3.Error, OSError) as exc:
+            logger.debug("response cache delete failed: %s", exc)
+
+    # maintenance
+
+    def evict_expired(self, vacuum_after: int = _VACUUM_AFTER) -> int:
+        """Deletes every expired entry.
+
+        Args:
+            vacuum_after: Compact the file when at least this many entries went.
+
+        Returns:
+            Number of deleted entries.
+        """
+        try:
+            conn = self._conn()
+            n = conn.execute("DELETE FROM response_cache WHERE fetched_at + ttl <= ?", (time.time(),)).rowcount
+            if n and n >= vacuum_after:
+                conn.execute("VACUUM")
+            return n
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("response cache eviction failed: %s", exc)
+            return 0
+
+    def close(self) -> None:
+        """Closes the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # legacy files
+
+    @staticmethod
+    def _import_legacy(conn: sqlite3.Connection, root: Path) -> int:
+        # one transaction for all files; the files go once they are committed
+        rows = []
+        done = []
+        for sub, kind_of in (
+            ("store_data", ResponseCache._legacy_store_kind),
+            ("store_tags", lambda stem: ("tags", stem)),
+            ("age_ratings", lambda stem: ("age_rating", stem)),
+        ):
+            d = root / sub
+            if not d.is_dir():
+                continue
+            for f in d.glob("*.json"):
+                kk = kind_of(f.stem)
+                if kk is None:
+                    continue
+                try:
+                    st = f.stat()
+                    with open(f, "r", encoding="utf-8") as fh:
+                        payload = json.load(fh)
+                except (OSError, ValueError):
+                    continue
+                kind, key = kk
+                rows.append((kind, key, st.st_mtime, KIND_TTL[kind], _pack(payload)))
+                done.append(f)
+
+        if not rows:
+            return 0
+        conn.execute("BEGIN")
+        try:
+            # newer entries written since win over the files
+            conn.executemany(
+                "INSERT OR IGNORE INTO response_cache (kind, key, fetched_at, ttl, payload) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+
+        for f in done:
+            f.unlink(missing_ok=True)
+        for sub in ("store_data", "store_tags", "age_ratings"):
+            try:
+                (root / sub).rmdir()
+            except OSError:
+                pass  # not empty or missing
+        return len(rows)
+
+    @staticmethod
+    def _legacy_store_kind(stem: str) -> tuple[str, str] | None:
+        app_id, _, suffix = stem.partition("_")
+        kind = _LEGACY_SUFFIX.get(suffix)
+        if kind is None or not app_id.isdigit():
+            return None
+        return kind, app_id
+
+
+_caches: dict[Path, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def response_cache(cache_dir: Path | str) -> ResponseCache:
+    """Returns the shared ResponseCache for a cache directory.
+
+    Args:
+        cache_dir: The application cache root (config.CACHE_DIR).
+
+    Returns:
+        The ResponseCache stored as response_cache.db in that directory.
+    """
+    path = (Path(cache_dir) / "response_cache.db").resolve()
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = ResponseCache(path)
+        return cache
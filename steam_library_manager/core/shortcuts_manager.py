@@ -11,6 +11,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from zlib import crc32
 import logging
+import struct
 import time
 
 from steam_library_manager.core import vdf_parser
@@ -147,7 +148,7 @@ class ShortcutsManager:
                 if isinstance(entry, dict):
                     out.append(SteamShortcut.from_vdf_dict(entry))
             return out
-        except (OSError, ValueError) as e:
+        except (OSError, ValueError, struct.error) as e:
             logger.error("failed to read shortcuts: %s" % e)
             return []
 
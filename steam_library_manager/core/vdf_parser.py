@@ -14,6 +14,7 @@ from io import BytesIO
 __all__ = [
     "UINT_64",
     "INT_64",
+    "binary_decode",
     "binary_dump",
     "binary_dumps",
     "binary_load",
@@ -38,90 +39,109 @@ UINT_64 = int
 INT_64 = int
 
 
-class _Parser:
-    # binary VDF parser
-
-    def __init__(self, s, *, alt_end=False):
-        self._s = s
-        self._e = {BIN_END, BIN_END_ALT} if alt_end else {BIN_END}
-
-    def parse(self):
-        # parse dict
-        o = {}
-
-        while True:
-            tag = self._s.read(1)
-            if not tag or tag in self._e:
-                break
-
-            k = self._rs()
-
-            if tag == BIN_NONE:
-                o[k] = self.parse()
-            elif tag == BIN_STRING:
-                o[k] = self._rs()
-            elif tag == BIN_INT32:
-                o[k] = struct.unpack("<i", self._s.read(4))[0]
-            elif tag == BIN_FLOAT32:
-                o[k] = struct.unpack("<f", self._s.read(4))[0]
-            elif tag == BIN_POINTER:
-                o[k] = struct.unpack("<i", self._s.read(4))[0]
-            elif tag == BIN_WIDESTRING:
-                o[k] = self._rw()
-            elif tag == BIN_COLOR:
-                o[k] = struct.unpack("<i", self._s.read(4))[0]
-            elif tag == BIN_UINT64:
-                o[k] = struct.unpack("<Q", self._s.read(8))[0]
-            elif tag == BIN_INT64:
-                o[k] = struct.unpack("<q", self._s.read(8))[0]
-            else:
-                raise ValueError("bad tag: 0x%s" % tag.hex())
-
-        return o
-
-    def _rs(self):
-        # read UTF-8
-        b = bytearray()
-        while True:
-            c = self._s.read(1)
-            if not c or c == b"\x00":
-                break
-            b.extend(c)
-        return b.decode("utf-8", errors="replace")
-
-    def _rw(self):
-        # read UTF-16LE
-        b = bytearray()
-        while True:
-            p = self._s.read(2)
-            if not p or p == b"\x00\x00":
-                break
-            b.extend(p)
-        return b.decode("utf-16-le", errors="replace")
+# precompiled unpackers for the fixed-size values
+_I32 = struct.Struct("<i")
+_F32 = struct.Struct("<f")
+_U64 = struct.Struct("<Q")
+_I64 = struct.Struct("<q")
 
+# deepest object nesting accepted; real files stay in single digits,
+# corrupt or hostile ones would otherwise hit RecursionError
+MAX_DEPTH = 64
 
-def binary_load(fp):
-    # parse from file
-    p = _Parser(fp)
-    o = {}
 
+def binary_decode(buf, pos=0, *, alt_end=False, depth=0):
+    # decode one object from a bytes buffer, starting right after its key;
+    # returns (dict, position after the object's end tag). Strings are
+    # located with find() and sliced out, never read byte by byte.
+    if depth >= MAX_DEPTH:
+        raise ValueError("nesting deeper than %d at offset %d" % (MAX_DEPTH, pos))
+    o = {}
+    n = len(buf)
+    find = buf.find
+    i32 = _I32.unpack_from
+
+    while pos < n:
+        tag = buf[pos]
+        if tag == 0x08 or (alt_end and tag == 0x0B):
+            return o, pos + 1
+
+        end = find(b"\x00", pos + 1)
+        if end < 0:
+            end = n
+        k = buf[pos + 1 : end].decode("utf-8", "replace")
+        pos = end + 1
+
+        # most frequent first: strings, ints, sub-objects
+        if tag == 0x01:
+            end = find(b"\x00", pos)
+            if end < 0:
+                end = n
+            o[k] = buf[pos:end].decode("utf-8", "replace")
+            pos = end + 1
+        elif tag == 0x02 or tag == 0x04 or tag == 0x06:
+            # int32, pointer, color
+            o[k] = i32(buf, pos)[0]
+            pos += 4
+        elif tag == 0x00:
+            o[k], pos = binary_decode(buf, pos, alt_end=alt_end, depth=depth + 1)
+        elif tag == 0x07:
+            o[k] = _U64.unpack_from(buf, pos)[0]
+            pos += 8
+        elif tag == 0x0A:
+            o[k] = _I64.unpack_from(buf, pos)[0]
+            pos += 8
+        elif tag == 0x03:
+            o[k] = _F32.unpack_from(buf, pos)[0]
+            pos += 4
+        elif tag == 0x05:
+            o[k], pos = _wide(buf, pos)
+        else:
+            raise ValueError("bad tag: 0x%02x" % tag)
+
+    return o, pos
+
+
+def _wide(buf, pos):
+    # UTF-16LE up to an aligned double NUL
+    end = pos
     while True:
-        tag = fp.read(1)
-        if not tag:
+        end = buf.find(b"\x00\x00", end)
+        if end < 0:
+            end = len(buf)
             break
-
-        if tag == BIN_NONE:
-            k = p._rs()
-            o[k] = p.parse()
-        elif tag in (BIN_END, BIN_END_ALT):
+        if (end - pos) % 2 == 0:
             break
+        end += 1
+    return buf[pos:end].decode("utf-16-le", "replace"), end + 2
 
-    return o
+
+def binary_load(fp):
+    # parse from file
+    return binary_loads(fp.read())
 
 
 def binary_loads(data):
     # parse from bytes
-    return binary_load(BytesIO(data))
+    buf = bytes(data)
+    o = {}
+    pos = 0
+    n = len(buf)
+
+    while pos < n:
+        tag = buf[pos]
+        pos += 1
+
+        if tag == 0x00:
+            end = buf.find(b"\x00", pos)
+            if end < 0:
+                end = n
+            k = buf[pos:end].decode("utf-8", "replace")
+            o[k], pos = binary_decode(buf, end + 1)
+        elif tag == 0x08 or tag == 0x0B:
+            break
+
+    return o
 
 
 def binary_dump(obj, fp):
@@ -15,9 +15,9 @@ import re
 import threading
 import time
 
-import requests
 from bs4 import BeautifulSoup
 
+from steam_library_manager.utils.http_client import http
 from steam_library_manager.utils.timeouts import HTTP_TIMEOUT_API, HTTP_TIMEOUT_LONG
 
 from steam_library_manager.integrations.hltb_models import (
@@ -30,7 +30,7 @@ from steam_library_manager.integrations.hltb_models import (
 
 logger = logging.getLogger("steamlibmgr.hltb_api")
 
-__all__ = ["HLTBClient", "HLTBResult"]
+__all__ = ["HLTBClient", "HLTBResult", "HLTBThrottled"]
 
 _BASE = "https://howlongtobeat.com"
 
@@ -70,12 +70,37 @@ _RETRY_MIN = 5
 _TTL = 300
 
 
+class HLTBThrottled(Exception):
+    """HLTB answered 429 or 5xx - the caller should back off and retry."""
+
+    def __init__(self, status, retry_after=0.0):
+        super().__init__("HLTB returned %d" % status)
+        self.status = status
+        self.retry_after = retry_after
+
+
+def _check_throttled(resp):
+    # raise HLTBThrottled for 429/5xx instead of treating it as a miss
+    code = resp.status_code
+    if code == 429 or code in range(500, 600):
+        try:
+            wait = float(resp.headers.get("Retry-After", 0))
+        except (TypeError, ValueError):
+            wait = 0.0
+        raise HLTBThrottled(code, wait)
+
+
 class HLTBClient:
-    """Client for searching HowLongToBeat game data."""
+    """Client for searching HowLongToBeat game data.
+
+    Safe to share between threads: searches share the pooled http client,
+    endpoint discovery and token refresh are serialized by _lock.
+    """
 
-    def __init__(self):
-        self._session = requests.Session()
-        self._session.headers.update(_HDRS)
+    def __init__(self, base_url=_BASE):
+        self._base = base_url.rstrip("/")
+        # 429s come straight back; the enrichment pool owns the backoff
+        self._session = http.session(_HDRS, retries=0)
         self._api_path = ""
         self._token = ""
         self._build_id = ""
@@ -101,7 +126,7 @@ class HLTBClient:
         if not self._ensure_ready():
             return {}
 
-        url = "%s/api/steam/getSteamImportData" % _BASE
+        url = "%s/api/steam/getSteamImportData" % self._base
 
         try:
             resp = self._session.post(
@@ -112,8 +137,8 @@ class HLTBClient:
                 },
                 headers={
                     "Content-Type": "application/json",
-                    "Origin": _BASE,
-                    "Referer": "%s/" % _BASE,
+                    "Origin": self._base,
+                    "Referer": "%s/" % self._base,
                 },
                 timeout=HTTP_TIMEOUT_API,
             )
@@ -143,16 +168,19 @@ class HLTBClient:
             logger.warning("No buildId available for HLTB game-by-ID fetch")
             return None
 
-        url = "%s/_next/data/%s/game/%d.json" % (_BASE, self._build_id, hltb_game_id)
+        url = "%s/_next/data/%s/game/%d.json" % (self._base, self._build_id, hltb_game_id)
 
         try:
             resp = self._session.get(
                 url,
-                headers={"Referer": "%s/" % _BASE},
+                headers={"Referer": "%s/" % self._base},
                 timeout=HTTP_TIMEOUT_LONG,
             )
+            _check_throttled(resp)
             resp.raise_for_status()
             data = resp.json()
+        except HLTBThrottled:
+            raise
         except Exception as exc:
             logger.warning("HLTB game-by-ID fetch failed for %d: %s", hltb_game_id, exc)
             return None
@@ -211,12 +239,12 @@ class HLTBClient:
     def _post(self, payload):
         # Send search POST to the HLTB API
         return self._session.post(
-            "%s/api/%s" % (_BASE, self._api_path),
+            "%s/api/%s" % (self._base, self._api_path),
             json=payload,
             headers={
                 "Content-Type": "application/json",
-                "Origin": _BASE,
-                "Referer": "%s/" % _BASE,
+                "Origin": self._base,
+                "Referer": "%s/" % self._base,
                 "x-auth-token": self._token,
             },
             timeout=HTTP_TIMEOUT_LONG,
@@ -264,8 +292,11 @@ class HLTBClient:
                     return None, 0
                 resp = self._post(payload)
 
+            _check_throttled(resp)
             resp.raise_for_status()
             data = resp.json()
+        except HLTBThrottled:
+            raise
         except Exception as exc:
             logger.warning("HLTB search failed for '%s': %s", query, exc)
             return None, 0
@@ -322,7 +353,7 @@ class HLTBClient:
     def _get_homepage(self):
         # Fetch HLTB homepage HTML
         try:
-            resp = self._session.get("%s/" % _BASE, timeout=HTTP_TIMEOUT_LONG)
+            resp = self._session.get("%s/" % self._base, timeout=HTTP_TIMEOUT_LONG)
             resp.raise_for_status()
             return resp.text
         except Exception as exc:
@@ -339,7 +370,7 @@ class HLTBClient:
         for tag in scripts:
             src = str(tag.get("src", ""))
             if "/_next/static/chunks/" in src and not src.endswith("Manifest.js"):
-                url = src if src.startswith("http") else "%s%s" % (_BASE, src)
+                url = src if src.startswith("http") else "%s%s" % (self._base, src)
                 chunk_urls.append(url)
 
         for url in chunk_urls:
@@ -386,14 +417,14 @@ class HLTBClient:
     def _get_token(self, api_path):
         # Obtain auth token from the HLTB init endpoint
         ts = int(time.time() * 1000)
-        url = "%s/api/%s/init?t=%d" % (_BASE, api_path, ts)
+        url = "%s/api/%s/init?t=%d" % (self._base, api_path, ts)
 
         try:
             resp = self._session.get(
                 url,
                 headers={
-                    "Referer": "%s/" % _BASE,
-                    "Origin": _BASE,
+                    "Referer": "%s/" % self._base,
+                    "Origin": self._base,
                 },
                 timeout=HTTP_TIMEOUT_LONG,
             )
@@ -14,6 +14,7 @@ from dataclasses import dataclass
 
 import requests
 
+from steam_library_manager.utils.http_client import http
 from steam_library_manager.utils.timeouts import HTTP_TIMEOUT
 
 logger = logging.getLogger("steamlibmgr.protondb_api")
@@ -40,8 +41,7 @@ class ProtonDBClient:
     BASE_URL = "https://www.protondb.com/api/v1/reports/summaries/"
 
     def __init__(self):
-        self._s = requests.Session()
-        self._s.headers.update({"User-Agent": "SteamLibraryManager/1.0"})
+        self._s = http.session({"User-Agent": "SteamLibraryManager/1.0"})
 
     def get_rating(self, aid):
         try:
@@ -72,14 +72,14 @@ class ProtonDBClient:
             logger.warning("ProtonDB: parse error for app %d: %s", aid, e)
             return None
 
-    def get_ratings_batch(self, aids, delay=0.5):
-        # rate limited batch fetch
+    def get_ratings_batch(self, aids, delay=0.0):
+        # the shared http client already paces protondb.com; delay adds a gap on top
         res = {}
         for i, x in enumerate(aids):
             rt = self.get_rating(x)
             if rt:
                 res[x] = rt
-            if i < len(aids) - 1:
+            if delay and i < len(aids) - 1:
                 time.sleep(delay)
         return res
 
@@ -10,15 +10,14 @@
 from __future__ import annotations
 
 import logging
-import time
-import json
+from datetime import datetime
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Any
 
 import requests
 from bs4 import BeautifulSoup
+from steam_library_manager.core.response_cache import response_cache
 from steam_library_manager.utils.age_ratings import ESRB_TO_PEGI, USK_TO_PEGI
+from steam_library_manager.utils.http_client import http
 from steam_library_manager.utils.i18n import t
 from steam_library_manager.utils.timeouts import HTTP_TIMEOUT
 
@@ -47,12 +46,9 @@ class SteamStoreScraper:
 
     def __init__(self, cache_dir: Path, language: str = "en"):
         """Initializes the SteamStoreScraper."""
-        self.cache_dir = cache_dir / "store_tags"
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache = response_cache(cache_dir)
         self.language_code = language
         self.steam_language = self.STEAM_LANGUAGES.get(language, "english")
-        self.last_request_time = 0.0
-        self.min_request_interval = 1.0  # Reduced from 1.5 - Steam tolerates 1.0
 
         # Tag blacklist (common but unhelpful tags)
         self.tag_blacklist = {
@@ -76,46 +72,24 @@ class SteamStoreScraper:
             "Steam Leaderboards",
         }
 
-    def _check_cache(self, cache_file: Path, max_age_days: int = 30) -> Any | None:
-        """Returns cached JSON data if the file exists and is fresh enough."""
-        if not cache_file.exists():
-            return None
-        try:
-            mtime = datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if datetime.now() - mtime < timedelta(days=max_age_days):
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-        except (OSError, json.JSONDecodeError, ValueError):
-            pass
-        return None
-
-    def _rate_limit(self) -> None:
-        """Enforces minimum interval between API requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
+    def _tags_key(self, app_id: str) -> str:
+        return f"{app_id}_{self.language_code}"
 
     def fetch_tags(self, app_id: str) -> list[str]:
         """Fetches tags for a game from the Steam Store page."""
-        cache_file = self.cache_dir / f"{app_id}_{self.language_code}.json"
-
         # Check Cache
-        cached = self._check_cache(cache_file)
+        cached = self.cache.get("tags", self._tags_key(app_id))
         if cached is not None:
             return cached
 
-        # Rate Limiting
-        self._rate_limit()
-
         # Fetch from Steam
         try:
-            self.last_request_time = time.time()
             cookies = {"Steam_Language": self.steam_language}
 
             # Secure HTTPS link
             url = f"https://store.steampowered.com/app/{app_id}/"
 
-            response = requests.get(url, cookies=cookies, timeout=HTTP_TIMEOUT)
+            response = http.get(url, cookies=cookies, timeout=HTTP_TIMEOUT)
 
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, "html.parser")
@@ -130,10 +104,8 @@ class SteamStoreScraper:
                     if tag_text and tag_text not in self.tag_blacklist and tag_text != "+":
                         tags.append(tag_text)
 
-                # Save (create directory if needed)
-                cache_file.parent.mkdir(parents=True, exist_ok=True)
-                with open(cache_file, "w", encoding="utf-8") as f:
-                    json.dump(tags, f)
+                # Save
+                self.cache.put("tags", self._tags_key(app_id), tags)
 
                 return tags
 
@@ -144,17 +116,11 @@ class SteamStoreScraper:
 
     def fetch_age_rating(self, app_id: str) -> str | None:
         """Fetches age rating from Steam Store (API first, HTML fallback)."""
-        cache_file = self.cache_dir.parent / "age_ratings" / f"{app_id}.json"
-        cache_file.parent.mkdir(exist_ok=True, parents=True)
-
         # Check Cache
-        cached = self._check_cache(cache_file)
+        cached = self.cache.get("age_rating", app_id)
         if cached is not None:
             return cached.get("pegi_rating")
 
-        # Rate Limiting
-        self._rate_limit()
-
         # Try API first (fast JSON parse, no age-gate issues)
         pegi_rating = self._fetch_age_rating_from_api(app_id)
 
@@ -163,30 +129,30 @@ class SteamStoreScraper:
             pegi_rating = self._fetch_age_rating_from_html(app_id)
 
         # Cache result
-        try:
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    {
-                        "pegi_rating": pegi_rating,
-                        "fetched_at": datetime.now().isoformat(),
-                        "method": "api" if pegi_rating else "html_fallback",
-                    },
-                    f,
-                )
-        except OSError:
-            pass
+        self.cache.put(
+            "age_rating",
+            app_id,
+            {
+                "pegi_rating": pegi_rating,
+                "fetched_at": datetime.now().isoformat(),
+                "method": "api" if pegi_rating else "html_fallback",
+            },
+        )
 
         return pegi_rating
 
+    def forget_age_rating(self, app_id: str) -> None:
+        """Drops the cached age rating so the next fetch asks the store again."""
+        self.cache.delete("age_rating", app_id)
+
     def _fetch_age_rating_from_api(self, app_id: str) -> str | None:
         """Fetches age rating using Steam Store API."""
         try:
-            self.last_request_time = time.time()
 
             # Steam Store API endpoint
             url = f"https://store.steampowered.com/api/appdetails?appids={app_id}"
 
-            response = requests.get(url, timeout=HTTP_TIMEOUT)
+            response = http.get(url, timeout=HTTP_TIMEOUT)
             response.raise_for_status()
 
             data = response.json()
@@ -234,7 +200,6 @@ class SteamStoreScraper:
     def _fetch_age_rating_from_html(self, app_id: str) -> str | None:
         """Fetches age rating via HTML scraping (fallback method)."""
         try:
-            self.last_request_time = time.time()
 
             # Age-Gate bypass with Unix timestamp
             birthtime = "631152000"  # Unix timestamp for 1990-01-01
@@ -246,7 +211,7 @@ class SteamStoreScraper:
             }
 
             url = f"https://store.steampowered.com/app/{app_id}/"
-            response = requests.get(url, cookies=cookies, timeout=HTTP_TIMEOUT)
+            response = http.get(url, cookies=cookies, timeout=HTTP_TIMEOUT)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.text, "html.parser")
@@ -335,12 +300,7 @@ class SteamStoreScraper:
     def get_cache_coverage(self, app_ids: list[str]) -> dict:
         """Check how many games have cached tag data."""
         total = len(app_ids)
-        cached = 0
-
-        for app_id in app_ids:
-            cache_file = self.cache_dir / f"{app_id}_{self.language_code}.json"
-            if self._check_cache(cache_file) is not None:
-                cached += 1
+        cached = len(self.cache.fresh_keys("tags", [self._tags_key(a) for a in app_ids]))
 
         missing = total - cached
         percentage = (cached / total * 100) if total > 0 else 0.0
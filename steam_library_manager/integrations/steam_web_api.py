@@ -11,13 +11,13 @@ from __future__ import annotations
 import json
 import logging
 import re
-import time
 from dataclasses import dataclass
 from typing import Any
 
 import requests
 
 from steam_library_manager.integrations.steam_api_endpoints import SteamAPIEndpoints
+from steam_library_manager.utils.http_client import http
 from steam_library_manager.utils.timeouts import HTTP_TIMEOUT_API
 
 logger = logging.getLogger("steamlibmgr.steam_web_api")
@@ -25,8 +25,7 @@ logger = logging.getLogger("steamlibmgr.steam_web_api")
 __all__ = ["SteamAppDetails", "SteamWebAPI"]
 
 _BATCH_SIZE = 50
-_BASE_DELAY = 1.0
-_MAX_RETRIES = 3
+_MAX_RETRIES = 3  # attempts per request on a 429
 _API_URL = "https://api.steampowered.com/IStoreBrowseService/GetItems/v1"
 
 
@@ -63,7 +62,9 @@ class SteamWebAPI(SteamAPIEndpoints):
             raise ValueError("Steam API key must not be empty")
         self.api_key: str = api_key.strip()
 
-    # GET with retry on 429, exponential backoff
+    # GET via the shared client, which paces api.steampowered.com and
+    # retries a 429 with backoff (_MAX_RETRIES attempts, independent of
+    # the client default); None if it is still throttled
     def _request_with_retry(
         self,
         url: str,
@@ -71,18 +72,14 @@ class SteamWebAPI(SteamAPIEndpoints):
         *,
         bail_on: frozenset[int] = frozenset(),
     ) -> requests.Response | None:
-        for attempt in range(_MAX_RETRIES):
-            response = requests.get(url, params=params, timeout=HTTP_TIMEOUT_API)
-            if response.status_code == 429:
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning("Rate limited (429), retrying in %.1fs..." % delay)
-                time.sleep(delay)
-                continue
-            if response.status_code in bail_on:
-                return None
-            response.raise_for_status()
-            return response
-        return None
+        response = http.get(url, params=params, timeout=HTTP_TIMEOUT_API, retries=_MAX_RETRIES - 1)
+        if response.status_code == 429:
+            logger.warning("Rate limited (429), giving up on request")
+            return None
+        if response.status_code in bail_on:
+            return None
+        response.raise_for_status()
+        return response
 
     # fetch metadata for multiple apps in chunks
     def get_app_details_batch(self, app_ids: list[int]) -> dict[int, SteamAppDetails]:
@@ -104,10 +101,6 @@ class SteamWebAPI(SteamAPIEndpoints):
             except requests.RequestException as exc:
                 logger.warning("Failed batch %d/%d: %s" % (idx + 1, len(chunks), exc))
 
-            # Rate limit between batches (skip after last)
-            if idx < len(chunks) - 1:
-                time.sleep(_BASE_DELAY)
-
         return out
 
     # fetch single batch from API
@@ -184,7 +177,7 @@ class SteamWebAPI(SteamAPIEndpoints):
         params = {"gameid": app_id}
 
         try:
-            response = requests.get(url, params=params, timeout=HTTP_TIMEOUT_API)
+            response = http.get(url, params=params, timeout=HTTP_TIMEOUT_API, retries=_MAX_RETRIES - 1)
             if response.status_code != 200:
                 return {}
             data = response.json()
@@ -14,6 +14,7 @@ import logging
 import requests
 
 from steam_library_manager.config import config
+from steam_library_manager.utils.http_client import http
 from steam_library_manager.utils.i18n import t
 from steam_library_manager.utils.timeouts import HTTP_TIMEOUT, HTTP_TIMEOUT_SHORT
 
@@ -68,7 +69,7 @@ class SteamGridDB:
                     params["dimensions"] = "600x900,342x482"
 
                 url = "%s/%s/game/%s" % (self.BASE_URL, img_type, game_id)
-                resp = requests.get(url, headers=self.headers, params=params, timeout=HTTP_TIMEOUT)
+                resp = http.get(url, headers=self.headers, params=params, timeout=HTTP_TIMEOUT)
 
                 if resp.status_code == 200:
                     data = resp.json()
@@ -114,7 +115,7 @@ class SteamGridDB:
                 params["dimensions"] = "600x900,342x482"
 
             url = "%s/%s/game/%s" % (self.BASE_URL, img_type, game_id)
-            resp = requests.get(url, headers=self.headers, params=params, timeout=HTTP_TIMEOUT)
+            resp = http.get(url, headers=self.headers, params=params, timeout=HTTP_TIMEOUT)
 
             if resp.status_code == 200:
                 data = resp.json()
@@ -132,7 +133,7 @@ class SteamGridDB:
         # TODO: cache this lookup?
         try:
             url = "%s/games/steam/%s" % (self.BASE_URL, steam_app_id)
-            response = requests.get(url, headers=self.headers, timeout=HTTP_TIMEOUT_SHORT)
+            response = http.get(url, headers=self.headers, timeout=HTTP_TIMEOUT_SHORT)
             if response.status_code == 200:
                 data = response.json()
                 if data["success"]:
@@ -145,7 +146,7 @@ class SteamGridDB:
         # grab first image url for endpoint
         try:
             url = "%s/%s/game/%s" % (self.BASE_URL, endpoint, game_id)
-            response = requests.get(url, headers=self.headers, params=params, timeout=HTTP_TIMEOUT_SHORT)
+            response = http.get(url, headers=self.headers, params=params, timeout=HTTP_TIMEOUT_SHORT)
             if response.status_code == 200:
                 data = response.json()
                 if data["success"] and data["data"]:
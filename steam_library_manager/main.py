@@ -117,6 +117,31 @@ def _auto_register_desktop_entry() -> None:
         logger.debug("Desktop entry auto-register failed: %s", e)
 
 
+def _profile_startup_format() -> str | None:
+    """Returns "json" or "chrome" if --profile-startup[=json|chrome] was given."""
+    for arg in sys.argv[1:]:
+        if arg == "--profile-startup":
+            return "json"
+        if arg.startswith("--profile-startup="):
+            fmt = arg.split("=", 1)[1]
+            return fmt if fmt in ("json", "chrome") else "json"
+    return None
+
+
+def _dump_startup_profile(fmt: str) -> None:
+    """Writes the collected startup spans next to the other user data."""
+    from steam_library_manager.utils.profiler import get_profiler
+
+    prof = get_profiler()
+    if prof is None:
+        return
+    name = "startup_trace.json" if fmt == "chrome" else "startup_profile.json"
+    try:
+        prof.dump(config.DATA_DIR / name, fmt)
+    except OSError as e:
+        logger.warning("Could not write startup profile: %s", e)
+
+
 def main() -> None:
     """Main application execution flow."""
     # Handle desktop integration CLI commands (no GUI needed)
@@ -127,6 +152,13 @@ def main() -> None:
         init_i18n(config.UI_LANGUAGE)
         sys.exit(_handle_desktop_integration(install=False))
 
+    # Startup profiling: spans are collected from here on
+    profile_fmt = _profile_startup_format()
+    if profile_fmt:
+        from steam_library_manager.utils import profiler
+
+        profiler.enable()
+
     # Initialize language (BEFORE creating UI elements)
     init_i18n(config.UI_LANGUAGE)
 
@@ -202,7 +234,8 @@ def main() -> None:
     logger.info(t("common.loading"))
 
     try:
-        window = MainWindow()
+        on_done = (lambda: _dump_startup_profile(profile_fmt)) if profile_fmt else None
+        window = MainWindow(on_bootstrap_complete=on_done)
         window.show()
 
         sys.exit(app.exec())
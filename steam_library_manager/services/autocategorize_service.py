@@ -31,22 +31,27 @@ class AutoCategorizeService:
         self.cat_svc = cat_svc
         self.scraper = scraper
 
-    def _add_cat(self, game, category):
-        # add game to category
+    @staticmethod
+    def _add_cat(plan, game, category):
+        # queue game for category, applied by _apply
+        plan.setdefault(category, {}).setdefault(game.app_id, game)
+
+    def _apply(self, plan):
+        # add all queued games in one category service call, returns count
+        if not plan:
+            return 0
         try:
-            self.cat_svc.add_app_to_category(game.app_id, category)
-            if category not in game.categories:
-                game.categories.append(category)
-            return True
+            self.cat_svc.apply_category_changes(add={cat: list(gs) for cat, gs in plan.items()})
         except (ValueError, RuntimeError):
-            return False
+            return 0
+        return sum(len(gs) for gs in plan.values())
 
     # generic engines
 
     def _categorize_simple(self, method_key, games, progress_cb=None):
         # reads one attribute per game, creates category from it
         cfg = SIMPLE_METHOD_CONFIGS[method_key]
-        added = 0
+        plan = {}
         for i, game in enumerate(games):
             if progress_cb:
                 progress_cb(i, game.name)
@@ -65,13 +70,13 @@ class AutoCategorizeService:
                     continue
                 disp = str(v).capitalize() if cfg.capitalize else str(v)
                 cat = disp if cfg.use_raw else t(cfg.i18n_key, **{cfg.i18n_kwarg: disp})
-                added += self._add_cat(game, cat)
-        return added
+                self._add_cat(plan, game, cat)
+        return self._apply(plan)
 
     def _categorize_buckets(self, method_key, games, progress_cb=None):
         # maps numeric attribute to threshold ranges
         cfg = BUCKET_METHOD_CONFIGS[method_key]
-        added = 0
+        plan = {}
         for i, game in enumerate(games):
             if progress_cb:
                 progress_cb(i, game.name)
@@ -95,8 +100,8 @@ class AutoCategorizeService:
                     else:
                         continue
             cat = t(cfg.i18n_wrapper_key, **{cfg.i18n_wrapper_kwarg: lbl})
-            added += self._add_cat(game, cat)
-        return added
+            self._add_cat(plan, game, cat)
+        return self._apply(plan)
 
     # simple method wrappers
 
@@ -138,13 +143,13 @@ class AutoCategorizeService:
         # uses steam store scraper to fetch tags per game
         if not self.scraper:
             return 0
-        added = 0
+        plan = {}
         for i, game in enumerate(games):
             if progress_callback:
                 progress_callback(i, game.name)
             for tag in self.scraper.fetch_tags(game.app_id)[:tags_count]:
-                added += self._add_cat(game, tag)
-        return added
+                self._add_cat(plan, game, tag)
+        return self._apply(plan)
 
     @staticmethod
     def _detect_franchise(name):
@@ -179,18 +184,18 @@ class AutoCategorizeService:
             if fr:
                 fmap.setdefault(fr, []).append(game)
 
-        added = 0
+        plan = {}
         known_lc = {f.lower() for f in KNOWN_FRANCHISES}
         for franchise, matched in fmap.items():
             if franchise.lower() not in known_lc and len(matched) < 3:
                 continue
             cat = t("auto_categorize.cat_franchise", name=franchise)
             for game in matched:
-                added += self._add_cat(game, cat)
-        return added
+                self._add_cat(plan, game, cat)
+        return self._apply(plan)
 
     def categorize_by_flags(self, games, progress_callback=None):
-        added = 0
+        plan = {}
         for i, game in enumerate(games):
             if progress_callback:
                 progress_callback(i, game.name)
@@ -199,13 +204,13 @@ class AutoCategorizeService:
                 flags.append("Free to Play")
             for flag in flags:
                 cat = t("auto_categorize.cat_flags", name=flag)
-                added += self._add_cat(game, cat)
-        return added
+                self._add_cat(plan, game, cat)
+        return self._apply(plan)
 
     _DECK_KEYS = frozenset({"verified", "playable", "unsupported"})
 
     def categorize_by_deck_status(self, games, progress_callback=None):
-        added = 0
+        plan = {}
         for i, game in enumerate(games):
             if progress_callback:
                 progress_callback(i, game.name)
@@ -213,8 +218,8 @@ class AutoCategorizeService:
             if not status or status not in self._DECK_KEYS:
                 continue
             cat = "%s %s" % (t("auto_categorize.cat_deck_" + status), t("emoji.vr"))
-            added += self._add_cat(game, cat)
-        return added
+            self._add_cat(plan, game, cat)
+        return self._apply(plan)
 
     _PEGI_BUCKETS = (
         ("3", "auto_categorize.pegi_3"),
@@ -242,13 +247,16 @@ class AutoCategorizeService:
                 if padded != cat:
                     renames[cat] = padded
 
+        moved, removed = {}, {}
         for old, new in renames.items():
             for game in games:
                 if old in game.categories:
-                    game.categories.remove(old)
-                    if new not in game.categories:
-                        game.categories.append(new)
-                    self.cat_svc.add_app_to_category(game.app_id, new)
+                    removed.setdefault(old, []).append(game.app_id)
+                    moved.setdefault(new, []).append(game.app_id)
+        if moved:
+            self.cat_svc.apply_category_changes(add=moved, remove=removed)
+
+        for old in renames:
             try:
                 self.cat_svc.delete_category(old)
             except (ValueError, RuntimeError):
@@ -256,7 +264,7 @@ class AutoCategorizeService:
 
     def categorize_by_pegi(self, games, progress_callback=None):
         self._migrate_pegi_categories(games)
-        added = 0
+        plan = {}
         for i, game in enumerate(games):
             if progress_callback:
                 progress_callback(i, game.name)
@@ -271,11 +279,11 @@ class AutoCategorizeService:
             else:
                 lbl = t("auto_categorize.pegi_unknown")
             cat = t("auto_categorize.cat_pegi", rating=lbl)
-            added += self._add_cat(game, cat)
-        return added
+            self._add_cat(plan, game, cat)
+        return self._apply(plan)
 
     def categorize_by_achievements(self, games, progress_callback=None):
-        added = 0
+        plan = {}
         for i, game in enumerate(games):
             if progress_callback:
                 progress_callback(i, game.name)
@@ -291,8 +299,8 @@ class AutoCategorizeService:
                 name = "%s %s" % (t("auto_categorize.cat_achievement_progress"), trophy)
             else:
                 name = "%s %s" % (t("auto_categorize.cat_achievement_started"), trophy)
-            added += self._add_cat(game, name)
-        return added
+            self._add_cat(plan, game, name)
+        return self._apply(plan)
 
     def categorize_by_curator(self, games, db_path=None, progress_callback=None):
         # uses stored curator recommendations from DB
@@ -307,7 +315,7 @@ class AutoCategorizeService:
             if not curators:
                 return 0
 
-            added = 0
+            plan = {}
             for cur in curators:
                 cid = cur["curator_id"]
                 cname = "%s %s" % (cur["name"], t("emoji.curator"))
@@ -323,9 +331,9 @@ class AutoCategorizeService:
                     except (ValueError, TypeError):
                         continue
                     if num_id in rec_ids:
-                        added += self._add_cat(game, cname)
+                        self._add_cat(plan, game, cname)
 
-            return added
+            return self._apply(plan)
         finally:
             db.close()
 
@@ -14,6 +14,7 @@ from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
 from steam_library_manager.config import config
 from steam_library_manager.utils.i18n import t
+from steam_library_manager.utils.profiler import begin, span
 
 logger = logging.getLogger("steamlibmgr.bootstrap")
 
@@ -43,13 +44,19 @@ class BootstrapService(QObject):
         self._games_done = False
         self._sess_w = None
         self._game_w = None
+        self._span = None
 
     def start(self):
         self._sess_done = False
         self._games_done = False
+        # closed in _check_done, once session and games are both in
+        self._span = begin("bootstrap")
         self.loading_started.emit()
 
-        if not self._init():
+        with span("bootstrap.init"):
+            ok = self._init()
+        if not ok:
+            self._span.end()
             self.bootstrap_complete.emit()
             return
 
@@ -86,7 +93,9 @@ class BootstrapService(QObject):
         # setup game service
         from steam_library_manager.services.game_service import GameService
 
-        self.mw.game_service = GameService(str(config.STEAM_PATH), config.STEAM_API_KEY, str(config.CACHE_DIR))
+        self.mw.game_service = GameService(
+            str(config.STEAM_PATH), config.STEAM_API_KEY, str(config.CACHE_DIR), use_snapshot=True
+        )
 
         cfg = config.get_localconfig_path(sid)
         if not cfg:
@@ -143,6 +152,7 @@ class BootstrapService(QObject):
         self._game_w = GameLoadWorker(self.mw.game_service, self._tid or "local")
         self._game_w.progress_update.connect(self._on_prog)
         self._game_w.finished.connect(self._on_games)
+        self._game_w.refreshed.connect(self._on_refreshed)
         self._game_w.start()
 
     def _on_sess_timeout(self):
@@ -190,6 +200,12 @@ class BootstrapService(QObject):
         self.load_progress.emit(step, cur, tot)
 
     def _on_games(self, ok):
+        with span("bootstrap.on_games") as sp:
+            if self.mw.game_service and self.mw.game_service.game_manager:
+                sp.count = len(self.mw.game_service.game_manager.games)
+            self._setup_services(ok)
+
+    def _setup_services(self, ok):
         from steam_library_manager.ui.widgets.ui_helper import UIHelper
         from steam_library_manager.integrations.steam_store import SteamStoreScraper
 
@@ -267,6 +283,24 @@ class BootstrapService(QObject):
 
         self._check_done()
 
+    def _on_refreshed(self, fresh):
+        # background full load after a warm start - patch only the deltas
+        gs = self.mw.game_service
+        if not gs or not self.mw.game_manager or gs.game_manager is not self.mw.game_manager:
+            return
+
+        changed = gs.apply_refresh(fresh)
+        if not changed:
+            return
+
+        # only the collections the changed fields feed into
+        if self.mw.smart_collection_manager:
+            self.mw.smart_collection_manager.apply_changes()
+        self.mw.populate_categories()
+        self.mw.update_statistics()
+
     def _check_done(self):
         if self._sess_done and self._games_done:
+            if self._span:
+                self._span.end()
             self.bootstrap_complete.emit()
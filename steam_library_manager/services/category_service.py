@@ -36,11 +36,14 @@ class CategoryService:
 
         parser.rename_category(old_name, new_name)
 
+        changes = self.game_manager.changes
         for game in self.game_manager.games.values():
             if old_name in game.categories:
                 game.categories.remove(old_name)
                 game.categories.append(new_name)
+                changes.note(game.app_id, "categories")
 
+        self.game_manager.query_svc.note_renamed(old_name, new_name)
         return True
 
     def delete_category(self, category_name):
@@ -54,7 +57,9 @@ class CategoryService:
         for game in self.game_manager.games.values():
             if category_name in game.categories:
                 game.categories.remove(category_name)
+                self.game_manager.changes.note(game.app_id, "categories")
 
+        self.game_manager.query_svc.note_deleted(category_name)
         return True
 
     def delete_multiple_categories(self, categories):
@@ -68,6 +73,8 @@ class CategoryService:
             for game in self.game_manager.games.values():
                 if cat in game.categories:
                     game.categories.remove(cat)
+                    self.game_manager.changes.note(game.app_id, "categories")
+            self.game_manager.query_svc.note_deleted(cat)
 
         return True
 
@@ -82,17 +89,22 @@ class CategoryService:
             return False
 
         sources = [c for c in categories if c != target_category]
+        qs = self.game_manager.query_svc
+        changes = self.game_manager.changes
 
         for src in sources:
             games_in_src = self.game_manager.get_games_by_category(src)
             for game in games_in_src:
+                changes.note(game.app_id, "categories")
                 if target_category not in game.categories:
                     game.categories.append(target_category)
                     parser.add_app_category(game.app_id, target_category)
+                    qs.note_added(game.app_id, target_category)
                 if src in game.categories:
                     game.categories.remove(src)
                     parser.remove_app_category(game.app_id, src)
             parser.delete_category(src)
+            qs.note_deleted(src)
 
         return True
 
@@ -157,6 +169,7 @@ class CategoryService:
                         self.cloud_parser._deleted_keys.add("user-collections.%s" % col_id)
                     self.cloud_parser.collections.remove(coll)
 
+            self.cloud_parser.invalidate_index()
             self.cloud_parser.modified = True
             merged += 1
 
@@ -192,7 +205,12 @@ class CategoryService:
                 aid = int(game.app_id)
             except (ValueError, TypeError):
                 continue
-            game.categories = cat_map.get(aid, [])
+            cats = cat_map.get(aid, [])
+            if cats != game.categories:
+                self.game_manager.changes.note(game.app_id, "categories")
+            game.categories = cats
+
+        self.game_manager.query_svc.invalidate()
 
     def get_all_categories(self):
         # Get all categories with game counts
@@ -210,6 +228,40 @@ class CategoryService:
             game = self.game_manager.games[app_id]
             if category not in game.categories:
                 game.categories.append(category)
+                self.game_manager.changes.note(app_id, "categories")
+            self.game_manager.query_svc.note_added(app_id, category)
+
+        return True
+
+    def apply_category_changes(self, add=None, remove=None):
+        # Add/remove many apps at once: add/remove map category -> app IDs.
+        # One parser pass, one query index update per category.
+        parser = self.get_active_parser()
+        if not parser:
+            return False
+
+        parser.apply_category_changes(add, remove)
+
+        games = self.game_manager.games
+        changes = self.game_manager.changes
+        query_svc = self.game_manager.query_svc
+        for category, app_ids in (remove or {}).items():
+            aids = [a for a in map(str, app_ids) if a in games]
+            for aid in aids:
+                game = games[aid]
+                if category in game.categories:
+                    game.categories.remove(category)
+                    changes.note(aid, "categories")
+            query_svc.note_batch(category, removed=aids)
+
+        for category, app_ids in (add or {}).items():
+            aids = [a for a in map(str, app_ids) if a in games]
+            for aid in aids:
+                game = games[aid]
+                if category not in game.categories:
+                    game.categories.append(category)
+                    changes.note(aid, "categories")
+            query_svc.note_batch(category, added=aids)
 
         return True
 
@@ -225,5 +277,7 @@ class CategoryService:
             game = self.game_manager.games[app_id]
             if category in game.categories:
                 game.categories.remove(category)
+                self.game_manager.changes.note(app_id, "categories")
+            self.game_manager.query_svc.note_removed(app_id, category)
 
         return True
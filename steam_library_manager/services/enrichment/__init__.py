@@ -12,6 +12,7 @@ from steam_library_manager.services.enrichment.achievement_enrichment_service im
 from steam_library_manager.services.enrichment.base_enrichment_thread import BaseEnrichmentThread
 from steam_library_manager.services.enrichment.deck_enrichment_service import DeckEnrichmentThread
 from steam_library_manager.services.enrichment.enrichment_service import EnrichmentThread
+from steam_library_manager.services.enrichment.fetch_engine import FetchEngine
 from steam_library_manager.services.enrichment.metadata_enrichment_service import MetadataEnrichmentService
 
 __all__: list[str] = [
@@ -19,5 +20,6 @@ __all__: list[str] = [
     "BaseEnrichmentThread",
     "DeckEnrichmentThread",
     "EnrichmentThread",
+    "FetchEngine",
     "MetadataEnrichmentService",
 ]
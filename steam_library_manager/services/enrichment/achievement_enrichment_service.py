@@ -22,6 +22,10 @@ __all__ = ["AchievementEnrichmentThread"]
 class AchievementEnrichmentThread(BaseEnrichmentThread):
     """Fetches Steam achievement data in background."""
 
+    # pipelined: the shared http client paces the Web API (HOST_LIMITS)
+    _pipeline_workers = 4
+    _fetch_host = "api.steampowered.com"
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._games = []
@@ -40,13 +44,12 @@ class AchievementEnrichmentThread(BaseEnrichmentThread):
         self._force_refresh = force_refresh
 
     def _setup(self):
-        from steam_library_manager.core.database import Database
         from steam_library_manager.integrations.steam_web_api import SteamWebAPI
 
         if not self._db_path or not self._api_key or not self._steam_id:
             raise ValueError("missing config")
 
-        self._db = Database(self._db_path)
+        self._db = self._open_db(self._db_path)
         self._api = SteamWebAPI(self._api_key)
 
     def _cleanup(self):
@@ -72,29 +75,51 @@ class AchievementEnrichmentThread(BaseEnrichmentThread):
     def _rate_limit(self):
         time.sleep(1.0)
 
+    def _fetch_item(self, item):
+        aid, _ = item
+        return self._fetch_achievements(aid)
+
+    def _store_item(self, item, data):
+        aid, _ = item
+        return self._store_achievements(aid, data)
+
+    def _commit(self):
+        self._db.commit()
+
     def _enrich(self, aid):
-        # get schema + progress + rarity
+        # fetch + store one game
+        ok = self._store_achievements(aid, self._fetch_achievements(aid))
+        self._commit_batch()
+        return ok
+
+    def _fetch_achievements(self, aid):
+        # get schema + progress + rarity (network only)
         sch = self._api.get_game_schema(aid)
         achs = (sch or {}).get("achievements", [])
+        if not achs:
+            return [], None, {}
+
+        pl = self._api.get_player_achievements(aid, self._steam_id)
+        gpct = self._api.get_global_achievement_percentages(aid)
+        return achs, pl, gpct
+
+    def _store_achievements(self, aid, data):
+        # merge and write, caller commits
+        achs, pl, gpct = data
 
         if not achs:
             # no achievements
-            self._db.upsert_achievement_stats(aid, 0, 0, 0.0, False)
-            self._db.commit()
+            self._write("upsert_achievement_stats", aid, 0, 0, 0.0, False)
             return True
 
         tot = len(achs)
 
         # player progress
-        pl = self._api.get_player_achievements(aid, self._steam_id)
         pmap = {}
         if pl:
             for a in pl:
                 pmap[a.get("apiname", "")] = a
 
-        # global rarity
-        gpct = self._api.get_global_achievement_percentages(aid)
-
         # merge
         recs = []
         ul = 0  # unlocked count
@@ -129,8 +154,7 @@ class AchievementEnrichmentThread(BaseEnrichmentThread):
         pct = (ul / tot * 100) if tot > 0 else 0.0
         perf = ul == tot and tot > 0
 
-        self._db.upsert_achievements(aid, recs)
-        self._db.upsert_achievement_stats(aid, tot, ul, pct, perf)
-        self._db.commit()
+        self._write("upsert_achievements", aid, recs)
+        self._write("upsert_achievement_stats", aid, tot, ul, pct, perf)
 
         return True
@@ -9,25 +9,67 @@
 from __future__ import annotations
 
 import logging
+import sqlite3
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from typing import Any
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from steam_library_manager.utils.rate_limiter import TokenBucket
+
 __all__ = ["BaseEnrichmentThread"]
 
 logger = logging.getLogger("steamlibmgr.enrichment.base")
 
+# pipelined mode: commit after this many stored items or seconds
+_BATCH_SIZE = 50
+_BATCH_SECS = 1.0
+
+# at most ~20 progress signals per second
+_PROGRESS_INTERVAL = 0.05
+
+# fetch attempts for errors listed in _retryable
+_FETCH_RETRIES = 4
+
+# worker result for items dropped by cancellation
+_SKIPPED = object()
+
 
 class BaseEnrichmentThread(QThread):
     """Template base class for enrichment threads.
 
+    Serial mode (default) calls _process_item() for one item after the
+    other with _rate_limit() in between.
+
+    Pipelined mode (opt-in via enable_pipeline()) is for subclasses that
+    split their work into _fetch_item() (network only, runs on a worker
+    pool) and _store_item() (database only, runs on this thread). Stored
+    items are committed through _commit() in batches by size or time.
+    With use_engine() the fetches go to a shared FetchEngine instead of
+    an own pool, capped per _fetch_host together with the other tracks.
+
     Signals:
-        progress: Emitted before each item (message, current, total).
+        progress: Emitted per item, coalesced in pipelined mode (message, current, total).
         finished_enrichment: Emitted when done (success_count, fail_count).
         error: Emitted on fatal error (error_message).
     """
 
+    # pipelined defaults for subclasses that implement _fetch_item/_store_item;
+    # 0 workers means the subclass does not support pipelined mode. Leave
+    # _pipeline_rate at 0 for hosts in http_client.HOST_LIMITS: the shared
+    # client already paces them, a second bucket here would only be tighter
+    _pipeline_workers: int = 0
+    _pipeline_rate: float = 0.0
+
+    # host _fetch_item() talks to, for the FetchEngine's concurrency cap
+    _fetch_host: str = ""
+
+    # exceptions from _fetch_item that mean "slow down and retry"; an optional
+    # retry_after attribute (seconds) is honoured
+    _retryable: tuple[type[BaseException], ...] = ()
+
     progress = pyqtSignal(str, int, int)
     finished_enrichment = pyqtSignal(int, int)
     error = pyqtSignal(str)
@@ -41,13 +83,74 @@ class BaseEnrichmentThread(QThread):
         super().__init__(parent)
         self._cancelled: bool = False
         self._force_refresh: bool = False
+        self._workers: int = 0
+        self._rate: float = 0.0
+        self._writer: Any = None
+        self._engine: Any = None
 
     def cancel(self) -> None:
         """Request cancellation of the enrichment loop."""
         self._cancelled = True
 
+    def enable_pipeline(self, workers: int | None = None, rate: float | None = None) -> bool:
+        """Switch to pipelined mode if the subclass supports it.
+
+        Args:
+            workers: Fetch threads, defaults to the subclass' _pipeline_workers.
+            rate: Fetches per second across all workers (0 = unpaced),
+                defaults to the subclass' _pipeline_rate.
+
+        Returns:
+            True if pipelined mode is on, False if the subclass is serial only.
+        """
+        if not self._pipeline_workers:
+            return False
+        self._workers = max(1, self._pipeline_workers if workers is None else workers)
+        self._rate = self._pipeline_rate if rate is None else rate
+        return True
+
+    def use_engine(self, engine: Any) -> bool:
+        """Run the fetches of pipelined mode on a shared FetchEngine.
+
+        Args:
+            engine: A started FetchEngine, or None for the own worker pool.
+
+        Returns:
+            True if the engine is used, False if the subclass is serial only.
+        """
+        if engine is not None and not self._workers and not self.enable_pipeline():
+            return False
+        self._engine = engine
+        return engine is not None
+
+    def use_writer(self, writer: Any) -> None:
+        """Route all writes through a shared DatabaseWriter.
+
+        Args:
+            writer: A started DatabaseWriter, or None for the own connection.
+        """
+        self._writer = writer
+
+    def _open_db(self, db_path: Any) -> Any:
+        """Open this thread's connection, read-only when a writer is attached."""
+        from steam_library_manager.core.database import Database
+
+        return Database(db_path, read_only=self._writer is not None)
+
+    def _write(self, method: str, *args: Any, **kwargs: Any) -> None:
+        """Call a Database write method, via the shared writer if there is one."""
+        if self._writer is not None:
+            self._writer.submit(method, *args, **kwargs)
+        else:
+            getattr(self._db, method)(*args, **kwargs)
+
+    def _flush_writes(self) -> None:
+        """Wait until the shared writer has committed this thread's writes."""
+        if self._writer is not None:
+            self._writer.flush()
+
     def run(self) -> None:
-        """Template method: iterate items, call _process_item() for each."""
+        """Template method: set up, process all items, clean up."""
         self._cancelled = False
         try:
             self._setup()
@@ -56,47 +159,177 @@ class BaseEnrichmentThread(QThread):
             self.error.emit(str(exc))
             return
 
+        try:
+            if self._workers:
+                success, failed = self._run_pipelined(items)
+            else:
+                success, failed = self._run_serial(items)
+        finally:
+            self._flush_writes()
+            self._cleanup()
+
+        self.finished_enrichment.emit(success, failed)
+
+    def _run_serial(self, items: list) -> tuple[int, int]:
+        """Call _process_item() for one item after the other."""
         total = len(items)
         success = 0
         failed = 0
 
+        for i, item in enumerate(items):
+            if self._cancelled:
+                break
+
+            self.progress.emit(
+                self._format_progress(item, i + 1, total),
+                i + 1,
+                total,
+            )
+
+            try:
+                processed = False
+                for attempt in range(3):
+                    try:
+                        if self._process_item(item):
+                            success += 1
+                        else:
+                            failed += 1
+                        processed = True
+                        break
+                    except Exception as exc:
+                        if "locked" in str(exc) and attempt < 2:
+                            time.sleep(2)
+                            continue
+                        raise
+                if not processed:
+                    failed += 1
+            except Exception as exc:
+                logger.warning("Enrichment failed for item %r: %s", item, exc)
+                failed += 1
+
+            self._rate_limit()
+
+        return success, failed
+
+    def _run_pipelined(self, items: list) -> tuple[int, int]:
+        """Fetch on a worker pool, store and commit in batches on this thread."""
+        total = len(items)
+        success = 0
+        failed = 0
+        done = 0
+        unsaved = 0
+        bucket = TokenBucket(self._rate, burst=self._workers) if self._rate > 0 else None
+        last_commit = last_emit = time.monotonic()
+
+        engine = self._engine
+        pool = None
+        if engine is None:
+            pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix=type(self).__name__)
+            window = self._workers * 2
+        else:
+            window = engine.capacity(self._fetch_host) * 2
+
         try:
-            for i, item in enumerate(items):
-                if self._cancelled:
-                    break
-
-                self.progress.emit(
-                    self._format_progress(item, i + 1, total),
-                    i + 1,
-                    total,
-                )
-
-                try:
-                    processed = False
-                    for attempt in range(3):
+            with pool or nullcontext():
+                queue = iter(items)
+                futures = {}
+
+                def submit_next() -> None:
+                    for item in queue:
+                        if engine is None:
+                            fut = pool.submit(self._fetch_paced, item, bucket)
+                        else:
+                            fut = engine.submit(self._fetch_host, self._fetch_paced, item, bucket)
+                        futures[fut] = item
+                        return
+
+                # a short queue keeps cancellation quick
+                for _ in range(window):
+                    submit_next()
+
+                while futures:
+                    # wake up for a time-based commit while results are pending
+                    due = max(0.0, _BATCH_SECS - (time.monotonic() - last_commit)) if unsaved else None
+                    finished, _ = wait(futures, timeout=due, return_when=FIRST_COMPLETED)
+                    for fut in finished:
+                        item = futures.pop(fut)
                         try:
-                            if self._process_item(item):
-                                success += 1
-                            else:
-                                failed += 1
-                            processed = True
-                            break
+                            payload = fut.result()
+                            if payload is not _SKIPPED:
+                                unsaved += 1
+                                if self._store_item(item, payload):
+                                    success += 1
+                                else:
+                                    failed += 1
                         except Exception as exc:
-                            if "locked" in str(exc) and attempt < 2:
-                                time.sleep(2)
-                                continue
-                            raise
-                    if not processed:
-                        failed += 1
-                except Exception as exc:
-                    logger.warning("Enrichment failed for item %r: %s", item, exc)
-                    failed += 1
-
-                self._rate_limit()
+                            logger.warning("Enrichment failed for item %r: %s", item, exc)
+                            failed += 1
+
+                        done += 1
+                        now = time.monotonic()
+                        if done == total or now - last_emit >= _PROGRESS_INTERVAL:
+                            self.progress.emit(self._format_progress(item, done, total), done, total)
+                            last_emit = now
+
+                        if unsaved >= _BATCH_SIZE or (unsaved and now - last_commit >= _BATCH_SECS):
+                            self._commit_batch()
+                            unsaved = 0
+                            last_commit = now
+
+                        if not self._cancelled:
+                            submit_next()
+
+                    # nothing finished within the batch window
+                    now = time.monotonic()
+                    if unsaved and now - last_commit >= _BATCH_SECS:
+                        self._commit_batch()
+                        unsaved = 0
+                        last_commit = now
         finally:
-            self._cleanup()
-
-        self.finished_enrichment.emit(success, failed)
+            if unsaved:
+                self._commit_batch()
+
+        return success, failed
+
+    def _fetch_paced(self, item: Any, bucket: TokenBucket | None) -> Any:
+        """Worker thread: _fetch_item() behind the token bucket, with backoff."""
+        for attempt in range(_FETCH_RETRIES):
+            if bucket is not None and not bucket.acquire(lambda: self._cancelled):
+                return _SKIPPED
+            if self._cancelled:
+                return _SKIPPED
+            try:
+                payload = self._fetch_item(item)
+            except self._retryable as exc:
+                delay = getattr(exc, "retry_after", 0) or 2.0**attempt
+                logger.info("Throttled on %r (%s), backing off %.1fs", item, exc, delay)
+                if attempt == _FETCH_RETRIES - 1:
+                    raise
+                if bucket is not None:
+                    bucket.backoff(delay)
+                else:
+                    time.sleep(delay)
+                continue
+            if bucket is not None:
+                bucket.recover()
+            return payload
+        return _SKIPPED
+
+    def _commit_batch(self) -> None:
+        """_commit() with a short retry while another writer holds the lock."""
+        if self._writer is not None:
+            # the writer commits on its own schedule
+            return
+        for attempt in range(3):
+            try:
+                self._commit()
+                return
+            except sqlite3.OperationalError as exc:
+                if "locked" in str(exc) and attempt < 2:
+                    time.sleep(0.5)
+                    continue
+                logger.warning("Enrichment batch commit failed: %s", exc)
+                return
 
     # ── Subclasses MUST override these ──────────────────
 
@@ -111,6 +344,9 @@ class BaseEnrichmentThread(QThread):
     def _process_item(self, item: Any) -> bool:
         """Process a single item.
 
+        The default fetches, stores and commits it, so subclasses that
+        implement the pipelined hooks get serial mode for free.
+
         Args:
             item: The item from _get_items() to process.
 
@@ -118,9 +354,11 @@ class BaseEnrichmentThread(QThread):
             True on success, False on expected failure.
 
         Raises:
-            NotImplementedError: Subclass must implement.
+            NotImplementedError: Subclass must implement this or the pipelined hooks.
         """
-        raise NotImplementedError
+        ok = self._store_item(item, self._fetch_item(item))
+        self._commit_batch()
+        return ok
 
     def _format_progress(self, item: Any, current: int, total: int) -> str:
         """Format a progress message for the current item.
@@ -156,3 +394,39 @@ class BaseEnrichmentThread(QThread):
     def _rate_limit(self) -> None:
         """Sleep between items to respect rate limits. Override as needed."""
         time.sleep(1.0)
+
+    # ── Pipelined mode hooks ─────────────────────────────
+
+    def _fetch_item(self, item: Any) -> Any:
+        """Fetch the data for one item. Runs on a worker thread.
+
+        Must not touch the database connection opened in _setup().
+
+        Args:
+            item: The item from _get_items() to fetch.
+
+        Returns:
+            Payload handed to _store_item().
+
+        Raises:
+            NotImplementedError: Subclass must implement for pipelined mode.
+        """
+        raise NotImplementedError
+
+    def _store_item(self, item: Any, payload: Any) -> bool:
+        """Write one fetched item without committing. Runs on this thread.
+
+        Args:
+            item: The item from _get_items().
+            payload: What _fetch_item() returned for it.
+
+        Returns:
+            True on success, False on expected failure.
+
+        Raises:
+            NotImplementedError: Subclass must implement for pipelined mode.
+        """
+        raise NotImplementedError
+
+    def _commit(self) -> None:
+        """Commit the items stored since the last call."""
@@ -29,27 +29,29 @@ class DeckEnrichmentThread(BaseEnrichmentThread):
     caches the result. Rate limited to 1 req/sec.
     """
 
+    # pipelined: the shared http client keeps the store at 1 req/s,
+    # slow answers overlap
+    _pipeline_workers = 4
+    _fetch_host = "store.steampowered.com"
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._games = []
         self._cdir = None
-        self._sdir = None
 
     def configure(self, games, cache_dir, force_refresh=False):
         self._games = games
         self._cdir = cache_dir
         self._force_refresh = force_refresh
 
-    def _setup(self):
-        self._sdir = self._cdir / "store_data"
-        self._sdir.mkdir(parents=True, exist_ok=True)
-
     def _get_items(self):
         return self._games
 
-    def _process_item(self, game):
+    def _fetch_item(self, game):
         # fetch and cache
-        st = self._fetch(game.app_id, self._sdir)
+        return self._fetch(game.app_id, self._cdir)
+
+    def _store_item(self, game, st):
         if st:
             game.steam_deck_status = st
             return True
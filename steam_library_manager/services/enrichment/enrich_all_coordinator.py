@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import logging
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
 logger = logging.getLogger("steamlibmgr.enrich_all")
 
@@ -36,11 +36,19 @@ TRK_CURATOR = "curator"
 
 
 class EnrichAllCoordinator(QObject):
-    """Runs all enrichment sources - tags first, then parallel."""
+    """Runs all enrichment sources - tags first, then parallel.
+
+    The parallel tracks share one DatabaseWriter: they read through
+    read-only connections and hand their upserts to the writer thread,
+    so only one connection ever holds the write lock. Their network
+    fetches share one FetchEngine, which keeps many requests in flight
+    with a concurrency cap per host.
+    """
 
     track_progress = pyqtSignal(str, int, int)
     track_finished = pyqtSignal(str, int, int)
     all_finished = pyqtSignal(dict)
+    writer_stats = pyqtSignal(object)  # WriterMetrics, once a second while running
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -48,6 +56,9 @@ class EnrichAllCoordinator(QObject):
         self._results = {}
         self._pending = 0
         self._cancelled = False
+        self._writer = None
+        self._engine = None
+        self._stats_timer = None
 
         # config params (set via configure())
         self._db_path = None
@@ -182,6 +193,8 @@ class EnrichAllCoordinator(QObject):
             self.track_finished.emit(TRK_CURATOR, -1, 0)
 
         if self._pending == 0:
+            self._stop_writer()
+            self._stop_engine()
             self.all_finished.emit(self._results)
 
     # track A: steam api (metadata -> achievements -> pegi chain)
@@ -191,6 +204,7 @@ class EnrichAllCoordinator(QObject):
 
         thr = EnrichmentThread(self)
         thr.configure_steam(self._games_db, self._db_path, self._api_key, force_refresh=True)
+        thr.use_writer(self._shared_writer())
 
         thr.progress.connect(lambda _t, cur, tot: self.track_progress.emit(TRK_STEAM, cur, tot))
         thr.finished_enrichment.connect(self._on_steam_meta_done)
@@ -218,6 +232,9 @@ class EnrichAllCoordinator(QObject):
 
         thr = AchievementEnrichmentThread(self)
         thr.configure(self._games_db, self._db_path, self._api_key, self._steam_id, force_refresh=True)
+        thr.enable_pipeline()
+        thr.use_engine(self._fetch_engine())
+        thr.use_writer(self._shared_writer())
 
         thr.progress.connect(lambda _t, cur, tot: self.track_progress.emit(TRK_STEAM, cur, tot))
         thr.finished_enrichment.connect(lambda s, f: self._on_steam_done(meta_ok, meta_fail, s, f))
@@ -317,7 +334,12 @@ class EnrichAllCoordinator(QObject):
     # shared wiring helpers
 
     def _wire_and_go(self, name, thr):
-        # hook up signals and start track
+        # hook up signals and start track; tracks that can fetch in
+        # parallel commit in batches, so they hold the write lock less often
+        thr.enable_pipeline()
+        thr.use_engine(self._fetch_engine())
+        if name != TRK_CURATOR:
+            thr.use_writer(self._shared_writer())
         thr.progress.connect(lambda _t, cur, tot: self.track_progress.emit(name, cur, tot))
         thr.finished_enrichment.connect(lambda s, f: self._on_trk_done(name, s, f))
         thr.error.connect(lambda msg: self._on_trk_err(name, msg))
@@ -338,4 +360,69 @@ class EnrichAllCoordinator(QObject):
     def _trk_complete(self):
         self._pending -= 1
         if self._pending <= 0:
+            self._stop_writer()
+            self._stop_engine()
             self.all_finished.emit(self._results)
+
+    # shared fetch engine
+
+    def _fetch_engine(self):
+        # started by the first pipelined track, stopped when all are done
+        if self._engine is None:
+            from steam_library_manager.services.enrichment.fetch_engine import FetchEngine
+
+            self._engine = FetchEngine()
+            self._engine.start()
+        return self._engine
+
+    def _stop_engine(self):
+        if self._engine is not None:
+            self._engine.stop()
+            self._engine = None
+
+    # shared database writer
+
+    def _shared_writer(self):
+        # started by the first track that writes, stopped when all are done
+        if self._writer is None and self._db_path:
+            from steam_library_manager.core.db.write_service import DatabaseWriter
+
+            writer = DatabaseWriter(self._db_path)
+            writer.start()
+            if not writer.running:
+                # could not open the file - tracks fall back to own connections
+                return None
+            self._writer = writer
+            self._stats_timer = QTimer(self)
+            self._stats_timer.setInterval(1000)
+            self._stats_timer.timeout.connect(self._emit_writer_stats)
+            self._stats_timer.start()
+        return self._writer
+
+    def _emit_writer_stats(self):
+        if self._writer is None:
+            return
+        m = self._writer.metrics()
+        if m.queue_depth:
+            logger.debug("db writer: %d queued, last commit %.1f ms", m.queue_depth, m.last_commit_ms)
+        self.writer_stats.emit(m)
+
+    def _stop_writer(self):
+        if self._stats_timer is not None:
+            self._stats_timer.stop()
+            self._stats_timer = None
+        if self._writer is None:
+            return
+        self._writer.stop()
+        m = self._writer.metrics()
+        self._writer = None
+        logger.info(
+            "db writer: %d calls in %d commits (avg %.1f ms, max %.1f ms), peak queue %d, %d errors",
+            m.calls,
+            m.commits,
+            m.avg_commit_ms,
+            m.max_commit_ms,
+            m.peak_queue_depth,
+            m.errors,
+        )
+        self.writer_stats.emit(m)
@@ -9,10 +9,10 @@
 from __future__ import annotations
 
 import logging
-import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from steam_library_manager.integrations.hltb_api import HLTBThrottled
 from steam_library_manager.services.enrichment.base_enrichment_thread import BaseEnrichmentThread
 from steam_library_manager.utils.age_ratings import convert_to_pegi
 from steam_library_manager.utils.i18n import t
@@ -26,7 +26,16 @@ __all__ = ["EnrichmentThread"]
 
 
 class EnrichmentThread(BaseEnrichmentThread):
-    """Thread for enriching game metadata from external APIs."""
+    """Thread for enriching game metadata from external APIs.
+
+    HLTB mode always runs pipelined: concurrent searches over the shared
+    client session, writes batched on this thread.
+    """
+
+    # HLTB: searches are paced by the shared http client (HOST_LIMITS)
+    _pipeline_workers = 4
+    _retryable = (HLTBThrottled,)
+    _fetch_host = "howlongtobeat.com"
 
     def __init__(self, parent=None):
         # init thread
@@ -39,7 +48,16 @@ class EnrichmentThread(BaseEnrichmentThread):
         self._api_key = ""
         self._db = None
 
-    def configure_hltb(self, games, db_path: Path, hltb_client: HLTBClient, steam_user_id="", force_refresh=False):
+    def configure_hltb(
+        self,
+        games,
+        db_path: Path,
+        hltb_client: HLTBClient,
+        steam_user_id="",
+        force_refresh=False,
+        workers=None,
+        rate=None,
+    ):
         # setup for HLTB mode
         self._mode = "hltb"
         self._games = games
@@ -47,6 +65,7 @@ class EnrichmentThread(BaseEnrichmentThread):
         self._hltb_client = hltb_client
         self._steam_user_id = steam_user_id
         self._force_refresh = force_refresh
+        self.enable_pipeline(workers, rate)
 
     def configure_steam(self, games, db_path: Path, api_key, force_refresh=False):
         # setup for Steam API mode
@@ -67,9 +86,7 @@ class EnrichmentThread(BaseEnrichmentThread):
 
     def _setup(self):
         # open db and load cache
-        from steam_library_manager.core.database import Database
-
-        self._db = Database(self._db_path)
+        self._db = self._open_db(self._db_path)
 
         # load existing mappings
         cached = self._db.load_hltb_id_cache()
@@ -83,7 +100,8 @@ class EnrichmentThread(BaseEnrichmentThread):
             )
             api_mappings = self._hltb_client.fetch_steam_import(self._steam_user_id)
             if api_mappings:
-                self._db.save_hltb_id_cache(api_mappings)
+                self._write("save_hltb_id_cache", api_mappings, commit=False)
+                self._commit_batch()
                 cached = api_mappings
                 logger.info("HLTB Steam Import: saved %d mappings to DB", len(api_mappings))
 
@@ -101,63 +119,40 @@ class EnrichmentThread(BaseEnrichmentThread):
         # return games list
         return self._games
 
-    def _process_item(self, item):
-        # enrich single game with HLTB data
+    def _format_progress(self, item, current, total):
+        # format progress text with game name
+        _app_id, name = item
+        return t("ui.enrichment.progress", name=name, current=current, total=total)
+
+    def _fetch_item(self, item):
+        # worker thread: search HLTB (HLTBThrottled -> base backs off)
         app_id, name = item
-        result = self._hltb_client.search_game(name, app_id)
+        return self._hltb_client.search_game(name, app_id)
 
+    def _store_item(self, item, result):
+        # write the hltb_data row; True if the game got real times
+        app_id, name = item
         if result:
-            has_times = any((result.main_story, result.main_extras, result.completionist))
-            self._db.conn.execute(
-                """
-                INSERT OR REPLACE INTO hltb_data
-                (app_id, main_story, main_extras, completionist, last_updated)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    app_id,
-                    result.main_story,
-                    result.main_extras,
-                    result.completionist,
-                    int(time.time()),
-                ),
-            )
-            self._db.conn.commit()
-
-            if has_times:
+            self._write("upsert_hltb_batch", [(app_id, result.main_story, result.main_extras, result.completionist)])
+            if any((result.main_story, result.main_extras, result.completionist)):
                 return True
-
             logger.debug("HLTB matched '%s' but 0h times, saved as checked", name)
             return False
 
         # mark as checked with NULL times so it won't be retried
         # dunno why HLTB returns empty results but we need to track it
-        self._db.conn.execute(
-            """
-            INSERT OR REPLACE INTO hltb_data
-            (app_id, main_story, main_extras, completionist, last_updated)
-            VALUES (?, NULL, NULL, NULL, ?)
-            """,
-            (app_id, int(time.time())),
-        )
-        self._db.conn.commit()
+        self._write("upsert_hltb_batch", [(app_id, None, None, None)])
         logger.info("HLTB miss: %d '%s' (marked as checked)", app_id, name)
         return False
 
-    def _format_progress(self, item, current, total):
-        # format progress text with game name
-        _app_id, name = item
-        return t("ui.enrichment.progress", name=name, current=current, total=total)
-
-    def _rate_limit(self):
-        # sleep between requests - HLTB gets angry if we go too fast
-        time.sleep(0.2)
+    def _commit(self):
+        if self._db:
+            self._db.commit()
 
     # --- Steam API mode ---
 
     def _run_steam(self):
         # batch enrich from Steam Web API
-        from steam_library_manager.core.database import Database
         from steam_library_manager.integrations.steam_web_api import SteamWebAPI
 
         self._cancelled = False
@@ -177,7 +172,7 @@ class EnrichmentThread(BaseEnrichmentThread):
         success = 0
         failed = 0
 
-        db = Database(self._db_path)
+        self._db = self._open_db(self._db_path)
         try:
             batch_size = 50
             for batch_start in range(0, len(app_ids), batch_size):
@@ -213,7 +208,7 @@ class EnrichmentThread(BaseEnrichmentThread):
                             update_fields["original_release_date"] = details.original_release_date
 
                         if update_fields:
-                            db.upsert_game_metadata(aid, **update_fields)
+                            self._write("upsert_game_metadata", aid, **update_fields)
 
                         if details.languages:
                             lang_dict = {
@@ -224,7 +219,7 @@ class EnrichmentThread(BaseEnrichmentThread):
                                 }
                                 for lang in details.languages
                             }
-                            db.upsert_languages(aid, lang_dict)
+                            self._write("upsert_languages", aid, lang_dict)
 
                         # extract PEGI from age ratings - ugh, so many formats
                         if details.age_ratings:
@@ -239,40 +234,24 @@ class EnrichmentThread(BaseEnrichmentThread):
                                     break
 
                             if pegi_value:
-                                db.conn.execute(
-                                    "UPDATE games SET pegi_rating = ? WHERE app_id = ?",
-                                    (pegi_value, aid),
-                                )
-
-                            for system, value in details.age_ratings:
-                                db.conn.execute(
-                                    """INSERT OR REPLACE INTO age_ratings
-                                       (app_id, rating_system, rating_value, source, fetched_at)
-                                       VALUES (?, ?, ?, 'api', ?)""",
-                                    (aid, system, str(value), int(time.time())),
-                                )
+                                self._write("set_pegi_rating", aid, pegi_value)
+                            self._write("upsert_age_ratings", aid, details.age_ratings)
 
                         if details.genres:
-                            db.conn.execute("DELETE FROM game_genres WHERE app_id = ?", (aid,))
-                            db.conn.executemany(
-                                "INSERT OR REPLACE INTO game_genres (app_id, genre) VALUES (?, ?)",
-                                [(aid, g) for g in details.genres],
-                            )
+                            self._write("replace_genres", aid, details.genres)
 
                         if details.tags:
-                            db.conn.execute("DELETE FROM game_tags WHERE app_id = ?", (aid,))
-                            db.conn.executemany(
-                                "INSERT OR REPLACE INTO game_tags (app_id, tag) VALUES (?, ?)",
-                                [(aid, tg) for tg in details.tags],
-                            )
+                            self._write("replace_tags", aid, details.tags)
 
-                        db.conn.commit()
                         success += 1
 
+                    self._commit_batch()
+
                 except Exception as exc:
                     logger.warning("Steam API batch failed: %s", exc)
                     failed += len(batch)
         finally:
-            db.close()
+            self._flush_writes()
+            self._cleanup()
 
         self.finished_enrichment.emit(success, failed)
@@ -0,0 +1,128 @@
+#
+# steam_library_manager/services/enrichment/fetch_engine.py
+# asyncio scheduler keeping many enrichment fetches in flight per host
+#
+# Copyright © 2025-2026 SwitchBros
+# Licensed under the MIT License. See LICENSE for details.
+#
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger("steamlibmgr.enrichment.engine")
+
+__all__ = ["FetchEngine"]
+
+# concurrent fetches per host; pacing itself is the shared http client's job
+HOST_CONCURRENCY: dict[str, int] = {
+    "api.steampowered.com": 8,
+    "store.steampowered.com": 6,
+    "www.protondb.com": 8,
+    "howlongtobeat.com": 6,
+}
+_DEFAULT_CONCURRENCY = 4
+_MAX_IN_FLIGHT = 48
+
+
+class FetchEngine:
+    """One asyncio loop on a background thread for all enrichment tracks.
+
+    Tracks submit blocking fetch calls tagged with a host. The loop caps
+    how many run at once per host (an asyncio.Semaphore each) and hands
+    them to a shared executor, so a few dozen requests are in flight
+    across ProtonDB, HLTB, the Store and the Web API while every host
+    stays under its own limit. submit() returns a concurrent Future, so
+    QThreads wait on it exactly like on a ThreadPoolExecutor.
+    """
+
+    def __init__(self, limits=None, max_in_flight=_MAX_IN_FLIGHT):
+        self._limits = dict(HOST_CONCURRENCY if limits is None else limits)
+        self._max = max_in_flight
+        self._loop = None
+        self._thread = None
+        self._pool = None
+        self._sems = {}
+        self._in_flight = {}
+        self._peak = {}
+        self._lock = threading.Lock()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Starts the loop thread; a no-op if it is already running."""
+        if self.running:
+            return
+        ready = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._pool = ThreadPoolExecutor(max_workers=self._max, thread_name_prefix="fetch")
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            self._loop.call_soon(ready.set)
+            self._loop.run_forever()
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="FetchEngine", daemon=True)
+        self._thread.start()
+        ready.wait()
+
+    def stop(self):
+        """Stops the loop; fetches not started yet are dropped."""
+        if not self.running:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._thread = None
+        self._sems.clear()
+        peaks = ", ".join("%s %d" % kv for kv in sorted(self._peak.items()))
+        if peaks:
+            logger.info("fetch engine peak in flight: %s" % peaks)
+
+    def capacity(self, host):
+        """Concurrent fetches allowed for a host."""
+        return self._limits.get(host, _DEFAULT_CONCURRENCY)
+
+    def submit(self, host, fn, *args):
+        """Schedules fn(*args) under the host's concurrency cap.
+
+        Args:
+            host: Host the call talks to (only used for the cap).
+            fn: Blocking callable.
+            *args: Its arguments.
+
+        Returns:
+            concurrent.futures.Future with fn's result or exception.
+
+        Raises:
+            RuntimeError: If the engine is not running.
+        """
+        if not self.running:
+            raise RuntimeError("FetchEngine is not running")
+        return asyncio.run_coroutine_threadsafe(self._run(host, fn, args), self._loop)
+
+    def in_flight(self):
+        """Currently running fetches per host."""
+        with self._lock:
+            return {h: n for h, n in self._in_flight.items() if n}
+
+    async def _run(self, host, fn, args):
+        sem = self._sems.get(host)
+        if sem is None:
+            # created on the loop thread, the only place they are touched
+            sem = self._sems[host] = asyncio.Semaphore(self.capacity(host))
+        async with sem:
+            with self._lock:
+                n = self._in_flight[host] = self._in_flight.get(host, 0) + 1
+                self._peak[host] = max(self._peak.get(host, 0), n)
+            try:
+                return await self._loop.run_in_executor(self._pool, fn, *args)
+            finally:
+                with self._lock:
+                    self._in_flight[host] -= 1
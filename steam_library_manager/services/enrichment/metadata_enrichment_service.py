@@ -9,7 +9,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 
@@ -17,6 +16,7 @@ from typing import Final
 
 from steam_library_manager.core.database import is_placeholder_name
 from steam_library_manager.core.game import Game
+from steam_library_manager.core.response_cache import response_cache
 from steam_library_manager.utils.date_utils import format_timestamp_to_date
 from steam_library_manager.utils.i18n import t
 
@@ -117,6 +117,7 @@ class MetadataEnrichmentService:
                 missing = local_ids - api_ids
 
                 if missing:
+                    new = []
                     for app_id in missing:
                         cats = []
 
@@ -142,8 +143,12 @@ class MetadataEnrichmentService:
                         if not cats:
                             continue
 
-                        # Create game entry
-                        name = self._get_cached_name(app_id) or t("ui.game_details.game_fallback", id=app_id)
+                        new.append((app_id, cats, hidden))
+
+                    # Create game entries, names resolved in one cache query
+                    names = self._cached_names(app_id for app_id, _, _ in new)
+                    for app_id, cats, hidden in new:
+                        name = names.get(app_id) or t("ui.game_details.game_fallback", id=app_id)
                         game = Game(app_id=app_id, name=name)
                         game.categories = cats
                         game.hidden = hidden
@@ -151,16 +156,17 @@ class MetadataEnrichmentService:
             except (KeyError, ValueError, TypeError):
                 pass  # Parser doesn't support get_all_app_ids
 
-    def _get_cached_name(self, app_id: str) -> str | None:
-        cache_file = self._cache_dir / "store_data" / f"{app_id}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, "r") as f:
-                    data = json.load(f)
-                    return data.get("name")
-            except (OSError, json.JSONDecodeError):
-                pass
-        return None
+    # app_id -> store name for many apps in one batched cache lookup
+    def _cached_names(self, app_ids) -> dict[str, str]:
+        app_ids = list(app_ids)
+        names = {}
+        if not app_ids:
+            return names
+        for app_id, data in response_cache(self._cache_dir).get_many("store", app_ids).items():
+            name = data.get("name") if isinstance(data, dict) else None
+            if name and not is_placeholder_name(name):
+                names[app_id] = name
+        return names
 
     # Types that represent real content worth showing in the library
     _DISCOVERABLE_TYPES: frozenset[str] = frozenset({"game", "music", "tool", "application", "video"})
@@ -190,7 +196,7 @@ class MetadataEnrichmentService:
         if not candidates:
             return 0
 
-        count = 0
+        found = []  # (app_id, app_type, name or "")
         fallback = set()
 
         for app_id in candidates:
@@ -211,13 +217,8 @@ class MetadataEnrichmentService:
             if app_type not in self._DISCOVERABLE_TYPES:
                 continue
 
-            # Use DB name only if it's a real name, otherwise try cache or fallback
-            ename = db_name if not is_placeholder_name(db_name) else ""
-            name = ename or self._get_cached_name(app_id) or t("ui.game_details.game_fallback", id=app_id)
-
-            game = Game(app_id=app_id, name=name, app_type=app_type)
-            self._games[app_id] = game
-            count += 1
+            # Use DB name only if it's a real name, otherwise cache or fallback below
+            found.append((app_id, app_type, db_name if not is_placeholder_name(db_name) else ""))
 
         # Fallback: resolve IDs not in DB via appinfo.vdf binary lookup
         if fallback and appinfo_manager:
@@ -229,12 +230,16 @@ class MetadataEnrichmentService:
                 name = meta.get("name", "")
                 if app_type not in self._DISCOVERABLE_TYPES:
                     continue
-                if not name or is_placeholder_name(name):
-                    name = self._get_cached_name(app_id) or t("ui.game_details.game_fallback", id=app_id)
-                game = Game(app_id=app_id, name=name, app_type=app_type)
-                self._games[app_id] = game
-                count += 1
+                found.append((app_id, app_type, name if name and not is_placeholder_name(name) else ""))
+
+        # Names neither source knows come from the store cache, all in one query
+        cached = self._cached_names(app_id for app_id, _, name in found if not name)
+
+        for app_id, app_type, name in found:
+            name = name or cached.get(app_id) or t("ui.game_details.game_fallback", id=app_id)
+            self._games[app_id] = Game(app_id=app_id, name=name, app_type=app_type)
 
+        count = len(found)
         if count > 0:
             logger.info(t("logs.manager.discovered_missing", count=count))
 
@@ -17,6 +17,9 @@ logger = logging.getLogger("steamlibmgr.enrichment.pegi")
 
 __all__ = ["PEGIEnrichmentThread"]
 
+# _fetch_item result for games that already have a rating
+_CACHED = object()
+
 
 class PEGIEnrichmentThread(BaseEnrichmentThread):
     """Fills in missing PEGI ratings from the Steam store.
@@ -25,6 +28,10 @@ class PEGIEnrichmentThread(BaseEnrichmentThread):
     Uses SteamStoreScraper to fetch individual store pages for the rest.
     """
 
+    # pipelined: store pages are paced by the shared http client
+    _pipeline_workers = 4
+    _fetch_host = "store.steampowered.com"
+
     def __init__(self, p=None):
         super().__init__(p)
         self._g = []
@@ -33,6 +40,7 @@ class PEGIEnrichmentThread(BaseEnrichmentThread):
         self._l = "en"
         self._db = None
         self._s = None
+        self._have = set()
 
     def configure(self, g, dbp, lang="en", fr=False):
         self._g = g
@@ -41,10 +49,9 @@ class PEGIEnrichmentThread(BaseEnrichmentThread):
         self._f = fr
 
     def _setup(self):
-        from steam_library_manager.core.database import Database
         from steam_library_manager.integrations.steam_store import SteamStoreScraper
 
-        self._db = Database(self._dbp)
+        self._db = self._open_db(self._dbp)
         cd = self._dbp.parent / "cache"
         cd.mkdir(parents=True, exist_ok=True)
         self._s = SteamStoreScraper(cd, self._l)
@@ -55,31 +62,36 @@ class PEGIEnrichmentThread(BaseEnrichmentThread):
             self._db = None
 
     def _get_items(self):
+        # games that already have a rating are looked up once, workers never touch the db
+        if not self._f and self._db is not None:
+            cur = self._db.conn.execute("SELECT app_id FROM games WHERE pegi_rating != ''")
+            self._have = {r[0] for r in cur.fetchall()}
         return self._g
 
-    def _process_item(self, it):
-        aid, nm = it
-
-        # skip if already has rating
-        if not self._f:
-            cur = self._db.conn.execute("SELECT pegi_rating FROM games WHERE app_id = ? AND pegi_rating != ''", (aid,))
-            if cur.fetchone():
-                return True
+    def _fetch_item(self, it):
+        aid, _nm = it
+        if aid in self._have:
+            return _CACHED
 
         if self._f:
-            cf = self._s.cache_dir.parent / "age_ratings" / ("%d.json" % aid)
-            if cf.exists():
-                cf.unlink(missing_ok=True)
+            self._s.forget_age_rating(str(aid))
 
-        rt = self._s.fetch_age_rating(str(aid))
+        return self._s.fetch_age_rating(str(aid))
+
+    def _store_item(self, it, rt):
+        aid, _nm = it
+        if rt is _CACHED:
+            return True
 
         if rt:
-            self._db.conn.execute("UPDATE games SET pegi_rating = ? WHERE app_id = ?", (rt, aid))
-            self._db.conn.commit()
+            self._write("set_pegi_rating", aid, rt)
             return True
 
         return False
 
+    def _commit(self):
+        self._db.commit()
+
     def _format_progress(self, it, cur, tot):
         _aid, nm = it
         return t("ui.enrichment.progress", name=nm, current=cur, total=tot)
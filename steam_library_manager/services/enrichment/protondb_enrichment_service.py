@@ -18,6 +18,9 @@ logger = logging.getLogger("steamlibmgr.enrichment.protondb")
 
 __all__ = ["ProtonDBEnrichmentThread"]
 
+# _fetch_item result for ratings still fresh in the db
+_CACHED = object()
+
 
 class ProtonDBEnrichmentThread(BaseEnrichmentThread):
     """Background worker for ProtonDB rating lookups.
@@ -26,6 +29,10 @@ class ProtonDBEnrichmentThread(BaseEnrichmentThread):
     from protondb.com API, caches in local DB.
     """
 
+    # pipelined: the shared http client paces protondb.com (HOST_LIMITS)
+    _pipeline_workers = 4
+    _fetch_host = "www.protondb.com"
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._games = []
@@ -33,6 +40,7 @@ class ProtonDBEnrichmentThread(BaseEnrichmentThread):
         self._force_refresh = False
         self._db = None
         self._cli = None
+        self._fresh = set()
 
     def configure(self, games, db_path, force_refresh=False):
         # setup before run
@@ -42,12 +50,10 @@ class ProtonDBEnrichmentThread(BaseEnrichmentThread):
 
     def _setup(self):
         # init db + api client
-        from steam_library_manager.core.database import Database
-        from steam_library_manager.integrations.protondb_api import ProtonDBClient, fetch_and_persist_protondb
+        from steam_library_manager.integrations.protondb_api import ProtonDBClient
 
-        self._db = Database(self._dbpath)
+        self._db = self._open_db(self._dbpath)
         self._cli = ProtonDBClient()
-        self._fetch = fetch_and_persist_protondb
 
     def _cleanup(self):
         if self._db:
@@ -55,30 +61,43 @@ class ProtonDBEnrichmentThread(BaseEnrichmentThread):
             self._db = None
 
     def _get_items(self):
+        # cached ratings are looked up once here, workers never touch the db
+        self._fresh = set() if self._force_refresh else self._db.get_fresh_protondb_ids()
         return self._games
 
-    def _process_item(self, item):
+    def _fetch_item(self, item):
         # get rating for one game
-        app_id, name = item
+        app_id, _name = item
+        if app_id in self._fresh:
+            return _CACHED
+        return self._cli.get_rating(app_id)
 
-        # check cache
-        if not self._force_refresh:
-            cached = self._db.get_cached_protondb(app_id)
-            if cached:
-                logger.debug("cache hit: %d '%s'" % (app_id, name))
-                return True
+    def _store_item(self, item, rt):
+        app_id, name = item
+        if rt is _CACHED:
+            logger.debug("cache hit: %d '%s'" % (app_id, name))
+            return True
 
-        # fetch from api
-        tier = self._fetch(app_id, self._db, self._cli)
-        if tier:
+        if rt:
+            self._write(
+                "upsert_protondb",
+                app_id,
+                tier=rt.tier,
+                confidence=rt.confidence,
+                trending_tier=rt.trending_tier,
+                score=rt.score,
+                best_reported=rt.best_reported,
+            )
             return True
 
         # mark unknown to avoid hammering
-        self._db.upsert_protondb(app_id, tier="unknown")
-        self._db.commit()
+        self._write("upsert_protondb", app_id, tier="unknown")
         logger.info("miss: %d '%s' (unknown)" % (app_id, name))
         return False
 
+    def _commit(self):
+        self._db.commit()
+
     def _format_progress(self, item, current, total):
         _id, name = item
         return t("ui.enrichment.progress", name=name, current=current, total=total)
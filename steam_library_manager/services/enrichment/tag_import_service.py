@@ -103,7 +103,8 @@ class TagImportThread(QThread):
             tagged = 0
             done = 0
 
-            for app_id, app_data in apps.items():
+            # iterate ids only so appinfo entries we don't own never get decoded
+            for app_id in apps:
                 if self._cancelled:
                     break
                 done += 1
@@ -119,6 +120,10 @@ class TagImportThread(QThread):
                 if app_id not in known_ids:
                     continue  # skip - we don't own this
 
+                app_data = apps.get(app_id)
+                if not app_data:
+                    continue
+
                 vdf_data = app_data.get("data", {})
                 common = AppInfoManager._find_common_section(vdf_data)
                 if not common:
@@ -185,25 +185,32 @@ class FilterService:
         if not self.has_active_filters():
             return games
 
+        # only the filters that can reject anything, checked in the usual order
+        checks = []
+        if self._types != ALL_TYPE_KEYS:
+            checks.append(self._chk_type)
+        if self._platforms != ALL_PLATFORM_KEYS:
+            checks.append(self._chk_platform)
+        if self._statuses:
+            checks.append(self._chk_status)
+        if self._languages:
+            checks.append(self._chk_lang)
+        if self._deck:
+            checks.append(self._chk_deck)
+        if self._achievements:
+            checks.append(self._chk_achv)
+        if self._pegi:
+            checks.append(self._chk_pegi)
+        if self._cur_ids:
+            checks.append(self._chk_curator)
+
         out = []
         for g in games:
-            if not self._chk_type(g):
-                continue
-            if not self._chk_platform(g):
-                continue
-            if not self._chk_status(g):
-                continue
-            if not self._chk_lang(g):
-                continue
-            if not self._chk_deck(g):
-                continue
-            if not self._chk_achv(g):
-                continue
-            if not self._chk_pegi(g):
-                continue
-            if not self._chk_curator(g):
-                continue
-            out.append(g)
+            for chk in checks:
+                if not chk(g):
+                    break
+            else:
+                out.append(g)
         return out
 
     def _chk_type(self, game):
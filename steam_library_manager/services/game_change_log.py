@@ -0,0 +1,103 @@
+#
+# steam_library_manager/services/game_change_log.py
+# Pending per-game field changes for incremental re-evaluation
+#
+# Copyright © 2025-2026 SwitchBros
+# Licensed under the MIT License. See LICENSE for details.
+#
+
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger("steamlibmgr.game_changes")
+
+__all__ = ["GameChangeLog"]
+
+
+def _value(g, attr):
+    # copy lists, they are often mutated in place
+    v = getattr(g, attr, None)
+    return list(v) if isinstance(v, list) else v
+
+
+class GameChangeLog:
+    """Collects (app_id, attribute) change events between refreshes.
+
+    Code that mutates Game objects outside a full load reports what it
+    touched through note*() or track(); consumers such as the smart
+    collection manager drain() the log and re-evaluate only what those
+    attributes can affect. An app_id mapped to None means the whole game
+    changed (added, removed or replaced).
+    """
+
+    def __init__(self) -> None:
+        self._pending = {}  # app_id -> set of attr names, None = everything
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._pending)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def note(self, app_id, attr) -> None:
+        # attr of app_id changed
+        with self._lock:
+            cur = self._pending.setdefault(str(app_id), set())
+            if cur is not None:
+                cur.add(attr)
+
+    def note_game(self, app_id) -> None:
+        # app_id was added, removed or replaced wholesale
+        with self._lock:
+            self._pending[str(app_id)] = None
+
+    def note_diff(self, app_id, old, new) -> None:
+        # compare two versions of the same game field by field
+        a, b = vars(old), vars(new)
+        changed = [k for k, v in b.items() if a.get(k) != v]
+        if not changed:
+            return
+        with self._lock:
+            cur = self._pending.setdefault(str(app_id), set())
+            if cur is not None:
+                cur.update(changed)
+
+    def watch(self, games, attrs):
+        """Snapshots attrs of games for a later note_watched().
+
+        For code that mutates games without reporting it (enrichment
+        threads, bulk reloads from the database).
+        """
+        attrs = tuple(attrs)
+        return attrs, [(g, tuple(_value(g, a) for a in attrs)) for g in games]
+
+    def note_watched(self, snapshot) -> None:
+        # note every watched attr that differs from the snapshot
+        attrs, rows = snapshot
+        for g, old in rows:
+            for a, v in zip(attrs, old):
+                if _value(g, a) != v:
+                    self.note(g.app_id, a)
+
+    @contextmanager
+    def track(self, games, attrs):
+        """Notes every attr in attrs that differs after the block, see watch()."""
+        snap = self.watch(games, attrs)
+        try:
+            yield self
+        finally:
+            self.note_watched(snap)
+
+    def drain(self) -> dict:
+        """Returns the pending changes and clears them."""
+        with self._lock:
+            out, self._pending = self._pending, {}
+        return out
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending = {}
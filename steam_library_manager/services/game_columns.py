@@ -0,0 +1,210 @@
+#
+# steam_library_manager/services/game_columns.py
+# Columnar NumPy snapshot of a game list for vectorized filtering
+#
+# Copyright © 2025-2026 SwitchBros
+# Licensed under the MIT License. See LICENSE for details.
+#
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+
+from steam_library_manager.utils.date_utils import year_from_timestamp
+
+logger = logging.getLogger("steamlibmgr.game_columns")
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+__all__ = ["GameColumns", "HAS_NUMPY"]
+
+# local Jan 1st timestamps for the years looked up with one searchsorted
+_YEAR_FIRST = 1970
+_YEAR_LAST = 2200
+_year_starts = None
+
+
+def _starts():
+    global _year_starts
+    if _year_starts is None:
+        _year_starts = np.array(
+            [datetime(y, 1, 1).timestamp() for y in range(_YEAR_FIRST, _YEAR_LAST + 1)],
+            dtype=np.float64,
+        )
+    return _year_starts
+
+
+class GameColumns:
+    """Column-per-field snapshot of a list of games.
+
+    Columns are built lazily on first use and cached under a key, so a
+    refresh that evaluates a hundred rule sets reads each game attribute
+    once: numeric fields become float64 arrays with a validity mask,
+    flags become bool arrays and low-cardinality strings (deck status,
+    ProtonDB tier, PEGI, app type...) are dictionary-encoded into an
+    int32 code array plus their distinct values. List fields (tags,
+    genres...) are exploded into (row, code) pairs the same way, so a
+    text test runs once per distinct value. Row i is games[i].
+
+    Needs NumPy; check HAS_NUMPY first.
+    """
+
+    def __init__(self, games) -> None:
+        self.games = games if isinstance(games, list) else list(games)
+        self.n = len(self.games)
+        self._cols = {}
+
+    def _cached(self, key, build):
+        col = self._cols.get(key)
+        if col is None:
+            col = self._cols[key] = build()
+        return col
+
+    def numeric(self, key, get):
+        """Returns (values, valid): float(get(g)) per game, valid False where that fails."""
+
+        def build():
+            vals = np.zeros(self.n, dtype=np.float64)
+            ok = np.ones(self.n, dtype=bool)
+            for i, g in enumerate(self.games):
+                try:
+                    vals[i] = float(get(g))
+                except (ValueError, TypeError):
+                    ok[i] = False
+            return vals, ok
+
+        return self._cached(("num", key), build)
+
+    def years(self, key, get):
+        """Returns (values, valid) for a release_year-like field.
+
+        Ints above 9999 are UNIX timestamps and map to their local year
+        (0 if out of range, like year_from_timestamp); anything else is
+        taken as a year number.
+        """
+
+        def build():
+            raws = [get(g) for g in self.games]
+            is_ts = np.fromiter(
+                (isinstance(r, int) and r > 9999 for r in raws),
+                dtype=bool,
+                count=self.n,
+            )
+            vals = np.zeros(self.n, dtype=np.float64)
+            ok = np.ones(self.n, dtype=bool)
+
+            if is_ts.any():
+                idx = np.flatnonzero(is_ts)
+                ts = np.array([raws[i] for i in idx], dtype=np.float64)
+                starts = _starts()
+                inside = (ts >= starts[0]) & (ts < starts[-1])
+                vals[idx[inside]] = _YEAR_FIRST + np.searchsorted(starts, ts[inside], side="right") - 1
+                for i in idx[~inside]:
+                    yr = year_from_timestamp(raws[i])
+                    vals[i] = float(yr) if yr else 0.0
+
+            for i in np.flatnonzero(~is_ts):
+                try:
+                    vals[i] = float(raws[i])
+                except (ValueError, TypeError):
+                    ok[i] = False
+            return vals, ok
+
+        return self._cached(("year", key), build)
+
+    def flags(self, key, get):
+        """Returns a bool array of bool(get(g))."""
+        return self._cached(
+            ("flag", key),
+            lambda: np.fromiter((bool(get(g)) for g in self.games), dtype=bool, count=self.n),
+        )
+
+    def encoded(self, key, get):
+        """Returns (codes, values): get(g) dictionary-encoded, values[codes[i]] == get(games[i])."""
+
+        def build():
+            index = {}
+            codes = np.fromiter(
+                (index.setdefault(get(g), len(index)) for g in self.games),
+                dtype=np.int32,
+                count=self.n,
+            )
+            return codes, list(index)
+
+        return self._cached(("enc", key), build)
+
+    def exploded(self, key, get):
+        """Returns (rows, codes, values) for a list field, one entry per list item.
+
+        get(g) may return a list/tuple or a single value; a falsy single
+        value means no items. values[codes[k]] is an item of games[rows[k]].
+        """
+
+        def build():
+            index = {}
+            rows = []
+            codes = []
+            for i, g in enumerate(self.games):
+                raw = get(g)
+                if not isinstance(raw, (list, tuple)):
+                    raw = [str(raw)] if raw else ()
+                for v in raw:
+                    rows.append(i)
+                    codes.append(index.setdefault(v, len(index)))
+            return np.array(rows, dtype=np.int64), np.array(codes, dtype=np.int32), list(index)
+
+        return self._cached(("list", key), build)
+
+    def app_ids(self):
+        """Returns (ids, valid): int(app_id) per game, valid False for non-numeric IDs."""
+
+        def build():
+            ids = np.full(self.n, -1, dtype=np.int64)
+            ok = np.ones(self.n, dtype=bool)
+            for i, g in enumerate(self.games):
+                try:
+                    ids[i] = int(g.app_id)
+                except (ValueError, TypeError):
+                    ok[i] = False
+            return ids, ok
+
+        return self._cached(("app_id",), build)
+
+    def match_values(self, key, get, test):
+        """Bool mask of test(get(g)), calling test once per distinct value."""
+        codes, values = self.encoded(key, get)
+        table = np.fromiter((bool(test(v)) for v in values), dtype=bool, count=len(values))
+        return table[codes] if len(values) else np.zeros(self.n, dtype=bool)
+
+    def match_any_item(self, key, get, test):
+        """Bool mask: test(item) holds for at least one item of the list field."""
+        rows, codes, values = self.exploded(key, get)
+        mask = np.zeros(self.n, dtype=bool)
+        if values:
+            table = np.fromiter((bool(test(v)) for v in values), dtype=bool, count=len(values))
+            mask[rows[table[codes]]] = True
+        return mask
+
+    def per_game(self, pred):
+        """Bool mask of pred(g), the per-object fallback."""
+        return np.fromiter((bool(pred(g)) for g in self.games), dtype=bool, count=self.n)
+
+    def none(self):
+        return np.zeros(self.n, dtype=bool)
+
+    def select(self, mask):
+        """The games where mask is set, in their original order."""
+
+        def build():
+            objs = np.empty(self.n, dtype=object)
+            objs[:] = self.games
+            return objs
+
+        return self._cached(("objects",), build)[mask].tolist()
@@ -11,17 +11,17 @@
 # list comprehension, set merge). Only developer/publisher share the same
 # pattern, which is too few to justify a mapping abstraction.
 
-import json
 import logging
 import time
 from contextlib import contextmanager
-from datetime import datetime, timedelta
 
 import requests
 
+from steam_library_manager.core.response_cache import response_cache
 from steam_library_manager.utils.age_ratings import USK_TO_PEGI
 from steam_library_manager.utils.date_utils import format_timestamp_to_date
 from steam_library_manager.utils.deck_utils import fetch_deck_compatibility
+from steam_library_manager.utils.http_client import http
 from steam_library_manager.utils.i18n import t
 from steam_library_manager.utils.timeouts import HTTP_TIMEOUT_SHORT
 
@@ -176,48 +176,34 @@ def fetch_proton_rating(game):
 
 
 def fetch_steam_deck_status(game, cache_dir):
-    # Fetch Steam Deck compatibility status with file cache
+    # Fetch Steam Deck compatibility status with response cache
     app_id = game.app_id
-    cache_file = cache_dir / "store_data" / ("%s_deck.json" % app_id)
     unk = "unknown"
 
-    if cache_file.exists():
-        try:
-            age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if age < timedelta(days=7):
-                with open(cache_file, "r") as f:
-                    data = json.load(f)
-                    game.steam_deck_status = data.get("status", unk)
-                return
-        except (OSError, json.JSONDecodeError):
-            pass
+    data = response_cache(cache_dir).get("deck", app_id)
+    if data is not None:
+        game.steam_deck_status = data.get("status", unk)
+        return
 
-    # Fetch from API (writes cache file automatically)
-    cache_file.parent.mkdir(parents=True, exist_ok=True)
-    status = fetch_deck_compatibility(app_id, cache_file.parent)
+    # Fetch from API (caches the answer itself)
+    status = fetch_deck_compatibility(app_id, cache_dir)
     game.steam_deck_status = status or unk
 
 
 def fetch_last_update(game, cache_dir):
     # Fetch the last developer update date from Steam News API
     app_id = game.app_id
-    cache_file = cache_dir / "store_data" / ("%s_news.json" % app_id)
+    cache = response_cache(cache_dir)
 
-    if cache_file.exists():
-        try:
-            age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if age < timedelta(days=1):
-                with open(cache_file, "r") as f:
-                    data = json.load(f)
-                    game.last_updated = data.get("last_update", "")
-                return
-        except (OSError, json.JSONDecodeError):
-            pass
+    data = cache.get("news", app_id)
+    if data is not None:
+        game.last_updated = data.get("last_update", "")
+        return
 
     try:
         url = "https://api.steampowered.com/ISteamNews/GetNewsForApp/v2/"
         params = {"appid": app_id, "count": 10, "maxlength": 100, "format": "json"}
-        resp = requests.get(url, params=params, timeout=HTTP_TIMEOUT_SHORT)
+        resp = http.get(url, params=params, timeout=HTTP_TIMEOUT_SHORT)
 
         if resp.status_code == 200:
             data = resp.json()
@@ -226,15 +212,13 @@ def fetch_last_update(game, cache_dir):
                 ts = items[0].get("date", 0)
                 if ts:
                     date_str = format_timestamp_to_date(ts)
-                    cache_file.parent.mkdir(exist_ok=True)
-                    with open(cache_file, "w") as f:
-                        json.dump({"last_update": date_str, "timestamp": ts}, f)
+                    cache.put("news", app_id, {"last_update": date_str, "timestamp": ts})
                     game.last_updated = date_str
                     return
 
         if not game.last_updated:
             game.last_updated = ""
-    except (requests.RequestException, ValueError, KeyError, OSError):
+    except (requests.RequestException, ValueError, KeyError):
         pass
 
 
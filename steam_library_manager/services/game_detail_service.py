@@ -6,13 +6,13 @@
 # Licensed under the MIT License. See LICENSE for details.
 #
 
-import json
 import logging
 import threading
-from datetime import datetime, timedelta
 
 import requests
 
+from steam_library_manager.core.response_cache import response_cache
+from steam_library_manager.utils.http_client import http
 from steam_library_manager.utils.timeouts import HTTP_TIMEOUT_SHORT
 from steam_library_manager.services.game_detail_enrichers import (
     apply_achievement_data,
@@ -81,55 +81,40 @@ class GameDetailService:
 
     def _get_store(self, app_id):
         # Fetch and cache Steam Store API data
-        cache_file = self._cache_dir / "store_data" / ("%s.json" % app_id)
-        if cache_file.exists():
-            try:
-                age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-                if age < timedelta(days=7):
-                    with open(cache_file, "r") as f:
-                        data = json.load(f)
-                        apply_store_data(self._games[app_id], data)
-                    return
-            except (OSError, json.JSONDecodeError):
-                pass
+        cache = response_cache(self._cache_dir)
+        data = cache.get("store", app_id)
+        if data is not None:
+            apply_store_data(self._games[app_id], data)
+            return
 
         try:
             url = "https://store.steampowered.com/api/appdetails"
             params = {"appids": app_id}
-            resp = requests.get(url, params=params, timeout=HTTP_TIMEOUT_SHORT)
+            resp = http.get(url, params=params, timeout=HTTP_TIMEOUT_SHORT)
             data = resp.json()
             if app_id in data and data[app_id]["success"]:
                 gd = data[app_id]["data"]
-                cache_file.parent.mkdir(exist_ok=True)
-                with open(cache_file, "w") as f:
-                    json.dump(gd, f)
+                cache.put("store", app_id, gd)
                 apply_store_data(self._games[app_id], gd)
-        except (requests.RequestException, ValueError, KeyError, OSError):
+        except (requests.RequestException, ValueError, KeyError):
             pass
 
     def _get_reviews(self, app_id):
         # Fetch and cache Steam review statistics
-        cache_file = self._cache_dir / "store_data" / ("%s_reviews.json" % app_id)
-        if cache_file.exists():
-            try:
-                age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-                if age < timedelta(hours=24):
-                    with open(cache_file, "r") as f:
-                        data = json.load(f)
-                        apply_review_data(self._games[app_id], data)
-                    return
-            except (OSError, json.JSONDecodeError):
-                pass
+        cache = response_cache(self._cache_dir)
+        data = cache.get("reviews", app_id)
+        if data is not None:
+            apply_review_data(self._games[app_id], data)
+            return
 
         try:
             url = "https://store.steampowered.com/appreviews/%s?json=1&language=german" % app_id
-            resp = requests.get(url, timeout=HTTP_TIMEOUT_SHORT)
+            resp = http.get(url, timeout=HTTP_TIMEOUT_SHORT)
             data = resp.json()
             if "query_summary" in data:
-                with open(cache_file, "w") as f:
-                    json.dump(data, f)
+                cache.put("reviews", app_id, data)
                 apply_review_data(self._games[app_id], data)
-        except (requests.RequestException, ValueError, KeyError, OSError):
+        except (requests.RequestException, ValueError, KeyError):
             pass
 
     # ------------------------------------------------------------------
@@ -137,7 +122,7 @@ class GameDetailService:
     # ------------------------------------------------------------------
 
     def _fetch_hltb_data(self, app_id):
-        # Fetch HowLongToBeat times (JSON cache, 7-day TTL)
+        # Fetch HowLongToBeat times (response cache, 7-day TTL)
         if app_id in self._hltb_checked:
             return
         if app_id not in self._games:
@@ -149,18 +134,12 @@ class GameDetailService:
             self._hltb_checked.add(app_id)
             return
 
-        cache_file = self._cache_dir / "store_data" / ("%s_hltb.json" % app_id)
-        if cache_file.exists():
-            try:
-                age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-                if age < timedelta(days=7):
-                    with open(cache_file, "r") as f:
-                        data = json.load(f)
-                    apply_hltb_data(game, data)
-                    self._hltb_checked.add(app_id)
-                    return
-            except (OSError, json.JSONDecodeError):
-                pass
+        cache = response_cache(self._cache_dir)
+        data = cache.get("hltb", app_id)
+        if data is not None:
+            apply_hltb_data(game, data)
+            self._hltb_checked.add(app_id)
+            return
 
         with self._hltb_lock:
             try:
@@ -170,7 +149,6 @@ class GameDetailService:
                     self._hltb_client = HLTBClient()
 
                 result = self._hltb_client.search_game(game.name, int(app_id))
-                cache_file.parent.mkdir(exist_ok=True)
 
                 if result:
                     data = {
@@ -178,13 +156,11 @@ class GameDetailService:
                         "main_extras": result.main_extras,
                         "completionist": result.completionist,
                     }
-                    with open(cache_file, "w") as f:
-                        json.dump(data, f)
+                    cache.put("hltb", app_id, data)
                     apply_hltb_data(game, data)
                     persist_hltb(int(app_id), result.main_story, result.main_extras, result.completionist)
                 else:
-                    with open(cache_file, "w") as f:
-                        json.dump({"no_data": True}, f)
+                    cache.put("hltb", app_id, {"no_data": True})
             except Exception as exc:
                 logger.debug("HLTB on-demand fetch failed for %s: %s", app_id, exc)
 
@@ -195,7 +171,7 @@ class GameDetailService:
     # ------------------------------------------------------------------
 
     def _fetch_achievement_data(self, app_id):
-        # Fetch achievement data from Steam API (JSON cache, 7-day TTL)
+        # Fetch achievement data from Steam API (response cache, 7-day TTL)
         if app_id in self._achievements_checked:
             return
         if app_id not in self._games:
@@ -210,18 +186,12 @@ class GameDetailService:
             self._achievements_checked.add(app_id)
             return
 
-        cache_file = self._cache_dir / "store_data" / ("%s_achievements.json" % app_id)
-        if cache_file.exists():
-            try:
-                age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-                if age < timedelta(days=7):
-                    with open(cache_file, "r") as f:
-                        data = json.load(f)
-                    apply_achievement_data(game, data)
-                    self._achievements_checked.add(app_id)
-                    return
-            except (OSError, json.JSONDecodeError):
-                pass
+        cache = response_cache(self._cache_dir)
+        data = cache.get("achievements", app_id)
+        if data is not None:
+            apply_achievement_data(game, data)
+            self._achievements_checked.add(app_id)
+            return
 
         try:
             from steam_library_manager.config import config
@@ -244,12 +214,10 @@ class GameDetailService:
 
             schema = api.get_game_schema(int_id)
             schema_achs = (schema or {}).get("achievements", [])
-            cache_file.parent.mkdir(exist_ok=True)
 
             if not schema_achs:
                 data = {"total": 0, "unlocked": 0, "percentage": 0.0, "perfect": False}
-                with open(cache_file, "w") as f:
-                    json.dump(data, f)
+                cache.put("achievements", app_id, data)
                 persist_achievement_stats(int_id, 0, 0, 0.0, False)
                 self._achievements_checked.add(app_id)
                 return
@@ -293,8 +261,7 @@ class GameDetailService:
                 "percentage": round(pct, 1),
                 "perfect": perfect,
             }
-            with open(cache_file, "w") as f:
-                json.dump(data, f)
+            cache.put("achievements", app_id, data)
 
             apply_achievement_data(game, data)
             persist_achievement_stats(int_id, total, unlocked, pct, perfect)
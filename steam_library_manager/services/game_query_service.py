@@ -9,6 +9,7 @@
 from __future__ import annotations
 
 import logging
+from bisect import insort
 
 from steam_library_manager.core.game import is_library_entry, is_real_game
 from steam_library_manager.utils.i18n import t
@@ -19,34 +20,124 @@ __all__ = ["GameQueryService"]
 
 
 class GameQueryService:
-    """Query facade."""
+    """Query facade.
+
+    Keeps a category -> games index (sorted like the old per-call scans)
+    plus the real-game list, built on first use. CategoryService reports
+    single edits through note_*(); bulk changes to games call invalidate().
+    """
 
     def __init__(self, gs, filter_non_games):
         self._g = gs
         self._f = filter_non_games
+        self._idx = None  # category -> games sorted by sort_name
+        self._members = {}  # category -> app_ids in _idx[category]
+        self._real = []
+        self._real_ids = set()
+        self._size = 0  # len(gs) when the index was built
+
+    def invalidate(self):
+        # games or their categories changed wholesale
+        self._idx = None
+
+    def _ensure(self):
+        # games added/removed behind our back also force a rebuild
+        if self._idx is not None and len(self._g) == self._size:
+            return
+
+        real = [x for x in self._g.values() if not self._f or is_real_game(x)]
+        idx = {}
+        members = {}
+        for x in real:
+            for k in x.categories:
+                ids = members.setdefault(k, set())
+                if x.app_id not in ids:
+                    ids.add(x.app_id)
+                    idx.setdefault(k, []).append(x)
+
+        for gs in idx.values():
+            gs.sort(key=_sort_key)
+
+        self._idx = idx
+        self._members = members
+        self._real = real
+        self._real_ids = {x.app_id for x in real}
+        self._size = len(self._g)
+
+    def note_added(self, aid, cat):
+        # app aid joined cat
+        if self._idx is None or aid not in self._real_ids:
+            return
+        ids = self._members.setdefault(cat, set())
+        if aid in ids:
+            return
+        ids.add(aid)
+        insort(self._idx.setdefault(cat, []), self._g.get(aid), key=_sort_key)
+
+    def note_removed(self, aid, cat):
+        # app aid left cat
+        if self._idx is None:
+            return
+        ids = self._members.get(cat)
+        if not ids or aid not in ids:
+            return
+        ids.discard(aid)
+        gs = self._idx[cat]
+        gs[:] = [x for x in gs if x.app_id != aid]
+        if not gs:
+            del self._idx[cat]
+            del self._members[cat]
+
+    def note_batch(self, cat, added=(), removed=()):
+        # many apps joined/left cat: one filter + sort instead of per-app edits
+        if self._idx is None:
+            return
+        ids = self._members.get(cat, set())
+        gone = ids.intersection(removed)
+        new = [a for a in dict.fromkeys(added) if a in self._real_ids and a not in ids]
+        if not gone and not new:
+            return
+        gs = self._idx.get(cat, [])
+        if gone:
+            gs = [x for x in gs if x.app_id not in gone]
+        gs.extend(self._g.get(a) for a in new)
+        gs.sort(key=_sort_key)
+        members = (ids - gone).union(new)
+        if gs:
+            self._idx[cat] = gs
+            self._members[cat] = members
+        else:
+            self._idx.pop(cat, None)
+            self._members.pop(cat, None)
+
+    def note_renamed(self, old, new):
+        if self._idx is None or old not in self._idx:
+            return
+        if new in self._idx:
+            self._idx = None  # merge of two lists, just rebuild
+            return
+        self._idx[new] = self._idx.pop(old)
+        self._members[new] = self._members.pop(old)
+
+    def note_deleted(self, cat):
+        if self._idx is None:
+            return
+        self._idx.pop(cat, None)
+        self._members.pop(cat, None)
 
     def get_real_games(self):
         if not self._f:
             return list(self._g.values())
-        res = []
-        for x in self._g.values():
-            if is_real_game(x):
-                res.append(x)
-        return res
+        self._ensure()
+        return list(self._real)
 
     def get_all_games(self):
         tmp = self._g.values()
         return list(tmp)
 
     def get_games_by_category(self, c):
-        all_g = self.get_real_games()
-        gs = []
-        for x in all_g:
-            if x.has_category(c):
-                gs.append(x)
-
-        gs.sort(key=lambda g: g.sort_name.lower())
-        return gs
+        self._ensure()
+        return list(self._idx.get(c, ()))
 
     def get_uncategorized_games(self, smart=None):
         # FIXME: hardcoded
@@ -83,35 +174,24 @@ class GameQueryService:
         return res
 
     def get_favorites(self):
-        rl = self.get_real_games()
-        gs = []
-        for x in rl:
-            if x.is_favorite():
-                gs.append(x)
-
-        gs.sort(key=lambda g: g.sort_name.lower())
-        return gs
+        return self.get_games_by_category(t("categories.favorites"))
 
     def get_all_categories(self):
-        ct = {}
-        rl = self.get_real_games()
-        for x in rl:
-            cats = x.categories
-            for k in cats:
-                ct[k] = ct.get(k, 0) + 1
-        return ct
+        self._ensure()
+        return {k: len(v) for k, v in self._idx.items()}
 
     def get_game_statistics(self):
         # stats
-        rl = self.get_real_games()
-        ic = set()
-        for x in rl:
-            if x.categories:
-                ic.add(x.app_id)
-        nc = len(self.get_all_categories())
+        self._ensure()
+        rl = self._real
+        ic = sum(1 for x in rl if x.categories)
         return {
             "total_games": len(rl),
-            "games_in_categories": len(ic),
-            "category_count": nc,
-            "uncategorized_games": len(rl) - len(ic),
+            "games_in_categories": ic,
+            "category_count": len(self._idx),
+            "uncategorized_games": len(rl) - ic,
         }
+
+
+def _sort_key(g):
+    return g.sort_name.lower()
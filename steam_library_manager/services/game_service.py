@@ -21,32 +21,54 @@ from steam_library_manager.core.appinfo_manager import AppInfoManager
 from steam_library_manager.core.database import Database
 from steam_library_manager.core.db.models import DatabaseEntry
 from steam_library_manager.core.database_importer import DatabaseImporter
+from steam_library_manager.core.library_snapshot import LibrarySnapshot, source_stamps
 from steam_library_manager.core.packageinfo_parser import PackageInfoParser
+from steam_library_manager.core.response_cache import response_cache
+from steam_library_manager.utils.http_client import http
 from steam_library_manager.utils.license_cache_parser import LicenseCacheParser
+from steam_library_manager.utils.profiler import span
+from steam_library_manager.utils.stage_graph import StageGraph
 from steam_library_manager.utils.timeouts import HTTP_TIMEOUT_LONG
 
 logger = logging.getLogger("steamlibmgr.game_service")
 
 __all__ = ["GameService"]
 
+# edited in the UI through the live parsers; a background reload keeps these
+_LIVE_ATTRS = ("categories", "hidden")
+
+
+class _NoGames(Exception):
+    # raised by the library stage to stop the rest of the pipeline
+    pass
+
 
 class GameService:
     """Orchestrates game loading from multiple sources.
 
     Pipeline: API fetch -> local VDF parse -> cloud storage merge
-    -> DB enrichment -> metadata overrides -> done.
+    -> DB enrichment -> metadata overrides -> done. load_and_prepare()
+    runs it as a StageGraph so the independent I/O overlaps.
+
+    With use_snapshot the prepared library is stored after each full load
+    and reused on the next launch while its source files are unchanged;
+    the full pipeline then runs via refresh_warm_start()/apply_refresh().
     """
 
-    def __init__(self, steam_path, api_key, cache_dir):
+    def __init__(self, steam_path, api_key, cache_dir, use_snapshot=False):
         self.steam_path = steam_path
         self.api_key = api_key
         self.cache_dir = cache_dir
+        self.use_snapshot = use_snapshot
+        self.warm_started = False
 
         self.localconfig_helper = None
         self.cloud_storage_parser = None
         self.game_manager = None
         self.appinfo_manager = None
         self.database = None
+        self._pkg_parser = None
+        self._snap_user = None
 
     def initialize_parsers(self, localconfig_path, user_id):
         # setup VDF + cloud storage parsers
@@ -88,14 +110,13 @@ class GameService:
             return None
 
     def _initial_import(self, db, cb=None):
-        # one-time import from appinfo.vdf
-        if db.get_game_count() > 0:
-            logger.info(t("logs.db.already_initialized"))
-            return
+        # one-time import from appinfo.vdf, delta refresh on later runs
+        fresh = db.get_game_count() == 0
 
         if not self.appinfo_manager:
             self.appinfo_manager = AppInfoManager(Path(self.steam_path))
-            self.appinfo_manager.load_appinfo()
+            if fresh:
+                self.appinfo_manager.load_appinfo()
 
         imp = DatabaseImporter(db, self.appinfo_manager)
 
@@ -103,8 +124,17 @@ class GameService:
             if cb:
                 cb(msg, cur, total)
 
-        logger.info(t("logs.db.import_one_time"))
-        imp.import_from_appinfo(bridge)
+        if fresh:
+            logger.info(t("logs.db.import_one_time"))
+            imp.import_from_appinfo(bridge)
+        else:
+            logger.info(t("logs.db.already_initialized"))
+
+        # only touches appinfo.vdf if its mtime/size moved since last time
+        try:
+            imp.sync_changed_apps(bridge)
+        except Exception as e:
+            logger.warning(t("logs.db.appinfo_sync_failed", error=str(e)))
 
     def load_games(self, user_id, progress_callback=None):
         # load all games from API/local, enrich with DB
@@ -112,11 +142,7 @@ class GameService:
             raise RuntimeError("Parsers not initialized. Call initialize_parsers() first.")
 
         self.game_manager = GameManager(self.api_key, Path(self.cache_dir), Path(self.steam_path))
-        self.database = self._init_db()
-
-        if self.database:
-            self._initial_import(self.database, progress_callback)
-            self.database.repair_placeholder_names()
+        self._prepare_db(progress_callback)
 
         ok = self.game_manager.load_games(user_id, progress_callback)
 
@@ -126,20 +152,230 @@ class GameService:
         return ok and bool(self.game_manager.games)
 
     def load_and_prepare(self, user_id, progress_callback=None):
-        # full pipeline
-        ok = self.load_games(user_id, progress_callback)
-        if not ok or not self.game_manager or not self.game_manager.games:
+        # warm start from the snapshot if nothing changed, else full pipeline
+        with span("game_service.load_and_prepare") as sp:
+            self.warm_started = False
+            if self.use_snapshot and self._load_snapshot(user_id, progress_callback):
+                sp.attrs["warm_start"] = True
+                sp.count = len(self.game_manager.games)
+                return True
+
+            # stamp before loading, so files changing mid-load invalidate it
+            stamps = self._snapshot_stamps() if self.use_snapshot else None
+            ok = self._load_full(user_id, progress_callback)
+            if ok:
+                sp.count = len(self.game_manager.games)
+                if stamps is not None:
+                    self._snapshot().save(user_id, stamps, self.game_manager.games, self.game_manager.load_source)
+            return ok
+
+    def _load_full(self, user_id, cb=None):
+        # full pipeline as a stage graph: owned games + manifests,
+        # packageinfo/licensecache and the API refresh fetch overlap with the
+        # DB import; everything touching the games dict stays chained in the
+        # old serial order so the result is identical
+        if not self.cloud_storage_parser:
+            raise RuntimeError("Parsers not initialized. Call initialize_parsers() first.")
+
+        gm = GameManager(self.api_key, Path(self.cache_dir), Path(self.steam_path))
+        self.game_manager = gm
+
+        def library(games, db):
+            if not games or not gm.games:
+                raise _NoGames
+            if self.database:
+                gm.enrich_from_database(self.database)
+
+        def discover(merge, mods, pkgs):
+            return self._discover_missing(pkgs, cb)
+
+        def refresh(discover, owned):
+            self._api_refresh_merge(user_id, cb, owned=owned)
+
+        def finalize(refresh, mods, discover):
+            self._finalize(mods, discover, cb)
+
+        # the sqlite connection belongs to this thread, so every stage that
+        # touches the DB runs inline; the pool only gets the pure I/O
+        g = StageGraph()
+        g.add("db", lambda: self._prepare_db(cb), inline=True)
+        g.add("games", lambda: gm.load_games(user_id, cb))
+        g.add("pkgs", lambda: self._resolve_pkgs(cb))
+        g.add("owned", lambda: self._fetch_owned(user_id))
+        # expired store/API responses; the first run also imports the old JSON files
+        g.add("cache", lambda: response_cache(self.cache_dir).evict_expired())
+        # after db: the initial import may create appinfo_manager itself
+        g.add("mods", lambda db: self._load_mods(cb), deps=("db",))
+        g.add("library", library, deps=("games", "db"), inline=True)
+        g.add("merge", lambda library: self._merge_cloud(cb), deps=("library",), inline=True)
+        g.add("discover", discover, deps=("merge", "mods", "pkgs"), inline=True)
+        g.add("refresh", refresh, deps=("discover", "owned"), inline=True)
+        g.add("finalize", finalize, deps=("refresh", "mods", "discover"), inline=True)
+
+        def timing(name, secs):
+            logger.info("load stage %s: %.0f ms" % (name, secs * 1000))
+            if cb:
+                cb(t("logs.service.stage_done", stage=name, ms=int(secs * 1000)), 0, 0)
+
+        try:
+            g.run(max_workers=4, on_done=timing)
+        except _NoGames:
+            return False
+        return True
+
+    def _prepare_db(self, cb=None):
+        self.database = self._init_db()
+        if self.database:
+            self._initial_import(self.database, cb)
+            self.database.repair_placeholder_names()
+
+    # warm start
+
+    def _snapshot(self):
+        return LibrarySnapshot(Path(self.cache_dir))
+
+    def _snapshot_stamps(self):
+        # every file whose change would alter the prepared library
+        from steam_library_manager.config import config as _cfg
+
+        sid, _ = _cfg.get_detected_user()
+        user_cfg = Path(self.steam_path) / "userdata" / str(sid) / "config" if sid else None
+        lc = self.localconfig_helper
+        cs = self.cloud_storage_parser
+
+        return source_stamps(
+            {
+                "localconfig": lc.config_path if lc else None,
+                "cloud_storage": cs.cloud_storage_path if cs else None,
+                "packageinfo": Path(self.steam_path) / "appcache" / "packageinfo.vdf",
+                "licensecache": user_cfg / "licensecache" if user_cfg else None,
+                "custom_metadata": Path(_cfg.DATA_DIR) / "custom_metadata.json",
+            }
+        )
+
+    def _load_snapshot(self, user_id, cb=None):
+        # cheap path: snapshot games + custom_metadata.json, no VDF/API/packageinfo
+        stamps = self._snapshot_stamps()
+        hit = self._snapshot().load(user_id, stamps)
+        if hit is None:
+            return False
+
+        games, source = hit
+        if not games:
             return False
 
-        cb = progress_callback
-        self._merge_cloud(cb)
-        mods = self._load_mods(cb)
-        pkg_ids = self._resolve_pkgs(cb)
-        types = self._discover_missing(pkg_ids, cb)
-        self._api_refresh_merge(user_id, cb)
-        self._finalize(mods, types, cb)
+        if cb:
+            cb(t("common.loading"), 0, 0)
+
+        gm = GameManager(self.api_key, Path(self.cache_dir), Path(self.steam_path))
+        gm.steam_user_id = user_id
+        # update in place - the manager's services share this dict
+        gm.games.update(games)
+        gm.load_source = source
+        gm.query_svc.invalidate()
+        self.game_manager = gm
+        self.database = self._init_db()
+
+        if not self.appinfo_manager:
+            self.appinfo_manager = AppInfoManager(Path(self.steam_path))
+            self.appinfo_manager.load_modifications_only()
+        gm.appinfo_manager = self.appinfo_manager
+
+        self.warm_started = True
+        self._snap_user = user_id
+        logger.info("warm start: %d games from library snapshot" % len(games))
         return True
 
+    def refresh_warm_start(self, progress_callback=None):
+        """Runs the full pipeline after a warm start without touching the live library.
+
+        Meant for the load worker thread. The library snapshot is written
+        here too, so apply_refresh() on the UI thread only patches deltas.
+
+        Args:
+            progress_callback: Optional func(message, current, total).
+
+        Returns:
+            A fully loaded GameService, or None if the load failed.
+        """
+        if not self.warm_started:
+            return None
+
+        fresh = GameService(self.steam_path, self.api_key, self.cache_dir)
+        stamps = self._snapshot_stamps()
+
+        try:
+            # own parsers read from disk, the live ones belong to the UI thread
+            if self.localconfig_helper:
+                lc = LocalConfigHelper(self.localconfig_helper.config_path)
+                fresh.localconfig_helper = lc if lc.load() else None
+            if self.cloud_storage_parser:
+                cs = CloudStorageParser(self.steam_path, self.cloud_storage_parser.user_id)
+                fresh.cloud_storage_parser = cs if cs.load() else None
+            if not fresh._load_full(self._snap_user, progress_callback):
+                return None
+            gm = fresh.game_manager
+            self._snapshot().save(self._snap_user, stamps, gm.games, gm.load_source)
+        except Exception as e:
+            logger.warning("background library refresh failed: %s" % e)
+            return None
+        return fresh
+
+    def apply_refresh(self, fresh):
+        """Patches the live library with what changed in a background reload.
+
+        Changed games are updated in place so existing references stay valid.
+        Fields the user edits while the refresh runs win over the reloaded
+        copy: categories and hidden come from the live games (the live
+        parsers hold unsaved edits), metadata overrides from the live
+        AppInfoManager.
+
+        Args:
+            fresh: The GameService returned by refresh_warm_start().
+
+        Returns:
+            list[str]: App IDs that were added, removed or changed.
+        """
+        if not self.game_manager or not fresh or not fresh.game_manager:
+            return []
+
+        live = self.game_manager.games
+        new = fresh.game_manager.games
+        log = self.game_manager.changes
+        changed = []
+
+        if self.appinfo_manager and self.appinfo_manager.modifications:
+            fresh.game_manager.apply_custom_overrides(self.appinfo_manager.modifications)
+
+        for aid in [a for a in live if a not in new]:
+            del live[aid]
+            log.note_game(aid)
+            changed.append(aid)
+
+        for aid, g in new.items():
+            cur = live.get(aid)
+            if cur is None:
+                live[aid] = g
+                log.note_game(aid)
+                changed.append(aid)
+                continue
+            # transient field, not part of the loaded state
+            g.curator_overlap = cur.curator_overlap
+            for attr in _LIVE_ATTRS:
+                setattr(g, attr, getattr(cur, attr))
+            if cur != g:
+                log.note_diff(aid, cur, g)
+                vars(cur).update(vars(g))
+                changed.append(aid)
+
+        self.game_manager.load_source = fresh.game_manager.load_source
+        if changed:
+            self.game_manager.query_svc.invalidate()
+
+        self.warm_started = False
+        logger.info("background refresh: %d games changed" % len(changed))
+        return changed
+
     # pipeline steps
 
     def _merge_cloud(self, cb):
@@ -159,7 +395,7 @@ class GameService:
         if cb:
             cb(t("logs.service.parsing_packages"), 0, 0)
 
-        pkg = PackageInfoParser(Path(self.steam_path))
+        pkg = self._packages()
 
         from steam_library_manager.config import config as _cfg
 
@@ -169,7 +405,7 @@ class GameService:
         if not s32:
             return pkg.get_all_app_ids()
 
-        lic = LicenseCacheParser(Path(self.steam_path), s32)
+        lic = LicenseCacheParser(Path(self.steam_path), s32, cache_dir=Path(self.cache_dir))
         owned = lic.get_owned_package_ids()
 
         if not owned:
@@ -179,6 +415,16 @@ class GameService:
         logger.info(t("logs.license_cache.cross_reference", packages=len(owned), apps=len(ids)))
         return ids
 
+    def _packages(self):
+        # one parsed packageinfo index per service, cached on disk between runs
+        if self._pkg_parser is None:
+            self._pkg_parser = PackageInfoParser(Path(self.steam_path), cache_dir=Path(self.cache_dir))
+        return self._pkg_parser
+
+    def get_packages_for_app(self, app_id):
+        # licenses (package ids) that grant this app
+        return self._packages().get_packages_for_app(app_id)
+
     def _discover_missing(self, pkg_ids, cb):
         if cb:
             cb(t("logs.service.discovering_games"), 0, 0)
@@ -208,10 +454,11 @@ class GameService:
 
         return types
 
-    def _api_refresh_merge(self, uid, cb):
+    def _api_refresh_merge(self, uid, cb, owned=None):
+        # owned: GetOwnedGames list fetched up front, None to fetch now
         if cb:
             cb(t("ui.status.api_refresh"), 0, 0)
-        new = self._api_refresh(uid)
+        new = self._api_refresh(uid) if owned is None else self._add_owned(owned)
         if new:
             if self.cloud_storage_parser:
                 self.game_manager.merge_with_localconfig(self.cloud_storage_parser)
@@ -236,7 +483,10 @@ class GameService:
         # fetch from steam API (oauth first, api key fallback)
         if not self.game_manager:
             return []
+        return self._add_owned(self._fetch_owned(uid))
 
+    def _fetch_owned(self, uid):
+        # raw GetOwnedGames list, [] on failure or without credentials
         from steam_library_manager.config import config
 
         tok = getattr(config, "STEAM_ACCESS_TOKEN", None)
@@ -264,7 +514,7 @@ class GameService:
         for method, auth_params in attempts:
             try:
                 params = {**base_params, **auth_params}
-                resp = requests.get(url, params=params, timeout=HTTP_TIMEOUT_LONG)
+                resp = http.get(url, params=params, timeout=HTTP_TIMEOUT_LONG)
                 resp.raise_for_status()
                 data = resp.json()
 
@@ -275,25 +525,7 @@ class GameService:
                         continue
                     return []
 
-                new_ids = []
-                for gd in glist:
-                    aid = str(gd["appid"])
-                    if aid not in self.game_manager.games:
-                        nm = gd.get("name") or t("ui.game_details.game_fallback", id=aid)
-                        pt = gd.get("playtime_forever", 0)
-                        game = Game(
-                            app_id=aid,
-                            name=nm,
-                            playtime_minutes=pt,
-                            app_type="",
-                        )
-                        self.game_manager.games[aid] = game
-                        new_ids.append(aid)
-                        logger.debug("found %s (%s)" % (aid, nm))
-
-                if new_ids:
-                    logger.info("refresh: %d new games" % len(new_ids))
-                return new_ids
+                return glist
 
             except Exception as e:
                 if isinstance(e, requests.HTTPError) and e.response is not None:
@@ -311,6 +543,34 @@ class GameService:
 
         return []
 
+    def _add_owned(self, glist):
+        # add the games of a GetOwnedGames list that are not loaded yet
+        if not self.game_manager or not glist:
+            return []
+
+        new_ids = []
+        try:
+            for gd in glist:
+                aid = str(gd["appid"])
+                if aid not in self.game_manager.games:
+                    nm = gd.get("name") or t("ui.game_details.game_fallback", id=aid)
+                    pt = gd.get("playtime_forever", 0)
+                    game = Game(
+                        app_id=aid,
+                        name=nm,
+                        playtime_minutes=pt,
+                        app_type="",
+                    )
+                    self.game_manager.games[aid] = game
+                    new_ids.append(aid)
+                    logger.debug("found %s (%s)" % (aid, nm))
+        except (KeyError, TypeError, AttributeError) as e:
+            logger.warning("API refresh failed: %s" % type(e).__name__)
+
+        if new_ids:
+            logger.info("refresh: %d new games" % len(new_ids))
+        return new_ids
+
     def _save_new(self, new_ids):
         # persist to db
         if not self.database or not self.game_manager:
@@ -431,6 +691,7 @@ class GameService:
                 fixed += 1
 
         if fixed > 0:
+            self.game_manager.query_svc.invalidate()
             if self.database:
                 self.database.commit()
             logger.info(t("logs.service.placeholder_names_repaired", count=fixed))
@@ -453,8 +714,7 @@ class GameService:
             self.appinfo_manager = AppInfoManager(Path(self.steam_path))
             self.appinfo_manager.load_appinfo()
 
-        pkg = PackageInfoParser(Path(self.steam_path))
-        ids = pkg.get_all_app_ids()
+        ids = self._packages().get_all_app_ids()
 
         if self.appinfo_manager:
             found = self.game_manager.discover_missing_games(self.localconfig_helper, self.appinfo_manager, ids)
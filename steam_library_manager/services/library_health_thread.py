@@ -11,10 +11,10 @@ from __future__ import annotations
 import logging
 import time
 
-import requests
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from steam_library_manager.services.library_health_service import HealthReport, StoreCheckResult
+from steam_library_manager.utils.http_client import http
 from steam_library_manager.utils.timeouts import HTTP_TIMEOUT
 
 logger = logging.getLogger("steamlibmgr.library_health")
@@ -146,7 +146,7 @@ class LibraryHealthThread(QThread):
 
             try:
                 url = "https://store.steampowered.com/app/%d/" % aid
-                resp = requests.get(
+                resp = http.get(
                     url,
                     timeout=HTTP_TIMEOUT,
                     allow_redirects=True,
@@ -0,0 +1,295 @@
+#
+# steam_library_manager/services/smart_collections/compiler.py
+# Compiles smart collection rules into predicate closures
+#
+# Copyright © 2025-2026 SwitchBros
+# Licensed under the MIT License. See LICENSE for details.
+#
+
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable
+
+from steam_library_manager.services.smart_collections.models import (
+    FIELD_CATEGORIES,
+    FilterField,
+    LogicOperator,
+    Operator,
+    SmartCollection,
+    SmartCollectionRule,
+    field_to_game_attr,
+)
+from steam_library_manager.utils.date_utils import year_from_timestamp
+
+if TYPE_CHECKING:
+    from steam_library_manager.core.game import Game
+
+__all__ = ["Predicate", "collection_fields", "compile_collection", "compile_rule"]
+
+logger = logging.getLogger("steamlibmgr.smart_collections.compiler")
+
+Predicate = Callable[["Game"], bool]
+
+_TXT_LIST = frozenset(FIELD_CATEGORIES["text_list"])
+_TXT_SINGLE = frozenset(FIELD_CATEGORIES["text_single"])
+_NUM = frozenset(FIELD_CATEGORIES["numeric"])
+_ENUM = frozenset(FIELD_CATEGORIES["enum"])
+_BOOL = frozenset(FIELD_CATEGORIES["boolean"])
+
+
+def _never(g):
+    return False
+
+
+def compile_collection(col: SmartCollection) -> Predicate:
+    """Compiles a collection's rules into one predicate.
+
+    Every rule is specialized once: target strings are lowered, numbers
+    parsed, regexes compiled and release-year bounds turned into
+    timestamp ranges, so matching a game does no parsing at all.
+
+    Args:
+        col: The collection to compile.
+
+    Returns:
+        A callable taking a Game and returning whether it matches.
+    """
+    if col.groups:
+        parts = [_combine([compile_rule(r) for r in grp.rules], grp.logic) for grp in col.groups]
+        return _combine(parts, col.logic)
+
+    # legacy flat-rule path
+    return _combine([compile_rule(r) for r in col.rules], col.logic)
+
+
+def _combine(preds, logic):
+    # empty rule lists never match
+    if not preds:
+        return _never
+    if len(preds) == 1:
+        return preds[0]
+    if len(preds) == 2:
+        # the common case, without a generator per game
+        a, b = preds
+        if logic == LogicOperator.AND:
+            return lambda g: a(g) and b(g)
+        return lambda g: a(g) or b(g)
+    if logic == LogicOperator.AND:
+        return lambda g: all(p(g) for p in preds)
+    return lambda g: any(p(g) for p in preds)
+
+
+def collection_fields(col: SmartCollection) -> frozenset[FilterField]:
+    """Returns every field the collection's rules read.
+
+    A change to any other field can't change the collection's matches,
+    which is what incremental re-evaluation relies on.
+    """
+    rules = [r for grp in col.groups for r in grp.rules] if col.groups else col.rules
+    return frozenset(r.field for r in rules)
+
+
+def compile_rule(r: SmartCollectionRule) -> Predicate:
+    """Compiles a single rule, negation included."""
+    m = _compile_match(r)
+    if r.negated:
+        return lambda g: not m(g)
+    return m
+
+
+def _compile_match(r):
+    get = _getter(r.field)
+
+    if r.field in _TXT_LIST:
+        test = _text_test(r.operator, r.value)
+        if test is None:
+            return _never
+
+        def match_list(g):
+            raw = get(g)
+            if isinstance(raw, (list, tuple)):
+                items = raw
+            else:
+                items = [str(raw)] if raw else ()
+            return any(test(v) for v in items)
+
+        # fast path: TAG + EQUALS with tag_id, name match if the game has no ids
+        if r.field == FilterField.TAG and r.operator == Operator.EQUALS and r.tag_id is not None:
+            tid = r.tag_id
+
+            def match_tag(g):
+                ids = getattr(g, "tag_ids", None)
+                if ids:
+                    return tid in ids
+                return match_list(g)
+
+            return match_tag
+        return match_list
+
+    if r.field in _TXT_SINGLE or r.field in _ENUM:
+        test = _text_test(r.operator, r.value)
+        if test is None:
+            return _never
+        return lambda g: test(str(get(g)))
+
+    if r.field in _NUM:
+        return _compile_num(r, get)
+
+    if r.field in _BOOL:
+        if r.operator == Operator.IS_TRUE:
+            return lambda g: bool(get(g))
+        if r.operator == Operator.IS_FALSE:
+            return lambda g: not get(g)
+        return _never
+
+    logger.warning("Unknown field category for %s" % r.field)
+    return _never
+
+
+def _getter(fld):
+    # playtime_hours is computed, not stored
+    if fld == FilterField.PLAYTIME_HOURS:
+        return lambda g: g.playtime_hours
+    attr = field_to_game_attr(fld)
+    return lambda g: getattr(g, attr, "")
+
+
+def _text_test(op, tgt):
+    # str -> bool test for one value, None when nothing can match
+    low = tgt.lower()
+
+    if op == Operator.EQUALS:
+        return lambda v: v.lower() == low
+    if op == Operator.CONTAINS:
+        return lambda v: low in v.lower()
+    if op == Operator.STARTS_WITH:
+        return lambda v: v.lower().startswith(low)
+    if op == Operator.ENDS_WITH:
+        return lambda v: v.lower().endswith(low)
+    if op == Operator.REGEX:
+        try:
+            pat = re.compile(tgt, re.IGNORECASE)
+        except re.error:
+            return None
+        search = pat.search
+        return lambda v: search(v) is not None
+    return None
+
+
+# numeric
+
+
+def _parse(s):
+    # empty target means 0, unparsable means the rule never matches
+    if not s:
+        return 0.0
+    try:
+        return float(s)
+    except (ValueError, TypeError):
+        return None
+
+
+def _num_test(op, t, t_max):
+    # float -> bool test, None when nothing can match
+    if op == Operator.EQUALS:
+        return lambda n: n == t
+    if op == Operator.GREATER_THAN:
+        return lambda n: n > t
+    if op == Operator.LESS_THAN:
+        return lambda n: n < t
+    if op == Operator.GREATER_EQUAL:
+        return lambda n: n >= t
+    if op == Operator.LESS_EQUAL:
+        return lambda n: n <= t
+    if op == Operator.BETWEEN:
+        lo, hi = min(t, t_max), max(t, t_max)
+        return lambda n: lo <= n <= hi
+    return None
+
+
+def _compile_num(r, get):
+    t = _parse(r.value)
+    if t is None:
+        return _never
+    t_max = 0.0
+    if r.operator == Operator.BETWEEN:
+        t_max = _parse(r.value_max)
+        if t_max is None:
+            return _never
+    test = _num_test(r.operator, t, t_max)
+    if test is None:
+        return _never
+
+    def match_num(g):
+        raw = get(g)
+        try:
+            return test(float(raw))
+        except (ValueError, TypeError):
+            return False
+
+    if r.field != FilterField.RELEASE_YEAR:
+        return match_num
+
+    # RELEASE_YEAR stores a UNIX timestamp but the user compares by year:
+    # turn the year bounds into a timestamp range once instead of
+    # converting every game's timestamp
+    if math.isfinite(t) and math.isfinite(t_max):
+        lo_ts, hi_ts = _year_range(r.operator, t, t_max)
+        safe = _TS_SAFE
+    else:
+        lo_ts = hi_ts = safe = 0  # inf/nan targets: convert per game
+
+    def match_year(g):
+        raw = get(g)
+        if isinstance(raw, int) and raw > 9999:
+            if raw < safe:
+                return lo_ts <= raw < hi_ts
+            yr = year_from_timestamp(raw)
+            return test(float(yr) if yr else 0.0)
+        try:
+            return test(float(raw))
+        except (ValueError, TypeError):
+            return False
+
+    return match_year
+
+
+def _year_start(y):
+    # local-time timestamp of Jan 1st, like year_from_timestamp uses
+    if y < 1:
+        return -math.inf
+    if y > 9999:
+        return math.inf
+    try:
+        return datetime(y, 1, 1).timestamp()
+    except (OverflowError, OSError, ValueError):
+        return -math.inf if y < 1970 else math.inf
+
+
+# timestamps below this convert to a year without overflow
+_TS_SAFE = _year_start(9999)
+
+
+def _year_range(op, t, t_max):
+    # [lo_ts, hi_ts) of timestamps whose year satisfies op against t
+    inf = math.inf
+    if op == Operator.EQUALS:
+        if t != int(t):
+            return inf, -inf
+        return _year_start(int(t)), _year_start(int(t) + 1)
+    if op == Operator.GREATER_THAN:
+        return _year_start(math.floor(t) + 1), inf
+    if op == Operator.GREATER_EQUAL:
+        return _year_start(math.ceil(t)), inf
+    if op == Operator.LESS_THAN:
+        return -inf, _year_start(math.ceil(t))
+    if op == Operator.LESS_EQUAL:
+        return -inf, _year_start(math.floor(t) + 1)
+    # BETWEEN
+    lo, hi = min(t, t_max), max(t, t_max)
+    return _year_start(math.ceil(lo)), _year_start(math.floor(hi) + 1)
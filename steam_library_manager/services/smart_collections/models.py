@@ -27,6 +27,7 @@ __all__ = [
     "collection_from_json",
     "collection_to_json",
     "field_to_game_attr",
+    "game_attrs_read",
     "group_from_dict",
     "group_to_dict",
     "rule_from_dict",
@@ -219,6 +220,18 @@ def field_to_game_attr(fld: FilterField) -> str:
     return _FIELD_TO_ATTR[fld]
 
 
+# stored attrs a field reads besides its own (computed or fast-path attrs)
+_FIELD_EXTRA_ATTRS: dict[FilterField, tuple[str, ...]] = {
+    FilterField.PLAYTIME_HOURS: ("playtime_minutes",),
+    FilterField.TAG: ("tag_ids",),
+}
+
+
+def game_attrs_read(fld: FilterField) -> tuple[str, ...]:
+    # every game attr a rule on fld can read
+    return (_FIELD_TO_ATTR[fld],) + _FIELD_EXTRA_ATTRS.get(fld, ())
+
+
 @dataclass(frozen=True)
 class SmartCollectionRule:
     # one rule: field + operator + value
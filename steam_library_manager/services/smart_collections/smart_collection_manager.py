@@ -17,11 +17,19 @@ from steam_library_manager.services.smart_collections.models import (
     collection_from_json,
     collection_to_json,
 )
+from steam_library_manager.services.smart_collections.sql_compiler import query_collection
 
 logger = logging.getLogger("steamlibmgr.smart_collections.manager")
 
 __all__ = ["SmartCollectionManager"]
 
+# passes per apply_changes(): syncing one collection can move games into
+# categories another collection matches on
+_MAX_PASSES = 3
+
+# attrs deciding whether a game counts as real (see is_real_game)
+_REAL_ATTRS = frozenset({"name", "app_type"})
+
 
 class SmartCollectionManager:
     """Manages smart collections: CRUD, evaluate, sync."""
@@ -160,41 +168,61 @@ class SmartCollectionManager:
         logger.info("un-excluded app %d from '%s'" % (app_id, sc.name))
         self._save_sidecar()
 
-    def evaluate_collection(self, collection):
-        # evaluate rules against games
-        all_games = self.game_manager.get_real_games()
-        return self.evaluator.evaluate_batch(all_games, collection)
+    def evaluate_collection(self, collection, games=None, columns=None, backend="python"):
+        # evaluate rules against games (all real games unless given);
+        # columns: evaluator.columns(games), shared across collections;
+        # backend "sql" asks metadata.db instead (see sql_compiler.py),
+        # falling back to python for fields the DB doesn't store
+        if games is None:
+            games = self.game_manager.get_real_games()
+        if backend == "sql":
+            ids = query_collection(self.database.conn, collection)
+            if ids is not None:
+                hit = {str(i) for i in ids}
+                return [g for g in games if g.app_id in hit]
+            logger.debug("'%s' reads fields metadata.db doesn't store, evaluating in python" % collection.name)
+        return self.evaluator.evaluate_batch(games, collection, columns)
 
     def evaluate_all(self):
         # evaluate all active collections
         result = {}
+        games = self.game_manager.get_real_games()
+        cols = self.evaluator.columns(games)
         for sc in self.get_all():
             if sc.is_active:
-                result[sc.name] = self.evaluate_collection(sc)
+                result[sc.name] = self.evaluate_collection(sc, games, cols)
         return result
 
-    def sync_to_steam(self, collection, matching_app_ids):
-        # sync matching games to steam category
+    def sync_to_steam(self, collection, matching_app_ids, app_ids=None):
+        # sync matching games to steam category;
+        # app_ids: only diff these games (incremental updates), None = all
         if not self.category_service:
             return
 
         matching_set = set(matching_app_ids)
-        current_games = self.game_manager.get_games_by_category(collection.name)
+        if app_ids is None:
+            current_games = self.game_manager.get_games_by_category(collection.name)
+        else:
+            current_games = [g for g in map(self.game_manager.get_game, app_ids) if g]
+            current_games = [g for g in current_games if collection.name in g.categories]
         current_ids = {g.app_id for g in current_games}
 
-        # add new matches
-        for aid in matching_set - current_ids:
-            self.category_service.add_app_to_category(aid, collection.name)
-
-        # remove non-matches
-        for aid in current_ids - matching_set:
-            self.category_service.remove_app_from_category(aid, collection.name)
+        # add new matches, remove non-matches, in one batch
+        add = matching_set - current_ids
+        remove = current_ids - matching_set
+        if add or remove:
+            self.category_service.apply_category_changes(
+                add={collection.name: sorted(add)} if add else None,
+                remove={collection.name: sorted(remove)} if remove else None,
+            )
 
     def sync_all_to_steam(self):
         # sync all active collections
+        games = self.game_manager.get_real_games()
+        cols = self.evaluator.columns(games)
         for sc in self.get_all():
             if sc.is_active and sc.auto_sync:
-                matching = self.evaluate_collection(sc)
+                matching = self.evaluate_collection(sc, games, cols)
                 app_ids = [int(g.app_id) for g in matching]
                 self.database.populate_smart_collection(sc.collection_id, app_ids)
                 self.sync_to_steam(sc, [g.app_id for g in matching])
@@ -203,10 +231,12 @@ class SmartCollectionManager:
     def refresh(self):
         # refresh all collections
         result = {}
+        games = self.game_manager.get_real_games()
+        cols = self.evaluator.columns(games)
         for sc in self.get_all():
             if not sc.is_active:
                 continue
-            matching = self.evaluate_collection(sc)
+            matching = self.evaluate_collection(sc, games, cols)
             app_ids = [int(g.app_id) for g in matching]
             self.database.populate_smart_collection(sc.collection_id, app_ids)
 
@@ -215,12 +245,84 @@ class SmartCollectionManager:
 
             result[sc.name] = len(matching)
 
+        # everything pending is covered now
+        changes = getattr(self.game_manager, "changes", None)
+        if changes is not None:
+            changes.clear()
+
         if result:
             self.database.commit()
             self._save_sidecar()
             logger.info("Refreshed %d smart collections: %s" % (len(result), result))
         return result
 
+    def apply_changes(self):
+        """Re-evaluates what the pending game changes can affect.
+
+        Drains game_manager.changes and, for every active collection whose
+        rules read a changed attribute, re-checks just the changed games.
+        The membership diff goes to the database and, for auto-sync
+        collections, to Steam. Category edits made by that sync are picked
+        up by a follow-up pass.
+
+        Returns:
+            dict: Collection name -> (added, removed) for collections
+            whose membership changed.
+        """
+        log = getattr(self.game_manager, "changes", None)
+        result = {}
+        if not log:
+            return result
+
+        active = [sc for sc in self.get_all() if sc.is_active]
+        for _ in range(_MAX_PASSES):
+            changes = log.drain()
+            if not changes or not active:
+                break
+            real = {g.app_id: g for g in self.game_manager.get_real_games()}
+            for sc in active:
+                added, removed = self._apply_to_collection(sc, changes, real)
+                if added or removed:
+                    a, r = result.get(sc.name, (0, 0))
+                    result[sc.name] = (a + added, r + removed)
+
+        if log:
+            logger.debug("%d game changes left for the next pass" % len(log))
+        if result:
+            self.database.commit()
+            logger.info("Updated %d smart collections incrementally: %s" % (len(result), result))
+        return result
+
+    def _apply_to_collection(self, sc, changes, real):
+        # re-check the changed games sc depends on, returns (added, removed) counts
+        deps = self.evaluator.dependencies(sc) | _REAL_ATTRS
+        touched = [aid for aid, attrs in changes.items() if attrs is None or not deps.isdisjoint(attrs)]
+        if not touched:
+            return 0, 0
+
+        match = self.evaluator.compiled(sc)
+        excluded = sc.excluded_app_ids
+        members = set(self.database.get_smart_collection_games(sc.collection_id))
+        hits, added, removed = [], [], []
+        for aid in touched:
+            try:
+                iid = int(aid)
+            except (ValueError, TypeError):
+                continue
+            g = real.get(aid)
+            if g is not None and iid not in excluded and match(g):
+                hits.append(aid)
+                if iid not in members:
+                    added.append(iid)
+            elif iid in members:
+                removed.append(iid)
+
+        if added or removed:
+            self.database.update_smart_collection_games(sc.collection_id, added, removed)
+        if sc.auto_sync:
+            self.sync_to_steam(sc, hits, [aid for aid in touched if aid in real])
+        return len(added), len(removed)
+
     @staticmethod
     def _sidecar_path():
         # get sidecar file path
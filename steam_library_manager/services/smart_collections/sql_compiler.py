@@ -0,0 +1,332 @@
+#
+# steam_library_manager/services/smart_collections/sql_compiler.py
+# Compiles smart collection rules into parameterized SQLite queries
+#
+# Copyright © 2025-2026 SwitchBros
+# Licensed under the MIT License. See LICENSE for details.
+#
+
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import re
+from datetime import datetime
+from functools import lru_cache
+
+from steam_library_manager.services.smart_collections.compiler import (
+    _BOOL,
+    _ENUM,
+    _NUM,
+    _TS_SAFE,
+    _TXT_LIST,
+    _TXT_SINGLE,
+    _num_test,
+    _parse,
+    _year_range,
+    collection_fields,
+)
+from steam_library_manager.services.smart_collections.models import (
+    FilterField,
+    LogicOperator,
+    Operator,
+    SmartCollection,
+)
+
+__all__ = ["SQL_FIELDS", "compile_collection_sql", "query_collection"]
+
+logger = logging.getLogger("steamlibmgr.smart_collections.sql")
+
+# fields with a metadata.db column; CATEGORY, INSTALLED, HIDDEN and
+# playtime only exist in Steam's own files
+SQL_FIELDS = frozenset(
+    {
+        FilterField.TAG,
+        FilterField.GENRE,
+        FilterField.PLATFORM,
+        FilterField.LANGUAGE,
+        FilterField.NAME,
+        FilterField.DEVELOPER,
+        FilterField.PUBLISHER,
+        FilterField.APP_TYPE,
+        FilterField.RELEASE_YEAR,
+        FilterField.REVIEW_SCORE,
+        FilterField.REVIEW_COUNT,
+        FilterField.HLTB_MAIN,
+        FilterField.ACHIEVEMENT_PCT,
+        FilterField.ACHIEVEMENT_TOTAL,
+        FilterField.STEAM_DECK,
+        FilterField.PROTONDB,
+        FilterField.ACHIEVEMENT_PERFECT,
+    }
+)
+
+# NULLs read the same way GameManager.enrich_from_database fills Game
+# fields: missing means "" or 0
+_COLUMNS = {
+    FilterField.NAME: ("g.name", None),
+    FilterField.DEVELOPER: ("COALESCE(g.developer, '')", None),
+    FilterField.PUBLISHER: ("COALESCE(g.publisher, '')", None),
+    FilterField.APP_TYPE: ("COALESCE(g.app_type, '')", None),
+    FilterField.STEAM_DECK: ("COALESCE(g.steam_deck_status, '')", None),
+    FilterField.PROTONDB: ("COALESCE(p.tier, '')", "p"),
+    FilterField.REVIEW_SCORE: ("COALESCE(g.review_percentage, 0)", None),
+    FilterField.REVIEW_COUNT: ("COALESCE(g.review_count, 0)", None),
+    FilterField.HLTB_MAIN: ("COALESCE(h.main_story, 0)", "h"),
+    FilterField.ACHIEVEMENT_PCT: ("COALESCE(a.completion_percentage, 0)", "a"),
+    FilterField.ACHIEVEMENT_TOTAL: ("COALESCE(a.total_achievements, g.achievements_total, 0)", "a"),
+    FilterField.ACHIEVEMENT_PERFECT: ("COALESCE(a.perfect_game, 0)", "a"),
+}
+
+# list fields: (subquery over the items, item column)
+_LISTS = {
+    FilterField.TAG: ("SELECT 1 FROM game_tags t WHERE t.app_id = g.app_id", "t.tag"),
+    FilterField.GENRE: ("SELECT 1 FROM game_genres t WHERE t.app_id = g.app_id", "t.genre"),
+    FilterField.LANGUAGE: (
+        "SELECT 1 FROM game_languages t WHERE t.app_id = g.app_id AND t.interface",
+        "t.language",
+    ),
+    FilterField.PLATFORM: (
+        "SELECT 1 FROM json_each(CASE WHEN g.platforms <> '' THEN g.platforms ELSE '[]' END) t WHERE 1",
+        "t.value",
+    ),
+}
+
+_JOINS = {
+    "h": "LEFT JOIN hltb_data h ON h.app_id = g.app_id",
+    "p": "LEFT JOIN protondb_ratings p ON p.app_id = g.app_id",
+    "a": "LEFT JOIN achievement_stats a ON a.app_id = g.app_id",
+}
+
+# first set release timestamp, like enrich_from_database picks it
+_RELEASE_TS = (
+    "CASE WHEN COALESCE(NULLIF(release_date, 0), NULLIF(steam_release_date, 0), NULLIF(original_release_date, 0), 0)"
+    " > 0 THEN COALESCE(NULLIF(release_date, 0), NULLIF(steam_release_date, 0), NULLIF(original_release_date, 0))"
+    " ELSE 0 END"
+)
+
+_CMP = {
+    Operator.EQUALS: "=",
+    Operator.GREATER_THAN: ">",
+    Operator.LESS_THAN: "<",
+    Operator.GREATER_EQUAL: ">=",
+    Operator.LESS_EQUAL: "<=",
+}
+
+# first timestamp datetime.fromtimestamp() can't turn into a year
+_TS_END = datetime(9999, 12, 31, 23, 59, 59).timestamp() + 1
+
+
+def compile_collection_sql(col: SmartCollection) -> tuple[str, dict] | None:
+    """Compiles a collection into one SELECT of matching app IDs.
+
+    Matches what the Python evaluator returns for games loaded from the
+    same database: text tests are case-insensitive through Python's own
+    lower() and re (registered on the connection by query_collection()),
+    NULLs read as the defaults the loader fills in, and release years
+    compare on timestamp ranges.
+
+    Args:
+        col: The collection to compile.
+
+    Returns:
+        (sql, named params), or None when a rule reads a field metadata.db
+        doesn't store or compares against inf/nan.
+    """
+    if not collection_fields(col) <= SQL_FIELDS:
+        return None
+
+    q = _Query()
+    try:
+        if col.groups:
+            parts = [q.combine([q.rule(r) for r in grp.rules], grp.logic) for grp in col.groups]
+            where = q.combine(parts, col.logic)
+        else:
+            where = q.combine([q.rule(r) for r in col.rules], col.logic)
+    except _Unsupported:
+        return None
+
+    source = "games"
+    if q.release:
+        source = "(SELECT *, %s AS release_ts FROM games)" % _RELEASE_TS
+    sql = "SELECT g.app_id FROM %s g %s WHERE %s" % (source, " ".join(_JOINS[j] for j in sorted(q.joins)), where)
+
+    if col.excluded_app_ids:
+        sql += " AND g.app_id NOT IN (SELECT value FROM json_each(%s))" % q.bind(
+            json.dumps(sorted(col.excluded_app_ids))
+        )
+    return sql, q.params
+
+
+def query_collection(conn, col: SmartCollection) -> list[int] | None:
+    """Runs a collection against a metadata.db connection.
+
+    Works without loaded games, so headless tools can use it directly.
+
+    Returns:
+        Matching app IDs, or None if the collection can't be pushed down.
+    """
+    compiled = compile_collection_sql(col)
+    if compiled is None:
+        return None
+    _register(conn)
+    sql, params = compiled
+    return [row[0] for row in conn.execute(sql, params)]
+
+
+def _register(conn):
+    conn.create_function("slm_lower", 1, _lower, deterministic=True)
+    conn.create_function("slm_regexp", 2, _regexp, deterministic=True)
+
+
+def _lower(s):
+    return s.lower() if isinstance(s, str) else str(s).lower()
+
+
+@lru_cache(maxsize=128)
+def _pattern(p):
+    return re.compile(p, re.IGNORECASE)
+
+
+def _regexp(p, s):
+    return _pattern(p).search(s if isinstance(s, str) else str(s)) is not None
+
+
+class _Unsupported(Exception):
+    pass
+
+
+class _Query:
+    # collects named params and the joins the rules need
+
+    def __init__(self):
+        self.params = {}
+        self.joins = set()
+        self.release = False
+
+    def bind(self, value):
+        name = "p%d" % len(self.params)
+        self.params[name] = value
+        return ":" + name
+
+    def combine(self, parts, logic):
+        # empty rule lists never match
+        if not parts:
+            return "0"
+        if len(parts) == 1:
+            return parts[0]
+        op = " AND " if logic == LogicOperator.AND else " OR "
+        return "(%s)" % op.join(parts)
+
+    def rule(self, r):
+        m = self.match(r)
+        return "NOT %s" % m if r.negated else m
+
+    def match(self, r):
+        fld = r.field
+
+        if fld in _TXT_LIST:
+            base, item = _LISTS[fld]
+            if fld == FilterField.TAG and r.operator == Operator.EQUALS and r.tag_id is not None:
+                # games with tag ids match by id, the rest by tag name
+                sql = (
+                    "(CASE WHEN EXISTS (SELECT 1 FROM game_tags t WHERE t.app_id = g.app_id AND t.tag_id IS NOT NULL)"
+                    " THEN EXISTS (SELECT 1 FROM game_tags t WHERE t.app_id = g.app_id AND t.tag_id = %s)"
+                    % self.bind(r.tag_id)
+                )
+                test = self.text(r.operator, r.value, item)
+                return "%s ELSE EXISTS (%s AND %s) END)" % (sql, base, test)
+            test = self.text(r.operator, r.value, item)
+            if test == "0":
+                return "0"
+            return "EXISTS (%s AND %s)" % (base, test)
+
+        if fld in _TXT_SINGLE or fld in _ENUM:
+            return self.text(r.operator, r.value, self.column(fld))
+
+        if fld in _NUM:
+            return self.num(r)
+
+        if fld in _BOOL:
+            if r.operator == Operator.IS_TRUE:
+                return "(%s <> 0)" % self.column(fld)
+            if r.operator == Operator.IS_FALSE:
+                return "(%s = 0)" % self.column(fld)
+            return "0"
+
+        raise _Unsupported(fld)
+
+    def column(self, fld):
+        expr, join = _COLUMNS[fld]
+        if join:
+            self.joins.add(join)
+        return expr
+
+    def text(self, op, tgt, expr):
+        # SQL for the compiler's _text_test on expr, "0" when nothing can match
+        low = tgt.lower()
+        if op == Operator.EQUALS:
+            return "(slm_lower(%s) = %s)" % (expr, self.bind(low))
+        if op == Operator.CONTAINS:
+            return "(instr(slm_lower(%s), %s) > 0)" % (expr, self.bind(low))
+        if op == Operator.STARTS_WITH:
+            return "(substr(slm_lower(%s), 1, %d) = %s)" % (expr, len(low), self.bind(low))
+        if op == Operator.ENDS_WITH:
+            if not low:
+                return "1"
+            return "(substr(slm_lower(%s), %d) = %s)" % (expr, -len(low), self.bind(low))
+        if op == Operator.REGEX:
+            try:
+                _pattern(tgt)
+            except re.error:
+                return "0"
+            return "slm_regexp(%s, %s)" % (self.bind(tgt), expr)
+        return "0"
+
+    def num(self, r):
+        t = _parse(r.value)
+        if t is None:
+            return "0"
+        op = r.operator
+        t_max = 0.0
+        if op == Operator.BETWEEN:
+            t_max = _parse(r.value_max)
+            if t_max is None:
+                return "0"
+        elif op not in _CMP:
+            return "0"
+        if not (math.isfinite(t) and math.isfinite(t_max)):
+            raise _Unsupported(r.field)
+
+        if r.field != FilterField.RELEASE_YEAR:
+            return self.cmp(self.column(r.field), op, t, t_max)
+
+        # timestamps compare on the years' timestamp range, small values
+        # are years already; see compiler._compile_num
+        self.release = True
+        lo_ts, hi_ts = _year_range(op, t, t_max)
+        if lo_ts >= hi_ts:
+            in_range = "0"
+        else:
+            bounds = []
+            if lo_ts != -math.inf:
+                bounds.append("g.release_ts >= %s" % self.bind(lo_ts))
+            if hi_ts != math.inf:
+                bounds.append("g.release_ts < %s" % self.bind(hi_ts))
+            in_range = "(%s)" % " AND ".join(bounds) if bounds else "1"
+        # year 9999 still converts, later timestamps read as year 0
+        test = _num_test(op, t, t_max)
+        late = "(CASE WHEN g.release_ts < %s THEN %d ELSE %d END)" % (self.bind(_TS_END), test(9999.0), test(0.0))
+        return "(CASE WHEN g.release_ts <= 9999 THEN %s WHEN g.release_ts < %s THEN %s ELSE %s END)" % (
+            self.cmp("g.release_ts", op, t, t_max),
+            self.bind(_TS_SAFE),
+            in_range,
+            late,
+        )
+
+    def cmp(self, expr, op, t, t_max):
+        if op == Operator.BETWEEN:
+            return "(%s BETWEEN %s AND %s)" % (expr, self.bind(min(t, t_max)), self.bind(max(t, t_max)))
+        return "(%s %s %s)" % (expr, _CMP[op], self.bind(t))
@@ -0,0 +1,179 @@
+#
+# steam_library_manager/services/smart_collections/vectorized.py
+# Compiles smart collection rules into NumPy mask builders
+#
+# Copyright © 2025-2026 SwitchBros
+# Licensed under the MIT License. See LICENSE for details.
+#
+
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+from steam_library_manager.services.game_columns import np
+from steam_library_manager.services.smart_collections.compiler import (
+    _BOOL,
+    _ENUM,
+    _NUM,
+    _TXT_LIST,
+    _TXT_SINGLE,
+    _compile_match,
+    _getter,
+    _parse,
+    _text_test,
+)
+from steam_library_manager.services.smart_collections.models import (
+    FilterField,
+    LogicOperator,
+    Operator,
+    SmartCollection,
+)
+
+if TYPE_CHECKING:
+    from steam_library_manager.services.game_columns import GameColumns
+
+__all__ = ["MaskBuilder", "compile_collection_mask"]
+
+MaskBuilder = Callable[["GameColumns"], "np.ndarray"]
+
+
+def compile_collection_mask(col: SmartCollection) -> MaskBuilder:
+    """Compiles a collection into a function from GameColumns to a match mask.
+
+    Numeric, boolean and single-value text rules become array
+    comparisons on the snapshot's columns; groups combine with & and |.
+    Text-list rules (tags, genres...) test each distinct item once and
+    map the result back to the games holding it. Category rules alone
+    fall back to the compiled per-game predicate, read live from the
+    Game objects.
+
+    Args:
+        col: The collection to compile.
+
+    Returns:
+        Callable taking a GameColumns and returning a bool array.
+    """
+    if col.groups:
+        parts = [_combine([_rule(r) for r in grp.rules], grp.logic) for grp in col.groups]
+        return _combine(parts, col.logic)
+    return _combine([_rule(r) for r in col.rules], col.logic)
+
+
+def _none(cols):
+    return cols.none()
+
+
+def _combine(parts, logic):
+    # empty rule lists never match
+    if not parts:
+        return _none
+    if len(parts) == 1:
+        return parts[0]
+    op = np.logical_and if logic == LogicOperator.AND else np.logical_or
+    return lambda cols: op.reduce([p(cols) for p in parts])
+
+
+def _rule(r):
+    m = _match(r)
+    if r.negated:
+        return lambda cols: ~m(cols)
+    return m
+
+
+def _match(r):
+    fld = r.field
+    get = _getter(fld)
+
+    if fld == FilterField.CATEGORY:
+        # per-object fallback, read live: syncing one collection can
+        # change the categories the next one matches on
+        pred = _compile_match(r)
+        return lambda cols: cols.per_game(pred)
+
+    if fld in _TXT_LIST:
+        test = _text_test(r.operator, r.value)
+        if test is None:
+            return _none
+        if fld == FilterField.TAG and r.operator == Operator.EQUALS and r.tag_id is not None:
+            return _tag_id(r.tag_id, get, test)
+        # one test per distinct item
+        return lambda cols: cols.match_any_item(fld, get, test)
+
+    if fld in _TXT_SINGLE or fld in _ENUM:
+        test = _text_test(r.operator, r.value)
+        if test is None:
+            return _none
+
+        def text(g):
+            return str(get(g))
+
+        # one test per distinct value
+        return lambda cols: cols.match_values(fld, text, test)
+
+    if fld in _NUM:
+        return _num(r, get)
+
+    if fld in _BOOL:
+        if r.operator == Operator.IS_TRUE:
+            return lambda cols: cols.flags(fld, get)
+        if r.operator == Operator.IS_FALSE:
+            return lambda cols: ~cols.flags(fld, get)
+        return _none
+
+    return _none
+
+
+def _tag_ids(g):
+    ids = getattr(g, "tag_ids", None)
+    return list(ids) if ids else ()
+
+
+def _tag_id(tid, get, test):
+    # games with tag ids match by id, the rest by tag name
+    def match(cols):
+        rows, codes, values = cols.exploded("tag_ids", _tag_ids)
+        has_ids = np.zeros(cols.n, dtype=bool)
+        has_ids[rows] = True
+        by_id = np.zeros(cols.n, dtype=bool)
+        if tid in values:
+            by_id[rows[codes == values.index(tid)]] = True
+        return np.where(has_ids, by_id, cols.match_any_item(FilterField.TAG, get, test))
+
+    return match
+
+
+# numeric operators as ufuncs
+_CMP = {
+    Operator.EQUALS: "equal",
+    Operator.GREATER_THAN: "greater",
+    Operator.LESS_THAN: "less",
+    Operator.GREATER_EQUAL: "greater_equal",
+    Operator.LESS_EQUAL: "less_equal",
+}
+
+
+def _num(r, get):
+    t = _parse(r.value)
+    if t is None:
+        return _none
+
+    op = r.operator
+    if op == Operator.BETWEEN:
+        t_max = _parse(r.value_max)
+        if t_max is None:
+            return _none
+        lo, hi = min(t, t_max), max(t, t_max)
+    elif op not in _CMP:
+        return _none
+
+    fld = r.field
+    years = fld == FilterField.RELEASE_YEAR
+
+    def match(cols):
+        vals, ok = cols.years(fld, get) if years else cols.numeric(fld, get)
+        if op == Operator.BETWEEN:
+            return ok & (vals >= lo) & (vals <= hi)
+        return ok & getattr(np, _CMP[op])(vals, t)
+
+    return match
@@ -106,6 +106,7 @@ class EnrichmentStarters:
             starting_key="ui.enrichment.deck_starting",
             total=len(to_enrich),
             refresh_cb=callback,
+            watched=self.mw.game_manager.changes.watch(to_enrich, ("steam_deck_status",)),
         )
 
     # howlongtobeat enrichment
@@ -358,6 +359,7 @@ class EnrichmentStarters:
         def on_finished(games_tagged: int, total_tags: int) -> None:
             progress.close()
             self._refresh_games_from_db()
+            self._apply_game_changes()
             UIHelper.show_success(
                 self.mw,
                 t("ui.tag_import.complete", games=games_tagged, tags=total_tags),
@@ -411,6 +413,7 @@ class EnrichmentStarters:
         thread = thread_cls(self.mw)
         extra = configure_kwargs or {}
         thread.configure(games, self._get_db_path(), force_refresh=force_refresh, **extra)
+        thread.enable_pipeline()
         callback = (
             None
             if force_refresh
@@ -437,6 +440,7 @@ class EnrichmentStarters:
         starting_key: str,
         total: int,
         refresh_cb: Callable[[], None] | None = None,
+        watched: tuple | None = None,
     ) -> None:
         progress = UIHelper.create_progress_dialog(
             self.mw,
@@ -457,6 +461,9 @@ class EnrichmentStarters:
 
         def on_finished(success: int, failed: int) -> None:
             progress.close()
+            # the thread wrote to the watched games directly
+            if watched:
+                self.mw.game_manager.changes.note_watched(watched)
             if refresh_cb:
                 wants_refresh = UIHelper.show_batch_result(
                     self.mw,
@@ -476,6 +483,7 @@ class EnrichmentStarters:
                     t("ui.enrichment.complete", success=success, failed=failed),
                 )
             self._refresh_games_from_db()
+            self._apply_game_changes()
             self.mw.populate_categories()
 
         thread.progress.connect(on_progress)
@@ -515,14 +523,21 @@ class EnrichmentStarters:
             all_tag_ids = db._batch_tids(app_ids)
             all_genres = db._batch_rel("game_genres", "genre", app_ids)
 
-            for app_id_str, game in self.mw.game_manager.games.items():
-                aid = int(app_id_str)
-                game.tags = all_tags.get(aid, [])
-                game.tag_ids = all_tag_ids.get(aid, [])
-                game.genres = all_genres.get(aid, [])
+            games = self.mw.game_manager.games
+            with self.mw.game_manager.changes.track(games.values(), ("tags", "tag_ids", "genres")):
+                for app_id_str, game in games.items():
+                    aid = int(app_id_str)
+                    game.tags = all_tags.get(aid, [])
+                    game.tag_ids = all_tag_ids.get(aid, [])
+                    game.genres = all_genres.get(aid, [])
         finally:
             db.close()
 
+    # re-evaluate the smart collections the changed games affect
+    def _apply_game_changes(self) -> None:
+        if getattr(self.mw, "smart_collection_manager", None):
+            self.mw.smart_collection_manager.apply_changes()
+
     def _open_database(self):
         from steam_library_manager.core.database import Database
 
@@ -26,46 +26,37 @@ class GameActions:
     # ------------------------------------------------------------------
 
     def toggle_favorite(self, game):
-        # Flip favorite status via cloud storage collection
-        if not self.mw.cloud_storage_parser:
+        # Flip favorite status via cloud storage collection;
+        # CategoryService keeps game.categories and the change log in sync
+        if not self.mw.cloud_storage_parser or not self.mw.category_service:
             return
 
         fav_key = t("categories.favorites")
 
         if game.is_favorite():
-            if fav_key in game.categories:
-                game.categories.remove(fav_key)
-            if self.mw.category_service:
-                self.mw.category_service.remove_app_from_category(game.app_id, fav_key)
+            self.mw.category_service.remove_app_from_category(game.app_id, fav_key)
         else:
-            if fav_key not in game.categories:
-                game.categories.append(fav_key)
-            if self.mw.category_service:
-                self.mw.category_service.add_app_to_category(game.app_id, fav_key)
+            self.mw.category_service.add_app_to_category(game.app_id, fav_key)
 
         self.mw.save_collections()
-        self.mw.populate_categories()
+        self.mw.populate_categories(changed={fav_key})
 
     def toggle_hide_game(self, game, hide):
         # Add/remove from hidden collection
-        if not self.mw.cloud_storage_parser:
+        if not self.mw.cloud_storage_parser or not self.mw.category_service:
             return
 
         hidden_key = t("categories.hidden")
 
         if hide:
-            if hidden_key not in game.categories:
-                game.categories.append(hidden_key)
-            if self.mw.category_service:
-                self.mw.category_service.add_app_to_category(game.app_id, hidden_key)
+            self.mw.category_service.add_app_to_category(game.app_id, hidden_key)
         else:
-            if hidden_key in game.categories:
-                game.categories.remove(hidden_key)
-            if self.mw.category_service:
-                self.mw.category_service.remove_app_from_category(game.app_id, hidden_key)
+            self.mw.category_service.remove_app_from_category(game.app_id, hidden_key)
 
         if self.mw.save_collections():
-            game.hidden = hide
+            if game.hidden != hide:
+                game.hidden = hide
+                self.mw.game_manager.changes.note(game.app_id, "hidden")
             self.mw.populate_categories()
 
             status_word = t("ui.visibility.hidden") if hide else t("ui.visibility.visible")
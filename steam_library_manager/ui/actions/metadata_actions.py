@@ -52,6 +52,10 @@ class MetadataActions:
 
                 if new.get("name"):
                     game.name = new["name"]
+                    self.mw.game_manager.query_svc.invalidate()
+                    self.mw.game_manager.changes.note(game.app_id, "name")
+                    if self.mw.smart_collection_manager:
+                        self.mw.smart_collection_manager.apply_changes()
 
                 self.mw.populate_categories()
                 self.mw.selection_handler.on_game_selected(game)
@@ -82,6 +86,7 @@ class MetadataActions:
                 # Normal bulk edit
                 name_mods = settings.pop("name_modifications", None)
                 count = self.mw.metadata_service.apply_bulk_metadata(self.mw.selected_games, settings, name_mods)
+                self.mw.game_manager.query_svc.invalidate()
                 self.mw.populate_categories()
                 UIHelper.show_success(self.mw, t("ui.metadata_editor.updated_bulk", count=count))
 
@@ -110,15 +115,18 @@ class MetadataActions:
         if self.mw.game_manager:
             game = self.mw.game_manager.get_game(app_id)
             if game:
-                if rating:
-                    game.pegi_rating = rating
-                else:
-                    # Restore original by re-fetching details
-                    self.mw.game_manager.fetch_game_details(app_id)
-
-                    # Re-apply other overrides (name, dev, etc.) just in case
-                    if self.mw.appinfo_manager:
-                        self.mw.game_manager.apply_metadata_overrides(self.mw.appinfo_manager)
+                with self.mw.game_manager.changes.track([game], ("pegi_rating",)):
+                    if rating:
+                        game.pegi_rating = rating
+                    else:
+                        # Restore original by re-fetching details
+                        self.mw.game_manager.fetch_game_details(app_id)
+
+                        # Re-apply other overrides (name, dev, etc.) just in case
+                        if self.mw.appinfo_manager:
+                            self.mw.game_manager.apply_metadata_overrides(self.mw.appinfo_manager)
+                if self.mw.smart_collection_manager:
+                    self.mw.smart_collection_manager.apply_changes()
 
                 self.mw.selection_handler.on_game_selected(game)
 
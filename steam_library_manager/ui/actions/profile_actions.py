@@ -162,6 +162,7 @@ class ProfileActions:
         if par and hasattr(par, "collections"):
             par.mark_all_managed_as_deleted()
             par.collections = list(p.collections)
+            par.invalidate_index()
             par.modified = True
 
         # autocat settings
@@ -9,8 +9,8 @@
 from __future__ import annotations
 
 from PyQt6.QtCore import QThread, pyqtSignal
-import requests
 
+from steam_library_manager.utils.http_client import http
 from steam_library_manager.utils.i18n import t
 from steam_library_manager.utils.timeouts import HTTP_TIMEOUT
 from steam_library_manager.ui.widgets.ui_helper import UIHelper
@@ -40,7 +40,7 @@ class StoreCheckThread(QThread):
     def run(self):
         try:
             u = "https://store.steampowered.com/app/%s/" % self.aid
-            r = requests.get(
+            r = http.get(
                 u,
                 timeout=HTTP_TIMEOUT,
                 allow_redirects=True,
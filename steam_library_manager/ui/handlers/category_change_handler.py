@@ -27,24 +27,25 @@ class CategoryChangeHandler:
         self.empty_handler = EmptyCollectionHandler(main_window)
 
     def apply_category_to_games(self, games, category, checked):
-        # add or remove category from games
+        # add or remove category from games; CategoryService updates
+        # g.categories so the change log and category index see the edit
         if not self.mw.category_service:
             return
 
         for g in games:
             if checked:
                 if category not in g.categories:
-                    g.categories.append(category)
                     self.mw.category_service.add_app_to_category(g.app_id, category)
             else:
                 if category in g.categories:
-                    g.categories.remove(category)
-
                     # smart collection? -> exclude instead of plain remove
                     sc_mgr = getattr(self.mw, "smart_collection_manager", None)
                     sc = sc_mgr.get_by_name(category) if sc_mgr else None
                     if sc:
                         sc_mgr.exclude_game(sc.collection_id, int(g.app_id))
+                        if category in g.categories:
+                            # no auto_sync: the exclusion left the Steam category alone
+                            self.mw.category_service.remove_app_from_category(g.app_id, category)
                     else:
                         self.mw.category_service.remove_app_from_category(g.app_id, category)
                         self.empty_handler.check_and_delete_if_empty(category)
@@ -91,7 +92,7 @@ class CategoryChangeHandler:
         if self.mw.current_search_query:
             self.mw.view_actions.on_search(self.mw.current_search_query)
         else:
-            self.mw.populate_categories()
+            self.mw.populate_categories(changed={category})
 
         if sel_ids:
             self.mw.selection_handler.restore_game_selection(sel_ids)
@@ -114,7 +115,6 @@ class CategoryChangeHandler:
 
         for g in games:
             if target_category not in g.categories:
-                g.categories.append(target_category)
                 self.mw.category_service.add_app_to_category(g.app_id, target_category)
 
         self.mw.save_collections()
@@ -122,7 +122,7 @@ class CategoryChangeHandler:
         if self.mw.current_search_query:
             self.mw.view_actions.on_search(self.mw.current_search_query)
         else:
-            self.mw.populate_categories()
+            self.mw.populate_categories(changed={target_category})
 
         # refresh details if dropped game is selected
         if games and self.mw.details_widget.current_game:
@@ -12,6 +12,7 @@ from collections import OrderedDict
 
 from steam_library_manager.integrations.external_games.models import get_collection_emoji
 from steam_library_manager.utils.i18n import t
+from steam_library_manager.utils.profiler import span
 
 __all__ = ["CategoryPopulator"]
 
@@ -27,7 +28,8 @@ _TYPE_MAP = {
 class CategoryPopulator:
     """Builds the sidebar category tree.
 
-    Cheap to rebuild (~50ms for 2500 games), no cache needed.
+    Edits that name the categories they touched only refresh those nodes;
+    everything else diffs against the current tree before rebuilding.
     Handles German umlauts, smart collections, duplicates.
     """
 
@@ -69,12 +71,21 @@ class CategoryPopulator:
             out[cn] = sorted(bkts[cn], key=lambda g: g.sort_name.lower())
         return out
 
-    def populate(self):
-        # refresh sidebar
+    def populate(self, changed=None):
+        # refresh sidebar; changed = category names touched by an edit
         mw = self._mw
         if not mw.game_manager:
             return
 
+        with span("category_populator.populate", partial=bool(changed)) as sp:
+            sp.count = len(mw.game_manager.games)
+            if changed and self._patch(changed):
+                return
+            self._build()
+
+    def _build(self):
+        mw = self._mw
+
         # apply filters
         raw = mw.game_manager.get_library_entries()
         filt = mw.filter_service.apply(raw)
@@ -85,19 +96,9 @@ class CategoryPopulator:
         vis = sort_fn([g for g in filt if not g.hidden])
         hid = sort_fn([g for g in filt if g.hidden])
 
-        favs = sort_fn(
-            [g for g in mw.game_manager.get_favorites() if not g.hidden and g.app_id in fids],
-        )
-
-        # smart collections
-        sc = set()
-        if hasattr(mw, "smart_collection_manager") and mw.smart_collection_manager:
-            for c in mw.smart_collection_manager.get_all():
-                sc.add(c.name)
-
-        uncat = sort_fn(
-            [g for g in mw.game_manager.get_uncategorized_games(sc) if not g.hidden and g.app_id in fids],
-        )
+        favs = self._favorites(fids)
+        sc = self._smart_names()
+        uncat = self._uncategorized(fids, sc)
 
         cats_data = OrderedDict()
 
@@ -109,28 +110,14 @@ class CategoryPopulator:
             cats_data[t("categories.favorites")] = favs
 
         # 3. User categories
-        cats = mw.game_manager.get_all_categories()
-
-        active = mw.cloud_storage_parser or mw.localconfig_helper
-        if active:
-            for pc in active.get_all_categories():
-                if pc not in cats:
-                    cats[pc] = 0
+        cats = self._category_names()
 
         # duplicates
         dups = {}
         if mw.cloud_storage_parser:
             dups = mw.cloud_storage_parser.get_duplicate_groups()
 
-        # protected names
-        from steam_library_manager.ui.constants import get_protected_collection_names
-
-        spec = get_protected_collection_names() | {
-            t("categories.soundtracks"),
-            t("categories.tools"),
-            t("categories.software"),
-            t("categories.videos"),
-        }
+        spec = self._special_names()
 
         dup_info = {}
 
@@ -157,10 +144,7 @@ class CategoryPopulator:
                     cats_data[dk] = cg
                     dup_info[dk] = (cn, idx + 1, tot)
             else:
-                cg = sort_fn(
-                    [g for g in mw.game_manager.get_games_by_category(cn) if not g.hidden and g.app_id in fids],
-                )
-                cats_data[cn] = cg
+                cats_data[cn] = self._category_games(cn, fids)
 
         # 4. Type categories
         _tf = {
@@ -203,4 +187,96 @@ class CategoryPopulator:
             if get_collection_emoji(cn):
                 ext.add(cn)
 
-        mw.tree.populate_categories(cats_data, dyn, dup_info, sc, ext)
+        # unchanged nodes are left alone, new/removed categories rebuild
+        mw.tree.update_categories(cats_data, dyn, dup_info, sc, ext)
+
+    def _patch(self, changed):
+        # recompute only the touched categories (+ favorites/uncategorized,
+        # whose membership follows them); False -> caller does a full build
+        mw = self._mw
+        tree = mw.tree
+
+        fav_key = t("categories.favorites")
+        unc_key = t("categories.uncategorized")
+        spec = self._special_names()
+        cats = self._category_names()
+
+        for cn in changed:
+            if cn == fav_key:
+                continue
+            # deleted, duplicated, special or brand new -> layout changes
+            if cn in spec or cn not in cats or not tree.has_category(cn):
+                return False
+
+        raw = mw.game_manager.get_library_entries()
+        fids = {g.app_id for g in mw.filter_service.apply(raw)}
+
+        data = OrderedDict()
+        for cn in changed:
+            if cn != fav_key:
+                data[cn] = self._category_games(cn, fids)
+
+        favs = self._favorites(fids) if fav_key in changed else None
+        if favs is not None:
+            if bool(favs) != tree.has_category(fav_key):
+                return False
+            if favs:
+                data[fav_key] = favs
+
+        uncat = self._uncategorized(fids, self._smart_names())
+        if bool(uncat) != tree.has_category(unc_key):
+            return False
+        if uncat:
+            data[unc_key] = uncat
+
+        return tree.update_categories(data, partial=True)
+
+    def _category_names(self):
+        # game categories plus (possibly empty) parser collections
+        mw = self._mw
+        cats = mw.game_manager.get_all_categories()
+
+        active = mw.cloud_storage_parser or mw.localconfig_helper
+        if active:
+            for pc in active.get_all_categories():
+                if pc not in cats:
+                    cats[pc] = 0
+        return cats
+
+    @staticmethod
+    def _special_names():
+        # protected names + type categories, never listed as user categories
+        from steam_library_manager.ui.constants import get_protected_collection_names
+
+        return get_protected_collection_names() | {
+            t("categories.soundtracks"),
+            t("categories.tools"),
+            t("categories.software"),
+            t("categories.videos"),
+        }
+
+    def _smart_names(self):
+        mw = self._mw
+        sc = set()
+        if hasattr(mw, "smart_collection_manager") and mw.smart_collection_manager:
+            for c in mw.smart_collection_manager.get_all():
+                sc.add(c.name)
+        return sc
+
+    def _category_games(self, cn, fids):
+        mw = self._mw
+        return mw.filter_service.sort_games(
+            [g for g in mw.game_manager.get_games_by_category(cn) if not g.hidden and g.app_id in fids],
+        )
+
+    def _favorites(self, fids):
+        mw = self._mw
+        return mw.filter_service.sort_games(
+            [g for g in mw.game_manager.get_favorites() if not g.hidden and g.app_id in fids],
+        )
+
+    def _uncategorized(self, fids, sc):
+        mw = self._mw
+        return mw.filter_service.sort_games(
+            [g for g in mw.game_manager.get_uncategorized_games(sc) if not g.hidden and g.app_id in fids],
+        )
@@ -85,7 +85,7 @@ class KeyboardHandler:
                     msg = t("ui.dialogs.confirm_bulk", count=n)
                     if UIHelper.confirm(mw, msg, cat):
                         mw.category_change_handler.apply_category_to_games(mw.selected_games, cat, False)
-                        mw.category_populator.populate()
+                        mw.category_populator.populate(changed={cat})
             return True
 
         if key == Qt.Key.Key_F2:
@@ -112,13 +112,7 @@ class KeyboardHandler:
         cats = mw.tree.get_selected_categories()
         if not cats:
             return
-        for i in range(mw.tree.topLevelItemCount()):
-            item = mw.tree.topLevelItem(i)
-            if item and item.text(0) in cats:
-                for j in range(item.childCount()):
-                    child = item.child(j)
-                    if child:
-                        child.setSelected(True)
+        mw.tree.select_all_in_categories(cats)
 
     def _open_imgs(self):
         # Open Image Browser for the currently selected game
@@ -8,7 +8,7 @@
 
 from __future__ import annotations
 
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
+from PyQt6.QtCore import QThread, pyqtSignal
 
 from steam_library_manager.utils.i18n import t
 
@@ -103,15 +103,7 @@ class SelectionHandler:
             return
 
         self.mw.tree.blockSignals(True)
-
-        for i in range(self.mw.tree.topLevelItemCount()):
-            ci = self.mw.tree.topLevelItem(i)
-            for j in range(ci.childCount()):
-                gi = ci.child(j)
-                aid = gi.data(0, Qt.ItemDataRole.UserRole)
-                if aid and aid in ids:
-                    gi.setSelected(True)
-
+        self.mw.tree.select_games(ids)
         self.mw.tree.blockSignals(False)
 
         self.mw.selected_games = [self.mw.game_manager.get_game(aid) for aid in ids]
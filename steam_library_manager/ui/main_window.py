@@ -62,8 +62,11 @@ __all__ = ["MainWindow"]
 class MainWindow(QMainWindow):
     """Primary application window for Steam Library Manager."""
 
-    def __init__(self):
+    def __init__(self, on_bootstrap_complete=None):
+        # on_bootstrap_complete: extra slot for bootstrap_complete, connected
+        # before start() since a failed init emits it synchronously
         super().__init__()
+        self._on_bootstrap_extra = on_bootstrap_complete
         self.setWindowTitle(__app_name__)
         self.resize(1400, 800)
 
@@ -177,6 +180,8 @@ class MainWindow(QMainWindow):
         self.bootstrap_service.persona_resolved.connect(self._on_persona_resolved)
         self.bootstrap_service.session_restored.connect(self._on_session_restored)
         self.bootstrap_service.bootstrap_complete.connect(self._on_bootstrap_complete)
+        if self._on_bootstrap_extra:
+            self.bootstrap_service.bootstrap_complete.connect(self._on_bootstrap_extra)
         self.bootstrap_service.start()
 
     def _on_loading_started(self):
@@ -209,9 +214,9 @@ class MainWindow(QMainWindow):
         self.loading_label.setVisible(False)
         self.progress_bar.setVisible(False)
 
-    def _populate_categories(self):
+    def _populate_categories(self, changed=None):
         # Refresh sidebar tree with current game data
-        self.category_populator.populate()
+        self.category_populator.populate(changed)
 
     def on_game_right_click(self, game, pos):
         # Show context menu for a right-clicked game
@@ -311,12 +316,13 @@ class MainWindow(QMainWindow):
             if not self.appinfo_manager.appinfo:
                 self.appinfo_manager.load_appinfo()
 
-            # Apply all tracked modifications to the binary
+            # Apply all tracked modifications to the binary;
+            # lazy entries that fail to decode read as missing and are skipped
             for app_id, meta_data in self.appinfo_manager.modifications.items():
                 modified = meta_data.get("modified", {})
                 if modified and self.appinfo_manager.appinfo:
                     int_id = int(app_id)
-                    if int_id in self.appinfo_manager.appinfo.apps:
+                    if self.appinfo_manager.appinfo.apps.get(int_id) is not None:
                         self.appinfo_manager.appinfo.update_app_metadata(int_id, modified)
 
             # Write to VDF with backup
@@ -347,9 +353,9 @@ class MainWindow(QMainWindow):
         # Persist collections to the active parser
         return self._save_collections()
 
-    def populate_categories(self):
-        # Rebuild the category tree from current data
-        self._populate_categories()
+    def populate_categories(self, changed=None):
+        # Refresh the category tree; changed = category names an edit touched
+        self._populate_categories(changed)
 
     def update_statistics(self):
         # Refresh the statistics label in the status bar
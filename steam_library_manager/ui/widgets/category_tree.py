@@ -1,6 +1,6 @@
 #
 # steam_library_manager/ui/widgets/category_tree.py
-# QTreeWidget for the hierarchical category/game sidebar
+# Tree view for the hierarchical category/game sidebar
 #
 # Copyright © 2025-2026 SwitchBros
 # Licensed under the MIT License. See LICENSE for details.
@@ -9,38 +9,25 @@
 
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint
-from PyQt6.QtWidgets import QTreeWidget, QTreeWidgetItem, QAbstractItemView
+from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QItemSelection, QItemSelectionModel
+from PyQt6.QtWidgets import QTreeView, QAbstractItemView
 
 from steam_library_manager.config import config
 from steam_library_manager.core.game_manager import Game
-from steam_library_manager.integrations.external_games.models import get_collection_emoji
+from steam_library_manager.ui.widgets.category_tree_model import CategoryTreeModel
 from steam_library_manager.utils.i18n import t
 
-# PEGI rating suffix -> emoji key
-_PEGI_RATINGS = {
-    "03": "emoji.pegi_3",
-    "07": "emoji.pegi_7",
-    "12": "emoji.pegi_12",
-    "16": "emoji.pegi_16",
-    "18": "emoji.pegi_18",
-}
-
 __all__ = ["GameTreeWidget"]
 
-
-def _get_pegi_emoji(cat_name):
-    # match "... PEGI XX" pattern regardless of locale prefix
-    for rating, key in _PEGI_RATINGS.items():
-        if cat_name.endswith("PEGI %s" % rating):
-            return t(key)
-    return ""
+_ROLE_KIND = Qt.ItemDataRole.UserRole
+_ROLE_DATA = Qt.ItemDataRole.UserRole + 1
 
 
-class GameTreeWidget(QTreeWidget):
+class GameTreeWidget(QTreeView):
     """Sidebar tree with categories, drag-drop, multi-select.
 
-    Persists expanded/collapsed state in config.
+    Backed by CategoryTreeModel, so game rows only exist for expanded
+    categories. Persists expanded/collapsed state in config.
     Emits signals for game clicks, right-clicks, and drops.
     """
 
@@ -52,9 +39,13 @@ class GameTreeWidget(QTreeWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._model = CategoryTreeModel(self)
+        self.setModel(self._model)
+
         self.setHeaderHidden(True)
         self.setIndentation(20)
         self.setAlternatingRowColors(False)
+        self.setUniformRowHeights(True)
 
         # drag & drop
         self.setDragEnabled(True)
@@ -64,21 +55,26 @@ class GameTreeWidget(QTreeWidget):
 
         self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
 
-        self.itemClicked.connect(self._on_click)
-        self.itemSelectionChanged.connect(self._on_sel)
-        self.itemExpanded.connect(self._on_expand)
-        self.itemCollapsed.connect(self._on_collapse)
+        self.clicked.connect(self._on_click)
+        self.selectionModel().selectionChanged.connect(self._on_sel)
+        self.expanded.connect(self._on_expand)
+        self.collapsed.connect(self._on_collapse)
 
         self.setStyleSheet(
-            "QTreeWidget::item { padding: 4px; }" " QTreeWidget::item:selected { background-color: #2d5a88; }"
+            "QTreeView::item { padding: 4px; }" " QTreeView::item:selected { background-color: #2d5a88; }"
         )
 
+    def clear(self):
+        self._model.clear()
+
     def set_loading_state(self, loading):
-        self.clear()
         if loading:
-            ph = QTreeWidgetItem(self)
-            ph.setText(0, t("common.loading"))
-            ph.setFlags(Qt.ItemFlag.NoItemFlags)
+            self._model.set_placeholder(t("common.loading"))
+        else:
+            self._model.clear()
+
+    def has_category(self, key):
+        return self._model.has_category(key)
 
     def populate_categories(
         self,
@@ -89,102 +85,108 @@ class GameTreeWidget(QTreeWidget):
         external_platform_collections=None,
     ):
         # rebuild entire tree
-        self.clear()
+        self._model.set_categories(
+            categories, dynamic_collections, duplicate_info, smart_collections, external_platform_collections
+        )
+        self._restore_expanded()
 
-        dyn = dynamic_collections or set()
-        dups = duplicate_info or {}
-        sc = smart_collections or set()
-        ext = external_platform_collections or set()
+    def update_categories(
+        self,
+        categories,
+        dynamic_collections=None,
+        duplicate_info=None,
+        smart_collections=None,
+        external_platform_collections=None,
+        partial=False,
+    ):
+        # patch only the nodes whose games changed; falls back to a full
+        # rebuild when categories were added, removed or reordered.
+        # partial=True: categories holds just the touched nodes, decorations
+        # from the last full build are kept. Returns True if patched in place
+        m = self._model
+        if partial:
+            if not categories or any(not m.has_category(k) for k in categories):
+                return False
+        elif not m.same_layout(
+            categories, dynamic_collections, duplicate_info, smart_collections, external_platform_collections
+        ):
+            self.populate_categories(
+                categories, dynamic_collections, duplicate_info, smart_collections, external_platform_collections
+            )
+            return False
 
         for cat_name, games in categories.items():
-            ci = QTreeWidgetItem(self)
-
-            real = cat_name
-            is_dup = cat_name in dups
-
-            if is_dup:
-                real, idx, total = dups[cat_name]
-                disp = t("categories.duplicate_indicator", name=real, index=idx, total=total)
-            else:
-                disp = cat_name
-                if cat_name in sc:
-                    disp = "%s %s" % (cat_name, t("emoji.brain"))
-                elif cat_name in dyn:
-                    disp = "%s %s" % (cat_name, t("emoji.blitz"))
-                elif cat_name in ext:
-                    em = get_collection_emoji(cat_name)
-                    if em:
-                        disp = "%s %s" % (cat_name, em)
-
-                # PEGI collections get age rating emoji
-                pegi_em = _get_pegi_emoji(cat_name)
-                if pegi_em:
-                    disp = "%s %s" % (cat_name, pegi_em)
-
-            ci.setText(0, t("categories.category_count", name=disp, count=len(games)))
-            ci.setData(0, Qt.ItemDataRole.UserRole, "category")
-            ci.setData(0, Qt.ItemDataRole.UserRole + 1, real)
-            if is_dup:
-                ci.setData(0, Qt.ItemDataRole.UserRole + 2, cat_name)
-
-            ci.setExpanded(real in config.EXPANDED_CATEGORIES)
-
-            for game in games:
-                gi = QTreeWidgetItem(ci)
-                gi.setText(0, game.name)
-                gi.setData(0, Qt.ItemDataRole.UserRole, "game")
-                gi.setData(0, Qt.ItemDataRole.UserRole + 1, game)
-
-                dev = game.developer if game.developer else t("common.unknown")
-                gi.setToolTip(0, t("categories.game_tooltip", name=game.name, developer=dev))
+            m.update_games(cat_name, games)
+        return True
 
-    @staticmethod
-    def _on_expand(item):
-        if item.data(0, Qt.ItemDataRole.UserRole) == "category":
-            nm = item.data(0, Qt.ItemDataRole.UserRole + 1)
+    def _restore_expanded(self):
+        # expanding a category is what loads its game rows
+        exp = set(config.EXPANDED_CATEGORIES)
+        if not exp:
+            return
+        for idx in self._model.category_indexes():
+            if idx.data(_ROLE_DATA) in exp:
+                self.setExpanded(idx, True)
+
+    def select_games(self, app_ids):
+        # select every loaded row showing one of app_ids
+        sel = QItemSelection()
+        for idx in self._model.game_indexes(set(app_ids)):
+            sel.select(idx, idx)
+        self.selectionModel().select(sel, QItemSelectionModel.SelectionFlag.Select)
+
+    def select_all_in_categories(self, names):
+        # select all games below the named categories (loads them first)
+        sel = QItemSelection()
+        for idx in self._model.category_indexes():
+            if idx.data(_ROLE_DATA) not in names:
+                continue
+            self._model.load_all(idx)
+            n = self._model.rowCount(idx)
+            if n:
+                sel.select(self._model.index(0, 0, idx), self._model.index(n - 1, 0, idx))
+        self.selectionModel().select(sel, QItemSelectionModel.SelectionFlag.Select)
+
+    def _on_expand(self, index):
+        if index.data(_ROLE_KIND) == "category":
+            # rows exist from here on, even before the view lays them out
+            self._model.load_all(index)
+            nm = index.data(_ROLE_DATA)
             if nm and nm not in config.EXPANDED_CATEGORIES:
                 config.EXPANDED_CATEGORIES.append(nm)
                 config.save()
 
     @staticmethod
-    def _on_collapse(item):
-        if item.data(0, Qt.ItemDataRole.UserRole) == "category":
-            nm = item.data(0, Qt.ItemDataRole.UserRole + 1)
+    def _on_collapse(index):
+        if index.data(_ROLE_KIND) == "category":
+            nm = index.data(_ROLE_DATA)
             if nm and nm in config.EXPANDED_CATEGORIES:
                 config.EXPANDED_CATEGORIES.remove(nm)
                 config.save()
 
-    def _on_click(self, item, _col):
-        if item.data(0, Qt.ItemDataRole.UserRole) == "game":
-            g = item.data(0, Qt.ItemDataRole.UserRole + 1)
+    def _on_click(self, index):
+        if index.data(_ROLE_KIND) == "game":
+            g = index.data(_ROLE_DATA)
             if g:
                 self.game_clicked.emit(g)
 
-    def _on_sel(self):
+    def _selected(self, kind):
+        return [idx.data(_ROLE_DATA) for idx in self.selectionModel().selectedIndexes() if idx.data(_ROLE_KIND) == kind]
+
+    def _on_sel(self, *_args):
         # emit all selected games
-        sel = [
-            item.data(0, Qt.ItemDataRole.UserRole + 1)
-            for item in self.selectedItems()
-            if item.data(0, Qt.ItemDataRole.UserRole) == "game"
-        ]
-        self.selection_changed.emit(sel)
+        self.selection_changed.emit(self._selected("game"))
 
     def get_selected_categories(self):
-        out = []
-        for item in self.selectedItems():
-            if item.data(0, Qt.ItemDataRole.UserRole) == "category":
-                cn = item.data(0, Qt.ItemDataRole.UserRole + 1)
-                if cn:
-                    out.append(cn)
-        return out
+        return [cn for cn in self._selected("category") if cn]
 
     def contextMenuEvent(self, event):
-        item = self.itemAt(event.pos())
-        if not item:
+        idx = self.indexAt(event.pos())
+        if not idx.isValid():
             return
 
-        tp = item.data(0, Qt.ItemDataRole.UserRole)
-        data = item.data(0, Qt.ItemDataRole.UserRole + 1)
+        tp = idx.data(_ROLE_KIND)
+        data = idx.data(_ROLE_DATA)
 
         if tp == "game" and data:
             self.game_right_clicked.emit(data, event.globalPos())
@@ -202,28 +204,24 @@ class GameTreeWidget(QTreeWidget):
             event.ignore()
 
     def dragMoveEvent(self, event):
-        item = self.itemAt(event.position().toPoint())
-        if item and item.data(0, Qt.ItemDataRole.UserRole) == "category":
+        idx = self.indexAt(event.position().toPoint())
+        if idx.isValid() and idx.data(_ROLE_KIND) == "category":
             event.accept()
         else:
             event.ignore()
 
     def dropEvent(self, event):
-        # handle game drag onto category
-        tgt = self.itemAt(event.position().toPoint())
+        # handle game drag onto category; the model itself never moves rows
+        idx = self.indexAt(event.position().toPoint())
 
-        if not tgt or tgt.data(0, Qt.ItemDataRole.UserRole) != "category":
+        if not idx.isValid() or idx.data(_ROLE_KIND) != "category":
             event.ignore()
             return
 
-        cat = tgt.data(0, Qt.ItemDataRole.UserRole + 1)
-
-        dropped = []
-        for item in self.selectedItems():
-            if item.data(0, Qt.ItemDataRole.UserRole) == "game":
-                dropped.append(item.data(0, Qt.ItemDataRole.UserRole + 1))
+        cat = idx.data(_ROLE_DATA)
+        dropped = self._selected("game")
 
         if dropped:
             self.games_dropped.emit(dropped, cat)
 
-        super().dropEvent(event)
+        event.acceptProposedAction()
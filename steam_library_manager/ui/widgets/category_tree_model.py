@@ -0,0 +1,290 @@
+#
+# steam_library_manager/ui/widgets/category_tree_model.py
+# Item model behind the category/game sidebar tree
+#
+# Copyright © 2025-2026 SwitchBros
+# Licensed under the MIT License. See LICENSE for details.
+#
+
+from __future__ import annotations
+
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+from steam_library_manager.integrations.external_games.models import get_collection_emoji
+from steam_library_manager.utils.i18n import t
+
+__all__ = ["CategoryTreeModel"]
+
+# PEGI rating suffix -> emoji key
+_PEGI_RATINGS = {
+    "03": "emoji.pegi_3",
+    "07": "emoji.pegi_7",
+    "12": "emoji.pegi_12",
+    "16": "emoji.pegi_16",
+    "18": "emoji.pegi_18",
+}
+
+_ROLE_KIND = Qt.ItemDataRole.UserRole
+_ROLE_DATA = Qt.ItemDataRole.UserRole + 1
+_ROLE_DUP = Qt.ItemDataRole.UserRole + 2
+
+
+def _get_pegi_emoji(cat_name):
+    # match "... PEGI XX" pattern regardless of locale prefix
+    for rating, key in _PEGI_RATINGS.items():
+        if cat_name.endswith("PEGI %s" % rating):
+            return t(key)
+    return ""
+
+
+class _CatNode:
+    # one top-level row; games are shared with the caller, never copied
+
+    __slots__ = ("key", "real", "label", "games", "loaded", "row", "sig", "placeholder")
+
+    def __init__(self, key, real, label, games, row):
+        self.key = key
+        self.real = real
+        self.label = label
+        self.games = games
+        self.loaded = 0
+        self.row = row
+        self.sig = _signature(games)
+        self.placeholder = False
+
+
+def _signature(games):
+    # what a category shows: which games, under which name
+    return tuple((g.app_id, g.name) for g in games)
+
+
+class CategoryTreeModel(QAbstractItemModel):
+    """Two-level model: categories at the top, their games below.
+
+    Game rows of a category only exist once the view expands it
+    (canFetchMore/fetchMore); labels and tooltips are formatted in data()
+    for visible rows only.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._nodes = []
+        self._by_key = {}
+        self._dyn = set()
+        self._dups = {}
+        self._sc = set()
+        self._ext = set()
+
+    # building
+
+    def set_placeholder(self, text):
+        # single disabled row ("Loading...")
+        self.beginResetModel()
+        node = _CatNode(None, None, text, [], 0)
+        node.placeholder = True
+        self._nodes = [node]
+        self._by_key = {}
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self._nodes = []
+        self._by_key = {}
+        self.endResetModel()
+
+    def set_categories(self, categories, dyn=None, dups=None, sc=None, ext=None):
+        # replace everything; categories: key -> list of games
+        self.beginResetModel()
+        self._dyn = dyn or set()
+        self._dups = dups or {}
+        self._sc = sc or set()
+        self._ext = ext or set()
+
+        self._nodes = []
+        self._by_key = {}
+        for key, games in categories.items():
+            real = self._dups[key][0] if key in self._dups else key
+            node = _CatNode(key, real, self._label(key), games, len(self._nodes))
+            self._nodes.append(node)
+            self._by_key[key] = node
+        self.endResetModel()
+
+    def same_layout(self, categories, dyn=None, dups=None, sc=None, ext=None):
+        # True if only the games inside categories differ
+        layout = (dyn or set(), dups or {}, sc or set(), ext or set())
+        return list(categories) == list(self._by_key) and layout == (self._dyn, self._dups, self._sc, self._ext)
+
+    def has_category(self, key):
+        return key in self._by_key
+
+    def update_games(self, key, games):
+        # swap the games of one category; returns True if anything changed
+        node = self._by_key[key]
+        sig = _signature(games)
+        if sig == node.sig:
+            node.games = games
+            return False
+
+        parent = self.index(node.row, 0)
+        was_loaded = node.loaded > 0
+
+        if node.loaded:
+            self.beginRemoveRows(parent, 0, node.loaded - 1)
+            node.loaded = 0
+            node.games = []
+            self.endRemoveRows()
+
+        node.games = games
+        node.sig = sig
+        # expanded categories stay populated, collapsed ones stay empty
+        if was_loaded:
+            self.load_all(parent)
+
+        self.dataChanged.emit(parent, parent)
+        return True
+
+    def _label(self, key):
+        # display name with duplicate / smart / dynamic / platform / PEGI marker
+        if key in self._dups:
+            real, idx, total = self._dups[key]
+            return t("categories.duplicate_indicator", name=real, index=idx, total=total)
+
+        disp = key
+        if key in self._sc:
+            disp = "%s %s" % (key, t("emoji.brain"))
+        elif key in self._dyn:
+            disp = "%s %s" % (key, t("emoji.blitz"))
+        elif key in self._ext:
+            em = get_collection_emoji(key)
+            if em:
+                disp = "%s %s" % (key, em)
+
+        # PEGI collections get age rating emoji
+        pegi_em = _get_pegi_emoji(key)
+        if pegi_em:
+            disp = "%s %s" % (key, pegi_em)
+        return disp
+
+    # lookups for the view
+
+    def category_index(self, key):
+        node = self._by_key.get(key)
+        return self.index(node.row, 0) if node else QModelIndex()
+
+    def category_indexes(self):
+        return [self.index(n.row, 0) for n in self._nodes if not n.placeholder]
+
+    def load_all(self, parent):
+        # materialize every game row below a category
+        node = self._node(parent)
+        if node and node.loaded < len(node.games):
+            self.beginInsertRows(parent, node.loaded, len(node.games) - 1)
+            node.loaded = len(node.games)
+            self.endInsertRows()
+
+    def game_indexes(self, app_ids):
+        # every loaded row showing one of app_ids
+        out = []
+        for node in self._nodes:
+            for i in range(node.loaded):
+                if node.games[i].app_id in app_ids:
+                    out.append(self.createIndex(i, 0, node))
+        return out
+
+    def _node(self, index):
+        # category node for a top-level index
+        if not index.isValid() or index.internalPointer() is not None:
+            return None
+        return self._nodes[index.row()]
+
+    # QAbstractItemModel
+
+    def index(self, row, column, parent=QModelIndex()):
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            if row < len(self._nodes):
+                return self.createIndex(row, 0)
+            return QModelIndex()
+        node = self._node(parent)
+        if node is None or row >= node.loaded:
+            return QModelIndex()
+        return self.createIndex(row, 0, node)
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer()
+        if node is None:
+            return QModelIndex()
+        return self.createIndex(node.row, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._nodes)
+        node = self._node(parent)
+        return node.loaded if node else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return bool(self._nodes)
+        node = self._node(parent)
+        return bool(node and node.games)
+
+    def canFetchMore(self, parent):
+        node = self._node(parent)
+        return bool(node and node.loaded < len(node.games))
+
+    def fetchMore(self, parent):
+        # whole category at once - QTreeView only fetches more for the last
+        # row on scroll, so chunks would leave mid-list categories truncated
+        self.load_all(parent)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        node = index.internalPointer()
+        if node is None:
+            if self._nodes[index.row()].placeholder:
+                return Qt.ItemFlag.NoItemFlags
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDropEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        parent = index.internalPointer()
+        if parent is None:
+            node = self._nodes[index.row()]
+            if role == Qt.ItemDataRole.DisplayRole:
+                if node.placeholder:
+                    return node.label
+                return t("categories.category_count", name=node.label, count=len(node.games))
+            if node.placeholder:
+                return None
+            if role == _ROLE_KIND:
+                return "category"
+            if role == _ROLE_DATA:
+                return node.real
+            if role == _ROLE_DUP and node.key in self._dups:
+                return node.key
+            return None
+
+        game = parent.games[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return game.name
+        if role == Qt.ItemDataRole.ToolTipRole:
+            dev = game.developer if game.developer else t("common.unknown")
+            return t("categories.game_tooltip", name=game.name, developer=dev)
+        if role == _ROLE_KIND:
+            return "game"
+        if role == _ROLE_DATA:
+            return game
+        return None
+
+    def supportedDropActions(self):
+        return Qt.DropAction.MoveAction | Qt.DropAction.CopyAction
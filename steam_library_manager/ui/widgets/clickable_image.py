@@ -21,6 +21,7 @@ from PyQt6.QtWidgets import QLabel, QWidget
 
 from steam_library_manager.ui.theme import Theme
 from steam_library_manager.ui.widgets.image_badge_overlay import ImageBadgeOverlay
+from steam_library_manager.utils.http_client import http
 from steam_library_manager.utils.i18n import t
 from steam_library_manager.utils.timeouts import HTTP_TIMEOUT
 
@@ -71,7 +72,7 @@ class ImageLoader(QThread):
         urls = [self.url_or_path] + self.fallbacks
         for url in urls:
             try:
-                resp = requests.get(url, headers=hdrs, timeout=HTTP_TIMEOUT)
+                resp = http.get(url, headers=hdrs, timeout=HTTP_TIMEOUT)
                 if resp.status_code == 200 and len(resp.content) > 100:
                     return QByteArray(resp.content)
             except requests.RequestException:
@@ -12,6 +12,8 @@ from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from steam_library_manager.utils.profiler import span
+
 if TYPE_CHECKING:
     from steam_library_manager.services.game_service import GameService
 
@@ -31,10 +33,13 @@ class GameLoadWorker(QThread):
     Signals:
         progress_update: Emitted during loading with (step_name, current, total).
         finished: Emitted when loading completes with success status.
+        refreshed: Emitted after a warm start with the GameService from
+            the background full load, to be passed to apply_refresh().
     """
 
     progress_update = pyqtSignal(str, int, int)
     finished = pyqtSignal(bool)
+    refreshed = pyqtSignal(object)
 
     def __init__(self, game_service: "GameService", user_id: str):
         """Initializes the game load worker.
@@ -51,11 +56,20 @@ class GameLoadWorker(QThread):
         """Executes the game loading process.
 
         Calls the game service's load_games method with a progress callback
-        and emits the finished signal with the result.
+        and emits the finished signal with the result. After a warm start
+        from the library snapshot, the full pipeline runs afterwards in
+        this thread and its result is emitted via refreshed.
         """
 
         def progress_callback(step: str, current: int, total: int):
             self.progress_update.emit(step, current, total)
 
-        success = self.game_service.load_and_prepare(self.user_id, progress_callback)
+        with span("game_load_worker.run"):
+            success = self.game_service.load_and_prepare(self.user_id, progress_callback)
         self.finished.emit(success)
+
+        if success and self.game_service.warm_started:
+            with span("game_load_worker.refresh"):
+                fresh = self.game_service.refresh_warm_start()
+            if fresh is not None:
+                self.refreshed.emit(fresh)
@@ -10,7 +10,12 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import mmap
+import os
 import struct
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
 from typing import BinaryIO
 
 # Import i18n if available (optional for standalone use)
@@ -37,11 +42,101 @@ from steam_library_manager.utils.appinfo_constants import (
     TYPE_STRING,
     VALID_VERSIONS,
 )
+from steam_library_manager.utils.profiler import span
 
 __all__ = ("AppInfo", "IncompatibleVersionError", "load", "loads")
 
 logger = logging.getLogger("steamlibmgr.appinfo")
 
+_U32 = struct.Struct("<I")
+
+# decoded entries kept around in lazy mode
+DEFAULT_CACHE_SIZE = 4096
+
+
+# Lazy app mapping
+
+
+class _LazyAppMap(MutableMapping):
+    """app_id -> entry mapping that decodes entries from the file on first access.
+
+    Only the byte offset of every entry is kept up front. Decoded entries
+    live in a small LRU; entries that were replaced or edited through
+    AppInfo are pinned in a separate dict so eviction can't drop changes.
+    """
+
+    def __init__(self, owner: AppInfo, index: dict[int, int], cache_size: int):
+        self._owner = owner
+        self._index = index
+        self._cache: OrderedDict[int, dict] = OrderedDict()
+        self._cache_size = max(1, cache_size)
+        self._dirty: dict[int, dict] = {}
+
+    def __getitem__(self, app_id: int) -> dict:
+        entry = self._dirty.get(app_id)
+        if entry is not None:
+            return entry
+
+        entry = self._cache.get(app_id)
+        if entry is not None:
+            self._cache.move_to_end(app_id)
+            return entry
+
+        off = self._index[app_id]
+        try:
+            entry = self._owner._decode_entry_at(off)
+        except Exception as e:
+            # same outcome as eager mode: broken entries just aren't there
+            logger.warning(t("logs.appinfo.parse_error", app_id=app_id, error=e))
+            del self._index[app_id]
+            raise KeyError(app_id) from e
+
+        self._cache[app_id] = entry
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return entry
+
+    def __setitem__(self, app_id: int, entry: dict) -> None:
+        self._cache.pop(app_id, None)
+        self._dirty[app_id] = entry
+
+    def __delitem__(self, app_id: int) -> None:
+        in_index = self._index.pop(app_id, None) is not None
+        in_dirty = self._dirty.pop(app_id, None) is not None
+        self._cache.pop(app_id, None)
+        if not (in_index or in_dirty):
+            raise KeyError(app_id)
+
+    def __contains__(self, app_id: object) -> bool:
+        return app_id in self._dirty or app_id in self._index
+
+    def __iter__(self) -> Iterator[int]:
+        yield from list(self._index)
+        for app_id in list(self._dirty):
+            if app_id not in self._index:
+                yield app_id
+
+    def __len__(self) -> int:
+        extra = sum(1 for app_id in self._dirty if app_id not in self._index)
+        return len(self._index) + extra
+
+    def pin(self, app_id: int) -> dict:
+        # decode (if needed) and keep entry for write-back
+        entry = self[app_id]
+        self[app_id] = entry
+        return entry
+
+    def is_modified(self, app_id: int) -> bool:
+        return app_id in self._dirty
+
+    def offset_of(self, app_id: int) -> int | None:
+        # file offset of the entry's size field, None for new apps
+        return self._index.get(app_id)
+
+    @property
+    def cached_count(self) -> int:
+        return len(self._cache)
+
 
 # Main parser class
 
@@ -51,18 +146,31 @@ class AppInfo:
 
     Supports versions 28, 29, 39, 40, and 41 with correct checksum
     calculation and string table handling.
+
+    With lazy=True the file is memory-mapped and only an app_id -> offset
+    index is built (using the v36+ size field to skip entries). Entries
+    are decoded on access and kept in an LRU of cache_size entries;
+    unchanged entries are copied verbatim on write().
     """
 
-    def __init__(self, path: str | None = None, data: bytes | None = None):
+    def __init__(
+        self,
+        path: str | None = None,
+        data: bytes | None = None,
+        lazy: bool = False,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
         self.file_path = path
         self.data = None
         self.offset = 0
+        self.lazy = False
+        self._lock = threading.Lock()
 
         # Parsed data
         self.magic = 0
         self.version = 0
         self.universe = EUniverse.Public
-        self.apps: dict[int, dict] = {}
+        self.apps: MutableMapping[int, dict] = {}
 
         # Version-specific
         self.string_table: list[str] = []
@@ -71,17 +179,25 @@ class AppInfo:
         # Load data
         if path:
             with open(path, "rb") as f:
-                self.data = bytearray(f.read())
+                if lazy and os.fstat(f.fileno()).st_size > 0:
+                    self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    self.data = bytearray(f.read())
         elif data:
-            self.data = bytearray(data)
+            self.data = bytes(data) if lazy else bytearray(data)
         else:
             raise ValueError(t("errors.appinfo.no_data"))
 
-        # Parse header
-        self._parse_header()
+        with span("appinfo.parse", lazy=lazy) as sp:
+            # Parse header
+            self._parse_header()
 
-        # Parse apps
-        self._parse_apps()
+            # Parse apps - lazy indexing needs the per-entry size field (v36+)
+            if lazy and self.version >= 36:
+                self._index_apps(cache_size)
+            else:
+                self._parse_apps()
+            sp.count = len(self.apps)
 
     # Header parsing
 
@@ -151,6 +267,39 @@ class AppInfo:
                 logger.warning(t("logs.appinfo.parse_error", app_id=aid, error=e))
                 continue
 
+    # walk entry headers only, remembering where each app starts
+    def _index_apps(self, cache_size: int):
+        data = self.data
+        end = len(data)
+        off = self.offset
+        index: dict[int, int] = {}
+        unpack = _U32.unpack_from
+
+        while off + 4 <= end:
+            aid = unpack(data, off)[0]
+            off += 4
+            if aid == 0:
+                break
+
+            size = unpack(data, off)[0]
+            if off + 4 + size > end:
+                logger.warning(t("logs.appinfo.truncated_entry", app_id=aid))
+                break
+
+            index[aid] = off
+            off += 4 + size
+
+        self.offset = off
+        self.lazy = True
+        self.apps = _LazyAppMap(self, index, cache_size)
+        logger.debug(t("logs.appinfo.indexed", count=len(index)))
+
+    # decode one entry starting at its size field (lazy mode)
+    def _decode_entry_at(self, off: int) -> dict:
+        with self._lock:
+            self.offset = off
+            return self._parse_app_entry()
+
     # parse single app entry
     def _parse_app_entry(self) -> dict:
         entry = {}
@@ -268,7 +417,7 @@ class AppInfo:
 
     # read null-terminated UTF-8 string
     def _read_cstring(self) -> str:
-        end = self.data.find(0, self.offset)
+        end = self.data.find(b"\x00", self.offset)
         if end == -1:
             end = len(self.data)
 
@@ -323,9 +472,12 @@ class AppInfo:
             if self.version >= 41:
                 self._write_string_table(output)
 
-            # Write to file
-            with open(opath, "wb") as f:
+            # Write via temp file - truncating a file we still have
+            # mapped would pull the rug out from under the lazy index
+            tmp = "%s.tmp" % opath
+            with open(tmp, "wb") as f:
                 f.write(output)
+            os.replace(tmp, opath)
 
             return True
 
@@ -348,8 +500,22 @@ class AppInfo:
             output.extend(struct.pack("<Q", 0))
 
     def _write_apps(self, output: bytearray):
-        for aid, adata in self.apps.items():
-            self._write_app_entry(output, aid, adata)
+        if not self.lazy:
+            for aid, adata in self.apps.items():
+                self._write_app_entry(output, aid, adata)
+            return
+
+        # untouched entries are copied byte for byte, string table
+        # indices stay valid because the table is only ever appended to
+        for aid in self.apps:
+            off = self.apps.offset_of(aid)
+            if off is None or self.apps.is_modified(aid):
+                self._write_app_entry(output, aid, self.apps[aid])
+                continue
+
+            size = _U32.unpack_from(self.data, off)[0]
+            output.extend(_U32.pack(aid))
+            output.extend(self.data[off : off + 4 + size])
 
     def _write_app_entry(self, output: bytearray, eid: int, edata: dict):
         # Write app ID
@@ -507,6 +673,32 @@ class AppInfo:
 
         return output
 
+    # Change tracking
+
+    # app_id -> (change_number, sha1_hash) straight from the entry headers
+    def get_change_index(self) -> dict[int, tuple[int, bytes]]:
+        if self.version < 36:
+            return {}
+
+        if not self.lazy:
+            return {aid: (e.get("change_number", 0), bytes(e.get("sha1_hash", b""))) for aid, e in self.apps.items()}
+
+        # size, info_state, last_updated [, access_token, sha1] then change_number
+        sha_off = 12 + 8
+        cn_off = 12 + (28 if self.version >= 38 else 0)
+        data = self.data
+        unpack = _U32.unpack_from
+        out = {}
+        for aid in self.apps:
+            off = self.apps.offset_of(aid)
+            if off is None or self.apps.is_modified(aid):
+                e = self.apps[aid]
+                out[aid] = (e.get("change_number", 0), bytes(e.get("sha1_hash", b"")))
+                continue
+            sha = bytes(data[off + sha_off : off + sha_off + 20]) if self.version >= 38 else b""
+            out[aid] = (unpack(data, off + cn_off)[0], sha)
+        return out
+
     # Convenience methods
 
     def get_app(self, app_id: int) -> dict | None:
@@ -516,14 +708,15 @@ class AppInfo:
         if set_app_id not in self.apps:
             self.apps[set_app_id] = {"info_state": 2, "last_updated": 0, "data": {}}
 
-        self.apps[set_app_id]["data"] = set_data
+        self._editable(set_app_id)["data"] = set_data
 
     # update common section metadata
     def update_app_metadata(self, update_app_id: int, metadata: dict):
-        if update_app_id not in self.apps:
+        # get(): a lazy entry that fails to decode reads as missing
+        if self.apps.get(update_app_id) is None:
             return False
 
-        adata = self.apps[update_app_id].get("data", {})
+        adata = self._editable(update_app_id).get("data", {})
 
         if "common" not in adata:
             adata["common"] = {}
@@ -542,6 +735,17 @@ class AppInfo:
 
         return True
 
+    # entry that is about to be changed - pinned in lazy mode
+    def _editable(self, app_id: int) -> dict:
+        if self.lazy:
+            return self.apps.pin(app_id)
+        return self.apps[app_id]
+
+    # release the memory map (lazy mode)
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
     def __len__(self) -> int:
         return len(self.apps)
 
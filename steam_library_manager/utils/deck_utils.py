@@ -9,12 +9,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 
 import requests
 
+from steam_library_manager.core.response_cache import response_cache
+from steam_library_manager.utils.http_client import http
 from steam_library_manager.utils.timeouts import HTTP_TIMEOUT_SHORT
 
 logger = logging.getLogger("steamlibmgr.deck_utils")
@@ -34,10 +35,10 @@ _USER_AGENT = "SteamLibraryManager/1.0"
 
 
 def fetch_deck_compatibility(app_id: str | int, cache_dir: Path | None = None) -> str | None:
-    # fetch deck status from valve API, optionally cache
+    # fetch deck status from valve API, optionally cache under the cache root
     try:
         url = _API_URL.format(app_id=app_id)
-        resp = requests.get(
+        resp = http.get(
             url,
             timeout=HTTP_TIMEOUT_SHORT,
             headers={"User-Agent": _USER_AGENT},
@@ -57,12 +58,10 @@ def fetch_deck_compatibility(app_id: str | int, cache_dir: Path | None = None) -
         status = DECK_STATUS_MAP.get(cat, "unknown")
 
         if cache_dir is not None:
-            cfile = cache_dir / ("%s_deck.json" % app_id)
-            with open(cfile, "w") as f:
-                json.dump({"status": status, "category": cat}, f)
+            response_cache(cache_dir).put("deck", app_id, {"status": status, "category": cat})
 
         return status
 
-    except (requests.RequestException, ValueError, KeyError, OSError) as exc:
+    except (requests.RequestException, ValueError, KeyError) as exc:
         logger.debug("Deck API fetch failed for %s: %s" % (app_id, exc))
         return None
@@ -0,0 +1,229 @@
+#
+# steam_library_manager/utils/http_client.py
+# Shared pooled HTTP client with per-host rate limits and 429 handling
+#
+# Copyright © 2025-2026 SwitchBros
+# Licensed under the MIT License. See LICENSE for details.
+#
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from steam_library_manager.utils.rate_limiter import TokenBucket
+
+logger = logging.getLogger("steamlibmgr.http")
+
+__all__ = ["ClientSession", "HttpClient", "http"]
+
+# requests/second and burst per host; hosts not listed are not paced
+# (image CDNs and the like). The only budget for these hosts: enrichment
+# threads don't pace on top, FetchEngine.HOST_CONCURRENCY only caps how
+# many requests are in flight.
+HOST_LIMITS: dict[str, tuple[float, int]] = {
+    # Valve's store limit, shared by the PEGI and Deck tracks
+    "store.steampowered.com": (1.0, 2),
+    # achievements: 2 games/s with 3 calls each, plus batch metadata
+    "api.steampowered.com": (6.0, 4),
+    # the old serial loops' 200ms delay, now across 4 workers
+    "www.protondb.com": (5.0, 4),
+    "howlongtobeat.com": (4.0, 4),
+    "www.steamgriddb.com": (4.0, 4),
+}
+
+# answers that mean "slow down", retried after Retry-After or a backoff
+_THROTTLED = frozenset({429, 503})
+_RETRIES = 2
+_DEFAULT_WAIT = 2.0
+_MAX_WAIT = 60.0
+_POOL_SIZE = 16
+
+
+def _retry_after(resp, default):
+    # Retry-After is either seconds or an HTTP date
+    val = resp.headers.get("Retry-After") if resp.headers else None
+    if not val:
+        return default
+    try:
+        return min(_MAX_WAIT, max(0.0, float(val)))
+    except ValueError:
+        pass
+    try:
+        return min(_MAX_WAIT, max(0.0, parsedate_to_datetime(val).timestamp() - time.time()))
+    except (TypeError, ValueError):
+        return default
+
+
+class _HostStats:
+    __slots__ = ("requests", "errors", "throttled", "latency")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.latency = 0.0
+
+
+class HttpClient:
+    """One keep-alive connection pool for all integrations.
+
+    Every request to a known host first takes a token from that host's
+    TokenBucket, so parallel enrichment tracks share one budget per host.
+    429/503 answers back the bucket off (honouring Retry-After) and are
+    retried a couple of times before the response is handed back.
+    """
+
+    def __init__(self, limits=None, retries=_RETRIES, clock=time.monotonic, sleep=time.sleep):
+        self._limits = dict(HOST_LIMITS if limits is None else limits)
+        self._retries = retries
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[str, TokenBucket] = {}
+        self._stats: dict[str, _HostStats] = {}
+        self._lock = threading.Lock()
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def _host(self, host):
+        # bucket (or None) and stats for a host, created on first use
+        with self._lock:
+            st = self._stats.get(host)
+            if st is None:
+                st = self._stats[host] = _HostStats()
+                lim = self._limits.get(host)
+                if lim:
+                    self._buckets[host] = TokenBucket(lim[0], burst=lim[1], clock=self._clock, sleep=self._sleep)
+            return self._buckets.get(host), st
+
+    def request(self, method, url, retries=None, **kwargs):
+        """Sends a request through the shared pool.
+
+        Args:
+            method: HTTP method.
+            url: Absolute URL.
+            retries: Throttled retries for this call; 0 hands a 429 straight
+                back to callers that run their own backoff. Defaults to the
+                client setting.
+            **kwargs: Passed on to requests (params, headers, timeout, ...).
+
+        Returns:
+            requests.Response: The final response, possibly still a 429 once
+            the retries are used up.
+
+        Raises:
+            requests.RequestException: On network errors, as with requests.
+        """
+        host = urlsplit(url).hostname or ""
+        bucket, st = self._host(host)
+        if retries is None:
+            retries = self._retries
+
+        attempt = 0
+        while True:
+            if bucket is not None:
+                bucket.acquire()
+            t0 = time.perf_counter()
+            try:
+                resp = self._session.request(method, url, **kwargs)
+            except requests.RequestException:
+                with self._lock:
+                    st.requests += 1
+                    st.errors += 1
+                    st.latency += time.perf_counter() - t0
+                raise
+
+            throttled = resp.status_code in _THROTTLED
+            with self._lock:
+                st.requests += 1
+                st.latency += time.perf_counter() - t0
+                if throttled:
+                    st.throttled += 1
+                elif resp.status_code >= 400:
+                    st.errors += 1
+
+            if not throttled:
+                if bucket is not None:
+                    bucket.recover()
+                return resp
+
+            wait = _retry_after(resp, _DEFAULT_WAIT * (2**attempt))
+            if attempt >= retries:
+                if bucket is not None:
+                    bucket.backoff(wait)
+                return resp
+
+            logger.info("%s answered %d, retrying in %.1fs" % (host, resp.status_code, wait))
+            if bucket is not None:
+                # everyone using this host waits, not just this caller
+                bucket.backoff(wait)
+            else:
+                self._sleep(wait)
+            attempt += 1
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def session(self, headers=None, retries=None):
+        """Returns a ClientSession carrying default headers over this pool."""
+        return ClientSession(self, headers, retries)
+
+    def stats(self):
+        """Request counters per host.
+
+        Returns:
+            dict: host -> requests, errors, throttled and avg_latency_ms.
+        """
+        with self._lock:
+            return {
+                host: {
+                    "requests": s.requests,
+                    "errors": s.errors,
+                    "throttled": s.throttled,
+                    "avg_latency_ms": round(s.latency / s.requests * 1000, 1) if s.requests else 0.0,
+                }
+                for host, s in self._stats.items()
+            }
+
+
+class ClientSession:
+    """Session-like view of HttpClient with its own default headers.
+
+    Drop-in for the requests.Session an integration used to keep.
+    """
+
+    def __init__(self, client, headers=None, retries=None):
+        self._client = client
+        self.headers = dict(headers or {})
+        self._retries = retries
+
+    def _merge(self, kwargs):
+        extra = kwargs.pop("headers", None)
+        hdrs = dict(self.headers)
+        if extra:
+            hdrs.update(extra)
+        kwargs["headers"] = hdrs
+        kwargs.setdefault("retries", self._retries)
+        return kwargs
+
+    def get(self, url, **kwargs):
+        return self._client.request("GET", url, **self._merge(kwargs))
+
+    def post(self, url, **kwargs):
+        return self._client.request("POST", url, **self._merge(kwargs))
+
+
+# the process-wide client every integration goes through
+http = HttpClient()
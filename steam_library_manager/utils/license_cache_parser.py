@@ -5,11 +5,12 @@
 # Copyright © 2025-2026 SwitchBros
 # Licensed under the MIT License. See LICENSE for details.
 #
-# FIXME: PRNG could be Cython for speed
 
 from __future__ import annotations
 
+import json
 import logging
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -24,6 +25,14 @@ from google.protobuf.message import DecodeError
 
 logger = logging.getLogger("steamlibmgr.license_cache")
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
 __all__ = ["LicenseCacheParser", "LicenseInfo"]
 
 
@@ -102,21 +111,64 @@ class _RandomStream:
                 break
         return low + (n % x)
 
+    # next n keystream bytes (printable range, as Steam uses)
+    def _fill(self, n: int) -> bytes:
+        rnd = self._random_int
+        return bytes([rnd(32, 126) for _ in range(n)])
+
     # XOR decrypt with PRNG stream
-    def decrypt(self, key: int, data: bytes) -> bytes:
-        self._set_seed(key)
-        out = bytearray(len(data))
-        for i in range(len(data)):
-            out[i] = data[i] ^ self._random_int(32, 126)
-        return bytes(out)
+    @staticmethod
+    def decrypt(key: int, data: bytes) -> bytes:
+        if not data:
+            return b""
+        return _xor(data, _keystream(key, len(data)))
+
+
+# The seed is the steam32 id, so an account's keystream never changes.
+# Keep it (and the PRNG positioned at its end) so re-reads only pay the XOR.
+_streams: dict[int, tuple[_RandomStream, bytearray]] = {}
+_streams_lock = threading.Lock()
+
+
+# first n keystream bytes for key, generated once per account
+def _keystream(key: int, n: int) -> bytes:
+    with _streams_lock:
+        entry = _streams.get(key)
+        if entry is None:
+            rs = _RandomStream()
+            rs._set_seed(key)
+            entry = _streams[key] = (rs, bytearray())
+        rs, ks = entry
+        if len(ks) < n:
+            ks += rs._fill(n - len(ks))
+        return bytes(ks[:n])
+
+
+# whole-buffer XOR: one numpy op, or one big-int op without numpy
+def _xor(data: bytes, ks: bytes) -> bytes:
+    if HAS_NUMPY:
+        a = np.frombuffer(data, dtype=np.uint8)
+        b = np.frombuffer(ks, dtype=np.uint8)
+        return np.bitwise_xor(a, b).tobytes()
+    n = len(data)
+    x = int.from_bytes(data, "little") ^ int.from_bytes(ks, "little")
+    return x.to_bytes(n, "little")
 
 
 class LicenseCacheParser:
-    """Parses Steam's encrypted licensecache for owned PackageIDs."""
+    """Parses Steam's encrypted licensecache for owned PackageIDs.
+
+    Generating the keystream is slow in pure Python, so with a cache_dir
+    the parsed licenses are stored on disk, keyed by the file's mtime and
+    size, and later launches skip decryption until Steam rewrites it.
+    """
+
+    _CACHE_VERSION = 1
 
-    def __init__(self, steam_path: Path, steam32_id: int) -> None:
+    def __init__(self, steam_path: Path, steam32_id: int, cache_dir: Path | None = None) -> None:
         self._path = steam_path / "userdata" / str(steam32_id) / "config" / "licensecache"
         self._steam32_id = steam32_id
+        self._cache = cache_dir / ("licensecache_%d.json" % steam32_id) if cache_dir else None
 
     # main entry point: returns owned package IDs
     def get_owned_package_ids(self) -> set[int]:
@@ -130,22 +182,56 @@ class LicenseCacheParser:
             return []
 
         try:
+            st = self._path.stat()
+            stamp = [st.st_mtime_ns, st.st_size]
+            cached = self._load_cache(stamp)
+            if cached is not None:
+                return cached
+
             encrypted = self._path.read_bytes()
             if len(encrypted) < 8:
                 logger.warning(t("logs.license_cache.too_small", size=len(encrypted)))
                 return []
 
-            decrypted = _RandomStream().decrypt(self._steam32_id, encrypted)
+            decrypted = _RandomStream.decrypt(self._steam32_id, encrypted)
 
             # Strip last 4 bytes (checksum, per Depressurizer)
             data = decrypted[:-4]
 
-            return self._parse_protobuf(data)
+            out = self._parse_protobuf(data)
+            self._save_cache(stamp, out)
+            return out
 
         except (OSError, IndexError, ValueError, DecodeError) as exc:
             logger.error(t("logs.license_cache.parse_error", error=str(exc)))
             return []
 
+    def _load_cache(self, stamp: list[int]) -> list[LicenseInfo] | None:
+        if not self._cache or not self._cache.exists():
+            return None
+        try:
+            with open(self._cache, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self._CACHE_VERSION or data.get("stamp") != stamp:
+                return None
+            return [LicenseInfo(package_id=pid, time_created=tc) for pid, tc in data["licenses"]]
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.debug("licensecache cache unusable: %s", exc)
+            return None
+
+    def _save_cache(self, stamp: list[int], licenses: list[LicenseInfo]) -> None:
+        if not self._cache:
+            return
+        try:
+            self._cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._cache.with_suffix(".tmp")
+            rows = [[lic.package_id, lic.time_created] for lic in licenses]
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": self._CACHE_VERSION, "stamp": stamp, "licenses": rows}, f)
+            tmp.replace(self._cache)
+        except OSError as exc:
+            logger.debug("licensecache cache not written: %s", exc)
+
     # protobuf -> LicenseInfo list
     def _parse_protobuf(self, data: bytes) -> list[LicenseInfo]:
         msg = CMsgClientLicenseList()
@@ -0,0 +1,236 @@
+#
+# steam_library_manager/utils/profiler.py
+# Hierarchical startup timing spans, dumpable as JSON or Chrome trace
+#
+# Copyright © 2025-2026 SwitchBros
+# Licensed under the MIT License. See LICENSE for details.
+#
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # not on Windows
+    resource = None
+
+logger = logging.getLogger("steamlibmgr.profiler")
+
+__all__ = ["Profiler", "Span", "begin", "enable", "get_profiler", "span"]
+
+
+def _peak_rss_kb():
+    # process high-water mark; ru_maxrss is KiB on Linux
+    if resource is None:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class Span:
+    """One timed region: wall time, thread CPU time, peak RSS growth, item count.
+
+    Use as a context manager, or begin()/end() when the region spans Qt
+    callbacks. Set ``count`` (or extra ``attrs``) while it runs.
+    """
+
+    def __init__(self, profiler, name, attrs):
+        self.name = name
+        self.attrs = attrs
+        self.count = None
+        self.children = []
+        self.thread = threading.current_thread().name
+        self.tid = threading.get_ident()
+        self.start = 0.0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.rss_kb = 0
+        self._prof = profiler
+        self._cpu0 = 0.0
+        self._rss0 = 0
+        self._open = False
+
+    def __enter__(self):
+        return self._begin()
+
+    def __exit__(self, *exc):
+        self.end()
+        return False
+
+    def _begin(self):
+        self._prof._push(self)
+        self._rss0 = _peak_rss_kb()
+        self._cpu0 = time.thread_time()
+        self.start = time.perf_counter()
+        self._open = True
+        return self
+
+    def end(self):
+        if not self._open:
+            return
+        self._open = False
+        self.wall = time.perf_counter() - self.start
+        # thread_time is per thread; a span ended elsewhere has no CPU figure
+        if threading.get_ident() == self.tid:
+            self.cpu = time.thread_time() - self._cpu0
+        self.rss_kb = _peak_rss_kb() - self._rss0
+        self._prof._pop(self)
+
+    def to_dict(self):
+        d = {
+            "name": self.name,
+            "thread": self.thread,
+            "start_ms": round((self.start - self._prof.origin) * 1000, 3),
+            "wall_ms": round(self.wall * 1000, 3),
+            "cpu_ms": round(self.cpu * 1000, 3),
+            "peak_rss_delta_kb": self.rss_kb,
+        }
+        if self.count is not None:
+            d["count"] = self.count
+        if self.attrs:
+            d["attrs"] = self.attrs
+        if self.children:
+            d["children"] = [c.to_dict() for c in self.children]
+        return d
+
+
+class _NullSpan:
+    # stand-in while profiling is off; costs one call per instrumented site
+    count = None
+    attrs = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __setattr__(self, key, value):
+        pass
+
+    def end(self):
+        pass
+
+
+_NULL = _NullSpan()
+
+
+class Profiler:
+    """Collects spans from all threads.
+
+    Nesting follows a per-thread stack, so a span opened inside another on
+    the same thread becomes its child; spans on worker threads are roots
+    of their own.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.roots = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self):
+        st = getattr(self._local, "stack", None)
+        if st is None:
+            st = self._local.stack = []
+        return st
+
+    def _push(self, sp):
+        st = self._stack()
+        if st:
+            st[-1].children.append(sp)
+        else:
+            with self._lock:
+                self.roots.append(sp)
+        st.append(sp)
+
+    def _pop(self, sp):
+        # only the opening thread has it on its stack
+        st = self._stack()
+        if sp in st:
+            del st[st.index(sp) :]
+
+    def to_json(self):
+        """Returns the span tree as a JSON-serializable dict."""
+        with self._lock:
+            roots = list(self.roots)
+        return {"pid": os.getpid(), "spans": [r.to_dict() for r in roots]}
+
+    def to_chrome_trace(self):
+        """Returns the spans in Chrome trace event format (chrome://tracing, Perfetto)."""
+        events = []
+        pid = os.getpid()
+
+        def walk(sp):
+            args = {"cpu_ms": round(sp.cpu * 1000, 3), "peak_rss_delta_kb": sp.rss_kb}
+            if sp.count is not None:
+                args["count"] = sp.count
+            args.update(sp.attrs)
+            events.append(
+                {
+                    "name": sp.name,
+                    "ph": "X",
+                    "ts": round((sp.start - self.origin) * 1e6),
+                    "dur": round(sp.wall * 1e6),
+                    "pid": pid,
+                    "tid": sp.tid,
+                    "args": args,
+                }
+            )
+            for c in sp.children:
+                walk(c)
+
+        with self._lock:
+            roots = list(self.roots)
+        for r in roots:
+            walk(r)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, path, fmt="json"):
+        """Writes the collected spans.
+
+        Args:
+            path: Output file.
+            fmt: "json" for the span tree, "chrome" for a trace file.
+        """
+        data = self.to_chrome_trace() if fmt == "chrome" else self.to_json()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+        logger.info("startup profile written to %s" % path)
+
+
+_profiler = None
+
+
+def enable():
+    """Turns span collection on for the rest of the process."""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler()
+    return _profiler
+
+
+def get_profiler():
+    """Returns the active Profiler, or None when profiling is off."""
+    return _profiler
+
+
+def span(name, **attrs):
+    """Context manager timing a region; a no-op unless enable() was called."""
+    if _profiler is None:
+        return _NULL
+    return Span(_profiler, name, attrs)
+
+
+def begin(name, **attrs):
+    """Opens a span to be closed later with .end()."""
+    if _profiler is None:
+        return _NULL
+    return Span(_profiler, name, attrs)._begin()
@@ -0,0 +1,82 @@
+#
+# steam_library_manager/utils/rate_limiter.py
+# Thread-safe token bucket with backoff for pacing HTTP requests
+#
+# Copyright © 2025-2026 SwitchBros
+# Licensed under the MIT License. See LICENSE for details.
+#
+
+from __future__ import annotations
+
+import threading
+import time
+
+__all__ = ["TokenBucket"]
+
+# longest single sleep while waiting, so cancellation stays responsive
+_POLL = 0.1
+
+
+class TokenBucket:
+    """Token bucket shared by worker threads.
+
+    Refills at ``rate`` tokens per second up to ``burst``. backoff() halves
+    the rate and pauses all callers, recover() creeps back towards the
+    configured rate (AIMD), so a server that starts answering 429 slows the
+    whole pool down instead of every worker retrying on its own.
+    """
+
+    def __init__(self, rate, burst=1, min_rate=0.25, clock=time.monotonic, sleep=time.sleep):
+        self.max_rate = float(rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.burst = max(1, int(burst))
+        self._rate = self.max_rate
+        # start with a single token - a fresh run ramps up instead of bursting
+        self._tokens = 1.0
+        self._clock = clock
+        self._sleep = sleep
+        self._last = clock()
+        self._hold_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self):
+        return self._rate
+
+    def _refill(self, now):
+        self._tokens = min(float(self.burst), self._tokens + (now - self._last) * self._rate)
+        self._last = now
+
+    def acquire(self, cancelled=None):
+        # block until a token is free; False if cancelled() turned true meanwhile
+        while True:
+            if cancelled is not None and cancelled():
+                return False
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now < self._hold_until:
+                    wait = self._hold_until - now
+                elif self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return True
+                else:
+                    wait = (1.0 - self._tokens) / self._rate
+            self._sleep(min(wait, _POLL))
+
+    def backoff(self, delay=0.0):
+        # multiplicative decrease, plus an optional pause (e.g. Retry-After)
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._rate = max(self.min_rate, self._rate / 2.0)
+            self._tokens = min(self._tokens, 0.0)
+            if delay > 0:
+                self._hold_until = max(self._hold_until, now + delay)
+
+    def recover(self):
+        # additive increase after a successful request
+        with self._lock:
+            if self._rate < self.max_rate:
+                self._refill(self._clock())
+                self._rate = min(self.max_rate, self._rate + self.max_rate / 20.0)
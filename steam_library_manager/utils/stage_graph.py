@@ -0,0 +1,121 @@
+#
+# steam_library_manager/utils/stage_graph.py
+# Runs named pipeline stages on a thread pool in dependency order
+#
+# Copyright © 2025-2026 SwitchBros
+# Licensed under the MIT License. See LICENSE for details.
+#
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from steam_library_manager.utils.profiler import span
+
+__all__ = ["StageGraph"]
+
+
+class StageGraph:
+    """A small DAG of named stages.
+
+    A stage starts as soon as all of its dependencies finished and gets
+    their results as keyword arguments (named after the dependency).
+    Independent stages overlap on the pool; anything that must happen in a
+    fixed order is simply chained through deps, so the outcome does not
+    depend on thread scheduling.
+
+    Stages added with inline=True run on the thread that called run()
+    instead of the pool - for work bound to that thread, such as an
+    sqlite connection. They still overlap with pool stages in flight.
+
+    The first stage that raises stops scheduling; running stages are
+    awaited and the exception is re-raised from run().
+    """
+
+    def __init__(self):
+        self._stages = {}
+        self.results = {}
+        self.timings = {}
+
+    def add(self, name, fn, deps=(), inline=False):
+        # deps must already be registered, which also rules out cycles
+        if name in self._stages:
+            raise ValueError("duplicate stage: %s" % name)
+        for d in deps:
+            if d not in self._stages:
+                raise ValueError("stage %s depends on unknown stage %s" % (name, d))
+        self._stages[name] = (fn, tuple(deps), inline)
+
+    def run(self, max_workers=4, on_done=None):
+        """Executes all stages.
+
+        Args:
+            max_workers: Pool size.
+            on_done: Optional func(name, seconds), called on the calling
+                thread after each stage finished.
+
+        Returns:
+            dict: Stage name -> return value.
+        """
+        pending = dict(self._stages)
+        running = {}
+        error = None
+
+        def call(name, fn, kw):
+            t0 = time.perf_counter()
+            with span("stage." + name):
+                res = fn(**kw)
+            return res, time.perf_counter() - t0
+
+        def done(name, res, secs):
+            self.results[name] = res
+            self.timings[name] = secs
+            if on_done:
+                on_done(name, secs)
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stage") as pool:
+            while pending or running:
+                if error is None:
+                    here = None
+                    # registration order keeps submission order stable
+                    for name, (fn, deps, inline) in list(pending.items()):
+                        if not all(d in self.results for d in deps):
+                            continue
+                        kw = {d: self.results[d] for d in deps}
+                        if inline:
+                            if here is None:
+                                here = (name, fn, kw)
+                            continue
+                        running[pool.submit(call, name, fn, kw)] = name
+                        del pending[name]
+
+                    if here is not None:
+                        name, fn, kw = here
+                        del pending[name]
+                        try:
+                            done(name, *call(name, fn, kw))
+                        except Exception as exc:
+                            error = exc
+                        continue
+                elif not running:
+                    break
+
+                if not running:
+                    # nothing runnable and nothing in flight
+                    raise RuntimeError("stages never became ready: %s" % ", ".join(pending))
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    name = running.pop(fut)
+                    try:
+                        res, secs = fut.result()
+                    except Exception as exc:
+                        if error is None:
+                            error = exc
+                        continue
+                    done(name, res, secs)
+
+        if error is not None:
+            raise error
+        return self.results
@@ -1,6 +1,10 @@
 # tests/conftest.py
+import json
 import os
 import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Generator
 from unittest.mock import MagicMock, patch
@@ -188,3 +192,94 @@ def mock_config():
     fake_config.STEAM_ACCESS_TOKEN = None
     with patch("steam_library_manager.config.config", fake_config):
         yield fake_config
+
+
+class _FakeHLTBHandler(BaseHTTPRequestHandler):
+    """Answers the handful of HLTB endpoints HLTBClient talks to."""
+
+    def log_message(self, *_args) -> None:
+        pass
+
+    def _send_json(self, status: int, body: dict, headers: dict | None = None) -> None:
+        raw = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        for key, val in (headers or {}).items():
+            self.send_header(key, val)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_GET(self) -> None:
+        path = self.path.split("?")[0]
+        if path == "/":
+            html = (
+                '<html><script src="/_next/static/chunks/app.js"></script>'
+                '<script src="/_next/static/fakebuild/_buildManifest.js"></script></html>'
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(html)))
+            self.end_headers()
+            self.wfile.write(html)
+        elif path == "/_next/static/chunks/app.js":
+            js = b"fetch(`/api/finder/init?t=${Date.now()}`)"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(js)))
+            self.end_headers()
+            self.wfile.write(js)
+        elif path == "/api/finder/init":
+            self._send_json(200, {"token": "fake-token"})
+        else:
+            self._send_json(404, {})
+
+    def do_POST(self) -> None:
+        srv = self.server
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if self.path != "/api/finder":
+            self._send_json(404, {})
+            return
+
+        with srv.lock:
+            srv.searches += 1
+            n = srv.searches
+            srv.in_flight += 1
+            srv.peak_in_flight = max(srv.peak_in_flight, srv.in_flight)
+        try:
+            if srv.throttle_every and n % srv.throttle_every == 0:
+                with srv.lock:
+                    srv.throttled += 1
+                self._send_json(429, {}, {"Retry-After": "0.05"})
+                return
+            time.sleep(srv.latency)
+            name = " ".join(body.get("searchTerms", []))
+            data = [] if name.startswith("Unknown") else [{"game_id": n, "game_name": name, "comp_main": 36000}]
+            self._send_json(200, {"data": data})
+        finally:
+            with srv.lock:
+                srv.in_flight -= 1
+
+
+@pytest.fixture
+def fake_hltb_server():
+    """Local stand-in for howlongtobeat.com (pass .url to HLTBClient).
+
+    Every search matches its own query with 10h main story, names starting
+    with "Unknown" find nothing. Tune .latency (seconds per search) and
+    .throttle_every (answer every n-th search with 429) to measure
+    throughput and backoff offline.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeHLTBHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.latency = 0.0
+    server.throttle_every = 0
+    server.searches = 0
+    server.throttled = 0
+    server.in_flight = 0
+    server.peak_in_flight = 0
+    server.url = "http://127.0.0.1:%d" % server.server_address[1]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
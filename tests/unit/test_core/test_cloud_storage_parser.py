@@ -335,6 +335,23 @@ class TestCloudStorageCorruptedData:
         # Save should also handle this gracefully
         parser.save()
 
+    def test_save_sanitize_invalidates_index(self, mock_cloud_storage_file):
+        """Rewriting a bad 'added' in place drops the index; lookups stay right."""
+        from steam_library_manager.core.cloud_storage_parser import CloudStorageParser
+
+        steam_path, user_id = mock_cloud_storage_file
+        parser = CloudStorageParser(str(steam_path), user_id)
+        parser.load()
+        parser.collections.append({"id": "from-tag-Broken", "name": "Broken", "added": 0, "removed": []})
+        before = parser.get_app_categories("440")
+
+        with patch.object(parser, "invalidate_index", wraps=parser.invalidate_index) as spy:
+            parser.save()
+
+        spy.assert_called_once()
+        parser.add_app_category("440", "Broken")
+        assert parser.get_app_categories("440") == before + ["Broken"]
+
     def test_to_app_id_int_invalid_values(self):
         """Invalid app_id values should return None."""
         from steam_library_manager.core.cloud_storage_parser import CloudStorageParser
@@ -443,3 +460,124 @@ class TestFuzzyDuplicateGroups:
 
         assert "roguelike" in result
         assert len(result["roguelike"]) == 3
+
+
+class TestCollectionIndex:
+    """Tests for the app_id -> collections inverted index."""
+
+    @staticmethod
+    def _parser():
+        from steam_library_manager.core.cloud_storage_parser import CloudStorageParser
+
+        parser = CloudStorageParser("/tmp/fake", "999")
+        parser.collections = [
+            {"id": "from-tag-RPG", "name": "RPG", "added": [100, 200, 300]},
+            {"id": "from-tag-Action", "name": "Action", "added": [300, 100]},
+            {"id": "uc-old", "name": "Old", "apps": [100]},
+        ]
+        return parser
+
+    def test_lookup_follows_list_order(self):
+        """Categories come back in collection order, 'apps' lists included."""
+        parser = self._parser()
+
+        assert parser.get_app_categories(100) == ["RPG", "Action", "Old"]
+        assert parser.get_app_categories("300") == ["RPG", "Action"]
+        assert parser.get_app_categories(999) == []
+
+    def test_set_keeps_other_apps_order(self):
+        """set_app_categories only touches the given app's entries."""
+        parser = self._parser()
+        parser.set_app_categories(100, ["Action", "New"])
+
+        assert parser.get_app_categories(100) == ["Action", "New"]
+        assert parser.collections[0]["added"] == [200, 300]
+        assert parser.collections[1]["added"] == [300, 100]
+        assert parser.collections[2]["apps"] == []
+        assert parser.collections[3] == {"id": "from-tag-New", "name": "New", "added": [100], "removed": []}
+
+    def test_add_and_remove_single_category(self):
+        """add/remove_app_category update lists and index together."""
+        parser = self._parser()
+        parser.add_app_category(200, "Action")
+        parser.add_app_category(200, "Action")
+        parser.remove_app_category(300, "RPG")
+
+        assert parser.collections[1]["added"] == [300, 100, 200]
+        assert parser.collections[0]["added"] == [100, 200]
+        assert parser.get_app_categories(200) == ["RPG", "Action"]
+        assert parser.get_app_categories(300) == ["Action"]
+
+    def test_apply_category_changes(self):
+        """Batch changes skip no-ops, create categories and report what changed."""
+        parser = self._parser()
+        parser.modified = False
+
+        added, removed = parser.apply_category_changes(
+            add={"Action": [200, "300", 400, "x"], "New": ["500"], "Empty": []},
+            remove={"RPG": [100, "300", 999], "Missing": [1]},
+        )
+
+        assert added == {"Action": {200, 400}, "New": {500}}
+        assert removed == {"RPG": {100, 300}}
+        assert parser.collections[0]["added"] == [200]
+        assert parser.collections[1]["added"] == [300, 100, 200, 400]
+        assert parser.collections[3] == {"id": "from-tag-New", "name": "New", "added": [500], "removed": []}
+        assert len(parser.collections) == 4
+        assert parser.get_app_categories(300) == ["Action"]
+        assert parser.get_app_categories(500) == ["New"]
+        assert parser.modified is True
+
+    def test_apply_category_changes_noop(self):
+        """Nothing to change leaves the parser unmodified."""
+        parser = self._parser()
+        parser.modified = False
+
+        assert parser.apply_category_changes(add={"Old": [100]}, remove={"Action": [200]}) == ({}, {})
+        assert parser.modified is False
+
+    def test_apply_category_changes_many_apps(self):
+        """3000 apps x 20 categories go in with one set diff per category."""
+        import time
+
+        parser = self._parser()
+        plan = {"Tag %d" % i: list(range(1000 + i, 4000 + i)) for i in range(20)}
+
+        start = time.perf_counter()
+        added, _ = parser.apply_category_changes(add=plan)
+        elapsed = time.perf_counter() - start
+
+        assert sum(map(len, added.values())) == 60_000
+        assert parser.get_app_categories(1000) == ["Tag 0"]
+        assert elapsed < 2.0  # generous bound, typically a few ms
+
+    def test_rename_delete_and_remove_app(self):
+        """Structural changes are reflected by the next lookup."""
+        parser = self._parser()
+        parser.get_app_categories(100)
+
+        parser.rename_category("RPG", "Role-Playing")
+        parser.add_app_category(400, "Role-Playing")
+        assert parser.collections[0]["added"] == [100, 200, 300, 400]
+
+        parser.delete_category("Action")
+        assert parser.get_app_categories(300) == ["Role-Playing"]
+
+        assert parser.remove_app(100) is True
+        assert parser.get_app_categories(100) == []
+        assert parser.remove_app(100) is False
+
+    def test_external_changes_rebuild_index(self):
+        """Replacing or resizing collections, or invalidate_index(), rebuilds."""
+        parser = self._parser()
+        assert parser.get_app_categories(500) == []
+
+        parser.collections.append({"id": "from-tag-Puzzle", "name": "Puzzle", "added": [500]})
+        assert parser.get_app_categories(500) == ["Puzzle"]
+
+        parser.collections[0]["added"] = [500]
+        parser.invalidate_index()
+        assert parser.get_app_categories(500) == ["RPG", "Puzzle"]
+
+        parser.collections = []
+        assert parser.get_app_categories(500) == []
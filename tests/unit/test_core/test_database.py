@@ -29,7 +29,7 @@ class TestDatabaseSchema:
     def test_schema_creation_succeeds(self, database: Database) -> None:
         """Database should create schema on init."""
         version = database._get_schema_version()
-        assert version == 9
+        assert version == 10
 
     def test_game_count_empty_db(self, database: Database) -> None:
         """Empty database should have zero games."""
@@ -169,6 +169,77 @@ class TestDatabaseBatch:
         assert count == 3
         assert database.get_game_count() == 3
 
+    def test_batch_insert_writes_related_tables(self, database: Database) -> None:
+        """Bulk path fills all multi-value tables."""
+        entry = DatabaseEntry(
+            app_id=10,
+            name="CS",
+            genres=["Action"],
+            tags=["FPS", "Classic"],
+            franchises=["Counter-Strike"],
+            languages={"english": {"interface": True, "audio": True, "subtitles": False}},
+            custom_meta={"k": "v"},
+        )
+        database.batch_insert_games([entry])
+
+        result = database.get_game(10)
+        assert result.genres == ["Action"]
+        assert sorted(result.tags) == ["Classic", "FPS"]
+        assert result.franchises == ["Counter-Strike"]
+        assert result.languages == {"english": {"interface": True, "audio": True, "subtitles": False}}
+        assert result.custom_meta == {"k": "v"}
+
+    def test_batch_insert_isolates_bad_rows(self, database: Database) -> None:
+        """A failing row falls back to per-row inserts and only loses itself."""
+        entries = [
+            DatabaseEntry(app_id=1, name="Good"),
+            DatabaseEntry(app_id=2, name=None),  # type: ignore[arg-type]  # NOT NULL violation
+            DatabaseEntry(app_id=3, name="Also Good"),
+        ]
+        count = database.batch_insert_games(entries)
+
+        assert count == 2
+        assert database.get_game_count() == 2
+
+    def test_batch_insert_without_commit_stays_in_transaction(self, database: Database) -> None:
+        """commit=False leaves the rows in the open transaction."""
+        database.batch_insert_games([DatabaseEntry(app_id=1, name="A")], commit=False)
+
+        assert database.conn.in_transaction
+        database.conn.rollback()
+        assert database.get_game_count() == 0
+
+    def test_bulk_import_mode_restores_synchronous(self, database: Database) -> None:
+        """PRAGMA synchronous is switched off only inside the block."""
+        before = database.conn.execute("PRAGMA synchronous").fetchone()[0]
+        with database.bulk_import_mode():
+            assert database.conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+            database.batch_insert_games([DatabaseEntry(app_id=1, name="A")], commit=False)
+
+        assert database.conn.execute("PRAGMA synchronous").fetchone()[0] == before
+        assert not database.conn.in_transaction
+        assert database.get_game_count() == 1
+
+    def test_bulk_import_mode_rebuilds_deferred_indexes(self, database: Database) -> None:
+        """Indexes dropped for the load are back afterwards, also on error."""
+
+        def names() -> set[str]:
+            q = "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'games'"
+            return {r[0] for r in database.conn.execute(q)}
+
+        before = names()
+        assert "idx_games_name" in before
+
+        try:
+            with database.bulk_import_mode(defer_indexes=("games",)):
+                assert "idx_games_name" not in names()
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        assert names() == before
+        assert database.conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
     def test_batch_insert_empty_list(self, database: Database) -> None:
         """batch_insert_games with empty list returns 0."""
         count = database.batch_insert_games([])
@@ -223,6 +294,24 @@ class TestImportStats:
         assert rows[0]["games_imported"] == 100
         assert rows[0]["source"] == "appinfo.vdf"
 
+    def test_record_import_with_phase_timing(self, database: Database) -> None:
+        """Convert/insert split ends up in the notes column."""
+        stats = ImportStats(
+            games_imported=1000,
+            games_updated=0,
+            games_failed=0,
+            duration_seconds=3.0,
+            source="appinfo.vdf",
+            convert_seconds=2.0,
+            insert_seconds=0.5,
+        )
+        database.record_import(stats)
+
+        notes = database.conn.execute("SELECT notes FROM import_history").fetchone()[0]
+        assert "2.00" in notes
+        assert "0.50" in notes
+        assert "2000" in notes
+
 
 # ========================================================================
 # DatabaseEntry -> Game conversion tests
@@ -437,6 +526,74 @@ class TestDatabaseImporter:
         assert database.get_game_count() == 2
 
 
+# ========================================================================
+# appinfo change index / delta refresh tests
+# ========================================================================
+
+
+def _delta_importer(database: Database, tmp_path, apps: dict, index: dict) -> DatabaseImporter:
+    """Importer over a mock appinfo manager backed by a real file path."""
+    path = tmp_path / "appinfo.vdf"
+    path.write_bytes(b"x" * len(index))
+    mgr = MagicMock()
+    mgr.appinfo_path = path
+    mgr.steam_apps = apps
+    mgr.appinfo.get_change_index.return_value = index
+    mgr._find_common_section.side_effect = lambda data: data.get("common", {})
+    return DatabaseImporter(database, mgr)
+
+
+class TestAppInfoDeltaSync:
+    """Tests for DatabaseImporter.sync_changed_apps."""
+
+    def test_first_sync_seeds_index_only(self, database: Database, tmp_path) -> None:
+        """Without a stored index nothing is re-imported, the index is seeded."""
+        imp = _delta_importer(database, tmp_path, {}, {440: (1, b"a"), 570: (1, b"b")})
+
+        assert imp.sync_changed_apps() is None
+        assert database.get_appinfo_index() == {440: (1, b"a"), 570: (1, b"b")}
+
+    def test_only_moved_apps_are_updated(self, database: Database, tmp_path) -> None:
+        """Apps whose change number moved are refreshed, enrichment data stays."""
+        database.insert_game(DatabaseEntry(app_id=440, name="TF2", pegi_rating="16"))
+        database.insert_game(DatabaseEntry(app_id=570, name="Dota 2"))
+        database.update_appinfo_index({440: (1, b"a"), 570: (1, b"b")})
+        apps = {
+            440: {"data": {"common": {"name": "Team Fortress 2", "type": "game"}}},
+            570: {"data": {"common": {"name": "Should Not Apply", "type": "game"}}},
+            730: {"data": {"common": {"name": "CS2", "type": "game"}}},
+        }
+        imp = _delta_importer(database, tmp_path, apps, {440: (2, b"c"), 570: (1, b"b"), 730: (5, b"d")})
+
+        stats = imp.sync_changed_apps()
+
+        assert stats.games_updated == 1
+        assert stats.games_imported == 1
+        assert database.get_game(440).name == "Team Fortress 2"
+        assert database.get_game(440).pegi_rating == "16"
+        assert database.get_game(570).name == "Dota 2"
+        assert database.get_game(730).name == "CS2"
+        assert database.get_appinfo_index()[440] == (2, b"c")
+
+    def test_unchanged_file_skips_appinfo(self, database: Database, tmp_path) -> None:
+        """Same mtime/size as last sync means appinfo is never consulted."""
+        imp = _delta_importer(database, tmp_path, {}, {440: (1, b"a")})
+        imp.sync_changed_apps()
+        imp.appinfo_manager.appinfo.get_change_index.reset_mock()
+
+        assert imp.sync_changed_apps() is None
+        imp.appinfo_manager.appinfo.get_change_index.assert_not_called()
+
+    def test_removed_apps_leave_index(self, database: Database, tmp_path) -> None:
+        """Apps gone from appinfo.vdf are dropped from the stored index."""
+        database.update_appinfo_index({440: (1, b"a"), 570: (1, b"b")})
+        imp = _delta_importer(database, tmp_path, {}, {440: (1, b"a")})
+
+        imp.sync_changed_apps()
+
+        assert database.get_appinfo_index() == {440: (1, b"a")}
+
+
 # ========================================================================
 # get_app_type_lookup tests
 # ========================================================================
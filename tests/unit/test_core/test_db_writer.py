@@ -0,0 +1,118 @@
+"""Tests for the shared DatabaseWriter and read-only connections."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+
+from steam_library_manager.core.database import Database
+from steam_library_manager.core.db.write_service import DatabaseWriter, WriteBatch
+
+
+def _add_games(db: Database, ids: list[int]) -> None:
+    db.conn.executemany(
+        "INSERT INTO games (app_id, name, app_type, developer, platforms, created_at, updated_at) "
+        "VALUES (?, ?, 'game', '', '[]', 0, 0)",
+        [(i, "Game %d" % i) for i in ids],
+    )
+    db.commit()
+
+
+@pytest.fixture
+def writer(database):
+    w = DatabaseWriter(database.db_path, max_calls=50, max_delay=0.05)
+    w.start()
+    yield w
+    w.stop()
+
+
+class TestWriteBatch:
+    """WriteBatch only accepts allowlisted methods."""
+
+    def test_unknown_method_rejected(self) -> None:
+        """Arbitrary Database methods cannot be queued."""
+        with pytest.raises(ValueError):
+            WriteBatch("clear_expired_hltb_cache", (((), {}),))
+
+
+class TestDatabaseWriter:
+    """Writes from many producers end up committed through one connection."""
+
+    def test_concurrent_producers(self, database, writer) -> None:
+        """Rows from several threads are all committed."""
+        _add_games(database, list(range(1, 201)))
+
+        def produce(start: int) -> None:
+            for aid in range(start, start + 50):
+                writer.submit("upsert_protondb", aid, tier="gold")
+
+        threads = [threading.Thread(target=produce, args=(s,)) for s in (1, 51, 101, 151)]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+
+        assert writer.flush(5.0) is True
+        count = database.conn.execute("SELECT COUNT(*) FROM protondb_ratings").fetchone()[0]
+        assert count == 200
+
+        m = writer.metrics()
+        assert m.calls == 200
+        assert m.errors == 0
+        # batched: far fewer commits than calls
+        assert 1 <= m.commits < 200
+        assert m.queue_depth == 0
+
+    def test_failing_call_is_isolated(self, database, writer) -> None:
+        """An FK violation drops only the offending call of a batch."""
+        _add_games(database, [1, 2])
+
+        writer.put(
+            WriteBatch(
+                "upsert_hltb_batch",
+                (
+                    (([(1, 5.0, None, None)],), {}),
+                    (([(999, 5.0, None, None)],), {}),
+                    (([(2, 7.0, None, None)],), {}),
+                ),
+            )
+        )
+        writer.flush(5.0)
+
+        rows = dict(database.conn.execute("SELECT app_id, main_story FROM hltb_data").fetchall())
+        assert rows == {1: 5.0, 2: 7.0}
+        assert writer.metrics().errors == 1
+
+    def test_stop_commits_the_rest(self, database) -> None:
+        """stop() commits whatever is still queued."""
+        _add_games(database, [1])
+        w = DatabaseWriter(database.db_path, max_calls=1000, max_delay=60.0)
+        w.start()
+        w.submit("set_pegi_rating", 1, "16")
+        w.stop()
+
+        row = database.conn.execute("SELECT pegi_rating FROM games WHERE app_id = 1").fetchone()
+        assert row[0] == "16"
+        assert not w.running
+
+    def test_submit_before_start(self, database) -> None:
+        """A writer that is not running refuses work."""
+        with pytest.raises(RuntimeError):
+            DatabaseWriter(database.db_path).submit("set_pegi_rating", 1, "16")
+
+
+class TestReadOnlyDatabase:
+    """Database(read_only=True) is for lookups only."""
+
+    def test_reads_but_refuses_writes(self, database) -> None:
+        """Queries work, writes raise."""
+        _add_games(database, [1])
+        ro = Database(database.db_path, read_only=True)
+        try:
+            assert ro.get_all_game_ids() == [(1, "Game 1")]
+            with pytest.raises(sqlite3.OperationalError):
+                ro.set_pegi_rating(1, "18")
+        finally:
+            ro.close()
@@ -0,0 +1,64 @@
+"""Tests for the warm-start LibrarySnapshot."""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime
+
+from steam_library_manager.core.game import Game
+from steam_library_manager.core.library_snapshot import LibrarySnapshot, source_stamps
+
+
+def _games() -> dict[str, Game]:
+    return {
+        "10": Game(app_id="10", name="Alpha", playtime_minutes=5, categories=["RPG"], tags=["Indie"]),
+        "20": Game(app_id="20", name="Beta", last_played=datetime(2025, 1, 2, 3, 4, 5), hltb_main_story=12.5),
+    }
+
+
+class TestSourceStamps:
+    """source_stamps() tracks mtime and size."""
+
+    def test_missing_and_none(self, tmp_path) -> None:
+        """Missing files and unset paths both stamp as None."""
+        assert source_stamps({"a": tmp_path / "nope", "b": None}) == {"a": None, "b": None}
+
+    def test_changes_with_mtime(self, tmp_path) -> None:
+        """Touching a file changes its stamp."""
+        f = tmp_path / "localconfig.vdf"
+        f.write_text("x")
+        before = source_stamps({"lc": f})
+        st = f.stat()
+        os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert source_stamps({"lc": f}) != before
+
+
+class TestLibrarySnapshot:
+    """Round trip and invalidation."""
+
+    def test_round_trip(self, tmp_path) -> None:
+        """Saved games come back field for field."""
+        snap = LibrarySnapshot(tmp_path)
+        stamps = {"lc": [1, 2]}
+        snap.save("123", stamps, _games(), "mixed")
+
+        games, source = snap.load("123", stamps)
+        assert source == "mixed"
+        assert games == _games()
+
+    def test_stale_stamps(self, tmp_path) -> None:
+        """A changed source file makes the snapshot unusable."""
+        snap = LibrarySnapshot(tmp_path)
+        snap.save("123", {"lc": [1, 2]}, _games(), "api")
+        assert snap.load("123", {"lc": [1, 3]}) is None
+
+    def test_other_user(self, tmp_path) -> None:
+        """A snapshot is never served to a different account."""
+        snap = LibrarySnapshot(tmp_path)
+        snap.save("123", {}, _games(), "api")
+        assert snap.load("456", {}) is None
+
+    def test_corrupt_file(self, tmp_path) -> None:
+        """Garbage on disk is ignored, not raised."""
+        (tmp_path / "library_snapshot.json").write_text("{not json")
+        assert LibrarySnapshot(tmp_path).load("123", {}) is None
@@ -0,0 +1,117 @@
+"""Tests for the SQLite response cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+
+from steam_library_manager.core.response_cache import ResponseCache, response_cache
+
+
+def _cache(tmp_path) -> ResponseCache:
+    return ResponseCache(tmp_path / "response_cache.db")
+
+
+class TestResponseCache:
+    """Tests for lookups, expiry and eviction."""
+
+    def test_put_get_roundtrip(self, tmp_path) -> None:
+        """A stored payload comes back unchanged."""
+        cache = _cache(tmp_path)
+        cache.put("store", "440", {"name": "TF2", "genres": ["Action"]})
+
+        assert cache.get("store", "440") == {"name": "TF2", "genres": ["Action"]}
+        assert cache.get("store", 440) == {"name": "TF2", "genres": ["Action"]}
+        assert cache.get("reviews", "440") is None
+
+    def test_expired_entry_not_returned(self, tmp_path) -> None:
+        """Entries past their TTL read as missing."""
+        cache = _cache(tmp_path)
+        cache.put("news", "440", {"last_update": 1}, ttl=-1)
+
+        assert cache.get("news", "440") is None
+        assert cache.get_many("news", ["440"]) == {}
+
+    def test_get_many_and_fresh_keys(self, tmp_path) -> None:
+        """Batch lookups return only the cached keys."""
+        cache = _cache(tmp_path)
+        for i in range(1200):
+            cache.put("store", i, {"name": "Game %d" % i})
+
+        got = cache.get_many("store", range(1190, 1210))
+        assert set(got) == {str(i) for i in range(1190, 1200)}
+        assert got["1195"] == {"name": "Game 1195"}
+        assert cache.fresh_keys("store", ["5", "99999"]) == {"5"}
+
+    def test_evict_expired(self, tmp_path) -> None:
+        """Eviction drops expired rows and keeps fresh ones."""
+        cache = _cache(tmp_path)
+        cache.put("hltb", "1", {"no_data": True}, ttl=-1)
+        cache.put("hltb", "2", {"no_data": True})
+
+        assert cache.evict_expired(vacuum_after=1) == 1
+        assert cache.fresh_keys("hltb", ["1", "2"]) == {"2"}
+
+    def test_unwritable_dir_degrades_to_miss(self, tmp_path) -> None:
+        """A cache that cannot be opened behaves as empty."""
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+        cache = ResponseCache(blocker / "sub" / "response_cache.db")
+
+        cache.put("store", "440", {"name": "TF2"})
+        assert cache.get("store", "440") is None
+        assert cache.evict_expired() == 0
+
+    def test_shared_per_directory(self, tmp_path) -> None:
+        """response_cache() hands out one instance per cache directory."""
+        assert response_cache(tmp_path) is response_cache(str(tmp_path))
+        assert response_cache(tmp_path) is not response_cache(tmp_path / "other")
+
+
+class TestLegacyImport:
+    """Tests for the one-time import of the old JSON cache files."""
+
+    def test_imports_and_removes_files(self, tmp_path) -> None:
+        """JSON files move into the table and the old folders go away."""
+        store = tmp_path / "store_data"
+        tags = tmp_path / "store_tags"
+        store.mkdir()
+        tags.mkdir()
+        (store / "440.json").write_text(json.dumps({"name": "TF2"}))
+        (store / "440_hltb.json").write_text(json.dumps({"main_story": 10.0}))
+        (tags / "440_en.json").write_text(json.dumps(["FPS"]))
+
+        cache = _cache(tmp_path)
+
+        assert cache.get("store", "440") == {"name": "TF2"}
+        assert cache.get("hltb", "440") == {"main_story": 10.0}
+        assert cache.get("tags", "440_en") == ["FPS"]
+        assert not store.exists()
+        assert not tags.exists()
+
+    def test_keeps_file_age(self, tmp_path) -> None:
+        """Imported entries keep the file's mtime, so stale files stay stale."""
+        store = tmp_path / "store_data"
+        store.mkdir()
+        old = store / "440_reviews.json"
+        old.write_text(json.dumps({"total": 5}))
+        past = time.time() - 2 * 86400
+        os.utime(old, (past, past))
+
+        cache = _cache(tmp_path)
+
+        assert cache.get("reviews", "440") is None
+
+    def test_skips_corrupt_and_unknown_files(self, tmp_path) -> None:
+        """Unreadable or unrecognised files are left alone."""
+        store = tmp_path / "store_data"
+        store.mkdir()
+        (store / "440.json").write_text("not valid json{{{")
+        (store / "440_other.json").write_text("{}")
+
+        cache = _cache(tmp_path)
+
+        assert cache.get("store", "440") is None
+        assert (store / "440.json").exists()
+        assert (store / "440_other.json").exists()
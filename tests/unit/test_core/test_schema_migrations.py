@@ -1,4 +1,4 @@
-"""Tests for database schema migrations (v3 through v9).
+"""Tests for database schema migrations (v3 through v10).
 
 Verifies that each migration step creates the expected tables/columns
 and that data survives the full migration chain.
@@ -54,7 +54,7 @@ INSERT INTO schema_version (version, applied_at, description)
 VALUES (2, strftime('%s', 'now'), 'v2 base');
 """
 
-SCHEMA_VERSION = 9
+SCHEMA_VERSION = 10
 
 
 class _MigrationHost(SchemaMixin):
@@ -321,27 +321,49 @@ class TestMigrateToV9:
         conn.close()
 
 
+class TestMigrateToV10:
+    """v10: appinfo change index + sync state."""
+
+    def test_creates_tables(self, tmp_path):
+        conn = _create_v2_db(tmp_path)
+        host = _MigrationHost(conn)
+        host._m10()
+
+        assert _table_exists(conn, "appinfo_index")
+        assert _table_exists(conn, "sync_state")
+        for col in ("app_id", "change_number", "sha1"):
+            assert _column_exists(conn, "appinfo_index", col)
+        conn.close()
+
+    def test_idempotent(self, tmp_path):
+        conn = _create_v2_db(tmp_path)
+        host = _MigrationHost(conn)
+        host._m10()
+        host._m10()  # no error
+        conn.close()
+
+
 # -- Full migration chain --
 
 
 class TestFullMigrationChain:
-    """Test the complete v2 -> v9 migration path."""
+    """Test the complete v2 -> v10 migration path."""
 
-    def test_migrate_v2_to_v9(self, tmp_path):
-        """Full chain should reach schema version 9."""
+    def test_migrate_v2_to_v10(self, tmp_path):
+        """Full chain should reach schema version 10."""
         conn = _create_v2_db(tmp_path)
         host = _MigrationHost(conn)
-        host._migrate(frm=2, to=9)
+        host._migrate(frm=2, to=10)
 
         row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
-        assert row[0] == 9
+        assert row[0] == 10
         conn.close()
 
     def test_all_tables_exist_after_chain(self, tmp_path):
-        """Every table from v3-v9 should exist after full migration."""
+        """Every table from v3-v10 should exist after full migration."""
         conn = _create_v2_db(tmp_path)
         host = _MigrationHost(conn)
-        host._migrate(frm=2, to=9)
+        host._migrate(frm=2, to=10)
 
         expected_tables = [
             "tag_definitions",  # v3
@@ -358,6 +380,8 @@ class TestFullMigrationChain:
             "playtime_snapshots",  # v8
             "curators",  # v9
             "curator_recommendations",  # v9
+            "appinfo_index",  # v10
+            "sync_state",  # v10
         ]
         for table in expected_tables:
             assert _table_exists(conn, table), f"Missing table after full migration: {table}"
@@ -367,7 +391,7 @@ class TestFullMigrationChain:
         """Columns added by migrations should exist after full chain."""
         conn = _create_v2_db(tmp_path)
         host = _MigrationHost(conn)
-        host._migrate(frm=2, to=9)
+        host._migrate(frm=2, to=10)
 
         # v3: tag_id on game_tags
         assert _column_exists(conn, "game_tags", "tag_id")
@@ -379,7 +403,7 @@ class TestFullMigrationChain:
         conn.close()
 
     def test_data_survives_migration(self, tmp_path):
-        """Games and tags inserted at v2 should survive migration to v9."""
+        """Games and tags inserted at v2 should survive migration to v10."""
         conn = _create_v2_db(tmp_path)
         now = int(time.time())
 
@@ -395,7 +419,7 @@ class TestFullMigrationChain:
 
         # Migrate
         host = _MigrationHost(conn)
-        host._migrate(frm=2, to=9)
+        host._migrate(frm=2, to=10)
 
         # Verify data intact
         game = conn.execute("SELECT name, developer FROM games WHERE app_id = 440").fetchone()
@@ -414,8 +438,8 @@ class TestFullMigrationChain:
         assert row[1] == ""  # pegi_rating DEFAULT ''
         conn.close()
 
-    def test_partial_migration_v5_to_v9(self, tmp_path):
-        """A DB already at v5 should only run migrations v6-v9."""
+    def test_partial_migration_v5_to_v10(self, tmp_path):
+        """A DB already at v5 should only run migrations v6-v10."""
         conn = _create_v2_db(tmp_path)
         host = _MigrationHost(conn)
 
@@ -436,8 +460,8 @@ class TestFullMigrationChain:
         assert not _table_exists(conn, "external_games")
         assert not _table_exists(conn, "curators")
 
-        # Now migrate from v5 to v9 (as _ensure_schema would)
-        host._migrate(frm=5, to=9)
+        # Now migrate from v5 to v10 (as _ensure_schema would)
+        host._migrate(frm=5, to=10)
 
         # Everything should exist now
         assert _table_exists(conn, "external_games")
@@ -445,7 +469,7 @@ class TestFullMigrationChain:
         assert _column_exists(conn, "games", "review_percentage")
 
         row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
-        assert row[0] == 9
+        assert row[0] == 10
         conn.close()
 
     def test_ensure_schema_triggers_migration(self, tmp_path):
@@ -455,6 +479,6 @@ class TestFullMigrationChain:
         host._ensure_schema()
 
         row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
-        assert row[0] == 9
+        assert row[0] == 10
         assert _table_exists(conn, "curators")
         conn.close()
@@ -17,6 +17,9 @@ from steam_library_manager.core.vdf_parser import (
     BIN_INT32,
     BIN_NONE,
     BIN_STRING,
+    BIN_WIDESTRING,
+    MAX_DEPTH,
+    binary_decode,
     binary_dump,
     binary_dumps,
     binary_load,
@@ -226,3 +229,75 @@ class TestBinaryLoadDump:
         buf.seek(0)
         result = binary_load(buf)
         assert result == obj
+
+
+class TestBinaryDecode:
+    """Tests for the buffer-based decoder shared with PackageInfoParser."""
+
+    def test_returns_end_position(self) -> None:
+        """The position after the end tag allows decoding back-to-back records."""
+        one = BIN_INT32 + b"a\x00" + struct.pack("<i", 1) + BIN_END
+        two = BIN_STRING + b"b\x00x\x00" + BIN_END
+        data = one + two
+
+        first, pos = binary_decode(data)
+        second, end = binary_decode(data, pos)
+
+        assert (first, second) == ({"a": 1}, {"b": "x"})
+        assert (pos, end) == (len(one), len(data))
+
+    def test_wide_string(self) -> None:
+        """UTF-16 values stop at an aligned double NUL only."""
+        # "\u0100" encodes as 00 01, which must not end the string early
+        value = "A\u0100B"
+        data = BIN_WIDESTRING + b"w\x00" + value.encode("utf-16-le") + b"\x00\x00" + BIN_END
+
+        assert binary_decode(data)[0] == {"w": value}
+
+    def test_alt_end(self) -> None:
+        """0x0B closes an object only when alt_end is set."""
+        data = BIN_STRING + b"k\x00v\x00" + b"\x0b"
+
+        assert binary_decode(data, alt_end=True) == ({"k": "v"}, len(data))
+        with pytest.raises(ValueError):
+            binary_decode(data)
+
+    def test_truncated_value_raises(self) -> None:
+        """A cut-off fixed-size value is an error, not a silent zero."""
+        with pytest.raises(struct.error):
+            binary_decode(BIN_INT32 + b"n\x00\x01\x02")
+
+    def test_deep_nesting_raises_value_error(self) -> None:
+        """A hostile nesting chain is a ValueError, not a RecursionError."""
+        data = (BIN_NONE + b"k\x00") * 100_000
+
+        with pytest.raises(ValueError):
+            binary_decode(data)
+        with pytest.raises(ValueError):
+            binary_loads(data)
+
+    def test_nesting_up_to_limit(self) -> None:
+        """Nesting just under MAX_DEPTH still decodes."""
+        levels = MAX_DEPTH - 1
+        data = (BIN_NONE + b"k\x00") * levels + BIN_END * (levels + 1)
+
+        o, pos = binary_decode(data)
+        for _ in range(levels):
+            o = o["k"]
+        assert (o, pos) == ({}, len(data))
+
+    def test_accepts_memoryview(self) -> None:
+        """binary_loads takes any bytes-like buffer."""
+        data = binary_dumps({"root": {"k": "v"}})
+        assert binary_loads(memoryview(data)) == {"root": {"k": "v"}}
+
+    def test_large_synthetic_file(self) -> None:
+        """A 100k-key file decodes to exactly what was encoded."""
+        original = {
+            "shortcuts": {
+                str(i): {"appid": -(i + 1), "AppName": "Game %d" % i, "LastPlayTime": 1700000000 + i, "tags": {}}
+                for i in range(33_334)
+            }
+        }
+
+        assert binary_loads(binary_dumps(original)) == original
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from steam_library_manager.integrations.hltb_api import HLTBClient, HLTBResult
+from steam_library_manager.integrations.hltb_api import HLTBClient, HLTBResult, HLTBThrottled
 from steam_library_manager.integrations.hltb_models import (
     find_best_match,
     levenshtein,
@@ -385,6 +385,45 @@ class TestSearchGame:
         assert result.game_name == "Game Y"
 
 
+class TestThrottling:
+    """429/5xx answers surface as HLTBThrottled instead of a miss."""
+
+    @pytest.mark.parametrize("status", [429, 503])
+    @patch.object(HLTBClient, "_ensure_ready", return_value=True)
+    def test_throttle_status_raises(self, _mock_ready: MagicMock, status: int) -> None:
+        """Rate-limit and server errors carry the Retry-After hint."""
+        client = _make_ready_client()
+        resp = MagicMock()
+        resp.status_code = status
+        resp.headers = {"Retry-After": "7"}
+        client._session.post = MagicMock(return_value=resp)
+
+        with pytest.raises(HLTBThrottled) as exc:
+            client.search_game("Portal 2")
+
+        assert exc.value.status == status
+        assert exc.value.retry_after == pytest.approx(7.0)
+
+    def test_fake_server_round_trip(self, fake_hltb_server) -> None:
+        """Endpoint discovery, token and search work against base_url."""
+        client = HLTBClient(base_url=fake_hltb_server.url)
+
+        result = client.search_game("Portal 2", app_id=620)
+
+        assert result is not None
+        assert result.game_name == "Portal 2"
+        assert result.main_story == pytest.approx(10.0)
+        assert client._build_id == "fakebuild"
+
+    def test_fake_server_429(self, fake_hltb_server) -> None:
+        """A real 429 response raises HLTBThrottled."""
+        fake_hltb_server.throttle_every = 1
+        client = HLTBClient(base_url=fake_hltb_server.url)
+
+        with pytest.raises(HLTBThrottled):
+            client.search_game("Portal 2")
+
+
 class TestFindBestMatch:
     """Tests for the _find_best_match static method."""
 
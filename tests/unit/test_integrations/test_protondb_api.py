@@ -44,7 +44,7 @@ class TestProtonDBResult:
 class TestProtonDBClientGetRating:
     """Tests for ProtonDBClient.get_rating()."""
 
-    @patch("steam_library_manager.integrations.protondb_api.requests.Session")
+    @patch("steam_library_manager.integrations.protondb_api.http.session")
     def test_get_rating_success(self, mock_session_cls: MagicMock) -> None:
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -69,7 +69,7 @@ class TestProtonDBClientGetRating:
         assert result.score == 0.82
         assert result.best_reported == "platinum"
 
-    @patch("steam_library_manager.integrations.protondb_api.requests.Session")
+    @patch("steam_library_manager.integrations.protondb_api.http.session")
     def test_get_rating_404_returns_none(self, mock_session_cls: MagicMock) -> None:
         mock_response = MagicMock()
         mock_response.status_code = 404
@@ -82,7 +82,7 @@ class TestProtonDBClientGetRating:
 
         assert result is None
 
-    @patch("steam_library_manager.integrations.protondb_api.requests.Session")
+    @patch("steam_library_manager.integrations.protondb_api.http.session")
     def test_get_rating_network_error_returns_none(self, mock_session_cls: MagicMock) -> None:
         mock_session = MagicMock()
         mock_session.get.side_effect = requests.ConnectionError("Connection refused")
@@ -93,7 +93,7 @@ class TestProtonDBClientGetRating:
 
         assert result is None
 
-    @patch("steam_library_manager.integrations.protondb_api.requests.Session")
+    @patch("steam_library_manager.integrations.protondb_api.http.session")
     def test_get_rating_partial_response(self, mock_session_cls: MagicMock) -> None:
         """API returns only tier, missing optional fields."""
         mock_response = MagicMock()
@@ -111,7 +111,7 @@ class TestProtonDBClientGetRating:
         assert result.confidence == ""
         assert result.score == 0.0
 
-    @patch("steam_library_manager.integrations.protondb_api.requests.Session")
+    @patch("steam_library_manager.integrations.protondb_api.http.session")
     def test_get_rating_server_error_returns_none(self, mock_session_cls: MagicMock) -> None:
         mock_response = MagicMock()
         mock_response.status_code = 500
@@ -128,7 +128,7 @@ class TestProtonDBClientGetRating:
 class TestProtonDBClientBatch:
     """Tests for ProtonDBClient.get_ratings_batch()."""
 
-    @patch("steam_library_manager.integrations.protondb_api.requests.Session")
+    @patch("steam_library_manager.integrations.protondb_api.http.session")
     @patch("steam_library_manager.integrations.protondb_api.time.sleep")
     def test_batch_returns_successful_results(self, mock_sleep: MagicMock, mock_session_cls: MagicMock) -> None:
         responses = []
@@ -149,7 +149,7 @@ class TestProtonDBClientBatch:
         assert results[730].tier == "gold"
         assert results[440].tier == "platinum"
 
-    @patch("steam_library_manager.integrations.protondb_api.requests.Session")
+    @patch("steam_library_manager.integrations.protondb_api.http.session")
     @patch("steam_library_manager.integrations.protondb_api.time.sleep")
     def test_batch_skips_failed_lookups(self, mock_sleep: MagicMock, mock_session_cls: MagicMock) -> None:
         ok_resp = MagicMock()
@@ -170,7 +170,7 @@ class TestProtonDBClientBatch:
         assert 730 in results
         assert 99999 not in results
 
-    @patch("steam_library_manager.integrations.protondb_api.requests.Session")
+    @patch("steam_library_manager.integrations.protondb_api.http.session")
     @patch("steam_library_manager.integrations.protondb_api.time.sleep")
     def test_batch_empty_list(self, mock_sleep: MagicMock, mock_session_cls: MagicMock) -> None:
         mock_session_cls.return_value = MagicMock()
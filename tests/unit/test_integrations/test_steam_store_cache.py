@@ -28,15 +28,10 @@ class TestSteamStoreCacheCoverage:
         from steam_library_manager.integrations.steam_store import SteamStoreScraper
 
         scraper = SteamStoreScraper(tmp_path, "en")
-        cache_dir = tmp_path / "store_tags"
-        cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create cache files
         app_ids = ["440", "730", "570"]
         for app_id in app_ids:
-            cache_file = cache_dir / f"{app_id}_en.json"
-            with open(cache_file, "w") as f:
-                json.dump(["Action", "FPS"], f)
+            scraper.cache.put("tags", f"{app_id}_en", ["Action", "FPS"])
 
         coverage = scraper.get_cache_coverage(app_ids)
 
@@ -50,14 +45,10 @@ class TestSteamStoreCacheCoverage:
         from steam_library_manager.integrations.steam_store import SteamStoreScraper
 
         scraper = SteamStoreScraper(tmp_path, "en")
-        cache_dir = tmp_path / "store_tags"
-        cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create cache for 2 out of 4 games
+        # Cache 2 out of 4 games
         for app_id in ["440", "730"]:
-            cache_file = cache_dir / f"{app_id}_en.json"
-            with open(cache_file, "w") as f:
-                json.dump(["Action", "FPS"], f)
+            scraper.cache.put("tags", f"{app_id}_en", ["Action", "FPS"])
 
         app_ids = ["440", "730", "570", "271590"]
         coverage = scraper.get_cache_coverage(app_ids)
@@ -67,8 +58,8 @@ class TestSteamStoreCacheCoverage:
         assert coverage["missing"] == 2
         assert coverage["percentage"] == 50.0
 
-    def test_get_cache_coverage_expired_cache(self, tmp_path):
-        """Test that expired cache (>30 days) is not counted."""
+    def test_get_cache_coverage_expired_legacy_file(self, tmp_path):
+        """Test that an imported legacy file older than 30 days is not counted."""
         from steam_library_manager.integrations.steam_store import SteamStoreScraper
 
         scraper = SteamStoreScraper(tmp_path, "en")
@@ -57,9 +57,8 @@ class TestSteamWebAPIInit:
 class TestBatchChunking:
     """Tests for batch chunking logic."""
 
-    @patch("steam_library_manager.integrations.steam_web_api.time.sleep")
-    @patch("steam_library_manager.integrations.steam_web_api.requests.get")
-    def test_batch_chunking_101_apps_splits_into_3(self, mock_get: MagicMock, mock_sleep: MagicMock) -> None:
+    @patch("steam_library_manager.integrations.steam_web_api.http.get")
+    def test_batch_chunking_101_apps_splits_into_3(self, mock_get: MagicMock) -> None:
         """101 app IDs are split into 3 batches (50+50+1)."""
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -70,11 +69,10 @@ class TestBatchChunking:
         api = SteamWebAPI("test_key")
         api.get_app_details_batch(list(range(101)))
 
+        # pacing between batches is the shared client's job
         assert mock_get.call_count == 3
-        # 2 sleeps between 3 batches
-        assert mock_sleep.call_count == 2
 
-    @patch("steam_library_manager.integrations.steam_web_api.requests.get")
+    @patch("steam_library_manager.integrations.steam_web_api.http.get")
     def test_empty_response_returns_empty_dict(self, mock_get: MagicMock) -> None:
         """Empty API response returns empty dict."""
         mock_response = MagicMock()
@@ -156,27 +154,22 @@ class TestParseItem:
 class TestRateLimitAndErrors:
     """Tests for rate limiting and error handling."""
 
-    @patch("steam_library_manager.integrations.steam_web_api.time.sleep")
-    @patch("steam_library_manager.integrations.steam_web_api.requests.get")
-    def test_rate_limit_retries_with_backoff(self, mock_get: MagicMock, mock_sleep: MagicMock) -> None:
-        """HTTP 429 triggers exponential backoff retries."""
+    @patch("steam_library_manager.integrations.steam_web_api.http.get")
+    def test_rate_limit_after_client_retries_returns_empty(self, mock_get: MagicMock) -> None:
+        """A 429 that survives the shared client's retries yields an empty batch."""
         rate_limited = MagicMock()
         rate_limited.status_code = 429
-
-        ok_response = MagicMock()
-        ok_response.status_code = 200
-        ok_response.json.return_value = {"response": {"store_items": []}}
-        ok_response.raise_for_status = MagicMock()
-
-        mock_get.side_effect = [rate_limited, ok_response]
+        mock_get.return_value = rate_limited
 
         api = SteamWebAPI("test_key")
         result = api._fetch_batch([440])
 
         assert result == []
-        assert mock_sleep.call_count >= 1
+        assert mock_get.call_count == 1
+        # three attempts in total, as before the shared client
+        assert mock_get.call_args.kwargs["retries"] == 2
 
-    @patch("steam_library_manager.integrations.steam_web_api.requests.get")
+    @patch("steam_library_manager.integrations.steam_web_api.http.get")
     def test_network_error_raises_connection_error(self, mock_get: MagicMock) -> None:
         """Network failure raises ConnectionError."""
         mock_get.side_effect = requests.ConnectionError("Network down")
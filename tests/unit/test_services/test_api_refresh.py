@@ -26,7 +26,7 @@ class TestApiRefresh:
         svc.game_manager.games = {}
         return svc
 
-    @patch("steam_library_manager.services.game_service.requests.get")
+    @patch("steam_library_manager.services.game_service.http.get")
     def test_discovers_new_games(self, mock_get: MagicMock, tmp_path: Path) -> None:
         """API refresh adds games not already in game_manager.games."""
         svc = self._make_service(tmp_path)
@@ -52,7 +52,7 @@ class TestApiRefresh:
         assert svc.game_manager.games["730"].name == "CS2"
         assert svc.game_manager.games["730"].playtime_minutes == 50
 
-    @patch("steam_library_manager.services.game_service.requests.get")
+    @patch("steam_library_manager.services.game_service.http.get")
     def test_no_duplicates(self, mock_get: MagicMock, tmp_path: Path) -> None:
         """API refresh does not duplicate existing games."""
         svc = self._make_service(tmp_path)
@@ -74,7 +74,7 @@ class TestApiRefresh:
         assert new_ids == []
         assert len(svc.game_manager.games) == 1
 
-    @patch("steam_library_manager.services.game_service.requests.get")
+    @patch("steam_library_manager.services.game_service.http.get")
     def test_failure_is_nonfatal(self, mock_get: MagicMock, tmp_path: Path) -> None:
         """API failure returns empty list, does not crash."""
         svc = self._make_service(tmp_path)
@@ -85,7 +85,7 @@ class TestApiRefresh:
         assert new_ids == []
         assert len(svc.game_manager.games) == 0
 
-    @patch("steam_library_manager.services.game_service.requests.get")
+    @patch("steam_library_manager.services.game_service.http.get")
     def test_oauth_401_falls_back_to_api_key(self, mock_get: MagicMock, tmp_path: Path) -> None:
         """OAuth 401 should fall back to API key and discover games."""
         svc = self._make_service(tmp_path)
@@ -109,7 +109,7 @@ class TestApiRefresh:
         assert new_ids == ["730"]
         assert mock_get.call_count == 2
 
-    @patch("steam_library_manager.services.game_service.requests.get")
+    @patch("steam_library_manager.services.game_service.http.get")
     def test_both_fail_returns_empty(self, mock_get: MagicMock, tmp_path: Path) -> None:
         """OAuth 401 + API key 401 should return empty list."""
         svc = self._make_service(tmp_path)
@@ -126,7 +126,7 @@ class TestApiRefresh:
         assert new_ids == []
         assert mock_get.call_count == 2
 
-    @patch("steam_library_manager.services.game_service.requests.get")
+    @patch("steam_library_manager.services.game_service.http.get")
     def test_oauth_empty_falls_back_to_api_key(self, mock_get: MagicMock, tmp_path: Path) -> None:
         """OAuth 200 with empty games should fall back to API key."""
         svc = self._make_service(tmp_path)
@@ -160,7 +160,7 @@ class TestLoadApiKeyFallback:
         mgr._load_source = None
         return mgr
 
-    @patch("steam_library_manager.core.game_manager.requests.get")
+    @patch("steam_library_manager.core.game_manager.http.get")
     def test_oauth_401_falls_back_to_api_key(self, mock_get: MagicMock) -> None:
         """OAuth 401 should try API key and load games."""
         mgr = self._make_manager()
@@ -184,7 +184,7 @@ class TestLoadApiKeyFallback:
         assert "730" in mgr.games
         assert mock_get.call_count == 2
 
-    @patch("steam_library_manager.core.game_manager.requests.get")
+    @patch("steam_library_manager.core.game_manager.http.get")
     def test_oauth_success_no_api_key_attempt(self, mock_get: MagicMock) -> None:
         """Successful OAuth should not try API key."""
         mgr = self._make_manager()
@@ -203,7 +203,7 @@ class TestLoadApiKeyFallback:
         assert result is True
         assert mock_get.call_count == 1
 
-    @patch("steam_library_manager.core.game_manager.requests.get")
+    @patch("steam_library_manager.core.game_manager.http.get")
     def test_both_fail(self, mock_get: MagicMock) -> None:
         """Both OAuth and API key fail should return False."""
         mgr = self._make_manager()
@@ -220,7 +220,7 @@ class TestLoadApiKeyFallback:
         assert result is False
         assert mock_get.call_count == 2
 
-    @patch("steam_library_manager.core.game_manager.requests.get")
+    @patch("steam_library_manager.core.game_manager.http.get")
     def test_no_token_uses_api_key_directly(self, mock_get: MagicMock) -> None:
         """No OAuth token should use API key directly (only 1 request)."""
         mgr = self._make_manager()
@@ -244,7 +244,7 @@ class TestLoadApiKeyFallback:
             call_params = mock_get.call_args[1].get("params", {})
         assert "key" in call_params
 
-    @patch("steam_library_manager.core.game_manager.requests.get")
+    @patch("steam_library_manager.core.game_manager.http.get")
     def test_oauth_empty_falls_back_to_api_key(self, mock_get: MagicMock) -> None:
         """OAuth 200 with empty response should fall back to API key."""
         mgr = self._make_manager()
@@ -268,6 +268,31 @@ class TestLoadApiKeyFallback:
         assert "730" in mgr.games
         assert mock_get.call_count == 2
 
+    @patch("steam_library_manager.core.game_manager.http.get")
+    def test_load_games_api_wins_over_local(self, mock_get: MagicMock) -> None:
+        """The API request overlaps the manifest scan, but API entries still take precedence."""
+        mgr = self._make_manager()
+        mgr.query_svc = MagicMock()
+
+        resp_ok = MagicMock()
+        resp_ok.json.return_value = {
+            "response": {"games": [{"appid": 440, "name": "TF2", "playtime_forever": 100}]},
+        }
+        mock_get.return_value = resp_ok
+        local = ([{"appid": 440, "name": "tf2 local"}, {"appid": 70, "name": "Half-Life"}], {})
+
+        with (
+            patch("steam_library_manager.config.config") as mock_cfg,
+            patch.object(mgr, "_read_local", return_value=local),
+        ):
+            mock_cfg.STEAM_ACCESS_TOKEN = None
+            assert mgr.load_games("76561198000000000") is True
+
+        assert list(mgr.games) == ["440", "70"]
+        assert mgr.games["440"].name == "TF2"
+        assert mgr.games["70"].installed is True
+        assert mgr.load_source == "mixed"
+
 
 class TestSteamAppDetailsTagIds:
     """Tests for tag_ids field on SteamAppDetails."""
@@ -24,10 +24,19 @@ def _make_service():
 
     service = AutoCategorizeService.__new__(AutoCategorizeService)
     service.cat_svc = MagicMock()
-    service.cat_svc.add_app_to_category = MagicMock()
     return service
 
 
+def _added(cat_svc) -> list[tuple[str, str]]:
+    """(app_id, category) pairs passed to apply_category_changes, in order."""
+    return [
+        (aid, cat)
+        for c in cat_svc.apply_category_changes.call_args_list
+        for cat, ids in c.kwargs["add"].items()
+        for aid in ids
+    ]
+
+
 class TestCategorizeByPEGI:
     """Tests for AutoCategorizeService.categorize_by_pegi()."""
 
@@ -37,7 +46,7 @@ class TestCategorizeByPEGI:
         games = [_make_game("1", "Doom Eternal", pegi="18")]
         result = service.categorize_by_pegi(games)
         assert result == 1
-        service.cat_svc.add_app_to_category.assert_called_once()
+        assert len(_added(service.cat_svc)) == 1
 
     def test_pegi_3_creates_category(self) -> None:
         """Game with PEGI 3 should be categorized."""
@@ -52,7 +61,7 @@ class TestCategorizeByPEGI:
         games = [_make_game("1", "Mystery Game", pegi="")]
         result = service.categorize_by_pegi(games)
         assert result == 1
-        service.cat_svc.add_app_to_category.assert_called_once()
+        assert len(_added(service.cat_svc)) == 1
 
     def test_none_rating_creates_unknown_category(self) -> None:
         """Game with None rating should also get 'Unknown' category."""
@@ -74,7 +83,7 @@ class TestCategorizeByPEGI:
         ]
         result = service.categorize_by_pegi(games)
         assert result == 5
-        assert service.cat_svc.add_app_to_category.call_count == 5
+        assert len(_added(service.cat_svc)) == 5
 
     def test_mixed_library_all_categorized(self) -> None:
         """Mix of rated + unrated games should produce categories for all."""
@@ -111,11 +120,26 @@ class TestCategorizeByPEGI:
     def test_category_service_error_handled(self) -> None:
         """ValueError from category_service should not crash."""
         service = _make_service()
-        service.cat_svc.add_app_to_category.side_effect = ValueError("test")
+        service.cat_svc.apply_category_changes.side_effect = ValueError("test")
         games = [_make_game("1", "Crasher", pegi="18")]
         result = service.categorize_by_pegi(games)
         assert result == 0
 
+    def test_old_labels_migrate_through_category_service(self) -> None:
+        """Unpadded PEGI labels move in one batch call the change log sees."""
+        service = _make_service()
+        game = _make_game("1", "Stardew Valley", pegi="3")
+        game.categories = ["Age Rating: PEGI 3"]
+
+        service._migrate_pegi_categories([game])
+
+        service.cat_svc.apply_category_changes.assert_called_once_with(
+            add={"Age Rating: PEGI 03": ["1"]}, remove={"Age Rating: PEGI 3": ["1"]}
+        )
+        service.cat_svc.delete_category.assert_called_once_with("Age Rating: PEGI 3")
+        # game.categories is left to CategoryService
+        assert game.categories == ["Age Rating: PEGI 3"]
+
     def test_invalid_pegi_value_gets_unknown(self) -> None:
         """Unexpected PEGI value (e.g. '99') should fall to Unknown."""
         service = _make_service()
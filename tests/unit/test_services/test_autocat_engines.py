@@ -26,11 +26,20 @@ def _make_service():
     service = AutoCategorizeService.__new__(AutoCategorizeService)
     service.game_mgr = MagicMock()
     service.cat_svc = MagicMock()
-    service.cat_svc.add_app_to_category = MagicMock()
     service.scraper = None
     return service
 
 
+def _added(cat_svc) -> list[tuple[str, str]]:
+    """(app_id, category) pairs passed to apply_category_changes, in order."""
+    return [
+        (aid, cat)
+        for c in cat_svc.apply_category_changes.call_args_list
+        for cat, ids in c.kwargs["add"].items()
+        for aid in ids
+    ]
+
+
 def _make_game(**kwargs) -> Game:
     """Helper to create a Game with given attributes."""
     g = Game(app_id=kwargs.pop("app_id", "1"), name=kwargs.pop("name", "Test"))
@@ -49,7 +58,7 @@ class TestSimpleEngine:
         games = [_make_game(publisher="Valve")]
         result = service.categorize_by_publisher(games)
         assert result == 1
-        service.cat_svc.add_app_to_category.assert_called_once()
+        assert len(_added(service.cat_svc)) == 1
 
     def test_developer_via_engine(self) -> None:
         """Developer categorization works through the engine."""
@@ -64,9 +73,9 @@ class TestSimpleEngine:
         games = [_make_game(genres=["Action", "RPG"])]
         result = service.categorize_by_genre(games)
         assert result == 2
-        calls = service.cat_svc.add_app_to_category.call_args_list
-        assert calls[0][0][1] == "Action"
-        assert calls[1][0][1] == "RPG"
+        calls = _added(service.cat_svc)
+        assert calls[0][1] == "Action"
+        assert calls[1][1] == "RPG"
 
     def test_platform_capitalizes_values(self) -> None:
         """Platform categories capitalize the platform name."""
@@ -74,10 +83,10 @@ class TestSimpleEngine:
         games = [_make_game(platforms=["linux", "windows"])]
         result = service.categorize_by_platform(games)
         assert result == 2
-        calls = service.cat_svc.add_app_to_category.call_args_list
+        calls = _added(service.cat_svc)
         # Category names contain capitalized platform names
-        assert "Linux" in calls[0][0][1]
-        assert "Windows" in calls[1][0][1]
+        assert "Linux" in calls[0][1]
+        assert "Windows" in calls[1][1]
 
     def test_year_uses_year_kwarg(self) -> None:
         """Year categorization uses the year kwarg for i18n."""
@@ -133,7 +142,7 @@ class TestSimpleEngine:
     def test_error_in_category_service_handled(self) -> None:
         """ValueError from category_service does not crash."""
         service = _make_service()
-        service.cat_svc.add_app_to_category.side_effect = ValueError("test")
+        service.cat_svc.apply_category_changes.side_effect = ValueError("test")
         games = [_make_game(publisher="Valve")]
         result = service.categorize_by_publisher(games)
         assert result == 0
@@ -208,7 +217,7 @@ class TestBucketEngine:
     def test_bucket_error_handled(self) -> None:
         """ValueError from category_service does not crash."""
         service = _make_service()
-        service.cat_svc.add_app_to_category.side_effect = ValueError("test")
+        service.cat_svc.apply_category_changes.side_effect = ValueError("test")
         games = [_make_game(review_percentage=80)]
         result = service.categorize_by_user_score(games)
         assert result == 0
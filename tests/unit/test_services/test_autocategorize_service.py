@@ -9,6 +9,16 @@ import pytest
 from steam_library_manager.services.autocategorize_service import AutoCategorizeService
 
 
+def _added(cat_svc) -> list[tuple[str, str]]:
+    """(app_id, category) pairs passed to apply_category_changes, in order."""
+    return [
+        (aid, cat)
+        for c in cat_svc.apply_category_changes.call_args_list
+        for cat, ids in c.kwargs["add"].items()
+        for aid in ids
+    ]
+
+
 class TestAutoCategorizeService:
     """Tests for AutoCategorizeService."""
 
@@ -22,7 +32,7 @@ class TestAutoCategorizeService:
     def mock_category_service(self):
         """Create a mock CategoryService."""
         service = Mock()
-        service.add_app_to_category = Mock()
+        service.apply_category_changes = Mock()
         return service
 
     @pytest.fixture
@@ -61,10 +71,10 @@ class TestAutoCategorizeService:
         mock_steam_scraper.fetch_tags.assert_called_once_with("440")
 
         # Should add 2 categories (Action, FPS)
-        assert service.cat_svc.add_app_to_category.call_count == 2  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 2
         assert count == 2
-        assert "Action" in mock_game.categories
-        assert "FPS" in mock_game.categories
+        assert (mock_game.app_id, "Action") in _added(service.cat_svc)
+        assert (mock_game.app_id, "FPS") in _added(service.cat_svc)
 
     def test_categorize_by_tags_no_scraper(self, mock_game_manager, mock_category_service, mock_game):
         """Test categorizing by tags without steam_scraper."""
@@ -75,7 +85,7 @@ class TestAutoCategorizeService:
 
         # Should return 0 without scraper
         assert count == 0
-        assert mock_category_service.add_app_to_category.call_count == 0  # type: ignore[attr-defined]
+        assert len(_added(mock_category_service)) == 0
 
     def test_categorize_by_tags_with_progress(self, service, mock_game):
         """Test categorizing by tags with progress callback."""
@@ -100,10 +110,10 @@ class TestAutoCategorizeService:
         count = service.categorize_by_publisher(games)
 
         # Should add publisher category
-        assert service.cat_svc.add_app_to_category.call_count == 1  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 1
         assert count == 1
         # Category name is i18n, so just check it was added
-        assert len(mock_game.categories) == 1
+        assert [aid for aid, _ in _added(service.cat_svc)] == [mock_game.app_id]
 
     def test_categorize_by_publisher_no_publisher(self, service):
         """Test categorizing games without publisher."""
@@ -118,7 +128,7 @@ class TestAutoCategorizeService:
 
         # Should not add any categories
         assert count == 0
-        assert service.cat_svc.add_app_to_category.call_count == 0  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 0
 
     # === FRANCHISE CATEGORIZATION TESTS ===
 
@@ -134,9 +144,9 @@ class TestAutoCategorizeService:
         count = service.categorize_by_franchise(games)
 
         # Should detect LEGO franchise and add category
-        assert service.cat_svc.add_app_to_category.call_count == 1  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 1
         assert count == 1
-        assert len(game.categories) == 1
+        assert [aid for aid, _ in _added(service.cat_svc)] == [game.app_id]
 
     def test_categorize_by_franchise_no_franchise(self, service):
         """Test categorizing games with no detectable franchise."""
@@ -150,7 +160,7 @@ class TestAutoCategorizeService:
 
         # Should not add any categories
         assert count == 0
-        assert service.cat_svc.add_app_to_category.call_count == 0  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 0
 
     # === GENRE CATEGORIZATION TESTS ===
 
@@ -161,10 +171,10 @@ class TestAutoCategorizeService:
         count = service.categorize_by_genre(games)
 
         # Should add 2 genre categories (Action, FPS)
-        assert service.cat_svc.add_app_to_category.call_count == 2  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 2
         assert count == 2
-        assert "Action" in mock_game.categories
-        assert "FPS" in mock_game.categories
+        assert (mock_game.app_id, "Action") in _added(service.cat_svc)
+        assert (mock_game.app_id, "FPS") in _added(service.cat_svc)
 
     def test_categorize_by_genre_no_genres(self, service):
         """Test categorizing games without genres."""
@@ -179,7 +189,7 @@ class TestAutoCategorizeService:
 
         # Should not add any categories
         assert count == 0
-        assert service.cat_svc.add_app_to_category.call_count == 0  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 0
 
     # === CACHE COVERAGE TESTS ===
 
@@ -225,8 +235,8 @@ class TestAutoCategorizeService:
         count = service.categorize_by_developer(games)
 
         assert count == 1
-        assert service.cat_svc.add_app_to_category.call_count == 1  # type: ignore[attr-defined]
-        assert len(game.categories) == 1
+        assert len(_added(service.cat_svc)) == 1
+        assert [aid for aid, _ in _added(service.cat_svc)] == [game.app_id]
 
     def test_categorize_by_developer_no_developer(self, service):
         """Test categorizing games without developer."""
@@ -240,7 +250,7 @@ class TestAutoCategorizeService:
         count = service.categorize_by_developer(games)
 
         assert count == 0
-        assert service.cat_svc.add_app_to_category.call_count == 0  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 0
 
     # === PLATFORM CATEGORIZATION TESTS ===
 
@@ -256,8 +266,8 @@ class TestAutoCategorizeService:
         count = service.categorize_by_platform(games)
 
         assert count == 2
-        assert service.cat_svc.add_app_to_category.call_count == 2  # type: ignore[attr-defined]
-        assert len(game.categories) == 2
+        assert len(_added(service.cat_svc)) == 2
+        assert [aid for aid, _ in _added(service.cat_svc)] == [game.app_id] * 2
 
     def test_categorize_by_platform_no_platforms(self, service):
         """Test categorizing games without platforms."""
@@ -271,7 +281,7 @@ class TestAutoCategorizeService:
         count = service.categorize_by_platform(games)
 
         assert count == 0
-        assert service.cat_svc.add_app_to_category.call_count == 0  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 0
 
     # === USER SCORE CATEGORIZATION TESTS ===
 
@@ -287,8 +297,8 @@ class TestAutoCategorizeService:
         count = service.categorize_by_user_score(games)
 
         assert count == 1
-        assert service.cat_svc.add_app_to_category.call_count == 1  # type: ignore[attr-defined]
-        assert len(game.categories) == 1
+        assert len(_added(service.cat_svc)) == 1
+        assert [aid for aid, _ in _added(service.cat_svc)] == [game.app_id]
 
     def test_categorize_by_user_score_no_score(self, service):
         """Test categorizing games without review score."""
@@ -302,7 +312,7 @@ class TestAutoCategorizeService:
         count = service.categorize_by_user_score(games)
 
         assert count == 0
-        assert service.cat_svc.add_app_to_category.call_count == 0  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 0
 
     # === HOURS PLAYED CATEGORIZATION TESTS ===
 
@@ -318,8 +328,8 @@ class TestAutoCategorizeService:
         count = service.categorize_by_hours_played(games)
 
         assert count == 1
-        assert service.cat_svc.add_app_to_category.call_count == 1  # type: ignore[attr-defined]
-        assert len(game.categories) == 1
+        assert len(_added(service.cat_svc)) == 1
+        assert [aid for aid, _ in _added(service.cat_svc)] == [game.app_id]
 
     def test_categorize_by_hours_played_never_played(self, service):
         """Test categorizing games with zero playtime."""
@@ -334,7 +344,7 @@ class TestAutoCategorizeService:
 
         # Zero playtime still creates "Never Played" category
         assert count == 1
-        assert service.cat_svc.add_app_to_category.call_count == 1  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 1
 
     # === FLAGS CATEGORIZATION TESTS ===
 
@@ -343,14 +353,14 @@ class TestAutoCategorizeService:
         from steam_library_manager.core.game_manager import Game
 
         game = Game(app_id="440", name="Team Fortress 2")
-        game.is_free = True  # type: ignore[attr-defined]
+        game.is_free = True
         game.categories = []
         games = [game]
 
         count = service.categorize_by_flags(games)
 
         assert count == 1
-        assert service.cat_svc.add_app_to_category.call_count == 1  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 1
 
     def test_categorize_by_flags_no_flags(self, service):
         """Test categorizing games with no detectable flags."""
@@ -363,7 +373,7 @@ class TestAutoCategorizeService:
         count = service.categorize_by_flags(games)
 
         assert count == 0
-        assert service.cat_svc.add_app_to_category.call_count == 0  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 0
 
     # === VR CATEGORIZATION TESTS ===
 
@@ -372,14 +382,14 @@ class TestAutoCategorizeService:
         from steam_library_manager.core.game_manager import Game
 
         game = Game(app_id="440", name="Half-Life: Alyx")
-        game.vr_support = "required"  # type: ignore[attr-defined]
+        game.vr_support = "required"
         game.categories = []
         games = [game]
 
         count = service.categorize_by_vr(games)
 
         assert count == 1
-        assert service.cat_svc.add_app_to_category.call_count == 1  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 1
 
     def test_categorize_by_vr_no_vr(self, service):
         """Test categorizing games without VR support."""
@@ -392,7 +402,7 @@ class TestAutoCategorizeService:
         count = service.categorize_by_vr(games)
 
         assert count == 0
-        assert service.cat_svc.add_app_to_category.call_count == 0  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 0
 
     # === YEAR CATEGORIZATION TESTS ===
 
@@ -408,8 +418,8 @@ class TestAutoCategorizeService:
         count = service.categorize_by_year(games)
 
         assert count == 1
-        assert service.cat_svc.add_app_to_category.call_count == 1  # type: ignore[attr-defined]
-        assert len(game.categories) == 1
+        assert len(_added(service.cat_svc)) == 1
+        assert [aid for aid, _ in _added(service.cat_svc)] == [game.app_id]
 
     def test_categorize_by_year_no_year(self, service):
         """Test categorizing games without release year."""
@@ -423,7 +433,7 @@ class TestAutoCategorizeService:
         count = service.categorize_by_year(games)
 
         assert count == 0
-        assert service.cat_svc.add_app_to_category.call_count == 0  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 0
 
     # === HLTB CATEGORIZATION TESTS ===
 
@@ -439,8 +449,8 @@ class TestAutoCategorizeService:
         count = service.categorize_by_hltb(games)
 
         assert count == 1
-        assert service.cat_svc.add_app_to_category.call_count == 1  # type: ignore[attr-defined]
-        assert len(game.categories) == 1
+        assert len(_added(service.cat_svc)) == 1
+        assert [aid for aid, _ in _added(service.cat_svc)] == [game.app_id]
 
     def test_categorize_by_hltb_no_data(self, service):
         """Test categorizing games without HLTB data."""
@@ -454,7 +464,7 @@ class TestAutoCategorizeService:
         count = service.categorize_by_hltb(games)
 
         assert count == 0
-        assert service.cat_svc.add_app_to_category.call_count == 0  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 0
 
     def test_categorize_by_hltb_edge_boundary(self, service):
         """Test HLTB categorization at range boundary (exactly 5h)."""
@@ -469,7 +479,7 @@ class TestAutoCategorizeService:
 
         assert count == 1
         # 5.0 falls into 5-15h range
-        assert len(game.categories) == 1
+        assert [aid for aid, _ in _added(service.cat_svc)] == [game.app_id]
 
     # === LANGUAGE CATEGORIZATION TESTS ===
 
@@ -485,8 +495,8 @@ class TestAutoCategorizeService:
         count = service.categorize_by_language(games)
 
         assert count == 2
-        assert service.cat_svc.add_app_to_category.call_count == 2  # type: ignore[attr-defined]
-        assert len(game.categories) == 2
+        assert len(_added(service.cat_svc)) == 2
+        assert [aid for aid, _ in _added(service.cat_svc)] == [game.app_id] * 2
 
     def test_categorize_by_language_no_languages(self, service):
         """Test categorizing games without language data."""
@@ -500,7 +510,7 @@ class TestAutoCategorizeService:
         count = service.categorize_by_language(games)
 
         assert count == 0
-        assert service.cat_svc.add_app_to_category.call_count == 0  # type: ignore[attr-defined]
+        assert len(_added(service.cat_svc)) == 0
 
     # === TIME ESTIMATION TEST ===
 
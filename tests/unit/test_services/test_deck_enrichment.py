@@ -8,6 +8,7 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from steam_library_manager.core.game import Game
+from steam_library_manager.core.response_cache import response_cache
 from steam_library_manager.services.enrichment.deck_enrichment_service import DeckEnrichmentThread
 from steam_library_manager.utils.deck_utils import DECK_STATUS_MAP
 
@@ -66,7 +67,7 @@ class TestDeckEnrichmentConfig:
 class TestFetchDeckStatus:
     """Tests for the static _fetch method."""
 
-    @patch("steam_library_manager.utils.deck_utils.requests.get")
+    @patch("steam_library_manager.utils.deck_utils.http.get")
     def test_fetch_verified_status(self, mock_get: MagicMock, tmp_path: Path) -> None:
         """API returning resolved_category=3 should map to 'verified'."""
         mock_response = MagicMock()
@@ -80,7 +81,7 @@ class TestFetchDeckStatus:
         result = DeckEnrichmentThread._fetch("440", store_dir)
         assert result == "verified"
 
-    @patch("steam_library_manager.utils.deck_utils.requests.get")
+    @patch("steam_library_manager.utils.deck_utils.http.get")
     def test_fetch_playable_status(self, mock_get: MagicMock, tmp_path: Path) -> None:
         """API returning resolved_category=2 should map to 'playable'."""
         mock_response = MagicMock()
@@ -94,7 +95,7 @@ class TestFetchDeckStatus:
         result = DeckEnrichmentThread._fetch("440", store_dir)
         assert result == "playable"
 
-    @patch("steam_library_manager.utils.deck_utils.requests.get")
+    @patch("steam_library_manager.utils.deck_utils.http.get")
     def test_fetch_unsupported_status(self, mock_get: MagicMock, tmp_path: Path) -> None:
         """API returning resolved_category=1 should map to 'unsupported'."""
         mock_response = MagicMock()
@@ -108,7 +109,7 @@ class TestFetchDeckStatus:
         result = DeckEnrichmentThread._fetch("440", store_dir)
         assert result == "unsupported"
 
-    @patch("steam_library_manager.utils.deck_utils.requests.get")
+    @patch("steam_library_manager.utils.deck_utils.http.get")
     def test_fetch_unknown_status(self, mock_get: MagicMock, tmp_path: Path) -> None:
         """API returning resolved_category=0 should map to 'unknown'."""
         mock_response = MagicMock()
@@ -122,7 +123,7 @@ class TestFetchDeckStatus:
         result = DeckEnrichmentThread._fetch("440", store_dir)
         assert result == "unknown"
 
-    @patch("steam_library_manager.utils.deck_utils.requests.get")
+    @patch("steam_library_manager.utils.deck_utils.http.get")
     def test_fetch_api_error_returns_none(self, mock_get: MagicMock, tmp_path: Path) -> None:
         """Network errors should return None."""
         import requests as req_mod
@@ -135,7 +136,7 @@ class TestFetchDeckStatus:
         result = DeckEnrichmentThread._fetch("440", store_dir)
         assert result is None
 
-    @patch("steam_library_manager.utils.deck_utils.requests.get")
+    @patch("steam_library_manager.utils.deck_utils.http.get")
     def test_fetch_non_200_returns_none(self, mock_get: MagicMock, tmp_path: Path) -> None:
         """Non-200 HTTP status should return None."""
         mock_response = MagicMock()
@@ -148,23 +149,19 @@ class TestFetchDeckStatus:
         result = DeckEnrichmentThread._fetch("440", store_dir)
         assert result is None
 
-    @patch("steam_library_manager.utils.deck_utils.requests.get")
-    def test_fetch_creates_cache_file(self, mock_get: MagicMock, tmp_path: Path) -> None:
-        """Successful fetch should create a cache file."""
+    @patch("steam_library_manager.utils.deck_utils.http.get")
+    def test_fetch_caches_result(self, mock_get: MagicMock, tmp_path: Path) -> None:
+        """Successful fetch should store the result in the response cache."""
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"results": {"resolved_category": 3}}
         mock_get.return_value = mock_response
 
-        store_dir = tmp_path / "store_data"
-        store_dir.mkdir()
-
-        DeckEnrichmentThread._fetch("440", store_dir)
+        DeckEnrichmentThread._fetch("440", tmp_path)
 
-        cache_file = store_dir / "440_deck.json"
-        assert cache_file.exists()
+        assert response_cache(tmp_path).get("deck", "440") == {"status": "verified", "category": 3}
 
-    @patch("steam_library_manager.utils.deck_utils.requests.get")
+    @patch("steam_library_manager.utils.deck_utils.http.get")
     def test_fetch_handles_list_results(self, mock_get: MagicMock, tmp_path: Path) -> None:
         """API sometimes returns results as a list — handle gracefully."""
         mock_response = MagicMock()
@@ -0,0 +1,281 @@
+"""Tests for the pipelined (producer/consumer) mode of BaseEnrichmentThread."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from steam_library_manager.services.enrichment.base_enrichment_thread import BaseEnrichmentThread
+
+
+class _Throttled(Exception):
+    retry_after = 0.01
+
+
+class _Recorder(BaseEnrichmentThread):
+    """Fetches ints, stores them in a list, counts commits."""
+
+    _pipeline_workers = 3
+    _retryable = (_Throttled,)
+
+    def __init__(self, items: list, throttle_once: set | None = None) -> None:
+        super().__init__()
+        self.items = items
+        self.throttle_once = set(throttle_once or ())
+        self.fetch_threads: set[str] = set()
+        self.store_threads: set[str] = set()
+        self.stored: list = []
+        self.commits: list[int] = []
+        self._lock = threading.Lock()
+
+    def _get_items(self) -> list:
+        return self.items
+
+    def _fetch_item(self, item: int) -> int:
+        with self._lock:
+            self.fetch_threads.add(threading.current_thread().name)
+            if item in self.throttle_once:
+                self.throttle_once.discard(item)
+                raise _Throttled("slow down")
+        return item * 10
+
+    def _store_item(self, item: int, payload: int) -> bool:
+        self.store_threads.add(threading.current_thread().name)
+        self.stored.append(payload)
+        return item % 2 == 0
+
+    def _commit(self) -> None:
+        self.commits.append(len(self.stored))
+
+    def _format_progress(self, item: int, current: int, total: int) -> str:
+        return "%d/%d" % (current, total)
+
+
+class TestPipelinedMode:
+    """Fetches run on workers, stores and commits on the calling thread."""
+
+    def test_fetch_on_workers_store_on_caller(self) -> None:
+        """Network work leaves the thread that owns the connection."""
+        thread = _Recorder(list(range(20)))
+        assert thread.enable_pipeline(rate=0) is True
+        spy = MagicMock()
+        thread.finished_enrichment.connect(spy)
+
+        thread.run()
+
+        spy.assert_called_once_with(10, 10)
+        assert sorted(thread.stored) == [i * 10 for i in range(20)]
+        assert thread.store_threads == {threading.current_thread().name}
+        assert all(name.startswith("_Recorder") for name in thread.fetch_threads)
+
+    def test_commits_are_batched(self) -> None:
+        """120 items commit three times: two full batches and the rest."""
+        thread = _Recorder(list(range(120)))
+        thread.enable_pipeline(rate=0)
+
+        thread.run()
+
+        assert thread.commits == [50, 100, 120]
+
+    def test_progress_is_coalesced(self) -> None:
+        """Fast items do not emit one progress signal each."""
+        thread = _Recorder(list(range(2000)))
+        thread.enable_pipeline(rate=0)
+        seen: list[tuple[int, int]] = []
+        thread.progress.connect(lambda _msg, cur, tot: seen.append((cur, tot)))
+
+        thread.run()
+
+        assert len(seen) < 2000
+        assert seen[-1] == (2000, 2000)
+
+    def test_retryable_errors_back_off(self) -> None:
+        """A throttled fetch is retried instead of counted as failed."""
+        thread = _Recorder([0, 2, 4], throttle_once={2})
+        thread.enable_pipeline(rate=100.0)
+        spy = MagicMock()
+        thread.finished_enrichment.connect(spy)
+
+        thread.run()
+
+        spy.assert_called_once_with(3, 0)
+
+    def test_cancel_drains_quickly(self) -> None:
+        """Cancelling stops submitting new fetches."""
+        thread = _Recorder(list(range(1000)))
+        thread.enable_pipeline(workers=1, rate=50.0)
+        original = thread._store_item
+
+        def store_and_cancel(item: int, payload: int) -> bool:
+            thread.cancel()
+            return original(item, payload)
+
+        thread._store_item = store_and_cancel  # type: ignore[method-assign]
+        t0 = time.monotonic()
+        thread.run()
+
+        assert len(thread.stored) < 5
+        assert time.monotonic() - t0 < 1.0
+
+
+class TestEngineMode:
+    """Fetches go to a shared FetchEngine instead of an own pool."""
+
+    def test_fetches_run_on_engine(self) -> None:
+        """The engine's threads fetch, the calling thread still stores."""
+        from steam_library_manager.services.enrichment.fetch_engine import FetchEngine
+
+        engine = FetchEngine(limits={"": 2})
+        engine.start()
+        try:
+            thread = _Recorder(list(range(30)))
+            assert thread.use_engine(engine) is True
+            spy = MagicMock()
+            thread.finished_enrichment.connect(spy)
+
+            thread.run()
+        finally:
+            engine.stop()
+
+        spy.assert_called_once_with(15, 15)
+        assert sorted(thread.stored) == [i * 10 for i in range(30)]
+        assert thread.store_threads == {threading.current_thread().name}
+        assert all(name.startswith("fetch") for name in thread.fetch_threads)
+
+
+class TestSerialFallback:
+    """Pipeline hooks also work in the default serial mode."""
+
+    def test_serial_mode_commits_per_item(self, monkeypatch) -> None:
+        """The default _process_item fetches, stores and commits."""
+        monkeypatch.setattr(_Recorder, "_rate_limit", lambda self: None)
+        thread = _Recorder([1, 2])
+
+        thread.run()
+
+        assert thread.stored == [10, 20]
+        assert thread.commits == [1, 2]
+
+    def test_serial_only_subclass_refuses(self) -> None:
+        """Threads without pipelined hooks stay serial."""
+        from steam_library_manager.services.enrichment.curator_enrichment_service import CuratorEnrichmentThread
+
+        thread = CuratorEnrichmentThread()
+        assert thread.enable_pipeline() is False
+        assert thread.use_engine(MagicMock()) is False
+
+
+class TestProtonDBPipeline:
+    """ProtonDB track in pipelined mode."""
+
+    def test_cached_ratings_skip_the_network(self, database) -> None:
+        """Fresh cached ratings are looked up once, not fetched again."""
+        from steam_library_manager.integrations.protondb_api import ProtonDBResult
+        from steam_library_manager.services.enrichment.protondb_enrichment_service import ProtonDBEnrichmentThread
+
+        database.conn.executemany(
+            "INSERT INTO games (app_id, name, app_type, developer, platforms, created_at, updated_at) "
+            "VALUES (?, ?, 'game', '', '[]', 0, 0)",
+            [(1, "A"), (2, "B"), (3, "C")],
+        )
+        database.upsert_protondb(1, tier="gold")
+        database.commit()
+
+        thread = ProtonDBEnrichmentThread()
+        thread.configure([(1, "A"), (2, "B"), (3, "C")], database.db_path)
+        thread.enable_pipeline(rate=0)
+        client = MagicMock()
+        client.get_rating.side_effect = lambda aid: (
+            ProtonDBResult(tier="platinum", confidence="", trending_tier="", score=0.9, best_reported="")
+            if aid == 2
+            else None
+        )
+        spy = MagicMock()
+        thread.finished_enrichment.connect(spy)
+
+        with patch("steam_library_manager.integrations.protondb_api.ProtonDBClient", return_value=client):
+            thread.run()
+
+        spy.assert_called_once_with(2, 1)
+        assert sorted(c.args[0] for c in client.get_rating.call_args_list) == [2, 3]
+        rows = dict(database.conn.execute("SELECT app_id, tier FROM protondb_ratings").fetchall())
+        assert rows == {1: "gold", 2: "platinum", 3: "unknown"}
+
+
+class TestSharedWriter:
+    """Threads attached to a DatabaseWriter read-only and write through it."""
+
+    def test_protondb_writes_through_writer(self, database) -> None:
+        """All rows land via the writer, the thread's own connection stays read-only."""
+        from steam_library_manager.core.db.write_service import DatabaseWriter
+        from steam_library_manager.integrations.protondb_api import ProtonDBResult
+        from steam_library_manager.services.enrichment.protondb_enrichment_service import ProtonDBEnrichmentThread
+
+        games = [(i, "G%d" % i) for i in range(1, 31)]
+        database.conn.executemany(
+            "INSERT INTO games (app_id, name, app_type, developer, platforms, created_at, updated_at) "
+            "VALUES (?, ?, 'game', '', '[]', 0, 0)",
+            games,
+        )
+        database.commit()
+
+        writer = DatabaseWriter(database.db_path)
+        writer.start()
+        thread = ProtonDBEnrichmentThread()
+        thread.configure(games, database.db_path, force_refresh=True)
+        thread.enable_pipeline(rate=0)
+        thread.use_writer(writer)
+        client = MagicMock()
+        client.get_rating.return_value = ProtonDBResult(
+            tier="gold", confidence="", trending_tier="", score=0.5, best_reported=""
+        )
+        opened = []
+        original = thread._open_db
+
+        def spy_open(path):
+            db = original(path)
+            opened.append(db.conn.execute("PRAGMA query_only").fetchone()[0])
+            return db
+
+        thread._open_db = spy_open  # type: ignore[method-assign]
+
+        try:
+            with patch("steam_library_manager.integrations.protondb_api.ProtonDBClient", return_value=client):
+                thread.run()
+        finally:
+            writer.stop()
+
+        count = database.conn.execute("SELECT COUNT(*) FROM protondb_ratings").fetchone()[0]
+        assert count == 30
+        assert writer.metrics().calls == 30
+        assert opened == [1]
+
+
+class TestHostBudget:
+    """Each host has one request budget, the shared http client's."""
+
+    def test_client_paced_hosts_have_no_thread_bucket(self) -> None:
+        """Tracks whose host is in HOST_LIMITS don't pace on top of the client."""
+        from steam_library_manager.services.enrichment.achievement_enrichment_service import (
+            AchievementEnrichmentThread,
+        )
+        from steam_library_manager.services.enrichment.deck_enrichment_service import DeckEnrichmentThread
+        from steam_library_manager.services.enrichment.enrichment_service import EnrichmentThread
+        from steam_library_manager.services.enrichment.fetch_engine import HOST_CONCURRENCY
+        from steam_library_manager.services.enrichment.pegi_enrichment_service import PEGIEnrichmentThread
+        from steam_library_manager.services.enrichment.protondb_enrichment_service import ProtonDBEnrichmentThread
+        from steam_library_manager.utils.http_client import HOST_LIMITS
+
+        for cls in (
+            AchievementEnrichmentThread,
+            DeckEnrichmentThread,
+            EnrichmentThread,
+            PEGIEnrichmentThread,
+            ProtonDBEnrichmentThread,
+        ):
+            assert cls._fetch_host in HOST_LIMITS, cls.__name__
+            assert cls._fetch_host in HOST_CONCURRENCY, cls.__name__
+            thread = cls()
+            assert thread.enable_pipeline() is True
+            assert thread._rate == 0.0, cls.__name__
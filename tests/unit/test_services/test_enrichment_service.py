@@ -107,10 +107,90 @@ class TestHLTBEnrichment:
         finished_spy.assert_called_once_with(1, 0)
 
 
+def _add_games(db, games: list) -> None:
+    """Inserts (app_id, name) rows so hltb_data foreign keys resolve."""
+    db.conn.executemany(
+        "INSERT INTO games (app_id, name, app_type, developer, platforms, created_at, updated_at) "
+        "VALUES (?, ?, 'game', '', '[]', 0, 0)",
+        games,
+    )
+    db.conn.commit()
+
+
+class TestHLTBPipeline:
+    """Concurrent HLTB enrichment against the local fake server."""
+
+    @staticmethod
+    def _run(db_path: Path, games: list, url: str, **kwargs) -> MagicMock:
+        from steam_library_manager.integrations.hltb_api import HLTBClient
+
+        thread = EnrichmentThread()
+        finished_spy = MagicMock()
+        thread.finished_enrichment.connect(finished_spy)
+        thread.configure_hltb(games, db_path, HLTBClient(base_url=url), **kwargs)
+        thread.run()
+        return finished_spy
+
+    @staticmethod
+    def _rows(db_path: Path) -> dict:
+        from steam_library_manager.core.database import Database
+
+        db = Database(db_path)
+        rows = dict(db.conn.execute("SELECT app_id, main_story FROM hltb_data").fetchall())
+        db.close()
+        return rows
+
+    def test_searches_run_concurrently(self, enrichment_db, fake_hltb_server) -> None:
+        """Several searches are in flight at once and all results are stored."""
+        fake_hltb_server.latency = 0.05
+        games = [(1000 + i, "Game %d" % i) for i in range(40)] + [(2000, "Unknown Thing")]
+        _add_games(enrichment_db, games)
+
+        spy = self._run(enrichment_db.db_path, games, fake_hltb_server.url, workers=4, rate=200.0)
+
+        spy.assert_called_once_with(40, 1)
+        assert fake_hltb_server.peak_in_flight > 1
+        rows = self._rows(enrichment_db.db_path)
+        assert len(rows) == 41
+        assert rows[1000] == pytest.approx(10.0)
+        assert rows[2000] is None
+
+    def test_throttled_searches_are_retried(self, enrichment_db, fake_hltb_server) -> None:
+        """429 answers back off and retry instead of marking the game checked."""
+        fake_hltb_server.throttle_every = 5
+        games = [(1000 + i, "Game %d" % i) for i in range(12)]
+        _add_games(enrichment_db, games)
+
+        spy = self._run(enrichment_db.db_path, games, fake_hltb_server.url, workers=3, rate=200.0)
+
+        spy.assert_called_once_with(12, 0)
+        assert fake_hltb_server.throttled > 0
+        assert all(v == pytest.approx(10.0) for v in self._rows(enrichment_db.db_path).values())
+
+    def test_writes_are_batched(self, enrichment_db) -> None:
+        """hltb_data rows are committed in batches, not per game."""
+        from steam_library_manager.core.database import Database
+
+        mock_client = MagicMock()
+        mock_client.search_game.side_effect = lambda name, app_id=0: HLTBResult(
+            game_name=name, main_story=1.0, main_extras=2.0, completionist=3.0
+        )
+        games = [(i, "G%d" % i) for i in range(1, 121)]
+        _add_games(enrichment_db, games)
+
+        with patch.object(Database, "commit", autospec=True, side_effect=lambda self: self.conn.commit()) as commit:
+            thread = EnrichmentThread()
+            thread.configure_hltb(games, enrichment_db.db_path, mock_client, rate=1000.0)
+            thread.run()
+
+        assert commit.call_count == 3
+        assert len(self._rows(enrichment_db.db_path)) == 120
+
+
 class TestPEGIBatchExtraction:
     """Tests for PEGI extraction from batch Steam API responses."""
 
-    @patch("steam_library_manager.integrations.steam_web_api.requests.get")
+    @patch("steam_library_manager.integrations.steam_web_api.http.get")
     def test_pegi_extracted_from_batch_ratings_pegi_direct(self, mock_get: MagicMock, enrichment_db) -> None:
         """Direct PEGI rating is used when present in batch response."""
         from steam_library_manager.integrations.steam_web_api import SteamAppDetails
@@ -139,7 +219,7 @@ class TestPEGIBatchExtraction:
         db.close()
         assert row[0] == "12"
 
-    @patch("steam_library_manager.integrations.steam_web_api.requests.get")
+    @patch("steam_library_manager.integrations.steam_web_api.http.get")
     def test_pegi_extracted_from_batch_ratings_esrb_mapping(self, mock_get: MagicMock, enrichment_db) -> None:
         """ESRB maps to PEGI via convert_to_pegi() when no PEGI present."""
         from steam_library_manager.integrations.steam_web_api import SteamAppDetails
@@ -168,7 +248,7 @@ class TestPEGIBatchExtraction:
         db.close()
         assert row[0] == "12"
 
-    @patch("steam_library_manager.integrations.steam_web_api.requests.get")
+    @patch("steam_library_manager.integrations.steam_web_api.http.get")
     def test_pegi_prefers_pegi_over_esrb(self, mock_get: MagicMock, enrichment_db) -> None:
         """PEGI takes priority when both PEGI and ESRB are in age_ratings."""
         from steam_library_manager.integrations.steam_web_api import SteamAppDetails
@@ -197,7 +277,7 @@ class TestPEGIBatchExtraction:
         db.close()
         assert row[0] == "18"
 
-    @patch("steam_library_manager.integrations.steam_web_api.requests.get")
+    @patch("steam_library_manager.integrations.steam_web_api.http.get")
     def test_pegi_empty_ratings_no_update(self, mock_get: MagicMock, enrichment_db) -> None:
         """Empty age_ratings tuple does not write to DB."""
         from steam_library_manager.integrations.steam_web_api import SteamAppDetails
@@ -226,7 +306,7 @@ class TestPEGIBatchExtraction:
         db.close()
         assert row[0] == "" or row[0] is None
 
-    @patch("steam_library_manager.integrations.steam_web_api.requests.get")
+    @patch("steam_library_manager.integrations.steam_web_api.http.get")
     def test_pegi_writes_all_ratings_to_age_ratings_table(self, mock_get: MagicMock, enrichment_db) -> None:
         """All rating systems from batch response are written to age_ratings table."""
         from steam_library_manager.integrations.steam_web_api import SteamAppDetails
@@ -276,6 +356,7 @@ class TestPEGIGapFiller:
         thread._s = MagicMock()
         thread._f = False
 
+        thread._get_items()
         result = thread._process_item((440, "TF2"))
         assert result is True
         thread._s.fetch_age_rating.assert_not_called()
@@ -291,6 +372,7 @@ class TestPEGIGapFiller:
         thread._s.cache_dir.parent = Path("/tmp")
         thread._f = False
 
+        thread._get_items()
         result = thread._process_item((440, "TF2"))
         assert result is True
         thread._s.fetch_age_rating.assert_called_once_with("440")
@@ -309,6 +391,7 @@ class TestPEGIGapFiller:
         thread._s.cache_dir.parent.__truediv__ = MagicMock(return_value=MagicMock())
         thread._f = True
 
+        thread._get_items()
         result = thread._process_item((440, "TF2"))
         assert result is True
         thread._s.fetch_age_rating.assert_called_once()
@@ -317,7 +400,7 @@ class TestPEGIGapFiller:
 class TestSteamAPIEnrichment:
     """Tests for Steam API enrichment via EnrichmentThread."""
 
-    @patch("steam_library_manager.integrations.steam_web_api.requests.get")
+    @patch("steam_library_manager.integrations.steam_web_api.http.get")
     def test_steam_api_enrichment_batches_correctly(self, mock_get: MagicMock, enrichment_db) -> None:
         """Steam API enrichment processes games in batches."""
         mock_response = MagicMock()
@@ -0,0 +1,82 @@
+"""Tests for the shared asyncio FetchEngine."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from steam_library_manager.services.enrichment.fetch_engine import FetchEngine
+
+
+@pytest.fixture()
+def engine():
+    eng = FetchEngine(limits={"a.example": 2, "b.example": 5})
+    eng.start()
+    yield eng
+    eng.stop()
+
+
+class _Gauge:
+    """Blocking fetch that records how many calls overlap."""
+
+    def __init__(self) -> None:
+        self.now = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, item: int) -> int:
+        with self._lock:
+            self.now += 1
+            self.peak = max(self.peak, self.now)
+        time.sleep(0.02)
+        with self._lock:
+            self.now -= 1
+        return item * 2
+
+
+class TestFetchEngine:
+    """Tests for per-host caps, results and lifecycle."""
+
+    def test_results_come_back(self, engine: FetchEngine) -> None:
+        """submit() returns a concurrent Future with the call's result."""
+        futs = [engine.submit("b.example", lambda x: x + 1, i) for i in range(10)]
+        assert [f.result(timeout=2) for f in futs] == list(range(1, 11))
+
+    def test_exceptions_propagate(self, engine: FetchEngine) -> None:
+        """An exception in the fetch surfaces from Future.result()."""
+
+        def boom() -> None:
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError):
+            engine.submit("a.example", boom).result(timeout=2)
+
+    def test_per_host_cap(self, engine: FetchEngine) -> None:
+        """No more than the host's cap run at once; other hosts are independent."""
+        gauge_a, gauge_b = _Gauge(), _Gauge()
+        futs = [engine.submit("a.example", gauge_a, i) for i in range(12)]
+        futs += [engine.submit("b.example", gauge_b, i) for i in range(12)]
+        for f in futs:
+            f.result(timeout=5)
+
+        assert gauge_a.peak == 2
+        assert 2 < gauge_b.peak <= 5
+
+    def test_unknown_host_gets_default_cap(self) -> None:
+        """Hosts without an entry share the default cap."""
+        assert FetchEngine(limits={}).capacity("x.example") == 4
+
+    def test_submit_requires_running_engine(self) -> None:
+        """Submitting before start() is an error, not a silent hang."""
+        with pytest.raises(RuntimeError):
+            FetchEngine().submit("a.example", print)
+
+    def test_stop_is_idempotent(self, engine: FetchEngine) -> None:
+        """stop() twice is harmless and start() works again afterwards."""
+        engine.stop()
+        engine.stop()
+        assert not engine.running
+        engine.start()
+        assert engine.submit("a.example", lambda: 1).result(timeout=2) == 1
@@ -0,0 +1,60 @@
+# tests/unit/test_services/test_game_change_log.py
+
+"""Tests for GameChangeLog."""
+
+from __future__ import annotations
+
+from steam_library_manager.core.game import Game
+from steam_library_manager.services.game_change_log import GameChangeLog
+
+
+class TestGameChangeLog:
+    """Tests for noting and draining field changes."""
+
+    def test_note_groups_by_app(self) -> None:
+        """Several fields of one game collapse into one entry."""
+        log = GameChangeLog()
+        log.note("10", "tags")
+        log.note(10, "name")
+
+        assert log.drain() == {"10": {"tags", "name"}}
+        assert not log
+
+    def test_whole_game_wins(self) -> None:
+        """A wholesale change is not narrowed by later field notes."""
+        log = GameChangeLog()
+        log.note("10", "tags")
+        log.note_game("10")
+        log.note("10", "name")
+
+        assert log.drain() == {"10": None}
+
+    def test_note_diff(self) -> None:
+        """Only fields that differ are noted."""
+        log = GameChangeLog()
+        old = Game(app_id="10", name="Doom", tags=["FPS"])
+        new = Game(app_id="10", name="Doom", tags=["FPS", "Classic"], installed=True)
+        log.note_diff("10", old, new)
+
+        assert log.drain() == {"10": {"tags", "installed"}}
+
+    def test_track_sees_in_place_list_edits(self) -> None:
+        """Lists are copied, so appending to one counts as a change."""
+        log = GameChangeLog()
+        a = Game(app_id="1", name="A", tags=["RPG"])
+        b = Game(app_id="2", name="B")
+        with log.track([a, b], ("tags", "steam_deck_status")):
+            a.tags.append("Indie")
+            b.steam_deck_status = "verified"
+
+        assert log.drain() == {"1": {"tags"}, "2": {"steam_deck_status"}}
+
+    def test_watch_unchanged(self) -> None:
+        """Nothing is noted when the watched values stay the same."""
+        log = GameChangeLog()
+        g = Game(app_id="1", name="A", tags=["RPG"])
+        snap = log.watch([g], ("tags",))
+        g.tags = ["RPG"]
+        log.note_watched(snap)
+
+        assert log.drain() == {}
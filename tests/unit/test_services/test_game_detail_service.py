@@ -36,8 +36,8 @@ class TestFetchGameDetails:
         service = GameDetailService(games, tmp_path)
         assert service.fetch_game_details("999") is False
 
-    @patch("steam_library_manager.services.game_detail_enrichers.requests.get")
-    @patch("steam_library_manager.services.game_detail_service.requests.get")
+    @patch("steam_library_manager.services.game_detail_enrichers.http.get")
+    @patch("steam_library_manager.services.game_detail_service.http.get")
     def test_returns_true_for_existing_game(self, mock_svc_get, mock_enr_get, tmp_path):
         """Test that fetching details for known app_id returns True."""
         import requests as req_mod
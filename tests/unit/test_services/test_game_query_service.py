@@ -0,0 +1,154 @@
+"""Tests for the category index in GameQueryService."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from steam_library_manager.core.game import Game
+from steam_library_manager.services.category_service import CategoryService
+from steam_library_manager.services.game_change_log import GameChangeLog
+from steam_library_manager.services.game_query_service import GameQueryService
+from steam_library_manager.utils.i18n import t
+
+
+def _games() -> dict[str, Game]:
+    return {
+        "1": Game(app_id="1", name="Zelda-like", app_type="game", categories=["Action", "RPG"]),
+        "2": Game(app_id="2", name="Alpha", app_type="game", categories=["Action"]),
+        "3": Game(app_id="3", name="Proton 8.0", app_type="tool", categories=["Action"]),
+        "4": Game(app_id="4", name="Beta", app_type="game", categories=[t("categories.favorites")]),
+        "5": Game(app_id="5", name="Gamma", app_type="game"),
+    }
+
+
+def _ids(games) -> list[str]:
+    return [g.app_id for g in games]
+
+
+class TestCategoryIndex:
+    """Tests for the lazily built category -> games index."""
+
+    def test_matches_library_scan(self) -> None:
+        """Lookups return the real games of a category, sorted by name."""
+        svc = GameQueryService(_games(), filter_non_games=True)
+
+        assert _ids(svc.get_games_by_category("Action")) == ["2", "1"]
+        assert _ids(svc.get_games_by_category("Missing")) == []
+        assert _ids(svc.get_favorites()) == ["4"]
+        assert svc.get_all_categories() == {"Action": 2, "RPG": 1, t("categories.favorites"): 1}
+        assert svc.get_game_statistics() == {
+            "total_games": 4,
+            "games_in_categories": 3,
+            "category_count": 3,
+            "uncategorized_games": 1,
+        }
+
+    def test_results_are_copies(self) -> None:
+        """Callers may mutate what they get back."""
+        svc = GameQueryService(_games(), filter_non_games=False)
+        svc.get_games_by_category("Action").clear()
+
+        assert len(svc.get_games_by_category("Action")) == 3
+
+    def test_notes_update_in_place(self) -> None:
+        """note_added/removed/renamed/deleted keep the index current."""
+        games = _games()
+        svc = GameQueryService(games, filter_non_games=True)
+        svc.get_all_categories()
+
+        games["5"].categories.append("Action")
+        svc.note_added("5", "Action")
+        svc.note_added("5", "Action")
+        svc.note_added("3", "RPG")  # not a real game - ignored
+        assert _ids(svc.get_games_by_category("Action")) == ["2", "5", "1"]
+        assert _ids(svc.get_games_by_category("RPG")) == ["1"]
+
+        svc.note_removed("1", "RPG")
+        assert "RPG" not in svc.get_all_categories()
+
+        svc.note_renamed("Action", "Arcade")
+        assert _ids(svc.get_games_by_category("Arcade")) == ["2", "5", "1"]
+
+        svc.note_deleted("Arcade")
+        assert svc.get_games_by_category("Arcade") == []
+
+    def test_added_games_trigger_rebuild(self) -> None:
+        """A game added to the dict is picked up without invalidate()."""
+        games = _games()
+        svc = GameQueryService(games, filter_non_games=True)
+        svc.get_all_categories()
+
+        games["6"] = Game(app_id="6", name="Delta", app_type="game", categories=["RPG"])
+
+        assert _ids(svc.get_games_by_category("RPG")) == ["6", "1"]
+
+    def test_invalidate_rebuilds(self) -> None:
+        """Bulk edits are picked up after invalidate()."""
+        games = _games()
+        svc = GameQueryService(games, filter_non_games=True)
+        svc.get_all_categories()
+
+        games["5"].categories = ["Puzzle"]
+        assert svc.get_games_by_category("Puzzle") == []
+
+        svc.invalidate()
+        assert _ids(svc.get_games_by_category("Puzzle")) == ["5"]
+
+
+class TestCategoryServiceKeepsIndex:
+    """CategoryService mutations report to the query service."""
+
+    @staticmethod
+    def _service():
+        games = _games()
+        svc = GameQueryService(games, filter_non_games=True)
+        gm = SimpleNamespace(
+            games=games, query_svc=svc, get_games_by_category=svc.get_games_by_category, changes=GameChangeLog()
+        )
+        return CategoryService(None, MagicMock(), gm), svc
+
+    def test_add_remove_app(self) -> None:
+        """Adding and removing an app shows up in the next lookup."""
+        cs, svc = self._service()
+        svc.get_all_categories()
+
+        cs.add_app_to_category("5", "RPG")
+        assert _ids(svc.get_games_by_category("RPG")) == ["5", "1"]
+
+        cs.remove_app_from_category("1", "RPG")
+        assert _ids(svc.get_games_by_category("RPG")) == ["5"]
+        assert cs.game_manager.changes.drain() == {"5": {"categories"}, "1": {"categories"}}
+
+    def test_batch_changes(self) -> None:
+        """apply_category_changes updates games, index and change log once per category."""
+        cs, svc = self._service()
+        svc.get_all_categories()
+
+        assert cs.apply_category_changes(add={"RPG": ["5", "2", 7]}, remove={"Action": ["1", "2"]}) is True
+
+        cs.cloud_parser.apply_category_changes.assert_called_once_with({"RPG": ["5", "2", 7]}, {"Action": ["1", "2"]})
+        assert _ids(svc.get_games_by_category("RPG")) == ["2", "5", "1"]
+        assert svc.get_games_by_category("Action") == []
+        assert cs.game_manager.games["2"].categories == ["RPG"]
+        assert cs.game_manager.changes.drain() == {
+            "1": {"categories"},
+            "2": {"categories"},
+            "5": {"categories"},
+        }
+
+    def test_rename_delete_merge(self) -> None:
+        """Structural edits are reflected without a rebuild."""
+        cs, svc = self._service()
+        cs.cloud_parser.get_all_categories.return_value = []
+        svc.get_all_categories()
+
+        cs.rename_category("RPG", "Role-Playing")
+        assert _ids(svc.get_games_by_category("Role-Playing")) == ["1"]
+
+        cs.merge_categories(["Action", "Role-Playing"], "Role-Playing")
+        assert _ids(svc.get_games_by_category("Role-Playing")) == ["2", "1"]
+        assert svc.get_games_by_category("Action") == []
+
+        cs.delete_category("Role-Playing")
+        assert svc.get_all_categories() == {t("categories.favorites"): 1}
@@ -452,3 +452,152 @@ class TestRepairPlaceholderNames:
 
         mock_aim.load_appinfo.assert_called_once()
         assert game.name == "Real Game"
+
+
+class TestStagePipeline:
+    """load_and_prepare as a stage graph."""
+
+    def test_prefetched_owned_games_applied_after_discovery(self, mock_dependencies):
+        """The API refresh is fetched up front but merged after discovery, as before."""
+        service = GameService("/fake/steam", "", "/fake/cache")
+        service.cloud_storage_parser = Mock()
+
+        mock_gm = mock_dependencies["GameManager"].return_value
+        mock_gm.load_games.return_value = True
+        mock_gm.games = {"123": Game(app_id="123", name="Test Game")}
+        order = []
+        mock_gm.discover_missing_games.side_effect = lambda *a, **kw: order.append(sorted(mock_gm.games)) or 0
+
+        with (
+            patch.object(service, "_init_db", return_value=None),
+            patch.object(service, "_fetch_owned", return_value=[{"appid": 730, "name": "CS2"}]) as fetch,
+        ):
+            assert service.load_and_prepare("76561197960287930") is True
+
+        fetch.assert_called_once_with("76561197960287930")
+        assert order == [["123"]]
+        assert "730" in mock_gm.games
+
+    def test_stage_timings_reported(self, mock_dependencies):
+        """Every stage reports its duration through the progress callback."""
+        service = GameService("/fake/steam", "", "/fake/cache")
+        service.cloud_storage_parser = Mock()
+
+        mock_gm = mock_dependencies["GameManager"].return_value
+        mock_gm.load_games.return_value = True
+        mock_gm.games = {"123": Game(app_id="123", name="Test Game")}
+        mock_gm.discover_missing_games.return_value = 0
+
+        callback = Mock()
+        with patch.object(service, "_init_db", return_value=None):
+            service.load_and_prepare("76561197960287930", callback)
+
+        messages = [c.args[0] for c in callback.call_args_list]
+        for stage in ("db", "games", "pkgs", "owned", "mods", "library", "merge", "discover", "refresh", "finalize"):
+            assert any(stage in m and "ms" in m for m in messages), stage
+
+
+class TestWarmStart:
+    """Library snapshot warm start and background delta patching."""
+
+    @staticmethod
+    def _service(tmp_path):
+        service = GameService(str(tmp_path / "steam"), "", str(tmp_path / "cache"), use_snapshot=True)
+        service.cloud_storage_parser = Mock()
+        return service
+
+    def test_snapshot_skips_pipeline(self, tmp_path, mock_dependencies):
+        """An unchanged library loads from the snapshot without the full pipeline."""
+        mock_dependencies["config"].DATA_DIR = tmp_path
+        service = self._service(tmp_path)
+        games = {"10": Game(app_id="10", name="Alpha")}
+        service._snapshot().save("u", service._snapshot_stamps(), games, "local")
+
+        with (
+            patch.object(service, "_load_full") as full,
+            patch.object(service, "_init_db", return_value=None),
+        ):
+            assert service.load_and_prepare("u") is True
+
+        full.assert_not_called()
+        assert service.warm_started is True
+        mock_dependencies["GameManager"].return_value.games.update.assert_called_once_with(games)
+
+    def test_apply_refresh_patches_deltas(self, tmp_path, mock_dependencies):
+        """Only added, removed and changed games are reported; objects are updated in place."""
+        mock_dependencies["config"].DATA_DIR = tmp_path
+        service = self._service(tmp_path)
+        kept = Game(app_id="1", name="Same")
+        stale = Game(app_id="2", name="Old")
+        service.game_manager = Mock()
+        service.game_manager.games = {"1": kept, "2": stale, "3": Game(app_id="3", name="Gone")}
+        service.warm_started = True
+        service._snap_user = "u"
+
+        fresh = Mock()
+        fresh.game_manager.load_source = "api"
+        fresh.game_manager.games = {
+            "1": Game(app_id="1", name="Same"),
+            "2": Game(app_id="2", name="New"),
+            "4": Game(app_id="4", name="Added"),
+        }
+
+        changed = service.apply_refresh(fresh)
+
+        assert sorted(changed) == ["2", "3", "4"]
+        assert service.game_manager.games["1"] is kept
+        assert service.game_manager.games["2"] is stale
+        assert stale.name == "New"
+        assert "3" not in service.game_manager.games
+        assert service.warm_started is False
+        # written by refresh_warm_start() on the worker, not here
+        assert not service._snapshot().path.exists()
+
+    def test_apply_refresh_keeps_live_edits(self, tmp_path, mock_dependencies):
+        """Category, hidden and metadata edits made during the refresh survive the merge."""
+        mock_dependencies["config"].DATA_DIR = tmp_path
+        service = self._service(tmp_path)
+        cur = Game(app_id="1", name="Edited", categories=["Favorites"], hidden=True)
+        service.game_manager = Mock()
+        service.game_manager.games = {"1": cur}
+        service.appinfo_manager = Mock()
+        service.appinfo_manager.modifications = {"1": {"modified": {"name": "Edited"}}}
+        service.warm_started = True
+        service._snap_user = "u"
+
+        fresh = Mock()
+        fresh.game_manager.games = {"1": Game(app_id="1", name="Stale", review_percentage=90)}
+        fresh.game_manager.apply_custom_overrides.side_effect = lambda mods: setattr(
+            fresh.game_manager.games["1"], "name", mods["1"]["modified"]["name"]
+        )
+
+        assert service.apply_refresh(fresh) == ["1"]
+        assert cur.categories == ["Favorites"]
+        assert cur.hidden is True
+        assert cur.name == "Edited"
+        assert cur.review_percentage == 90
+
+    def test_refresh_uses_own_parsers(self, tmp_path, mock_dependencies):
+        """The background load reads its own parsers instead of sharing the live ones."""
+        mock_dependencies["config"].DATA_DIR = tmp_path
+        service = self._service(tmp_path)
+        service.localconfig_helper = Mock(config_path=tmp_path / "localconfig.vdf")
+        service.cloud_storage_parser.user_id = "u"
+        service.warm_started = True
+        service._snap_user = "u"
+        seen = {}
+
+        def load_full(fresh, *_args):
+            seen["lc"] = fresh.localconfig_helper
+            seen["cs"] = fresh.cloud_storage_parser
+            fresh.game_manager = Mock(games={"1": Game(app_id="1", name="Alpha")}, load_source="local")
+            return True
+
+        with patch.object(GameService, "_load_full", autospec=True, side_effect=load_full):
+            assert service.refresh_warm_start() is not None
+
+        assert seen["lc"] is mock_dependencies["LocalConfigHelper"].return_value
+        assert seen["cs"] is mock_dependencies["CloudStorageParser"].return_value
+        mock_dependencies["CloudStorageParser"].assert_called_once_with(str(tmp_path / "steam"), "u")
+        # the snapshot is written on the worker thread
+        assert service._snapshot().path.exists()
@@ -137,7 +137,7 @@ class TestLibraryHealthThread:
         mock_response = MagicMock()
         mock_response.status_code = 404
 
-        with patch("steam_library_manager.services.library_health_thread.requests.get", return_value=mock_response):
+        with patch("steam_library_manager.services.library_health_thread.http.get", return_value=mock_response):
             with patch("steam_library_manager.services.library_health_thread.time.sleep"):
                 results = thread._check_store_detail([440], {440: "TF2"})
 
@@ -160,7 +160,7 @@ class TestLibraryHealthThread:
         mock_response.url = "https://store.steampowered.com/agecheck/app/440/"
         mock_response.text = "<html>Age verification required</html>"
 
-        with patch("steam_library_manager.services.library_health_thread.requests.get", return_value=mock_response):
+        with patch("steam_library_manager.services.library_health_thread.http.get", return_value=mock_response):
             with patch("steam_library_manager.services.library_health_thread.time.sleep"):
                 results = thread._check_store_detail([440], {440: "TF2"})
 
@@ -181,7 +181,7 @@ class TestLibraryHealthThread:
         mock_response.url = "https://store.steampowered.com/app/440/"
         mock_response.text = "<html>This product is not available in your country</html>"
 
-        with patch("steam_library_manager.services.library_health_thread.requests.get", return_value=mock_response):
+        with patch("steam_library_manager.services.library_health_thread.http.get", return_value=mock_response):
             with patch("steam_library_manager.services.library_health_thread.time.sleep"):
                 results = thread._check_store_detail([440], {440: "TF2"})
 
@@ -202,7 +202,7 @@ class TestLibraryHealthThread:
         mock_response.url = "https://store.steampowered.com/"
         mock_response.text = "<html>Steam Store</html>"
 
-        with patch("steam_library_manager.services.library_health_thread.requests.get", return_value=mock_response):
+        with patch("steam_library_manager.services.library_health_thread.http.get", return_value=mock_response):
             with patch("steam_library_manager.services.library_health_thread.time.sleep"):
                 results = thread._check_store_detail([440], {440: "TF2"})
 
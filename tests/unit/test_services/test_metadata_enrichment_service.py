@@ -3,9 +3,10 @@
 """Tests for MetadataEnrichmentService."""
 
 import json
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from steam_library_manager.core.game import Game
+from steam_library_manager.core.response_cache import ResponseCache, response_cache
 from steam_library_manager.services.enrichment.metadata_enrichment_service import MetadataEnrichmentService
 
 
@@ -108,8 +109,8 @@ class TestApplyMetadataOverrides:
         service.apply_metadata_overrides(appinfo_manager)
 
 
-class TestGetCachedName:
-    """Tests for _get_cached_name."""
+class TestCachedNames:
+    """Tests for _cached_names."""
 
     def test_returns_cached_name(self, tmp_path):
         """Test that cached name is returned from store_data cache."""
@@ -121,16 +122,16 @@ class TestGetCachedName:
         cache_file = cache_dir / "440.json"
         cache_file.write_text(json.dumps({"name": "Team Fortress 2"}))
 
-        assert service._get_cached_name("440") == "Team Fortress 2"
+        assert service._cached_names(["440"]) == {"440": "Team Fortress 2"}
 
     def test_returns_none_for_missing_cache(self, tmp_path):
-        """Test that None is returned when cache file doesn't exist."""
+        """Test that nothing is returned when cache file doesn't exist."""
         games: dict[str, Game] = {}
         service = MetadataEnrichmentService(games, tmp_path)
-        assert service._get_cached_name("440") is None
+        assert service._cached_names(["440"]) == {}
 
     def test_returns_none_for_corrupt_cache(self, tmp_path):
-        """Test that None is returned for corrupted cache file."""
+        """Test that nothing is returned for corrupted cache file."""
         games: dict[str, Game] = {}
         service = MetadataEnrichmentService(games, tmp_path)
 
@@ -139,7 +140,7 @@ class TestGetCachedName:
         cache_file = cache_dir / "440.json"
         cache_file.write_text("not valid json{{{")
 
-        assert service._get_cached_name("440") is None
+        assert service._cached_names(["440"]) == {}
 
 
 class TestDiscoverFromDbLookup:
@@ -201,6 +202,38 @@ class TestDiscoverFromDbLookup:
         assert "200" not in games
 
 
+class TestDiscoverCachedNames:
+    """Tests for store-cache name resolution during discovery."""
+
+    def test_placeholder_names_resolved_in_one_query(self, tmp_path):
+        """Candidates without a real name share one batched cache lookup."""
+        games: dict[str, Game] = {}
+        service = MetadataEnrichmentService(games, tmp_path)
+        response_cache(tmp_path).put("store", "100", {"name": "Cached One"})
+        response_cache(tmp_path).put("store", "200", {"name": "Cached Two"})
+
+        localconfig = MagicMock()
+        localconfig.get_all_app_ids.return_value = ["100", "200", "300", "400"]
+
+        db_lookup = {
+            "100": ("game", "App 100"),
+            "200": ("game", ""),
+            "300": ("game", "Real Name"),
+            "400": ("game", "App 400"),
+        }
+
+        with patch.object(ResponseCache, "get_many", wraps=response_cache(tmp_path).get_many) as get_many:
+            count = service.discover_missing_games(localconfig, MagicMock(), db_type_lookup=db_lookup)
+
+        assert count == 4
+        assert games["100"].name == "Cached One"
+        assert games["200"].name == "Cached Two"
+        assert games["300"].name == "Real Name"
+        assert games["400"].name != ""
+        get_many.assert_called_once()
+        assert sorted(get_many.call_args.args[1]) == ["100", "200", "400"]
+
+
 class TestDiscoverFallbackToAppinfo:
     """Tests for discover_missing_games fallback when ID is not in DB."""
 
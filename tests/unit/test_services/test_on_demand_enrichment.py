@@ -9,13 +9,13 @@ apply functions from game_detail_enrichers.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from steam_library_manager.core.game import Game
+from steam_library_manager.core.response_cache import response_cache
 from steam_library_manager.services.game_detail_enrichers import (
     apply_achievement_data,
     apply_hltb_data,
@@ -32,7 +32,6 @@ def cache_dir(tmp_path: Path) -> Path:
     """Returns a temporary cache directory."""
     d = tmp_path / "cache"
     d.mkdir()
-    (d / "store_data").mkdir()
     return d
 
 
@@ -156,16 +155,15 @@ class TestFetchHltbData:
         assert games["100"].hltb_main_story == 15.0
 
     def test_loads_from_cache(self, service: GameDetailService, games: dict, cache_dir: Path) -> None:
-        """Loads HLTB data from JSON cache if available."""
-        cache_file = cache_dir / "store_data" / "100_hltb.json"
-        cache_file.write_text(
-            json.dumps(
-                {
-                    "main_story": 12.5,
-                    "main_extras": 18.0,
-                    "completionist": 25.0,
-                }
-            )
+        """Loads HLTB data from the response cache if available."""
+        response_cache(cache_dir).put(
+            "hltb",
+            "100",
+            {
+                "main_story": 12.5,
+                "main_extras": 18.0,
+                "completionist": 25.0,
+            },
         )
 
         service._fetch_hltb_data("100")
@@ -177,8 +175,7 @@ class TestFetchHltbData:
 
     def test_loads_no_data_from_cache(self, service: GameDetailService, games: dict, cache_dir: Path) -> None:
         """Cached 'no_data' result does not set HLTB fields."""
-        cache_file = cache_dir / "store_data" / "100_hltb.json"
-        cache_file.write_text(json.dumps({"no_data": True}))
+        response_cache(cache_dir).put("hltb", "100", {"no_data": True})
 
         service._fetch_hltb_data("100")
 
@@ -220,9 +217,8 @@ class TestFetchHltbData:
         assert games["100"].hltb_main_story == 0.0
         mock_persist.assert_not_called()
         # Should have cached no_data
-        cache_file = cache_dir / "store_data" / "100_hltb.json"
-        assert cache_file.exists()
-        data = json.loads(cache_file.read_text())
+        data = response_cache(cache_dir).get("hltb", "100")
+        assert data is not None
         assert data.get("no_data") is True
         assert "100" in service._hltb_checked
 
@@ -266,17 +262,16 @@ class TestFetchAchievementData:
         assert games["100"].achievement_total == 0
 
     def test_loads_from_cache(self, service: GameDetailService, games: dict, cache_dir: Path) -> None:
-        """Loads achievement data from JSON cache."""
-        cache_file = cache_dir / "store_data" / "100_achievements.json"
-        cache_file.write_text(
-            json.dumps(
-                {
-                    "total": 50,
-                    "unlocked": 25,
-                    "percentage": 50.0,
-                    "perfect": False,
-                }
-            )
+        """Loads achievement data from the response cache."""
+        response_cache(cache_dir).put(
+            "achievements",
+            "100",
+            {
+                "total": 50,
+                "unlocked": 25,
+                "percentage": 50.0,
+                "perfect": False,
+            },
         )
 
         service._fetch_achievement_data("100")
@@ -289,16 +284,15 @@ class TestFetchAchievementData:
 
     def test_loads_zero_total_from_cache(self, service: GameDetailService, games: dict, cache_dir: Path) -> None:
         """Cached total=0 means game has no achievements."""
-        cache_file = cache_dir / "store_data" / "100_achievements.json"
-        cache_file.write_text(
-            json.dumps(
-                {
-                    "total": 0,
-                    "unlocked": 0,
-                    "percentage": 0.0,
-                    "perfect": False,
-                }
-            )
+        response_cache(cache_dir).put(
+            "achievements",
+            "100",
+            {
+                "total": 0,
+                "unlocked": 0,
+                "percentage": 0.0,
+                "perfect": False,
+            },
         )
 
         service._fetch_achievement_data("100")
@@ -373,8 +367,7 @@ class TestFetchAchievementData:
 
         assert games["100"].achievement_total == 0
         mock_persist_stats.assert_called_once_with(100, 0, 0, 0.0, False)
-        cache_file = cache_dir / "store_data" / "100_achievements.json"
-        assert cache_file.exists()
+        assert response_cache(cache_dir).get("achievements", "100") is not None
         assert "100" in service._achievements_checked
 
     def test_skips_without_api_key(self, service: GameDetailService, games: dict) -> None:
@@ -0,0 +1,179 @@
+# tests/unit/test_services/test_smart_collection_compiler.py
+
+"""Tests for the compiled smart collection rules, plus a 10k x 50 benchmark."""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import datetime
+
+import pytest
+
+from steam_library_manager.core.game import Game
+from steam_library_manager.services.smart_collections.compiler import compile_collection, compile_rule
+from steam_library_manager.services.smart_collections.evaluator import SmartCollectionEvaluator
+from steam_library_manager.services.smart_collections.models import (
+    FilterField,
+    LogicOperator,
+    Operator,
+    SmartCollection,
+    SmartCollectionRule,
+    SmartCollectionRuleGroup,
+)
+
+
+def _ts(year: int, month: int = 1, day: int = 1, hour: int = 0) -> int:
+    return int(datetime(year, month, day, hour).timestamp())
+
+
+def _year_rule(op: Operator, value: str, value_max: str = "") -> SmartCollectionRule:
+    return SmartCollectionRule(field=FilterField.RELEASE_YEAR, operator=op, value=value, value_max=value_max)
+
+
+class TestReleaseYearBounds:
+    """Year comparisons on timestamps use precomputed bounds."""
+
+    @pytest.mark.parametrize(
+        "op, value, value_max, ts, expected",
+        [
+            (Operator.EQUALS, "2015", "", _ts(2015, 1, 1), True),
+            (Operator.EQUALS, "2015", "", _ts(2015, 12, 31, 23), True),
+            (Operator.EQUALS, "2015", "", _ts(2016, 1, 1), False),
+            (Operator.EQUALS, "2015.5", "", _ts(2015, 6, 1), False),
+            (Operator.GREATER_THAN, "2015", "", _ts(2015, 12, 31, 23), False),
+            (Operator.GREATER_THAN, "2015", "", _ts(2016, 1, 1), True),
+            (Operator.GREATER_EQUAL, "2014.5", "", _ts(2015, 1, 1), True),
+            (Operator.LESS_THAN, "2015", "", _ts(2014, 12, 31, 23), True),
+            (Operator.LESS_THAN, "2015", "", _ts(2015, 1, 1), False),
+            (Operator.LESS_EQUAL, "2015", "", _ts(2015, 12, 31, 23), True),
+            (Operator.BETWEEN, "2020", "2010", _ts(2010, 1, 1), True),
+            (Operator.BETWEEN, "2010", "2020", _ts(2021, 1, 1), False),
+        ],
+    )
+    def test_timestamp_bounds(self, op, value, value_max, ts, expected) -> None:
+        """Boundaries fall exactly on local New Year, like year_from_timestamp."""
+        pred = compile_rule(_year_rule(op, value, value_max))
+        assert pred(Game(app_id="1", name="x", release_year=ts)) is expected
+
+    def test_plain_year_value(self) -> None:
+        """Values that are already years are compared directly."""
+        pred = compile_rule(_year_rule(Operator.EQUALS, "2009"))
+        assert pred(Game(app_id="1", name="x", release_year="2009"))
+        assert pred(Game(app_id="1", name="x", release_year=2009))
+
+    def test_invalid_target_never_matches(self) -> None:
+        """An unparsable target is rejected at compile time."""
+        pred = compile_rule(_year_rule(Operator.GREATER_THAN, "abc"))
+        assert not pred(Game(app_id="1", name="x", release_year=_ts(2015)))
+
+
+class TestCompiledCollection:
+    """Tests for compile_collection and the evaluator cache."""
+
+    def test_empty_group_never_matches(self) -> None:
+        """A group without rules fails, as before compilation."""
+        col = SmartCollection(
+            logic=LogicOperator.OR,
+            groups=[SmartCollectionRuleGroup(logic=LogicOperator.AND, rules=())],
+        )
+        assert not compile_collection(col)(Game(app_id="1", name="x"))
+
+    def test_evaluator_reuses_compiled_rules(self) -> None:
+        """Collections with equal rules share one compiled predicate."""
+        ev = SmartCollectionEvaluator()
+        rule = SmartCollectionRule(field=FilterField.NAME, operator=Operator.CONTAINS, value="lego")
+        a = SmartCollection(name="A", rules=[rule])
+        b = SmartCollection(name="B", rules=[rule])
+
+        assert ev.compiled(a) is ev.compiled(b)
+
+    def test_edited_rules_recompile(self) -> None:
+        """Changing a collection's rules is picked up on the next call."""
+        ev = SmartCollectionEvaluator()
+        game = Game(app_id="1", name="LEGO Batman")
+        col = SmartCollection(rules=[SmartCollectionRule(FilterField.NAME, Operator.CONTAINS, "lego")])
+        assert ev.evaluate(game, col)
+
+        col.rules = [SmartCollectionRule(FilterField.NAME, Operator.CONTAINS, "doom")]
+        assert not ev.evaluate(game, col)
+
+
+# ========================================================================
+# BENCHMARK
+# ========================================================================
+
+_TAGS = ["Action", "RPG", "Indie", "Horror", "LEGO", "Puzzle", "Co-op", "Strategy", "Roguelike", "Sci-Fi"]
+
+
+def _synthetic_games(n: int) -> list[Game]:
+    rnd = random.Random(42)
+    return [
+        Game(
+            app_id=str(10 + i),
+            name="Game %d %s" % (i, rnd.choice(_TAGS)),
+            tags=rnd.sample(_TAGS, rnd.randint(0, 4)),
+            genres=rnd.sample(_TAGS, rnd.randint(0, 2)),
+            developer=rnd.choice(["Valve", "id Software", "Capcom", ""]),
+            release_year=_ts(rnd.randint(1995, 2025), rnd.randint(1, 12), rnd.randint(1, 28)),
+            playtime_minutes=rnd.randint(0, 6000),
+            review_percentage=rnd.randint(0, 100),
+            installed=rnd.random() < 0.3,
+            steam_deck_status=rnd.choice(["verified", "playable", "unsupported", ""]),
+        )
+        for i in range(n)
+    ]
+
+
+def _synthetic_collections(n: int) -> list[SmartCollection]:
+    rnd = random.Random(7)
+    cols = []
+    for i in range(n):
+        lo = rnd.randint(1995, 2020)
+        rules = [
+            SmartCollectionRule(FilterField.TAG, Operator.CONTAINS, rnd.choice(_TAGS).lower()),
+            SmartCollectionRule(FilterField.RELEASE_YEAR, Operator.BETWEEN, str(lo), str(lo + 5)),
+            SmartCollectionRule(FilterField.NAME, Operator.REGEX, r"^game \d+ (%s)" % rnd.choice(_TAGS)),
+            SmartCollectionRule(FilterField.PLAYTIME_HOURS, Operator.GREATER_THAN, str(rnd.randint(0, 50))),
+            SmartCollectionRule(FilterField.INSTALLED, Operator.IS_TRUE, negated=rnd.random() < 0.5),
+        ]
+        rnd.shuffle(rules)
+        cols.append(
+            SmartCollection(
+                name="Collection %d" % i,
+                logic=rnd.choice(list(LogicOperator)),
+                groups=[
+                    SmartCollectionRuleGroup(logic=LogicOperator.AND, rules=tuple(rules[:2])),
+                    SmartCollectionRuleGroup(logic=LogicOperator.OR, rules=tuple(rules[2:])),
+                ],
+            )
+        )
+    return cols
+
+
+class TestBenchmark:
+    """10k synthetic games x 50 collections, the shape refresh() evaluates."""
+
+    def test_10k_games_50_collections(self) -> None:
+        """Every collection is evaluated over the whole library in well under a few seconds."""
+        games = _synthetic_games(10_000)
+        cols = _synthetic_collections(50)
+        ev = SmartCollectionEvaluator()
+
+        start = time.perf_counter()
+        results = {c.name: ev.evaluate_batch(games, c) for c in cols}
+        elapsed = time.perf_counter() - start
+
+        assert len(results) == 50
+        assert any(results.values())
+        # generous bound, only catches a return to per-game rule parsing
+        assert elapsed < 10.0
+
+    def test_tag_contains_matches_reference(self) -> None:
+        """The compiled form agrees with a direct check over the same games."""
+        games = _synthetic_games(2_000)
+        col = SmartCollection(rules=[SmartCollectionRule(FilterField.TAG, Operator.CONTAINS, "rog")])
+
+        got = SmartCollectionEvaluator().evaluate_batch(games, col)
+
+        assert got == [g for g in games if any("rog" in t.lower() for t in g.tags)]
@@ -9,6 +9,7 @@ from unittest.mock import Mock
 import pytest
 
 from steam_library_manager.core.game import Game
+from steam_library_manager.services.game_change_log import GameChangeLog
 from steam_library_manager.services.smart_collections.models import (
     FilterField,
     LogicOperator,
@@ -77,6 +78,7 @@ def mock_category_service() -> Mock:
     cs = Mock()
     cs.add_app_to_category.return_value = True
     cs.remove_app_from_category.return_value = True
+    cs.apply_category_changes.return_value = True
     return cs
 
 
@@ -131,7 +133,9 @@ class TestCreate:
         manager.create(collection)
 
         # Should sync games that match (100 and 200 have "Action" tag)
-        assert mock_category_service.add_app_to_category.call_count >= 1
+        mock_category_service.apply_category_changes.assert_called_once_with(
+            add={"Action": ["100", "200"]}, remove=None
+        )
 
     def test_create_no_sync_when_disabled(self, manager: SmartCollectionManager, mock_category_service: Mock) -> None:
         """Tests that create skips sync when auto_sync is False."""
@@ -141,7 +145,7 @@ class TestCreate:
             rules=[SmartCollectionRule(FilterField.TAG, Operator.CONTAINS, "Action")],
         )
         manager.create(collection)
-        mock_category_service.add_app_to_category.assert_not_called()
+        mock_category_service.apply_category_changes.assert_not_called()
 
 
 # ========================================================================
@@ -351,7 +355,9 @@ class TestSync:
         collection = SmartCollection(name="SyncTest")
         manager.sync_to_steam(collection, ["100", "200"])
 
-        assert mock_category_service.add_app_to_category.call_count == 2
+        mock_category_service.apply_category_changes.assert_called_once_with(
+            add={"SyncTest": ["100", "200"]}, remove=None
+        )
 
     def test_sync_removes_stale_games(
         self, manager: SmartCollectionManager, mock_category_service: Mock, mock_game_manager: Mock
@@ -366,7 +372,7 @@ class TestSync:
         # Only 100 matches now
         manager.sync_to_steam(collection, ["100"])
 
-        mock_category_service.remove_app_from_category.assert_called_once_with("200", "SyncTest")
+        mock_category_service.apply_category_changes.assert_called_once_with(add=None, remove={"SyncTest": ["200"]})
 
     def test_sync_no_category_service(self, mock_db: Mock, mock_game_manager: Mock) -> None:
         """Tests that sync does nothing without category service."""
@@ -407,6 +413,93 @@ class TestRefresh:
         assert result == {}
 
 
+# ========================================================================
+# TESTS: INCREMENTAL UPDATES
+# ========================================================================
+
+_ACTION_ROW = {
+    "collection_id": 1,
+    "name": "Action",
+    "rules": '{"logic": "OR", "rules": [{"field": "tag", "operator": "contains", "value": "Action"}]}',
+    "created_at": 0,
+}
+
+
+@pytest.fixture
+def tracked(manager: SmartCollectionManager, mock_db: Mock, mock_game_manager: Mock) -> GameChangeLog:
+    """Gives the manager a real change log and one collection holding 100 and 200."""
+    games = {g.app_id: g for g in mock_game_manager.get_real_games()}
+    mock_game_manager.get_game.side_effect = games.get
+    mock_game_manager.changes = GameChangeLog()
+    mock_db.get_all_smart_collections.return_value = [_ACTION_ROW]
+    mock_db.get_smart_collection_games.return_value = [100, 200]
+    return mock_game_manager.changes
+
+
+class TestApplyChanges:
+    """Tests for re-evaluating only what changed."""
+
+    def test_new_match_is_added(
+        self, manager: SmartCollectionManager, mock_db: Mock, mock_game_manager: Mock, tracked: GameChangeLog
+    ) -> None:
+        """A tag edit adds just that game, without repopulating the collection."""
+        sims = mock_game_manager.get_game("300")
+        sims.tags.append("Action")
+        tracked.note("300", "tags")
+
+        assert manager.apply_changes() == {"Action": (1, 0)}
+        mock_db.update_smart_collection_games.assert_called_once_with(1, [300], [])
+        mock_db.populate_smart_collection.assert_not_called()
+
+    def test_lost_match_is_removed_and_synced(
+        self,
+        manager: SmartCollectionManager,
+        mock_db: Mock,
+        mock_game_manager: Mock,
+        mock_category_service: Mock,
+        tracked: GameChangeLog,
+    ) -> None:
+        """A game that stops matching leaves the collection and its Steam category."""
+        lego = mock_game_manager.get_game("100")
+        lego.categories.append("Action")
+        lego.tags = ["LEGO"]
+        tracked.note("100", "tags")
+
+        assert manager.apply_changes() == {"Action": (0, 1)}
+        mock_db.update_smart_collection_games.assert_called_once_with(1, [], [100])
+        mock_category_service.apply_category_changes.assert_called_once_with(add=None, remove={"Action": ["100"]})
+
+    def test_unrelated_field_is_skipped(
+        self, manager: SmartCollectionManager, mock_db: Mock, tracked: GameChangeLog
+    ) -> None:
+        """Changes to fields the rules don't read never touch the collection."""
+        tracked.note("300", "hltb_main_story")
+
+        assert manager.apply_changes() == {}
+        mock_db.get_smart_collection_games.assert_not_called()
+        mock_db.update_smart_collection_games.assert_not_called()
+
+    def test_removed_game_leaves(
+        self, manager: SmartCollectionManager, mock_db: Mock, mock_game_manager: Mock, tracked: GameChangeLog
+    ) -> None:
+        """A game that is gone from the library is dropped."""
+        mock_game_manager.get_real_games.return_value = mock_game_manager.get_real_games()[1:]
+        tracked.note_game("100")
+
+        assert manager.apply_changes() == {"Action": (0, 1)}
+        mock_db.update_smart_collection_games.assert_called_once_with(1, [], [100])
+
+    def test_refresh_clears_pending(
+        self, manager: SmartCollectionManager, mock_db: Mock, tracked: GameChangeLog
+    ) -> None:
+        """A full refresh covers everything that was pending."""
+        tracked.note("300", "tags")
+        manager.refresh()
+
+        assert not tracked
+        assert manager.apply_changes() == {}
+
+
 class TestExcludeList:
     """Tests for Smart Collection exclude list."""
 
@@ -0,0 +1,180 @@
+# tests/unit/test_services/test_smart_collection_sql.py
+
+"""Conformance tests: the SQL backend selects what the Python evaluator selects."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from steam_library_manager.core.database import Database
+from steam_library_manager.core.db.models import DatabaseEntry
+from steam_library_manager.core.game import Game
+from steam_library_manager.core.game_manager import GameManager
+from steam_library_manager.services.smart_collections.models import (
+    FilterField,
+    LogicOperator,
+    Operator,
+    SmartCollection,
+    SmartCollectionRule,
+    SmartCollectionRuleGroup,
+)
+from steam_library_manager.services.smart_collections.smart_collection_manager import SmartCollectionManager
+from steam_library_manager.services.smart_collections.sql_compiler import (
+    SQL_FIELDS,
+    compile_collection_sql,
+    query_collection,
+)
+
+_NAMES = ["LEGO Batman", "Doom", "Ökosystem", "İstanbul Nights", "Hades II", "the [bracket] game", "ABC"]
+_TAGS = ["Action", "RPG", "Indie", "Horror", "LEGO", "Échecs"]
+_PLATFORMS = ["windows", "linux", "mac"]
+_LANGS = ["english", "german", "türkçe"]
+_VALUES = ["", "a", "action", "rpg", "^l", "[", "ö", "i̇", "2015", "1999.5", "abc", "50", "0", "verified", "gold", "e$"]
+
+
+def _ts(year: int, month: int = 1, day: int = 1) -> int:
+    return int(datetime(year, month, day).timestamp())
+
+
+def _entry(rnd: random.Random, aid: int) -> DatabaseEntry:
+    return DatabaseEntry(
+        app_id=aid,
+        name=rnd.choice(_NAMES),
+        app_type=rnd.choice(["game", "", "Game", "tool"]),
+        developer=rnd.choice([None, "", "Valve", "id Software"]),
+        publisher=rnd.choice([None, "Bethesda", "Capcom"]),
+        release_date=rnd.choice([None, 0, -5, 2009, _ts(rnd.randint(1990, 2025), rnd.randint(1, 12))]),
+        steam_release_date=rnd.choice([None, 0, _ts(2015, 12, 31)]),
+        original_release_date=rnd.choice([None, _ts(1999)]),
+        review_percentage=rnd.choice([None, 0, rnd.randint(1, 100)]),
+        review_count=rnd.choice([None, 0, rnd.randint(1, 5000)]),
+        achievements_total=rnd.choice([0, 0, 12]),
+        platforms=rnd.sample(_PLATFORMS, rnd.randint(0, 3)),
+        genres=rnd.sample(_TAGS, rnd.randint(0, 2)),
+        tags=rnd.sample(_TAGS, rnd.randint(0, 3)),
+        languages={lang: {"interface": rnd.random() < 0.5} for lang in rnd.sample(_LANGS, rnd.randint(0, 2))},
+        steam_deck_status=rnd.choice(["", "verified", "Playable"]),
+    )
+
+
+@pytest.fixture
+def library(tmp_path: Path):
+    """A generated metadata.db plus the games GameManager loads from it."""
+    rnd = random.Random(5)
+    db = Database(tmp_path / "metadata.db")
+    ids = list(range(10, 310))
+    db.batch_insert_games([_entry(rnd, aid) for aid in ids])
+
+    for aid in ids:
+        if rnd.random() < 0.3:
+            db.conn.execute("UPDATE game_tags SET tag_id = 19 + (rowid % 3) WHERE app_id = ?", (aid,))
+        if rnd.random() < 0.4:
+            db.conn.execute(
+                "INSERT INTO hltb_data (app_id, main_story, main_extras, completionist) VALUES (?, ?, 0, 0)",
+                (aid, rnd.choice([None, 0.0, 12.5, 50.0])),
+            )
+        if rnd.random() < 0.4:
+            db.upsert_protondb(aid, rnd.choice(["gold", "platinum", "borked"]))
+        if rnd.random() < 0.4:
+            pct = rnd.choice([0.0, 33.33, 100.0])
+            db.upsert_achievement_stats(aid, 30, int(pct * 0.3), pct, pct == 100.0)
+    db.commit()
+
+    gm = GameManager(None, tmp_path / "cache", tmp_path)
+    gm.games.update({str(aid): Game(app_id=str(aid), name="") for aid in ids})
+    gm.enrich_from_database(db)
+    yield db, list(gm.games.values())
+    db.close()
+
+
+def _random_rule(rnd: random.Random) -> SmartCollectionRule:
+    return SmartCollectionRule(
+        field=rnd.choice(sorted(SQL_FIELDS, key=lambda f: f.value)),
+        operator=rnd.choice(list(Operator)),
+        value=rnd.choice(_VALUES),
+        value_max=rnd.choice(_VALUES),
+        negated=rnd.random() < 0.3,
+        tag_id=rnd.choice([None, 19, 20]),
+    )
+
+
+class TestConformance:
+    """Membership must be identical on generated libraries."""
+
+    def test_single_rules(self, library) -> None:
+        """Every field/operator pair agrees with the Python evaluator."""
+        db, games = library
+        manager = SmartCollectionManager(db, game_manager=None)
+        for fld in SQL_FIELDS:
+            for op in Operator:
+                for value in _VALUES:
+                    col = SmartCollection(rules=[SmartCollectionRule(fld, op, value, "2020", tag_id=19)])
+                    expected = manager.evaluate_collection(col, games)
+                    assert manager.evaluate_collection(col, games, backend="sql") == expected, (fld, op, value)
+
+    def test_release_year_edges(self, library) -> None:
+        """New Year boundaries and plain years behave like year_from_timestamp."""
+        db, games = library
+        manager = SmartCollectionManager(db, game_manager=None)
+        for op in (Operator.EQUALS, Operator.GREATER_THAN, Operator.LESS_EQUAL, Operator.BETWEEN):
+            for value in ("1999", "2009", "2015", "2015.5", "2016", "0", "-3"):
+                col = SmartCollection(rules=[SmartCollectionRule(FilterField.RELEASE_YEAR, op, value, "2009")])
+                expected = manager.evaluate_collection(col, games)
+                assert manager.evaluate_collection(col, games, backend="sql") == expected, (op, value)
+
+    def test_random_collections(self, library) -> None:
+        """Randomized groups, negation and exclusions agree."""
+        db, games = library
+        manager = SmartCollectionManager(db, game_manager=None)
+        rnd = random.Random(9)
+        for _ in range(300):
+            groups = [
+                SmartCollectionRuleGroup(
+                    logic=rnd.choice(list(LogicOperator)),
+                    rules=tuple(_random_rule(rnd) for _ in range(rnd.randint(0, 3))),
+                )
+                for _ in range(rnd.randint(1, 3))
+            ]
+            col = SmartCollection(
+                logic=rnd.choice(list(LogicOperator)),
+                groups=groups,
+                excluded_app_ids=set(rnd.sample(range(10, 310), 5)),
+            )
+            expected = manager.evaluate_collection(col, games)
+            assert manager.evaluate_collection(col, games, backend="sql") == expected
+
+
+class TestPushdownLimits:
+    """Collections the database can't answer."""
+
+    def test_category_is_not_pushed_down(self) -> None:
+        """Steam categories only exist in cloud storage."""
+        col = SmartCollection(rules=[SmartCollectionRule(FilterField.CATEGORY, Operator.EQUALS, "Favorites")])
+        assert compile_collection_sql(col) is None
+
+    def test_infinite_target_is_not_pushed_down(self) -> None:
+        """inf/nan targets keep Python's comparison semantics."""
+        col = SmartCollection(rules=[SmartCollectionRule(FilterField.REVIEW_COUNT, Operator.LESS_THAN, "inf")])
+        assert compile_collection_sql(col) is None
+
+    def test_manager_falls_back_to_python(self, library) -> None:
+        """The sql backend evaluates in Python when it has to."""
+        db, games = library
+        games[0].installed = True
+        manager = SmartCollectionManager(db, game_manager=None)
+        col = SmartCollection(rules=[SmartCollectionRule(FilterField.INSTALLED, Operator.IS_TRUE)])
+
+        assert manager.evaluate_collection(col, games, backend="sql") == [games[0]]
+
+    def test_headless_query(self, library) -> None:
+        """query_collection needs nothing but the connection."""
+        db, games = library
+        col = SmartCollection(rules=[SmartCollectionRule(FilterField.PROTONDB, Operator.EQUALS, "GOLD")])
+
+        ids = query_collection(db.conn, col)
+
+        assert sorted(ids) == sorted(int(g.app_id) for g in games if g.proton_db_rating == "gold")
@@ -0,0 +1,89 @@
+"""
+Unit tests for CategoryChangeHandler.
+
+Checkbox and drag-and-drop edits go through CategoryService, so the
+change log and the category index see every one of them.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from steam_library_manager.core.game_manager import Game, GameManager
+from steam_library_manager.services.category_service import CategoryService
+from steam_library_manager.ui.handlers.category_change_handler import CategoryChangeHandler
+
+
+@pytest.fixture
+def mock_main_window(tmp_path):
+    """MainWindow mock with a real GameManager and CategoryService."""
+    mw = MagicMock()
+    gm = GameManager(None, tmp_path / "cache", tmp_path)
+    for aid in ("1", "2"):
+        gm.games[aid] = Game(app_id=aid, name="Game %s" % aid)
+    gm.games["2"].categories = ["RPG"]
+    mw.game_manager = gm
+    mw.category_service = CategoryService(None, MagicMock(), gm)
+    mw.smart_collection_manager = None
+    mw.current_search_query = ""
+    return mw
+
+
+@pytest.fixture
+def handler(mock_main_window):
+    return CategoryChangeHandler(mock_main_window)
+
+
+def test_checkbox_add_is_logged(handler, mock_main_window):
+    """Checking a category logs the game and updates the index."""
+    gm = mock_main_window.game_manager
+    games = [gm.games["1"], gm.games["2"]]
+
+    handler.apply_category_to_games(games, "Action", True)
+
+    assert all("Action" in g.categories for g in games)
+    assert gm.changes.drain() == {"1": {"categories"}, "2": {"categories"}}
+    assert [g.app_id for g in gm.get_games_by_category("Action")] == ["1", "2"]
+
+
+def test_checkbox_remove_is_logged(handler, mock_main_window):
+    """Unchecking a category logs the game and drops it from the index."""
+    gm = mock_main_window.game_manager
+    assert gm.get_games_by_category("RPG") == [gm.games["2"]]
+
+    handler.apply_category_to_games([gm.games["2"]], "RPG", False)
+
+    assert gm.games["2"].categories == []
+    assert gm.changes.drain() == {"2": {"categories"}}
+    assert gm.get_games_by_category("RPG") == []
+
+
+def test_drop_is_logged(handler, mock_main_window):
+    """Dropping games onto a category logs each one."""
+    gm = mock_main_window.game_manager
+
+    handler.on_games_dropped([gm.games["1"]], "Favorites")
+
+    assert gm.games["1"].categories == ["Favorites"]
+    assert gm.changes.drain() == {"1": {"categories"}}
+
+
+@pytest.mark.parametrize("auto_sync", [False, True])
+def test_smart_collection_uncheck_updates_index(handler, mock_main_window, auto_sync):
+    """Unchecking a smart collection excludes the game and drops it from the category index."""
+    gm = mock_main_window.game_manager
+    cat_svc = mock_main_window.category_service
+    game = gm.games["2"]
+    sc = MagicMock(collection_id=7, auto_sync=auto_sync)
+    sc_mgr = MagicMock()
+    sc_mgr.get_by_name.return_value = sc
+    if auto_sync:
+        sc_mgr.exclude_game.side_effect = lambda cid, aid: cat_svc.remove_app_from_category(str(aid), "RPG")
+    mock_main_window.smart_collection_manager = sc_mgr
+    assert gm.get_games_by_category("RPG") == [game]
+
+    handler.apply_category_to_games([game], "RPG", False)
+
+    sc_mgr.exclude_game.assert_called_once_with(7, 2)
+    assert game.categories == []
+    assert gm.get_games_by_category("RPG") == []
+    assert gm.changes.drain() == {"2": {"categories"}}
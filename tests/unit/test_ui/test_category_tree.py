@@ -0,0 +1,272 @@
+"""Tests for the sidebar tree (GameTreeWidget, CategoryTreeModel, CategoryPopulator)."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PyQt6.QtCore import QPersistentModelIndex, Qt
+
+from steam_library_manager.core.game import Game
+from steam_library_manager.utils.i18n import t
+
+
+def _cat_index(tree, key):
+    return tree.model().category_index(key)
+
+
+def _names(tree, key) -> list[str]:
+    """Game names below a category (loads its rows)."""
+    m = tree.model()
+    idx = _cat_index(tree, key)
+    m.load_all(idx)
+    return [m.index(i, 0, idx).data() for i in range(m.rowCount(idx))]
+
+
+@pytest.fixture
+def tree(qtbot):
+    """A GameTreeWidget that never touches the real config file."""
+    from steam_library_manager.ui.widgets.category_tree import GameTreeWidget
+
+    with patch("steam_library_manager.ui.widgets.category_tree.config") as cfg:
+        cfg.EXPANDED_CATEGORIES = []
+        widget = GameTreeWidget()
+        qtbot.addWidget(widget)
+        yield widget
+
+
+class TestCategoryTreeModel:
+    """Tests for lazy rows and on-demand data."""
+
+    def test_collapsed_categories_have_no_rows(self, tree) -> None:
+        """Game rows only exist after a category is expanded."""
+        games = [Game(app_id=str(i), name="G%d" % i) for i in range(1000)]
+        tree.populate_categories({"Action": games, "RPG": games[:3]})
+        m = tree.model()
+        action = _cat_index(tree, "Action")
+
+        assert m.rowCount(action) == 0
+        assert m.hasChildren(action) is True
+        assert m.canFetchMore(action) is True
+        assert action.data() == t("categories.category_count", name="Action", count=1000)
+
+        tree.setExpanded(action, True)
+
+        assert m.rowCount(action) == 1000
+        assert m.rowCount(_cat_index(tree, "RPG")) == 0
+
+    def test_expanded_categories_are_restored(self, qtbot) -> None:
+        """Categories remembered in config load their rows on populate."""
+        from steam_library_manager.ui.widgets.category_tree import GameTreeWidget
+
+        with patch("steam_library_manager.ui.widgets.category_tree.config") as cfg:
+            cfg.EXPANDED_CATEGORIES = ["RPG"]
+            widget = GameTreeWidget()
+            qtbot.addWidget(widget)
+            widget.populate_categories({"Action": [Game(app_id="1", name="A")], "RPG": [Game(app_id="2", name="B")]})
+
+            m = widget.model()
+            assert m.rowCount(_cat_index(widget, "RPG")) == 1
+            assert m.rowCount(_cat_index(widget, "Action")) == 0
+
+    def test_game_row_data(self, tree) -> None:
+        """Roles and tooltip are computed from the Game on request."""
+        g = Game(app_id="1", name="Portal", developer="Valve")
+        tree.populate_categories({"Action": [g]})
+        m = tree.model()
+        cat = _cat_index(tree, "Action")
+        m.load_all(cat)
+        row = m.index(0, 0, cat)
+
+        assert row.data() == "Portal"
+        assert row.data(Qt.ItemDataRole.UserRole) == "game"
+        assert row.data(Qt.ItemDataRole.UserRole + 1) is g
+        assert row.data(Qt.ItemDataRole.ToolTipRole) == t("categories.game_tooltip", name="Portal", developer="Valve")
+        assert row.parent() == cat
+        assert cat.data(Qt.ItemDataRole.UserRole) == "category"
+        assert cat.data(Qt.ItemDataRole.UserRole + 1) == "Action"
+
+    def test_duplicate_nodes_keep_real_name(self, tree) -> None:
+        """Duplicate collections show an indicator but report the real name."""
+        tree.populate_categories({"__dup__RPG__0": []}, duplicate_info={"__dup__RPG__0": ("RPG", 1, 2)})
+        cat = _cat_index(tree, "__dup__RPG__0")
+
+        assert cat.data(Qt.ItemDataRole.UserRole + 1) == "RPG"
+        assert cat.data(Qt.ItemDataRole.UserRole + 2) == "__dup__RPG__0"
+
+    def test_loading_placeholder(self, tree) -> None:
+        """The loading row is a single disabled entry."""
+        tree.set_loading_state(True)
+        m = tree.model()
+
+        assert m.rowCount() == 1
+        assert m.index(0, 0).data() == t("common.loading")
+        assert m.flags(m.index(0, 0)) == Qt.ItemFlag.NoItemFlags
+
+        tree.set_loading_state(False)
+        assert m.rowCount() == 0
+
+
+class TestGameTreeUpdate:
+    """Tests for GameTreeWidget.update_categories."""
+
+    def test_unchanged_nodes_are_kept(self, tree) -> None:
+        """Same layout patches only the category whose games changed."""
+        a, b, c = Game(app_id="1", name="A"), Game(app_id="2", name="B"), Game(app_id="3", name="C")
+        tree.populate_categories({"Action": [a, b], "RPG": [c]})
+        tree.setExpanded(_cat_index(tree, "Action"), True)
+        kept = QPersistentModelIndex(tree.model().index(0, 0, _cat_index(tree, "Action")))
+
+        assert tree.update_categories({"Action": [a, b], "RPG": [a, c]}) is True
+
+        assert kept.isValid()
+        assert _names(tree, "RPG") == ["A", "C"]
+        assert _cat_index(tree, "RPG").data() == t("categories.category_count", name="RPG", count=2)
+
+    def test_expanded_node_is_reloaded(self, tree) -> None:
+        """A changed, expanded category shows its new games right away."""
+        a, b = Game(app_id="1", name="A"), Game(app_id="2", name="B")
+        tree.populate_categories({"Action": [a, b]})
+        cat = _cat_index(tree, "Action")
+        tree.setExpanded(cat, True)
+
+        tree.update_categories({"Action": [b]})
+
+        m = tree.model()
+        assert m.rowCount(cat) == 1
+        assert m.index(0, 0, cat).data(Qt.ItemDataRole.UserRole + 1) is b
+
+    def test_layout_change_rebuilds(self, tree) -> None:
+        """A new category falls back to a full rebuild."""
+        a = Game(app_id="1", name="A")
+        tree.populate_categories({"Action": [a]})
+
+        assert tree.update_categories({"Action": [a], "New": []}) is False
+        assert tree.model().rowCount() == 2
+        assert tree.has_category("New")
+
+    def test_partial_rejects_unknown_nodes(self, tree) -> None:
+        """Partial updates only patch nodes that already exist."""
+        tree.populate_categories({"Action": []})
+
+        assert tree.update_categories({"Missing": []}, partial=True) is False
+        assert tree.update_categories({"Action": [Game(app_id="1", name="A")]}, partial=True) is True
+        assert _names(tree, "Action") == ["A"]
+
+    def test_clear_forgets_nodes(self, tree) -> None:
+        """After clear() nothing can be patched in place."""
+        tree.populate_categories({"Action": []})
+        tree.clear()
+
+        assert not tree.has_category("Action")
+
+
+class TestGameTreeSelection:
+    """Tests for selection helpers and signals."""
+
+    def test_select_all_in_category(self, tree, qtbot) -> None:
+        """Selecting a category's games loads and emits all of them."""
+        games = [Game(app_id=str(i), name="G%d" % i) for i in range(5)]
+        tree.populate_categories({"Action": games, "RPG": games[:1]})
+
+        with qtbot.waitSignal(tree.selection_changed) as sig:
+            tree.select_all_in_categories(["Action"])
+
+        assert sorted(g.app_id for g in sig.args[0]) == ["0", "1", "2", "3", "4"]
+
+    def test_select_games_by_id(self, tree) -> None:
+        """select_games marks every loaded row of the given ids."""
+        a, b = Game(app_id="1", name="A"), Game(app_id="2", name="B")
+        tree.populate_categories({"Action": [a, b], "RPG": [a]})
+        tree.setExpanded(_cat_index(tree, "Action"), True)
+        tree.setExpanded(_cat_index(tree, "RPG"), True)
+
+        tree.select_games(["1"])
+
+        picked = [i.data(Qt.ItemDataRole.UserRole + 1) for i in tree.selectionModel().selectedIndexes()]
+        assert picked == [a, a]
+
+
+class TestCategoryPopulatorPatch:
+    """Tests for CategoryPopulator.populate(changed=...)."""
+
+    @staticmethod
+    def _window(tree, games):
+        mw = MagicMock()
+        mw.tree = tree
+        mw.cloud_storage_parser = None
+        mw.localconfig_helper = None
+        mw.smart_collection_manager = None
+
+        gm = mw.game_manager
+        gm.games = {g.app_id: g for g in games}
+        gm.get_library_entries.side_effect = lambda: list(games)
+        gm.get_games_by_category.side_effect = lambda c: [g for g in games if c in g.categories]
+        gm.get_favorites.side_effect = lambda: [g for g in games if g.is_favorite()]
+        gm.get_uncategorized_games.side_effect = lambda sc=None: [g for g in games if not g.categories]
+
+        def all_cats():
+            counts = {}
+            for g in games:
+                for c in g.categories:
+                    counts[c] = counts.get(c, 0) + 1
+            return counts
+
+        gm.get_all_categories.side_effect = all_cats
+        mw.filter_service.apply.side_effect = lambda gs: list(gs)
+        mw.filter_service.sort_games.side_effect = lambda gs: sorted(gs, key=lambda g: g.name)
+        return mw
+
+    def test_changed_category_is_patched(self, tree) -> None:
+        """Moving a game patches its category and Uncategorized only."""
+        from steam_library_manager.ui.handlers.category_populator import CategoryPopulator
+
+        a = Game(app_id="1", name="A", categories=["Action"])
+        b = Game(app_id="2", name="B", categories=["RPG"])
+        c = Game(app_id="3", name="C")
+        d = Game(app_id="4", name="D")
+        mw = self._window(tree, [a, b, c, d])
+        pop = CategoryPopulator(mw)
+        pop.populate()
+
+        c.categories.append("RPG")
+        with patch.object(tree, "populate_categories") as rebuild:
+            pop.populate(changed={"RPG"})
+            rebuild.assert_not_called()
+
+        assert _names(tree, "RPG") == ["B", "C"]
+        assert _names(tree, t("categories.uncategorized")) == ["D"]
+        assert _names(tree, "Action") == ["A"]
+
+    def test_emptied_uncategorized_falls_back(self, tree) -> None:
+        """A node that has to disappear forces a full rebuild."""
+        from steam_library_manager.ui.handlers.category_populator import CategoryPopulator
+
+        a = Game(app_id="1", name="A", categories=["Action"])
+        b = Game(app_id="2", name="B")
+        mw = self._window(tree, [a, b])
+        pop = CategoryPopulator(mw)
+        pop.populate()
+        assert tree.has_category(t("categories.uncategorized"))
+
+        b.categories.append("Action")
+        pop.populate(changed={"Action"})
+
+        assert not tree.has_category(t("categories.uncategorized"))
+        assert _names(tree, "Action") == ["A", "B"]
+
+    def test_new_category_falls_back(self, tree) -> None:
+        """A category that is not in the tree yet triggers a full rebuild."""
+        from steam_library_manager.ui.handlers.category_populator import CategoryPopulator
+
+        a = Game(app_id="1", name="A", categories=["Action"])
+        b = Game(app_id="2", name="B", categories=["Action"])
+        mw = self._window(tree, [a, b])
+        pop = CategoryPopulator(mw)
+        pop.populate()
+
+        b.categories.append("Puzzle")
+        pop.populate(changed={"Puzzle"})
+
+        assert tree.has_category("Puzzle")
+        assert tree.has_category("Action")
@@ -86,6 +86,22 @@ def test_pegi_override_saves(mock_ui_helper, metadata_actions, mock_mainwindow):
     mock_ui_helper.show_success.assert_called()
 
 
+@patch("steam_library_manager.ui.actions.metadata_actions.UIHelper")
+def test_pegi_override_is_logged(mock_ui_helper, metadata_actions, mock_mainwindow):
+    """The new rating is reported to the change log before smart collections re-evaluate."""
+    from steam_library_manager.services.game_change_log import GameChangeLog
+
+    game = Game("123", "Test Game")
+    mock_mainwindow.game_manager.get_game.return_value = game
+    mock_mainwindow.game_manager.changes = GameChangeLog()
+
+    metadata_actions.on_pegi_override_requested("123", "18")
+
+    assert game.pegi_rating == "18"
+    assert mock_mainwindow.game_manager.changes.drain() == {"123": {"pegi_rating"}}
+    mock_mainwindow.smart_collection_manager.apply_changes.assert_called_once()
+
+
 def test_auto_categorize_checks_selection(edit_actions, mock_mainwindow):
     """Test that auto_categorize uses selected games if available."""
     # Setup selection
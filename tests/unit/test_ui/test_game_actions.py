@@ -161,6 +161,36 @@ class TestToggleHideGame:
         mock_helper.show_success.assert_called_once()
 
 
+class TestChangeLog:
+    """Favorite and hide edits must reach game_manager.changes."""
+
+    @pytest.fixture
+    def live_window(self, mock_main_window: Mock, sample_game: Game, tmp_path):
+        from steam_library_manager.core.game_manager import GameManager
+        from steam_library_manager.services.category_service import CategoryService
+
+        gm = GameManager(None, tmp_path / "cache", tmp_path)
+        gm.games["440"] = sample_game
+        mock_main_window.game_manager = gm
+        mock_main_window.category_service = CategoryService(None, Mock(), gm)
+        return mock_main_window
+
+    def test_toggle_favorite_is_logged(self, game_actions: GameActions, live_window: Mock, sample_game: Game):
+        """The in-memory list is changed by CategoryService, which logs it."""
+        game_actions.toggle_favorite(sample_game)
+
+        assert sample_game.is_favorite()
+        assert live_window.game_manager.changes.drain() == {"440": {"categories"}}
+
+    @patch("steam_library_manager.ui.actions.game_actions.UIHelper")
+    def test_toggle_hide_is_logged(self, _helper, game_actions: GameActions, live_window: Mock, sample_game: Game):
+        """Hiding logs both the hidden collection and the hidden flag."""
+        game_actions.toggle_hide_game(sample_game, True)
+
+        assert sample_game.hidden is True
+        assert live_window.game_manager.changes.drain() == {"440": {"categories", "hidden"}}
+
+
 # ==================================================================
 # Open In Store Tests
 # ==================================================================
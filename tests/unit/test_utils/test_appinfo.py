@@ -0,0 +1,151 @@
+"""Tests for the appinfo.vdf parser.
+
+Covers lazy (index + on-demand decode) mode against the eager parser,
+LRU bounds and write-back of modified and untouched entries.
+"""
+
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+
+import pytest
+
+from steam_library_manager.utils.appinfo import AppInfo
+from steam_library_manager.utils.appinfo_constants import MAGIC_NUMBER
+
+
+def _empty_appinfo(version: int = 41) -> bytes:
+    """Header + end marker (+ string table for v41) without any apps."""
+    out = bytearray(struct.pack("<I", (MAGIC_NUMBER << 8) | version))
+    out += struct.pack("<I", 1)  # universe
+    if version >= 41:
+        out += struct.pack("<q", 0)  # string table offset, patched below
+    out += struct.pack("<I", 0)  # end of apps
+    if version >= 41:
+        st_off = len(out)
+        keys = [b"appid", b"common", b"name", b"type"]
+        out += struct.pack("<I", len(keys))
+        for key in keys:
+            out += key + b"\x00"
+        struct.pack_into("<q", out, 8, st_off)
+    return bytes(out)
+
+
+def _app_data(app_id: int) -> dict:
+    return {
+        "appid": app_id,
+        "common": {"name": "Game %d" % app_id, "type": "Game", "review_percentage": app_id % 100},
+    }
+
+
+@pytest.fixture
+def appinfo_file(tmp_path: Path) -> Path:
+    """A v41 appinfo.vdf with 50 apps written by the eager writer."""
+    info = AppInfo(data=_empty_appinfo())
+    for app_id in range(10, 60):
+        info.set_app(app_id, _app_data(app_id))
+    path = tmp_path / "appinfo.vdf"
+    assert info.write(str(path))
+    return path
+
+
+class TestLazyAppInfo:
+    """Tests for AppInfo(lazy=True)."""
+
+    def test_lazy_matches_eager(self, appinfo_file: Path) -> None:
+        """Every lazily decoded entry equals the eagerly parsed one."""
+        eager = AppInfo(path=str(appinfo_file))
+        lazy = AppInfo(path=str(appinfo_file), lazy=True)
+
+        assert lazy.lazy is True
+        assert len(lazy) == len(eager) == 50
+        assert list(lazy.apps) == list(eager.apps)
+        for app_id in eager.apps:
+            assert lazy[app_id] == eager[app_id]
+
+    def test_nothing_decoded_up_front(self, appinfo_file: Path) -> None:
+        """Building the index decodes no entries."""
+        lazy = AppInfo(path=str(appinfo_file), lazy=True)
+
+        assert lazy.apps.cached_count == 0
+        assert 10 in lazy
+        assert 9999 not in lazy
+        assert lazy.get_app(9999) is None
+        assert lazy.apps.cached_count == 0
+
+    def test_lru_is_bounded(self, appinfo_file: Path) -> None:
+        """Decoded entries beyond cache_size are evicted."""
+        lazy = AppInfo(path=str(appinfo_file), lazy=True, cache_size=8)
+
+        for app_id in list(lazy.apps):
+            assert lazy.get_app(app_id)["data"]["appid"] == app_id
+
+        assert lazy.apps.cached_count == 8
+
+    def test_write_keeps_untouched_and_modified(self, appinfo_file: Path, tmp_path: Path) -> None:
+        """Modified entries survive eviction and are re-encoded on write."""
+        lazy = AppInfo(path=str(appinfo_file), lazy=True, cache_size=2)
+        lazy.update_app_metadata(20, {"name": "Renamed"})
+        lazy.set_app(999, _app_data(999))
+
+        # push the edited entry out of the LRU
+        for app_id in range(30, 40):
+            lazy.get_app(app_id)
+
+        out = tmp_path / "out.vdf"
+        assert lazy.write(str(out))
+
+        reread = AppInfo(path=str(out))
+        original = AppInfo(path=str(appinfo_file))
+        assert len(reread) == 51
+        assert reread[20]["data"]["common"]["name"] == "Renamed"
+        assert reread[999]["data"] == _app_data(999)
+        assert reread[30] == original[30]
+
+    def test_write_in_place(self, appinfo_file: Path) -> None:
+        """Writing over the mapped source file keeps the index usable."""
+        lazy = AppInfo(path=str(appinfo_file), lazy=True)
+        lazy.update_app_metadata(11, {"developer": "Someone"})
+
+        assert lazy.write()
+        assert lazy[12]["data"] == _app_data(12)
+        assert AppInfo(path=str(appinfo_file))[11]["data"]["common"]["developer"] == "Someone"
+
+    def test_old_versions_fall_back_to_eager(self) -> None:
+        """Versions without the size field are parsed eagerly."""
+        info = AppInfo(data=_empty_appinfo(version=29), lazy=True)
+
+        assert info.lazy is False
+        assert isinstance(info.apps, dict)
+
+    def test_change_index_matches_eager(self, appinfo_file: Path) -> None:
+        """Header-only change index equals the one from decoded entries."""
+        eager = AppInfo(path=str(appinfo_file))
+        lazy = AppInfo(path=str(appinfo_file), lazy=True)
+
+        index = lazy.get_change_index()
+        assert index == eager.get_change_index()
+        assert len(index) == 50
+        assert lazy.apps.cached_count == 0
+
+    def test_broken_entry_is_skipped_by_metadata_lookup(self, appinfo_file: Path) -> None:
+        """A corrupt entry reads as missing instead of raising KeyError."""
+        from steam_library_manager.core.appinfo_manager import AppInfoManager
+
+        mgr = AppInfoManager()
+        mgr.appinfo = AppInfo(path=str(appinfo_file), lazy=True)
+        mgr.appinfo.apps._index[20] = len(mgr.appinfo.data) - 2  # points past the entries
+
+        assert mgr.get_app_metadata("20").get("name") is None
+        assert 20 not in mgr.appinfo.apps
+        assert mgr.get_app_metadata("21")["name"] == "Game 21"
+
+    def test_broken_entry_is_skipped_by_update(self, appinfo_file: Path) -> None:
+        """Writing back metadata skips a corrupt entry instead of raising."""
+        info = AppInfo(path=str(appinfo_file), lazy=True)
+        info.apps._index[20] = len(info.data) - 2  # points past the entries
+
+        assert info.update_app_metadata(20, {"name": "Renamed"}) is False
+        assert info.update_app_metadata(21, {"name": "Renamed"}) is True
+        assert info.apps[21]["data"]["common"]["name"] == "Renamed"
@@ -0,0 +1,129 @@
+"""Tests for the shared pooled HTTP client."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from steam_library_manager.utils.http_client import HttpClient
+
+
+class _Clock:
+    """Manual clock; sleep() just advances it."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, secs: float) -> None:
+        self.now += secs
+
+
+def _resp(status: int = 200, headers: dict | None = None) -> MagicMock:
+    r = MagicMock()
+    r.status_code = status
+    r.headers = headers or {}
+    return r
+
+
+def _client(clock: _Clock, **kw) -> HttpClient:
+    kw.setdefault("limits", {"api.example.com": (2.0, 1)})
+    client = HttpClient(clock=clock, sleep=clock.sleep, **kw)
+    client._session.request = MagicMock(return_value=_resp())
+    return client
+
+
+class TestHttpClient:
+    """Tests for pacing, throttling and stats."""
+
+    def test_paces_limited_host(self) -> None:
+        """Requests to a limited host are spaced 1/rate apart."""
+        clock = _Clock()
+        client = _client(clock)
+
+        for _ in range(5):
+            client.get("https://api.example.com/x")
+
+        assert clock.now == pytest.approx(2.0)
+
+    def test_unknown_host_not_paced(self) -> None:
+        """Hosts without a limit go straight through."""
+        clock = _Clock()
+        client = _client(clock)
+
+        for _ in range(5):
+            client.get("https://cdn.example.com/img.jpg")
+
+        assert clock.now == 0.0
+
+    def test_429_retried_after_retry_after(self) -> None:
+        """A 429 waits for Retry-After and is retried."""
+        clock = _Clock()
+        client = _client(clock)
+        client._session.request.side_effect = [_resp(429, {"Retry-After": "5"}), _resp(200)]
+
+        resp = client.get("https://api.example.com/x")
+
+        assert resp.status_code == 200
+        assert client._session.request.call_count == 2
+        assert clock.now >= 5.0
+
+    def test_retries_exhausted_returns_last_response(self) -> None:
+        """After the retries the throttled response is handed back."""
+        clock = _Clock()
+        client = _client(clock, retries=1)
+        client._session.request.return_value = _resp(429)
+
+        resp = client.get("https://api.example.com/x")
+
+        assert resp.status_code == 429
+        assert client._session.request.call_count == 2
+
+    def test_session_retries_zero_returns_429_immediately(self) -> None:
+        """A session opened with retries=0 leaves the backoff to its owner."""
+        clock = _Clock()
+        client = _client(clock)
+        client._session.request.return_value = _resp(429)
+
+        resp = client.session({"User-Agent": "x"}, retries=0).post("https://api.example.com/x")
+
+        assert resp.status_code == 429
+        assert client._session.request.call_count == 1
+
+    def test_session_merges_headers(self) -> None:
+        """Default headers are sent and per-call headers win."""
+        clock = _Clock()
+        client = _client(clock)
+        sess = client.session({"User-Agent": "a", "Accept": "json"})
+
+        sess.get("https://cdn.example.com/", headers={"Accept": "html"})
+
+        hdrs = client._session.request.call_args.kwargs["headers"]
+        assert hdrs == {"User-Agent": "a", "Accept": "html"}
+
+    def test_stats_count_per_host(self) -> None:
+        """stats() tracks requests, errors and throttled answers per host."""
+        clock = _Clock()
+        client = _client(clock, retries=0)
+        client._session.request.side_effect = [
+            _resp(200),
+            _resp(404),
+            _resp(429),
+            requests.ConnectionError("down"),
+        ]
+
+        client.get("https://api.example.com/a")
+        client.get("https://api.example.com/b")
+        client.get("https://api.example.com/c")
+        with pytest.raises(requests.ConnectionError):
+            client.get("https://cdn.example.com/d")
+
+        stats = client.stats()
+        assert stats["api.example.com"]["requests"] == 3
+        assert stats["api.example.com"]["errors"] == 1
+        assert stats["api.example.com"]["throttled"] == 1
+        assert stats["cdn.example.com"]["errors"] == 1
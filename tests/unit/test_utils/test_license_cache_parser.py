@@ -1,7 +1,9 @@
 """Unit tests for LicenseCacheParser."""
 
 import struct
+from unittest.mock import patch
 
+from steam_library_manager.utils import license_cache_parser
 from steam_library_manager.utils.license_cache_parser import (
     LicenseCacheParser,
     LicenseInfo,
@@ -83,6 +85,23 @@ class TestRandomStream:
         decrypted = _RandomStream().decrypt(key, encrypted)
         assert decrypted == data
 
+    def test_matches_per_byte_reference(self):
+        """Bulk keystream + XOR is byte-identical to the per-byte PRNG loop."""
+        key = 43925226
+        data = bytes((i * 37 + 11) & 0xFF for i in range(5000))
+
+        ref = _RandomStream()
+        ref._set_seed(key)
+        expected = bytes(b ^ ref._random_int(32, 126) for b in data)
+
+        license_cache_parser._streams.pop(key, None)
+        assert _RandomStream().decrypt(key, data[:100]) == expected[:100]
+        # longer read extends the cached keystream instead of restarting it
+        assert _RandomStream().decrypt(key, data) == expected
+
+        with patch.object(license_cache_parser, "HAS_NUMPY", False):
+            assert _RandomStream().decrypt(key, data) == expected
+
 
 # -- TestLicenseCacheParser ---------------------------------------------------
 
@@ -184,6 +203,34 @@ class TestLicenseCacheParser:
         assert 0 not in result
         assert result == {42, 100}
 
+    def test_disk_cache_skips_decryption(self, tmp_path):
+        """A second parser with the same cache_dir does not decrypt again."""
+        steam_path = tmp_path / "steam"
+        cfg_dir = steam_path / "userdata" / "12345" / "config"
+        cfg_dir.mkdir(parents=True)
+        (cfg_dir / "licensecache").write_bytes(_make_encrypted_licensecache(12345, [42, 100]))
+        cache = tmp_path / "cache"
+
+        first = LicenseCacheParser(steam_path, 12345, cache_dir=cache).parse()
+        assert (cache / "licensecache_12345.json").exists()
+
+        with patch.object(_RandomStream, "decrypt", side_effect=AssertionError("decrypted")):
+            assert LicenseCacheParser(steam_path, 12345, cache_dir=cache).parse() == first
+
+    def test_changed_file_invalidates_disk_cache(self, tmp_path):
+        """A rewritten licensecache (new size/mtime) is decrypted again."""
+        steam_path = tmp_path / "steam"
+        cfg_dir = steam_path / "userdata" / "12345" / "config"
+        cfg_dir.mkdir(parents=True)
+        path = cfg_dir / "licensecache"
+        path.write_bytes(_make_encrypted_licensecache(12345, [42]))
+        cache = tmp_path / "cache"
+        LicenseCacheParser(steam_path, 12345, cache_dir=cache).parse()
+
+        path.write_bytes(_make_encrypted_licensecache(12345, [42, 100]))
+
+        assert LicenseCacheParser(steam_path, 12345, cache_dir=cache).get_owned_package_ids() == {42, 100}
+
 
 # -- TestPackageInfoParserFiltered --------------------------------------------
 
@@ -236,6 +283,104 @@ class TestPackageInfoParserFiltered:
         # Package 20 should NOT be included
         assert "200" not in result
 
+    def test_get_all_app_ids(self, tmp_path):
+        """All packages are decoded back to back from one buffer."""
+        from steam_library_manager.core.packageinfo_parser import PackageInfoParser
+
+        appcache = tmp_path / "appcache"
+        appcache.mkdir()
+        (appcache / "packageinfo.vdf").write_bytes(_build_minimal_packageinfo({10: [100, 101], 20: [200]}))
+
+        assert PackageInfoParser(tmp_path).get_all_app_ids() == {"100", "101", "200"}
+
+    def test_truncated_file_keeps_earlier_packages(self, tmp_path):
+        """A cut-off record is logged; packages before it still count."""
+        from steam_library_manager.core.packageinfo_parser import PackageInfoParser
+
+        data = _build_minimal_packageinfo({10: [100], 20: [200]})
+        appcache = tmp_path / "appcache"
+        appcache.mkdir()
+        # cut into the second package's appid value
+        (appcache / "packageinfo.vdf").write_bytes(data[:-10])
+
+        assert PackageInfoParser(tmp_path).get_all_app_ids() == {"100"}
+
+
+class TestPackageIndex:
+    """Tests for the one-pass PackageIndex and its on-disk cache."""
+
+    @staticmethod
+    def _write(tmp_path, packages):
+        appcache = tmp_path / "appcache"
+        appcache.mkdir(exist_ok=True)
+        path = appcache / "packageinfo.vdf"
+        path.write_bytes(_build_minimal_packageinfo(packages))
+        return path
+
+    def test_reverse_lookup(self, tmp_path):
+        """packages_for_app lists every license that grants the app."""
+        from steam_library_manager.core.packageinfo_parser import PackageInfoParser
+
+        self._write(tmp_path, {10: [100, 101], 20: [100], 30: [300]})
+        parser = PackageInfoParser(tmp_path)
+
+        assert parser.get_packages_for_app(100) == [10, 20]
+        assert parser.get_packages_for_app("300") == [30]
+        assert parser.get_packages_for_app(999) == []
+
+    def test_one_parse_for_both_queries(self, tmp_path):
+        """All-apps and owned-apps queries share a single parse."""
+        from steam_library_manager.core.packageinfo_parser import PackageInfoParser
+
+        self._write(tmp_path, {10: [100], 20: [200]})
+        parser = PackageInfoParser(tmp_path)
+
+        with patch.object(parser, "_iter_packages", wraps=parser._iter_packages) as spy:
+            assert parser.get_all_app_ids() == {"100", "200"}
+            assert parser.get_app_ids_for_packages({20}) == {"200"}
+
+        assert spy.call_count == 1
+
+    def test_disk_cache_skips_parsing(self, tmp_path):
+        """A second parser with the same cache_dir does not parse again."""
+        from steam_library_manager.core.packageinfo_parser import PackageInfoParser
+
+        self._write(tmp_path, {10: [100, 101]})
+        cache = tmp_path / "cache"
+        assert PackageInfoParser(tmp_path, cache_dir=cache).get_all_app_ids() == {"100", "101"}
+        assert (cache / "packageinfo_index.json").exists()
+
+        parser = PackageInfoParser(tmp_path, cache_dir=cache)
+        with patch.object(parser, "_iter_packages", side_effect=AssertionError("parsed")):
+            assert parser.get_app_ids_for_packages({10}) == {"100", "101"}
+
+    def test_changed_file_invalidates_cache(self, tmp_path):
+        """A rewritten packageinfo.vdf (new size/mtime) is parsed again."""
+        import os
+
+        from steam_library_manager.core.packageinfo_parser import PackageInfoParser
+
+        path = self._write(tmp_path, {10: [100]})
+        cache = tmp_path / "cache"
+        PackageInfoParser(tmp_path, cache_dir=cache).get_all_app_ids()
+
+        self._write(tmp_path, {10: [100], 20: [200]})
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert PackageInfoParser(tmp_path, cache_dir=cache).get_all_app_ids() == {"100", "200"}
+
+    def test_truncated_file_is_not_cached(self, tmp_path):
+        """A partial parse is used but never written to the cache."""
+        from steam_library_manager.core.packageinfo_parser import PackageInfoParser
+
+        path = self._write(tmp_path, {10: [100], 20: [200]})
+        path.write_bytes(path.read_bytes()[:-10])
+        cache = tmp_path / "cache"
+
+        assert PackageInfoParser(tmp_path, cache_dir=cache).get_all_app_ids() == {"100"}
+        assert not (cache / "packageinfo_index.json").exists()
+
 
 def _build_minimal_packageinfo(packages: dict[int, list[int]]) -> bytes:
     """Build a minimal binary packageinfo.vdf for testing.
@@ -0,0 +1,77 @@
+"""Tests for the startup profiler spans."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from steam_library_manager.utils import profiler
+
+
+@pytest.fixture
+def prof(monkeypatch):
+    monkeypatch.setattr(profiler, "_profiler", None)
+    return profiler.enable()
+
+
+class TestProfiler:
+    """Span collection and export."""
+
+    def test_disabled_is_noop(self, monkeypatch) -> None:
+        """Without enable() spans record nothing."""
+        monkeypatch.setattr(profiler, "_profiler", None)
+        with profiler.span("x") as sp:
+            sp.count = 3
+        assert profiler.get_profiler() is None
+        assert sp.count is None
+
+    def test_nesting_and_counts(self, prof) -> None:
+        """Spans opened inside another on the same thread become children."""
+        with profiler.span("outer") as outer:
+            with profiler.span("inner", kind="db") as inner:
+                inner.count = 42
+            outer.count = 1
+
+        tree = prof.to_json()["spans"]
+        assert [s["name"] for s in tree] == ["outer"]
+        child = tree[0]["children"][0]
+        assert child["name"] == "inner"
+        assert child["count"] == 42
+        assert child["attrs"] == {"kind": "db"}
+        assert tree[0]["wall_ms"] >= child["wall_ms"]
+
+    def test_begin_end(self, prof) -> None:
+        """begin()/end() spans work across callbacks and close once."""
+        sp = profiler.begin("bootstrap")
+        with profiler.span("step"):
+            pass
+        sp.end()
+        sp.end()
+
+        tree = prof.to_json()["spans"]
+        assert len(tree) == 1
+        assert tree[0]["children"][0]["name"] == "step"
+
+    def test_worker_thread_is_own_root(self, prof) -> None:
+        """A span on another thread is not nested under the caller's span."""
+        with profiler.span("main"):
+            t = threading.Thread(target=lambda: profiler.span("worker").__enter__().end())
+            t.start()
+            t.join()
+
+        names = sorted(s["name"] for s in prof.to_json()["spans"])
+        assert names == ["main", "worker"]
+
+    def test_chrome_trace_dump(self, prof, tmp_path) -> None:
+        """The chrome format writes complete ("X") events with durations."""
+        with profiler.span("load") as sp:
+            sp.count = 5
+
+        out = tmp_path / "trace.json"
+        prof.dump(out, "chrome")
+        events = json.loads(out.read_text())["traceEvents"]
+        assert events[0]["name"] == "load"
+        assert events[0]["ph"] == "X"
+        assert events[0]["args"]["count"] == 5
@@ -0,0 +1,94 @@
+"""Tests for the TokenBucket rate limiter."""
+
+from __future__ import annotations
+
+import pytest
+
+from steam_library_manager.utils.rate_limiter import TokenBucket
+
+
+class _Clock:
+    """Manual clock; sleep() just advances it."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, secs: float) -> None:
+        self.slept.append(secs)
+        self.now += secs
+
+
+def _bucket(clock: _Clock, rate: float = 2.0, burst: int = 1) -> TokenBucket:
+    return TokenBucket(rate, burst=burst, clock=clock, sleep=clock.sleep)
+
+
+class TestTokenBucket:
+    """Tests for pacing, backoff and recovery."""
+
+    def test_paces_at_rate(self) -> None:
+        """After the first token, callers are spaced 1/rate apart."""
+        clock = _Clock()
+        bucket = _bucket(clock, rate=2.0)
+
+        for _ in range(5):
+            assert bucket.acquire() is True
+
+        assert clock.now == pytest.approx(2.0)
+
+    def test_burst_caps_saved_tokens(self) -> None:
+        """An idle bucket never holds more than burst tokens."""
+        clock = _Clock()
+        bucket = _bucket(clock, rate=1.0, burst=3)
+        clock.now = 100.0
+
+        for _ in range(3):
+            bucket.acquire()
+        assert clock.now == pytest.approx(100.0)
+
+        bucket.acquire()
+        assert clock.now == pytest.approx(101.0)
+
+    def test_backoff_halves_rate_and_holds(self) -> None:
+        """backoff() slows everyone down and pauses for the given delay."""
+        clock = _Clock()
+        bucket = _bucket(clock, rate=4.0)
+        bucket.acquire()
+
+        bucket.backoff(3.0)
+        assert bucket.rate == pytest.approx(2.0)
+
+        bucket.acquire()
+        assert clock.now >= 3.0
+
+    def test_backoff_respects_min_rate(self) -> None:
+        """The rate never drops below min_rate."""
+        bucket = TokenBucket(1.0, min_rate=0.5)
+        for _ in range(5):
+            bucket.backoff()
+
+        assert bucket.rate == pytest.approx(0.5)
+
+    def test_recover_climbs_back(self) -> None:
+        """recover() raises the rate step by step up to the configured one."""
+        bucket = TokenBucket(2.0)
+        bucket.backoff()
+
+        bucket.recover()
+        assert 1.0 < bucket.rate < 2.0
+
+        for _ in range(50):
+            bucket.recover()
+        assert bucket.rate == pytest.approx(2.0)
+
+    def test_cancelled_wait_returns_false(self) -> None:
+        """A waiting caller gives up once cancelled() is true."""
+        clock = _Clock()
+        bucket = _bucket(clock, rate=0.1)
+        bucket.acquire()
+
+        assert bucket.acquire(cancelled=lambda: clock.now > 0.5) is False
+        assert clock.now < 1.0
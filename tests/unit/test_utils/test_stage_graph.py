@@ -0,0 +1,70 @@
+"""Tests for the StageGraph pipeline runner."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from steam_library_manager.utils.stage_graph import StageGraph
+
+
+class TestStageGraph:
+    """Dependency order, overlap and error handling."""
+
+    def test_results_passed_to_dependents(self) -> None:
+        """A stage receives its dependencies' results as keyword arguments."""
+        g = StageGraph()
+        g.add("a", lambda: 2)
+        g.add("b", lambda: 3)
+        g.add("sum", lambda a, b: a + b, deps=("a", "b"))
+
+        assert g.run()["sum"] == 5
+
+    def test_independent_stages_overlap(self) -> None:
+        """Stages without a dependency between them run at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+        g = StageGraph()
+        g.add("x", barrier.wait)
+        g.add("y", barrier.wait)
+
+        g.run(max_workers=2)  # would raise BrokenBarrierError if serial
+
+    def test_chain_runs_in_order(self) -> None:
+        """Chained stages never overlap, whatever the pool size."""
+        order = []
+        g = StageGraph()
+        g.add("first", lambda: order.append("first"))
+        g.add("second", lambda first: order.append("second"), deps=("first",))
+        g.add("third", lambda second: order.append("third"), deps=("second",))
+
+        g.run(max_workers=4)
+        assert order == ["first", "second", "third"]
+
+    def test_failure_stops_dependents(self) -> None:
+        """A failing stage is re-raised and its dependents never start."""
+        ran = []
+        g = StageGraph()
+        g.add("boom", lambda: 1 / 0)
+        g.add("after", lambda boom: ran.append("after"), deps=("boom",))
+
+        with pytest.raises(ZeroDivisionError):
+            g.run()
+        assert ran == []
+
+    def test_timings_reported(self) -> None:
+        """on_done is called once per stage with its duration."""
+        seen = {}
+        g = StageGraph()
+        g.add("a", lambda: None)
+        g.add("b", lambda a: None, deps=("a",))
+
+        g.run(on_done=lambda name, secs: seen.setdefault(name, secs))
+        assert set(seen) == {"a", "b"}
+        assert set(g.timings) == {"a", "b"}
+
+    def test_unknown_dependency_rejected(self) -> None:
+        """Dependencies must be registered first, which also rules out cycles."""
+        g = StageGraph()
+        with pytest.raises(ValueError):
+            g.add("b", lambda a: None, deps=("a",))